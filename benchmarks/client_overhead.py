@@ -0,0 +1,236 @@
+"""Benchmark: load generator self-overhead against a local mock server.
+
+Starts ``shared.testing.mock_server`` in separate processes (so the server
+does not compete for the client's CPU) and drives it through the real
+``LoadGenerator`` + ``OpenAICompatibleAdapter`` path:
+
+- ceiling: zero injected latency, reports the client's maximum req/s and
+  chunks/s and the client CPU time per request.
+- accuracy: known TTFT/ITL, reports measured minus injected latency.
+- memory: long-lived requests, reports traced Python memory per in-flight
+  request.
+
+With ``--check`` every scenario is compared to a threshold and the script
+exits 1 on a regression. Run from the repository root:
+
+    python benchmarks/client_overhead.py --concurrency 64 --requests 2000 --check
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Optional
+
+SRC = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(SRC))
+
+from shared.adapters.openai_compat import OpenAICompatibleAdapter  # noqa: E402
+from shared.core.load_generator import LoadGenerator  # noqa: E402
+from shared.core.models import (  # noqa: E402
+    BenchmarkConfig,
+    ConcurrencyResult,
+    TransportConfig,
+)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class ServerProcess:
+    """Mock server running in child processes."""
+
+    def __init__(self, processes: int, uds: Optional[str] = None, **options):
+        self.port = free_port()
+        self.uds = uds
+        self.args = [
+            sys.executable,
+            "-m",
+            "shared.testing",
+            "--port",
+            str(self.port),
+            "--processes",
+            str(processes),
+        ]
+        if uds:
+            self.args += ["--uds", uds]
+        for name, value in options.items():
+            if value is not None:
+                self.args += [f"--{name.replace('_', '-')}", str(value)]
+        self._process = None
+
+    @property
+    def url(self) -> str:
+        if self.uds:
+            return "http://localhost"
+        return f"http://127.0.0.1:{self.port}"
+
+    def __enter__(self) -> "ServerProcess":
+        env = dict(os.environ, PYTHONPATH=str(SRC))
+        self._process = subprocess.Popen(
+            self.args, env=env, stdout=subprocess.PIPE, text=True
+        )
+        # 서버가 준비되면 "listening" 줄을 출력함
+        self._process.stdout.readline()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._process.terminate()
+        self._process.wait()
+
+
+async def run_level(
+    url: str,
+    concurrency: int,
+    requests: int,
+    output_tokens: int,
+    transport: Optional[TransportConfig] = None,
+) -> ConcurrencyResult:
+    adapter = OpenAICompatibleAdapter(
+        url, "mock-model", max_connections=concurrency, transport=transport
+    )
+    config = BenchmarkConfig(
+        server_url=url,
+        model="mock-model",
+        input_len=32,
+        output_len=output_tokens,
+        num_prompts=requests,
+        concurrency=[concurrency],
+        warmup=0,
+    )
+    try:
+        result = await LoadGenerator(adapter).run(config)
+    finally:
+        await adapter.aclose()
+    return result.results[0]
+
+
+def ceiling(args) -> dict:
+    """Maximum client throughput with zero server latency."""
+    with ServerProcess(args.server_processes, output_tokens=args.tokens) as server:
+        cpu = time.process_time()
+        level = asyncio.run(run_level(server.url, args.concurrency, args.requests, args.tokens))
+        cpu = time.process_time() - cpu
+
+    return {
+        "req_per_sec": level.request_rate_per_sec,
+        "chunks_per_sec": level.total_output_tokens / level.duration_seconds,
+        "cpu_ms_per_request": cpu * 1000 / level.total_requests,
+        "cpu_utilization": cpu / level.duration_seconds,
+        "failed": level.failed_requests,
+        "saturated_requests": level.saturated_requests,
+    }
+
+
+def accuracy(args) -> dict:
+    """Measured minus injected latency at moderate load."""
+    with ServerProcess(
+        args.server_processes, ttft_ms=args.ttft_ms, itl_ms=args.itl_ms, output_tokens=args.tokens
+    ) as server:
+        level = asyncio.run(
+            run_level(server.url, args.accuracy_concurrency, args.accuracy_requests, args.tokens)
+        )
+
+    e2e = args.ttft_ms + args.itl_ms * (args.tokens - 1)
+    return {
+        "ttft_error_ms": level.ttft.p50 - args.ttft_ms,
+        "ttft_p99_error_ms": level.ttft.p99 - args.ttft_ms,
+        "itl_error_ms": level.itl.p50 - args.itl_ms,
+        "e2e_error_ms": level.e2e_latency.p50 - e2e,
+        "failed": level.failed_requests,
+    }
+
+
+def memory(args) -> dict:
+    """Traced Python memory per in-flight request."""
+    # 요청이 오래 열려 있도록 긴 TTFT를 주입
+    with ServerProcess(
+        args.server_processes, ttft_ms=500, itl_ms=10, output_tokens=args.tokens
+    ) as server:
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        level = asyncio.run(
+            run_level(server.url, args.memory_concurrency, args.memory_concurrency, args.tokens)
+        )
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return {
+        "kb_per_inflight_request": (peak - baseline) / 1024 / args.memory_concurrency,
+        "failed": level.failed_requests,
+    }
+
+
+# (scenario, metric, comparison, argument holding the threshold)
+CHECKS = [
+    ("ceiling", "req_per_sec", ">=", "min_rps"),
+    ("ceiling", "cpu_ms_per_request", "<=", "max_cpu_ms"),
+    ("accuracy", "ttft_error_ms", "<=", "max_error_ms"),
+    ("accuracy", "itl_error_ms", "<=", "max_error_ms"),
+    ("accuracy", "e2e_error_ms", "<=", "max_error_ms"),
+    ("memory", "kb_per_inflight_request", "<=", "max_kb_per_request"),
+]
+
+
+def check(results: dict, args) -> list[str]:
+    """Threshold violations (empty when everything passes)."""
+    failures = []
+    for scenario, metric, op, threshold_arg in CHECKS:
+        value = results[scenario][metric]
+        threshold = getattr(args, threshold_arg)
+        ok = value >= threshold if op == ">=" else abs(value) <= threshold
+        if not ok:
+            failures.append(f"{scenario}.{metric} = {value:.3f} (want {op} {threshold})")
+    for scenario, values in results.items():
+        if values["failed"]:
+            failures.append(f"{scenario}: {values['failed']} failed requests")
+    return failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--tokens", type=int, default=16, help="Output tokens per request")
+    parser.add_argument("--server-processes", type=int, default=2)
+    parser.add_argument("--ttft-ms", type=float, default=100.0)
+    parser.add_argument("--itl-ms", type=float, default=20.0)
+    parser.add_argument("--accuracy-concurrency", type=int, default=4)
+    parser.add_argument("--accuracy-requests", type=int, default=80)
+    parser.add_argument("--memory-concurrency", type=int, default=256)
+    parser.add_argument("--json", default=None, help="Write results to this file")
+    parser.add_argument("--check", action="store_true", help="Exit 1 on a regression")
+    parser.add_argument("--min-rps", type=float, default=200.0)
+    parser.add_argument("--max-cpu-ms", type=float, default=5.0)
+    parser.add_argument("--max-error-ms", type=float, default=15.0)
+    parser.add_argument("--max-kb-per-request", type=float, default=64.0)
+    args = parser.parse_args()
+
+    results = {"ceiling": ceiling(args), "accuracy": accuracy(args), "memory": memory(args)}
+
+    for scenario, values in results.items():
+        print(f"{scenario}:")
+        for metric, value in values.items():
+            print(f"  {metric:<26} {value:>12.3f}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+
+    if args.check:
+        failures = check(results, args)
+        for failure in failures:
+            print(f"FAIL {failure}")
+        sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
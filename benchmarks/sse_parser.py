@@ -0,0 +1,107 @@
+"""Microbenchmark: byte-level SSE parser vs. line + json.loads decoding.
+
+Replays a synthetic chat-completion stream through both code paths and
+reports chunks per second. Run from the repository root:
+
+    python benchmarks/sse_parser.py --tokens 512 --repeat 200
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from shared.adapters.sse import DONE, SSEParser, scan_chunk  # noqa: E402
+
+
+def build_stream(tokens: int, read_size: int) -> list[bytes]:
+    """Build a vLLM-style SSE body split into network-sized reads."""
+    events = []
+    for i in range(tokens):
+        finish_reason = "length" if i == tokens - 1 else None
+        events.append(
+            {
+                "id": "chatcmpl-bench",
+                "object": "chat.completion.chunk",
+                "created": 1700000000,
+                "model": "bench-model",
+                "choices": [
+                    {
+                        "index": 0,
+                        "delta": {"content": f" tok{i}"},
+                        "logprobs": None,
+                        "finish_reason": finish_reason,
+                    }
+                ],
+            }
+        )
+    body = b"".join(b"data: " + json.dumps(e).encode() + b"\n\n" for e in events)
+    body += b"data: [DONE]\n\n"
+    return [body[i : i + read_size] for i in range(0, len(body), read_size)]
+
+
+def legacy_path(reads: list[bytes]) -> int:
+    """Previous path: text lines, startswith, json.loads, nested .get."""
+    text = b"".join(reads).decode()
+    tokens = 0
+    for line in text.splitlines():
+        if not line or not line.startswith("data: "):
+            continue
+        data_str = line[6:]
+        if data_str == "[DONE]":
+            break
+        data = json.loads(data_str)
+        choices = data.get("choices", [])
+        if choices and choices[0].get("delta", {}).get("content"):
+            tokens += 1
+    return tokens
+
+
+def byte_path(reads: list[bytes]) -> int:
+    """New path: SSEParser over raw reads + scan_chunk."""
+    parser = SSEParser()
+    tokens = 0
+    for raw in reads:
+        for chunk in parser.feed(raw):
+            if chunk == DONE:
+                return tokens
+            has_content, _ = scan_chunk(chunk)
+            if has_content:
+                tokens += 1
+    return tokens
+
+
+def bench(fn, reads: list[bytes], repeat: int) -> float:
+    """Return the best per-stream wall time (seconds) over ``repeat`` runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(reads)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tokens", type=int, default=512, help="Chunks per stream")
+    parser.add_argument("--read-size", type=int, default=4096, help="Bytes per read")
+    parser.add_argument("--repeat", type=int, default=200, help="Timed repetitions")
+    args = parser.parse_args()
+
+    reads = build_stream(args.tokens, args.read_size)
+    assert legacy_path(reads) == byte_path(reads) == args.tokens
+
+    legacy = bench(legacy_path, reads, args.repeat)
+    fast = bench(byte_path, reads, args.repeat)
+
+    print(f"chunks/stream : {args.tokens}")
+    print(f"legacy        : {args.tokens / legacy:>12,.0f} chunks/s")
+    print(f"byte parser   : {args.tokens / fast:>12,.0f} chunks/s")
+    print(f"speedup       : {legacy / fast:>12.2f}x")
+
+
+if __name__ == "__main__":
+    main()
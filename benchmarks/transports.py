@@ -0,0 +1,87 @@
+"""Benchmark: adapter transports (HTTP/1.1, HTTP/2, UDS, socket options).
+
+Drives the mock server (``shared.testing``, one process over TCP and one
+over a Unix domain socket) through ``LoadGenerator`` + the OpenAI adapter
+with every transport and reports, per transport:
+
+- ceiling: req/s and client CPU time per request with zero server latency.
+- overhead: measured minus injected TTFT (p50, p99) and ITL (p50) with the
+  injected latencies of ``--ttft-ms`` / ``--itl-ms``.
+
+Run from the repository root (HTTP/2 needs the ``h2`` package):
+
+    python benchmarks/transports.py --concurrency 64 --requests 2000
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from client_overhead import ServerProcess, run_level
+
+from shared.core.models import TransportConfig
+
+
+def transports(uds: str) -> dict[str, TransportConfig]:
+    return {
+        "http1": TransportConfig(),
+        "http1-nagle": TransportConfig(tcp_nodelay=False),
+        "http1-keepalive": TransportConfig(tcp_keepalive_seconds=30),
+        "http2": TransportConfig(http_version="2"),
+        "http2-8-streams": TransportConfig(http_version="2", http2_max_streams=8),
+        "uds-http1": TransportConfig(uds=uds),
+        "uds-http2": TransportConfig(uds=uds, http_version="2"),
+    }
+
+
+def measure(args, ttft_ms: float, itl_ms: float, concurrency: int, requests: int) -> dict:
+    """Run every transport against a TCP and a UDS server with the given latency."""
+    uds = str(Path(tempfile.mkdtemp()) / "mock.sock")
+    options = dict(ttft_ms=ttft_ms, itl_ms=itl_ms, output_tokens=args.tokens)
+    results = {}
+    with ServerProcess(1, **options) as tcp, ServerProcess(1, uds=uds, **options) as unix:
+        for name, transport in transports(uds).items():
+            url = unix.url if transport.uds else tcp.url
+            cpu = time.process_time()
+            level = asyncio.run(run_level(url, concurrency, requests, args.tokens, transport))
+            cpu = time.process_time() - cpu
+            results[name] = (level, cpu)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--tokens", type=int, default=16, help="Output tokens per request")
+    parser.add_argument("--ttft-ms", type=float, default=50.0)
+    parser.add_argument("--itl-ms", type=float, default=10.0)
+    parser.add_argument("--overhead-concurrency", type=int, default=8)
+    parser.add_argument("--overhead-requests", type=int, default=200)
+    args = parser.parse_args()
+
+    ceiling = measure(args, 0.0, 0.0, args.concurrency, args.requests)
+    overhead = measure(
+        args, args.ttft_ms, args.itl_ms, args.overhead_concurrency, args.overhead_requests
+    )
+
+    print(
+        f"{'transport':<18} {'req/s':>9} {'cpu ms/req':>11} "
+        f"{'ttft p50 +ms':>13} {'ttft p99 +ms':>13} {'itl p50 +ms':>12} {'failed':>7}"
+    )
+    for name, (level, cpu) in ceiling.items():
+        measured = overhead[name][0]
+        print(
+            f"{name:<18} {level.request_rate_per_sec:>9.1f} "
+            f"{cpu * 1000 / level.total_requests:>11.3f} "
+            f"{measured.ttft.p50 - args.ttft_ms:>13.2f} "
+            f"{measured.ttft.p99 - args.ttft_ms:>13.2f} "
+            f"{measured.itl.p50 - args.itl_ms:>12.3f} "
+            f"{level.failed_requests + measured.failed_requests:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,7 @@ from llm_loadtest_api.logging_config import (
 from llm_loadtest_api.routers.benchmarks import router as benchmarks_router
 from llm_loadtest_api.routers.websocket import router as websocket_router
 from llm_loadtest_api.routers.recommend import router as recommend_router
+from llm_loadtest_api.routers.distributed import router as distributed_router
 
 # Configure structured logging
 configure_logging()
@@ -44,6 +45,7 @@ def create_app() -> FastAPI:
     app.include_router(benchmarks_router)
     app.include_router(websocket_router)
     app.include_router(recommend_router)
+    app.include_router(distributed_router)
 
     @app.get("/")
     async def root():
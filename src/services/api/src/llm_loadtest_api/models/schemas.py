@@ -5,6 +5,8 @@ from typing import Literal, Optional, Union
 
 from pydantic import BaseModel, Field
 
+from shared.core.models import BenchmarkConfig
+
 
 # ============================================================
 # Framework Types
@@ -21,6 +23,71 @@ class GoodputThresholdsSchema(BaseModel):
     e2e_ms: Optional[float] = Field(default=None, description="E2E threshold (ms)")
 
 
+class LengthDistributionSchema(BaseModel):
+    """Per-request token length distribution."""
+
+    kind: Literal["uniform", "normal", "lognormal", "empirical"] = Field(
+        description="Distribution family"
+    )
+    min: Optional[int] = Field(default=None, ge=1, description="Lower bound (tokens)")
+    max: Optional[int] = Field(default=None, ge=1, description="Upper bound (tokens)")
+    mean: Optional[float] = Field(default=None, gt=0, description="Mean length (tokens)")
+    std: Optional[float] = Field(default=None, ge=0, description="Length standard deviation")
+    path: Optional[str] = Field(
+        default=None, description="File of observed lengths on the API host (empirical)"
+    )
+
+
+class LoadPhaseSchema(BaseModel):
+    """One phase of a load profile."""
+
+    shape: Literal["constant", "ramp", "step", "spike", "sine"] = Field(
+        description="Load shape of the phase"
+    )
+    duration_seconds: float = Field(gt=0, description="Phase duration in seconds")
+    target: float = Field(ge=0, description="Target (or peak) concurrency or request rate")
+    start: Optional[float] = Field(
+        default=None, ge=0, description="Level at phase start (previous phase's end when unset)"
+    )
+    steps: int = Field(default=4, ge=1, description="Number of steps (step)")
+    spike_seconds: Optional[float] = Field(
+        default=None, gt=0, description="Spike width (a third of the phase when unset)"
+    )
+    period_seconds: Optional[float] = Field(
+        default=None, gt=0, description="Sine period (the phase duration when unset)"
+    )
+    steady: Optional[bool] = Field(
+        default=None, description="Count toward steady-state results (all but ramp when unset)"
+    )
+    name: Optional[str] = Field(default=None, description="Phase label")
+
+
+class LoadProfileSchema(BaseModel):
+    """Staged load profile."""
+
+    dimension: Literal["concurrency", "request_rate"] = Field(
+        default="concurrency", description="Load dimension the phases drive"
+    )
+    phases: list[LoadPhaseSchema] = Field(min_length=1, description="Phases run back to back")
+
+
+class TransportSchema(BaseModel):
+    """HTTP transport options."""
+
+    http_version: Literal["1.1", "2"] = Field(default="1.1", description="HTTP version")
+    http2_max_streams: int = Field(
+        default=100, ge=1, le=100, description="Concurrent streams per HTTP/2 connection"
+    )
+    uds: Optional[str] = Field(default=None, description="Unix domain socket path")
+    tcp_nodelay: bool = Field(default=True, description="Set TCP_NODELAY")
+    tcp_keepalive_seconds: Optional[float] = Field(
+        default=None, gt=0, description="TCP keep-alive idle time (null: OS default)"
+    )
+    keepalive_expiry: float = Field(
+        default=30.0, ge=0, description="Idle pooled connections are closed after this (seconds)"
+    )
+
+
 class ValidationConfig(BaseModel):
     """Validation configuration for cross-checking client metrics against server."""
 
@@ -140,9 +207,76 @@ class BenchmarkRequest(BaseModel):
     output_len: int = Field(default=128, description="Output token length")
     stream: bool = Field(default=True, description="Enable streaming")
     warmup: int = Field(default=3, description="Warmup requests")
+    warmup_mode: Literal["requests", "steady"] = Field(
+        default="requests",
+        description="requests: serial warmup requests; "
+        "steady: ramp to the first level and hold until TTFT is stable",
+    )
+    warmup_ramp_seconds: float = Field(
+        default=10.0, ge=0, description="Steady warmup ramp-up time (s)"
+    )
+    warmup_window: int = Field(
+        default=20, ge=2, description="Steady warmup completions per TTFT window"
+    )
+    warmup_tolerance: float = Field(
+        default=0.05, gt=0, description="Steady warmup max CV of recent window mean TTFTs"
+    )
+    warmup_max_seconds: float = Field(
+        default=120.0, gt=0, description="Steady warmup time limit (s)"
+    )
     timeout: float = Field(default=120.0, description="Request timeout (s)")
     api_key: Optional[str] = Field(default=None, description="API key")
     duration_seconds: Optional[int] = Field(default=None, description="Duration mode")
+    request_rate: Optional[float] = Field(
+        default=None, gt=0, description="Open-loop request rate (req/s)"
+    )
+    arrival_distribution: Literal["poisson", "constant", "gamma"] = Field(
+        default="poisson", description="Inter-arrival distribution for request-rate mode"
+    )
+    burstiness: float = Field(default=1.0, gt=0, description="Gamma shape factor")
+    metrics_mode: Literal["auto", "exact", "sketch"] = Field(
+        default="auto", description="Percentile accuracy mode (sketch bounds memory)"
+    )
+    workers: int = Field(default=1, ge=1, le=64, description="Load-generator processes")
+    dataset: Optional[str] = Field(
+        default=None, description="Prompt dataset path on the API host (JSONL or ShareGPT JSON)"
+    )
+    dataset_format: Literal["auto", "jsonl", "sharegpt"] = Field(
+        default="auto", description="Dataset file format"
+    )
+    prefix_len: Optional[int] = Field(
+        default=None, ge=0, description="Shared prefix tokens of synthetic prompts"
+    )
+    prefix_share_ratio: float = Field(
+        default=1.0, ge=0, le=1, description="Fraction of requests carrying the shared prefix"
+    )
+    input_len_dist: Optional[LengthDistributionSchema] = Field(
+        default=None, description="Per-request input length distribution"
+    )
+    output_len_dist: Optional[LengthDistributionSchema] = Field(
+        default=None, description="Per-request output length distribution"
+    )
+    convergence_width: Optional[float] = Field(
+        default=None, gt=0, description="Stop a level once CIs reach this relative width"
+    )
+    convergence_confidence: float = Field(
+        default=0.95, gt=0, lt=1, description="Confidence level of the convergence CIs"
+    )
+    convergence_min_requests: int = Field(
+        default=100, ge=1, description="Requests before convergence is first checked"
+    )
+    timeline_interval: Optional[float] = Field(
+        default=1.0, gt=0, description="Timeline bucket width in seconds (null disables)"
+    )
+    loop_lag_threshold_ms: float = Field(
+        default=10.0, gt=0, description="Client event-loop lag that flags results (ms)"
+    )
+    load_profile: Optional[LoadProfileSchema] = Field(
+        default=None, description="Ramp/step/spike/sine profile replacing the concurrency sweep"
+    )
+    transport: Optional[TransportSchema] = Field(
+        default=None, description="HTTP transport (HTTP/2, Unix socket, socket options)"
+    )
     goodput_thresholds: Optional[GoodputThresholdsSchema] = Field(
         default=None, description="Goodput SLO thresholds"
     )
@@ -295,6 +429,13 @@ class TestConfigSchema(BaseModel):
         default=[1, 10, 50, 100, 200], description="Concurrency levels to test"
     )
     num_requests_per_step: int = Field(default=50, description="Requests per level")
+    adaptive: bool = Field(
+        default=False,
+        description="Search for the max concurrency meeting the SLO instead of fixed steps",
+    )
+    max_concurrency: int = Field(
+        default=512, ge=1, description="Upper bound of the adaptive search"
+    )
 
 
 class RecommendRequest(BaseModel):
@@ -367,3 +508,26 @@ class RecommendStatus(BaseModel):
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     error: Optional[str] = None
+
+
+# ============================================================
+# Distributed Runs
+# ============================================================
+
+
+class DistributedRunRequest(BaseModel):
+    """Request to start a distributed run."""
+
+    config: BenchmarkConfig = Field(description="Benchmark configuration to shard")
+    agent_ids: Optional[list[str]] = Field(
+        default=None, description="Agents to use (all registered agents if omitted)"
+    )
+    save_result: bool = Field(
+        default=True, description="Store the merged result with regular benchmark runs"
+    )
+    level_timeout_seconds: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Fail the run if a warmup or level takes longer than this "
+        "(plus duration_seconds; coordinator default if omitted)",
+    )
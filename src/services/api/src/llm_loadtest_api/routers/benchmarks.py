@@ -278,6 +278,41 @@ async def export_result(
         )
 
 
+@router.get("/result/{run_id}/timeline")
+async def get_run_timeline(
+    run_id: str,
+    concurrency: Optional[int] = Query(default=None, description="Only this concurrency level"),
+    service: BenchmarkService = Depends(get_service),
+) -> dict:
+    """Get per-interval metric timelines of a run for charting.
+
+    Args:
+        run_id: The benchmark run ID.
+        concurrency: Optional concurrency level filter.
+
+    Returns:
+        Run ID and one timeline per concurrency level.
+    """
+    timeline = service.get_timeline(run_id)
+    if not timeline:
+        run = service.get_status(run_id)
+        if not run:
+            raise HTTPException(status_code=404, detail="Run not found")
+        if run["status"] == "running":
+            raise HTTPException(status_code=202, detail="Benchmark still running")
+        if run["status"] == "failed":
+            raise HTTPException(status_code=500, detail="Benchmark failed")
+        raise HTTPException(status_code=404, detail="Result not found")
+
+    if concurrency is not None:
+        timeline["levels"] = [
+            level for level in timeline["levels"] if level["concurrency"] == concurrency
+        ]
+        if not timeline["levels"]:
+            raise HTTPException(status_code=404, detail="Concurrency level not found")
+    return timeline
+
+
 def _export_to_csv(result: dict) -> str:
     """Convert benchmark result to CSV format."""
     output = io.StringIO()
@@ -0,0 +1,199 @@
+"""Distributed load generation API routes (coordinator side)."""
+
+import time
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+
+from llm_loadtest_api.auth import APIKeyAuth
+from llm_loadtest_api.logging_config import get_logger
+from llm_loadtest_api.models.schemas import DistributedRunRequest
+from llm_loadtest_api.routers.benchmarks import get_db
+from shared.core.distributed import (
+    AgentInfo,
+    AgentRegistration,
+    DistributedCoordinator,
+    DistributedRunStatus,
+    LevelAssignment,
+    LevelReport,
+    RegistrationResponse,
+    RunAssignment,
+    WarmupReport,
+)
+from shared.core.models import BenchmarkResult
+
+logger = get_logger(__name__)
+
+router = APIRouter(
+    prefix="/api/v1/distributed",
+    tags=["distributed"],
+    dependencies=[Depends(APIKeyAuth(required=True))],
+)
+
+# Coordinator instance (singleton pattern)
+_coordinator: Optional[DistributedCoordinator] = None
+
+
+def get_coordinator() -> DistributedCoordinator:
+    """Get coordinator instance."""
+    global _coordinator
+    if _coordinator is None:
+        _coordinator = DistributedCoordinator()
+    return _coordinator
+
+
+@router.post("/agents", response_model=RegistrationResponse)
+async def register_agent(
+    registration: AgentRegistration,
+    coordinator: DistributedCoordinator = Depends(get_coordinator),
+) -> RegistrationResponse:
+    """Register a load-generation agent."""
+    agent = coordinator.register_agent(registration.name)
+    logger.info("agent_registered", agent_id=agent.agent_id, name=agent.name)
+    return RegistrationResponse(agent_id=agent.agent_id, server_time=time.time())
+
+
+@router.get("/agents", response_model=list[AgentInfo])
+async def list_agents(
+    coordinator: DistributedCoordinator = Depends(get_coordinator),
+) -> list[AgentInfo]:
+    """List registered agents."""
+    return coordinator.list_agents()
+
+
+@router.get("/agents/{agent_id}/assignment", response_model=RunAssignment)
+async def get_assignment(
+    agent_id: str,
+    coordinator: DistributedCoordinator = Depends(get_coordinator),
+):
+    """Poll for the next run (204 if there is none)."""
+    try:
+        assignment = coordinator.get_assignment(agent_id)
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    if assignment is None:
+        return Response(status_code=204)
+    return assignment
+
+
+@router.post("/runs", response_model=dict)
+async def start_distributed_run(
+    request: DistributedRunRequest,
+    coordinator: DistributedCoordinator = Depends(get_coordinator),
+) -> dict:
+    """Shard a benchmark across agents and start it."""
+    on_complete = on_fail = None
+    if request.save_result:
+        db = get_db()
+
+        def on_complete(result: BenchmarkResult) -> None:
+            result_dict = result.model_dump(mode="json")
+            result_dict["summary"] = result.get_summary()
+            db.save_result(result.run_id, result_dict)
+
+        def on_fail(run_id: str, error: str) -> None:
+            logger.warning("distributed_run_failed", run_id=run_id, error=error)
+            db.update_status(run_id, "failed")
+
+    try:
+        run_id = coordinator.create_run(
+            request.config,
+            request.agent_ids,
+            on_complete,
+            on_fail,
+            level_timeout=request.level_timeout_seconds,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if request.save_result:
+        db.create_run(
+            run_id=run_id,
+            server_url=request.config.server_url,
+            model=request.config.model,
+            adapter=request.config.adapter,
+            config=request.config.model_dump(),
+        )
+        db.update_status(run_id, "running")
+
+    status = coordinator.get_status(run_id)
+    logger.info("distributed_run_started", run_id=run_id, agents=len(status.agent_ids))
+    return {"run_id": run_id, "status": "started", "agent_ids": status.agent_ids}
+
+
+@router.get("/runs/{run_id}", response_model=DistributedRunStatus)
+async def get_distributed_status(
+    run_id: str,
+    coordinator: DistributedCoordinator = Depends(get_coordinator),
+) -> DistributedRunStatus:
+    """Get distributed run progress."""
+    try:
+        return coordinator.get_status(run_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Run not found")
+
+
+@router.get("/runs/{run_id}/levels/{level}", response_model=LevelAssignment)
+async def get_level(
+    run_id: str,
+    level: int,
+    agent_id: str = Query(..., description="Polling agent"),
+    coordinator: DistributedCoordinator = Depends(get_coordinator),
+) -> LevelAssignment:
+    """Get an agent's shard and synchronized start time for a level."""
+    try:
+        return coordinator.get_level(run_id, level, agent_id)
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.post("/runs/{run_id}/warmup", response_model=dict)
+async def submit_warmup(
+    run_id: str,
+    report: WarmupReport,
+    coordinator: DistributedCoordinator = Depends(get_coordinator),
+) -> dict:
+    """Upload an agent's warmup report."""
+    try:
+        accepted = coordinator.submit_warmup(run_id, report)
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"status": "accepted" if accepted else "ignored"}
+
+
+@router.post("/runs/{run_id}/levels/{level}", response_model=dict)
+async def submit_level(
+    run_id: str,
+    level: int,
+    report: LevelReport,
+    coordinator: DistributedCoordinator = Depends(get_coordinator),
+) -> dict:
+    """Upload an agent's level results."""
+    try:
+        accepted = coordinator.submit_level(run_id, level, report)
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"status": "accepted" if accepted else "ignored"}
+
+
+@router.get("/runs/{run_id}/result", response_model=BenchmarkResult)
+async def get_distributed_result(
+    run_id: str,
+    coordinator: DistributedCoordinator = Depends(get_coordinator),
+) -> BenchmarkResult:
+    """Get the merged result of a completed distributed run."""
+    try:
+        result = coordinator.get_result(run_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Run not found")
+
+    if result is None:
+        error = coordinator.get_status(run_id).error
+        detail = f"Run failed: {error}" if error else "Run still in progress"
+        raise HTTPException(status_code=409, detail=detail)
+    return result
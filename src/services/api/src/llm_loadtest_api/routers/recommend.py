@@ -16,6 +16,7 @@ sys.path.insert(0, str(project_root))
 from shared.core.load_generator import LoadGenerator
 from shared.core.models import BenchmarkConfig, WorkloadSpec
 from shared.core.recommend import InfraRecommender
+from shared.core.search import DEFAULT_MAX_CONCURRENCY
 from shared.adapters.base import AdapterFactory
 from shared.adapters.openai_compat import OpenAICompatibleAdapter  # Registers the adapter
 
@@ -25,6 +26,7 @@ from llm_loadtest_api.models.schemas import (
     RecommendRequest,
     RecommendResponse,
     RecommendStatus,
+    TestConfigSchema,
     WorkloadSpecSchema,
     InfraProfileSchema,
     InfraRecommendationSchema,
@@ -81,6 +83,15 @@ def _convert_concurrency_result(result) -> ConcurrencyResultSchema:
     )
 
 
+def _max_connections(test_config: Optional[TestConfigSchema]) -> int:
+    """Connection pool size covering the highest concurrency that may be tested."""
+    if test_config is None:
+        return 200
+    if test_config.adaptive:
+        return test_config.max_concurrency
+    return max(test_config.concurrency_steps)
+
+
 async def _run_recommendation(run_id: str, request: RecommendRequest) -> None:
     """Background task to run infrastructure recommendation."""
     try:
@@ -95,6 +106,7 @@ async def _run_recommendation(run_id: str, request: RecommendRequest) -> None:
             model=request.model,
             api_key=request.api_key,
             timeout=request.timeout,
+            max_connections=_max_connections(request.test_config),
         )
 
         # Create load generator and recommender
@@ -113,6 +125,8 @@ async def _run_recommendation(run_id: str, request: RecommendRequest) -> None:
         test_config = request.test_config
         concurrency_steps = test_config.concurrency_steps if test_config else [1, 10, 50, 100, 200]
         num_requests = test_config.num_requests_per_step if test_config else 50
+        adaptive = test_config.adaptive if test_config else False
+        max_concurrency = test_config.max_concurrency if test_config else DEFAULT_MAX_CONCURRENCY
 
         # Create workload spec
         workload = WorkloadSpec(
@@ -148,6 +162,8 @@ async def _run_recommendation(run_id: str, request: RecommendRequest) -> None:
             concurrency_steps=concurrency_steps,
             num_requests_per_step=num_requests,
             headroom=request.headroom_percent / 100.0,
+            adaptive=adaptive,
+            max_concurrency=max_concurrency,
         )
 
         # Convert results to schema
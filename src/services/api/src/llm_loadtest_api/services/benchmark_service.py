@@ -12,11 +12,22 @@ project_root = Path(__file__).parent.parent.parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from shared.core.load_generator import LoadGenerator
-from shared.core.models import BenchmarkConfig, BenchmarkResult, GoodputThresholds
+from shared.core.models import (
+    BenchmarkConfig,
+    BenchmarkResult,
+    ConfidenceInterval,
+    GoodputThresholds,
+    LengthDistribution,
+    LoadProfile,
+    TransportConfig,
+)
+from shared.core.profile import max_connections_for
+from shared.core.stats import DEFAULT_CONFIDENCE, compare_intervals
+from shared.core.warmup import check_warmup
 from shared.core.gpu_monitor import GPUMonitor, get_gpu_static_info
 from shared.core.system_info import get_system_info
 from shared.core.serving_engine_info import get_vllm_engine_info
-from shared.adapters.base import AdapterFactory
+from shared.adapters.base import AdapterFactory, BaseAdapter
 from shared.adapters.openai_compat import OpenAICompatibleAdapter  # Register adapter
 
 from shared.database import Database
@@ -24,6 +35,23 @@ from llm_loadtest_api.models.schemas import BenchmarkRequest
 from llm_loadtest_api.routers.websocket import get_connection_manager
 
 
+def _result_intervals(level: dict) -> dict[str, ConfidenceInterval]:
+    """Confidence intervals of the compared statistics of one stored level.
+
+    Results saved before confidence intervals were recorded yield nothing.
+    """
+    intervals = {}
+    if level.get("throughput_ci"):
+        intervals["throughput"] = ConfidenceInterval(**level["throughput_ci"])
+    for metric in ("ttft", "tpot", "e2e_latency"):
+        ci = (level.get(metric) or {}).get("ci")
+        if not ci:
+            continue
+        for stat in ("mean", "p50", "p99"):
+            intervals[f"{metric}_{stat}"] = ConfidenceInterval(**ci[stat])
+    return intervals
+
+
 class BenchmarkService:
     """Service for managing benchmark runs."""
 
@@ -51,6 +79,20 @@ class BenchmarkService:
                 e2e_ms=request.goodput_thresholds.e2e_ms,
             )
 
+        input_len_dist = output_len_dist = None
+        if request.input_len_dist:
+            input_len_dist = LengthDistribution(**request.input_len_dist.model_dump())
+        if request.output_len_dist:
+            output_len_dist = LengthDistribution(**request.output_len_dist.model_dump())
+
+        load_profile = None
+        if request.load_profile:
+            load_profile = LoadProfile(**request.load_profile.model_dump())
+
+        transport = TransportConfig()
+        if request.transport:
+            transport = TransportConfig(**request.transport.model_dump())
+
         config = BenchmarkConfig(
             server_url=request.server_url,
             model=request.model,
@@ -61,9 +103,32 @@ class BenchmarkService:
             concurrency=request.concurrency,
             stream=request.stream,
             warmup=request.warmup,
+            warmup_mode=request.warmup_mode,
+            warmup_ramp_seconds=request.warmup_ramp_seconds,
+            warmup_window=request.warmup_window,
+            warmup_tolerance=request.warmup_tolerance,
+            warmup_max_seconds=request.warmup_max_seconds,
             timeout=request.timeout,
             api_key=request.api_key,
             duration_seconds=request.duration_seconds,
+            request_rate=request.request_rate,
+            arrival_distribution=request.arrival_distribution,
+            burstiness=request.burstiness,
+            metrics_mode=request.metrics_mode,
+            workers=request.workers,
+            dataset=request.dataset,
+            dataset_format=request.dataset_format,
+            prefix_len=request.prefix_len,
+            prefix_share_ratio=request.prefix_share_ratio,
+            input_len_dist=input_len_dist,
+            output_len_dist=output_len_dist,
+            convergence_width=request.convergence_width,
+            convergence_confidence=request.convergence_confidence,
+            convergence_min_requests=request.convergence_min_requests,
+            timeline_interval=request.timeline_interval,
+            loop_lag_threshold_ms=request.loop_lag_threshold_ms,
+            load_profile=load_profile,
+            transport=transport,
             goodput_thresholds=goodput_thresholds,
         )
 
@@ -117,6 +182,7 @@ class BenchmarkService:
         manager = get_connection_manager()
         gpu_monitor: Optional[GPUMonitor] = None
         gpu_monitoring_active = False
+        adapter: Optional[BaseAdapter] = None
 
         try:
             # Update status to running
@@ -136,14 +202,19 @@ class BenchmarkService:
                 model=config.model,
                 api_key=config.api_key,
                 timeout=config.timeout,
+                max_connections=max_connections_for(config),
+                transport=config.transport,
             )
 
-            # Run warmup
-            if config.warmup > 0:
-                await adapter.warmup(
-                    config.warmup,
-                    config.input_len // 4,
-                    config.output_len // 4,
+            # Run warmup (steady mode runs inside the load generator)
+            warmup_result = None
+            if config.warmup_mode == "requests" and config.warmup > 0:
+                warmup_result = check_warmup(
+                    await adapter.warmup(
+                        config.warmup,
+                        config.input_len // 4,
+                        config.output_len // 4,
+                    )
                 )
 
             # Run load generator with progress callback
@@ -219,6 +290,8 @@ class BenchmarkService:
                 container_name=container_name,
                 validation_progress_callback=validation_progress_callback if enable_validation else None,
             )
+            if warmup_result is not None:
+                result.warmup = warmup_result
 
             # Stop GPU monitoring and collect metrics
             if gpu_monitoring_active and gpu_monitor:
@@ -269,6 +342,9 @@ class BenchmarkService:
                     gpu_monitor.stop()
                 except Exception:
                     pass
+            # Release pooled connections (also covers failures before the run)
+            if adapter is not None:
+                await adapter.aclose()
             # Clean up task reference
             if run_id in self._running_tasks:
                 del self._running_tasks[run_id]
@@ -326,6 +402,27 @@ class BenchmarkService:
         """Get benchmark result."""
         return self.db.get_result(run_id)
 
+    def get_timeline(self, run_id: str) -> Optional[dict]:
+        """Get the per-interval timeline of every level of a run.
+
+        Args:
+            run_id: Benchmark run ID.
+
+        Returns:
+            ``{run_id, levels: [{concurrency, timeline}]}`` (timeline None for
+            levels recorded without one), or None when there is no result.
+        """
+        result = self.db.get_result(run_id)
+        if not result:
+            return None
+        return {
+            "run_id": run_id,
+            "levels": [
+                {"concurrency": level["concurrency"], "timeline": level.get("timeline")}
+                for level in result.get("results", [])
+            ],
+        }
+
     def list_runs(
         self,
         limit: int = 50,
@@ -351,7 +448,9 @@ class BenchmarkService:
             run_ids: List of run IDs to compare.
 
         Returns:
-            Comparison summary.
+            Comparison summary. ``significance`` tests every other run against
+            the first one, per concurrency level, and reports whether each
+            difference is statistically significant.
         """
         results = []
         for run_id in run_ids:
@@ -396,4 +495,44 @@ class BenchmarkService:
                         "concurrency": cr.get("concurrency"),
                     }
 
+        comparison["significance"] = self._significance(results)
         return comparison
+
+    @staticmethod
+    def _significance(results: list[dict]) -> dict:
+        """Test each run's per-level statistics against the first run.
+
+        Args:
+            results: Stored results, the first one being the baseline.
+
+        Returns:
+            Significance tests grouped by run and concurrency level.
+        """
+        baseline = results[0]
+        baseline_levels = {
+            cr.get("concurrency"): _result_intervals(cr) for cr in baseline.get("results", [])
+        }
+
+        runs = []
+        for result in results[1:]:
+            by_concurrency = {}
+            for cr in result.get("results", []):
+                concurrency = cr.get("concurrency")
+                mine = baseline_levels.get(concurrency)
+                if not mine:
+                    continue
+                theirs = _result_intervals(cr)
+                tests = [
+                    compare_intervals(metric, mine[metric], theirs[metric]).model_dump()
+                    for metric in mine
+                    if metric in theirs
+                ]
+                if tests:
+                    by_concurrency[str(concurrency)] = tests
+            runs.append({"run_id": result.get("run_id", "unknown"), "by_concurrency": by_concurrency})
+
+        return {
+            "baseline_run_id": baseline.get("run_id", "unknown"),
+            "confidence": DEFAULT_CONFIDENCE,
+            "runs": runs,
+        }
@@ -0,0 +1,74 @@
+"""Agent command for distributed load generation."""
+
+import asyncio
+import sys
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from shared.core.distributed import DEFAULT_POLL_INTERVAL, DistributedAgent
+
+
+def agent_command(
+    coordinator: str = typer.Option(
+        ...,
+        "--coordinator", "-c",
+        help="Coordinator API URL (e.g., http://coordinator:8080)",
+    ),
+    name: Optional[str] = typer.Option(
+        None,
+        "--name", "-n",
+        help="Agent name shown by the coordinator (default: hostname)",
+    ),
+    api_key: Optional[str] = typer.Option(
+        None,
+        "--api-key",
+        help="Coordinator API key (X-API-Key)",
+        envvar="LLM_LOADTEST_API_KEY",
+    ),
+    poll_interval: float = typer.Option(
+        DEFAULT_POLL_INTERVAL,
+        "--poll-interval",
+        help="Seconds between polls for work",
+    ),
+) -> None:
+    """Join a coordinator as a distributed load-generation agent.
+
+    The agent registers with the coordinator, waits for runs, executes its
+    shard of each concurrency level at the synchronized start time and
+    uploads the results.
+
+    Examples:
+
+        # On each client host
+        llm-loadtest agent --coordinator http://coordinator:8080
+
+        # Then start a run on the coordinator
+        curl -X POST http://coordinator:8080/api/v1/distributed/runs \\
+            -H 'Content-Type: application/json' \\
+            -d '{"config": {"server_url": "http://vllm:8000", "model": "qwen3-14b",
+                 "concurrency": [64, 256], "num_prompts": 2000}}'
+    """
+    agent = DistributedAgent(
+        coordinator_url=coordinator,
+        name=name,
+        api_key=api_key,
+        poll_interval=poll_interval,
+    )
+
+    async def serve():
+        agent_id = await agent.register()
+        print(f"[llm-loadtest] Registered with {coordinator} as {agent.name} ({agent_id})")
+        print(f"[llm-loadtest] Clock offset: {agent.clock_offset * 1000:+.1f} ms")
+        print("[llm-loadtest] Waiting for runs... (Ctrl+C to stop)")
+        await agent.serve()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        print("\n[llm-loadtest] Agent stopped")
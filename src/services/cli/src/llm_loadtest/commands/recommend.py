@@ -15,6 +15,7 @@ sys.path.insert(0, str(project_root))
 from shared.core.load_generator import LoadGenerator
 from shared.core.models import BenchmarkConfig, WorkloadSpec
 from shared.core.recommend import InfraRecommender
+from shared.core.search import goodput_of
 from shared.adapters.base import AdapterFactory
 from shared.adapters.openai_compat import OpenAICompatibleAdapter  # Registers the adapter
 
@@ -79,6 +80,16 @@ def recommend_command(
         "--concurrency-steps",
         help="Concurrency levels to test (comma-separated)",
     ),
+    adaptive: bool = typer.Option(
+        False,
+        "--adaptive",
+        help="Search for the max concurrency meeting the SLO instead of testing fixed steps",
+    ),
+    max_concurrency: int = typer.Option(
+        512,
+        "--max-concurrency",
+        help="Upper bound of the adaptive search (default: 512)",
+    ),
     num_requests: int = typer.Option(
         50,
         "--num-requests", "-n",
@@ -118,7 +129,7 @@ def recommend_command(
     adapter: str = typer.Option(
         "openai",
         "--adapter",
-        help="Server adapter (openai, triton, trtllm)",
+        help="Server adapter (openai, triton, triton-grpc, trtllm, mock)",
     ),
     output: Optional[Path] = typer.Option(
         None,
@@ -145,6 +156,10 @@ def recommend_command(
         llm-loadtest recommend -s http://localhost:8000 -m qwen3-14b -p 500 \\
             --concurrency-steps 1,10,50,100,200,300
 
+        # Adaptive search (exponential ramp + binary search to the SLO knee)
+        llm-loadtest recommend -s http://localhost:8000 -m qwen3-14b -p 500 \\
+            --adaptive --max-concurrency 1024
+
         # Save results
         llm-loadtest recommend -s http://localhost:8000 -m qwen3-14b -p 500 \\
             -o recommendation.json
@@ -167,7 +182,10 @@ def recommend_command(
 
     # Parse concurrency steps
     steps = parse_concurrency_steps(concurrency_steps)
-    print(f"[llm-loadtest] Test concurrency levels: {steps}")
+    if adaptive:
+        print(f"[llm-loadtest] Adaptive search: concurrency {min(steps)} ~ {max_concurrency}")
+    else:
+        print(f"[llm-loadtest] Test concurrency levels: {steps}")
     print(f"[llm-loadtest] Requests per level: {num_requests}")
     print()
 
@@ -204,8 +222,9 @@ def recommend_command(
             model=model,
             api_key=api_key,
             timeout=timeout,
+            max_connections=max_concurrency if adaptive else max(steps),
         )
-    except ValueError as e:
+    except (ValueError, ImportError) as e:
         print(f"[llm-loadtest] Error: {e}")
         raise typer.Exit(1)
 
@@ -235,6 +254,8 @@ def recommend_command(
             num_requests_per_step=num_requests,
             headroom=headroom / 100.0,  # Convert percentage to decimal
             progress_callback=print_progress,
+            adaptive=adaptive,
+            max_concurrency=max_concurrency,
         )
 
         print()  # New line after progress
@@ -268,6 +289,24 @@ def recommend_command(
     print("└─────────────────────────────────────────────────────────────┘")
     print()
 
+    # Measured curve (adaptive search)
+    if adaptive:
+        print("┌─────────────────────────────────────────────────────────────┐")
+        print("│ MEASURED CURVE (adaptive search)                            │")
+        print("├─────────────────────────────────────────────────────────────┤")
+        for result in benchmark_result.results:
+            goodput = goodput_of(result)
+            mark = "✓" if goodput >= goodput_target else "✗"
+            row = (
+                f"{mark} c={result.concurrency:<5} goodput={goodput:5.1f}%  "
+                f"{result.throughput_tokens_per_sec:8.1f} tok/s"
+            )
+            print(f"│ {row:<59} │")
+        total = sum(r.total_requests for r in benchmark_result.results)
+        print(f"│ {f'Total requests: {total}':<59} │")
+        print("└─────────────────────────────────────────────────────────────┘")
+        print()
+
     # Estimated performance
     print("┌─────────────────────────────────────────────────────────────┐")
     print("│ ESTIMATED PERFORMANCE                                       │")
@@ -13,7 +13,16 @@ project_root = Path(__file__).parent.parent.parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from shared.core.load_generator import LoadGenerator
-from shared.core.models import BenchmarkConfig, GoodputThresholds
+from shared.core.models import (
+    BenchmarkConfig,
+    GoodputThresholds,
+    LengthDistribution,
+    LoadPhase,
+    LoadProfile,
+    TransportConfig,
+)
+from shared.core.profile import max_connections_for
+from shared.core.warmup import WarmupError, check_warmup
 from shared.adapters.base import AdapterFactory
 from shared.adapters.openai_compat import OpenAICompatibleAdapter  # Registers the adapter
 
@@ -44,6 +53,72 @@ def parse_goodput(value: Optional[str]) -> Optional[GoodputThresholds]:
     return thresholds
 
 
+def parse_length_dist(value: Optional[str]) -> Optional[LengthDistribution]:
+    """Parse a length distribution like 'uniform:128,1024' or 'lognormal:512,256'.
+
+    Formats: uniform:MIN,MAX | normal:MEAN,STD[,MIN,MAX] |
+    lognormal:MEAN,STD[,MIN,MAX] | empirical:PATH
+    """
+    if not value:
+        return None
+
+    kind, _, params = value.partition(":")
+    kind = kind.strip().lower()
+    if kind == "empirical":
+        return LengthDistribution(kind="empirical", path=params.strip())
+
+    numbers = [float(x) for x in params.split(",") if x.strip()]
+    if kind == "uniform" and len(numbers) == 2:
+        return LengthDistribution(kind="uniform", min=int(numbers[0]), max=int(numbers[1]))
+    if kind in ("normal", "lognormal") and len(numbers) in (2, 4):
+        bounds = {"min": int(numbers[2]), "max": int(numbers[3])} if len(numbers) == 4 else {}
+        return LengthDistribution(kind=kind, mean=numbers[0], std=numbers[1], **bounds)
+    raise typer.BadParameter(f"Invalid length distribution: {value}")
+
+
+def parse_load_profile(value: Optional[str], dimension: str) -> Optional[LoadProfile]:
+    """Parse a load profile like 'ramp:64:60,constant:64:300,spike:64-256:30:10'.
+
+    Each phase is SHAPE:[START-]TARGET:SECONDS[:EXTRA] where EXTRA is the
+    number of steps (step), spike width in seconds (spike) or sine period
+    in seconds (sine). A path to a JSON file with a LoadProfile also works.
+    """
+    if not value:
+        return None
+
+    path = Path(value)
+    if path.suffix == ".json" and path.exists():
+        return LoadProfile.model_validate_json(path.read_text())
+
+    extras = {"step": "steps", "spike": "spike_seconds", "sine": "period_seconds"}
+    phases = []
+    for part in value.split(","):
+        fields = [field.strip() for field in part.split(":")]
+        if len(fields) not in (3, 4):
+            raise typer.BadParameter(f"Invalid load profile phase: {part}")
+        shape, levels, seconds = fields[0].lower(), fields[1], fields[2]
+        start, _, target = levels.rpartition("-")
+        if len(fields) == 4 and shape not in extras:
+            raise typer.BadParameter(f"Phase '{shape}' takes no extra parameter: {part}")
+        try:
+            phase = {
+                "shape": shape,
+                "target": float(target),
+                "start": float(start) if start else None,
+                "duration_seconds": float(seconds),
+            }
+            if len(fields) == 4:
+                phase[extras[shape]] = float(fields[3])
+            phases.append(LoadPhase(**phase))
+        except ValueError as e:
+            raise typer.BadParameter(f"Invalid load profile phase '{part}': {e}")
+
+    try:
+        return LoadProfile(dimension=dimension, phases=phases)
+    except ValueError as e:
+        raise typer.BadParameter(f"Invalid load profile: {e}")
+
+
 def print_progress(current: int, total: int, message: Optional[str] = None) -> None:
     """Print simple progress bar."""
     if total == 0:
@@ -97,7 +172,33 @@ def run_command(
     warmup: int = typer.Option(
         3,
         "--warmup",
-        help="Number of warmup requests",
+        help="Number of warmup requests (requests mode)",
+    ),
+    warmup_mode: str = typer.Option(
+        "requests",
+        "--warmup-mode",
+        help="Warmup mode: requests (serial --warmup requests) or steady "
+        "(ramp to the first level and hold until TTFT is stable)",
+    ),
+    warmup_ramp: float = typer.Option(
+        10.0,
+        "--warmup-ramp",
+        help="Steady warmup: seconds to ramp up to the first concurrency",
+    ),
+    warmup_window: int = typer.Option(
+        20,
+        "--warmup-window",
+        help="Steady warmup: completions per TTFT window",
+    ),
+    warmup_tolerance: float = typer.Option(
+        0.05,
+        "--warmup-tolerance",
+        help="Steady warmup: max coefficient of variation of the last 3 window mean TTFTs",
+    ),
+    warmup_max: float = typer.Option(
+        120.0,
+        "--warmup-max",
+        help="Steady warmup: give up (not stable) after this many seconds",
     ),
     timeout: float = typer.Option(
         120.0,
@@ -113,7 +214,7 @@ def run_command(
     adapter: str = typer.Option(
         "openai",
         "--adapter",
-        help="Server adapter (openai, triton, trtllm)",
+        help="Server adapter (openai, triton, triton-grpc, trtllm, mock)",
     ),
     goodput: Optional[str] = typer.Option(
         None,
@@ -125,6 +226,146 @@ def run_command(
         "--duration", "-d",
         help="Test duration in seconds (alternative to --num-prompts)",
     ),
+    request_rate: Optional[float] = typer.Option(
+        None,
+        "--request-rate", "-r",
+        help="Open-loop request rate (req/s); --concurrency then caps in-flight requests",
+    ),
+    arrival: str = typer.Option(
+        "poisson",
+        "--arrival",
+        help="Inter-arrival distribution for --request-rate (poisson, constant, gamma)",
+    ),
+    burstiness: float = typer.Option(
+        1.0,
+        "--burstiness",
+        help="Gamma shape factor for --arrival gamma (<1 burstier, >1 smoother)",
+    ),
+    seed: Optional[int] = typer.Option(
+        None,
+        "--seed",
+        help="Random seed for the arrival schedule",
+    ),
+    metrics_mode: str = typer.Option(
+        "auto",
+        "--metrics-mode",
+        help="Percentile accuracy: exact, sketch (bounded memory, ~1% error), or auto",
+    ),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        min=1,
+        help="Load-generator processes; concurrency and requests are sharded across them",
+    ),
+    dataset: Optional[Path] = typer.Option(
+        None,
+        "--dataset",
+        exists=True,
+        dir_okay=False,
+        help="Prompt dataset (JSONL or ShareGPT JSON); replaces synthetic --input-len prompts",
+    ),
+    dataset_format: str = typer.Option(
+        "auto",
+        "--dataset-format",
+        help="Dataset format (auto, jsonl, sharegpt)",
+    ),
+    input_len_dist: Optional[str] = typer.Option(
+        None,
+        "--input-len-dist",
+        help="Per-request input lengths: uniform:MIN,MAX | normal:MEAN,STD | lognormal:MEAN,STD | empirical:FILE",
+    ),
+    output_len_dist: Optional[str] = typer.Option(
+        None,
+        "--output-len-dist",
+        help="Per-request max_tokens, same format as --input-len-dist",
+    ),
+    prefix_len: Optional[int] = typer.Option(
+        None,
+        "--prefix-len",
+        min=0,
+        help="Shared prefix tokens; generates exact-length unique prompts (0 = no sharing)",
+    ),
+    prefix_share: float = typer.Option(
+        1.0,
+        "--prefix-share",
+        min=0.0,
+        max=1.0,
+        help="Fraction of requests that carry the shared prefix (with --prefix-len)",
+    ),
+    convergence_width: Optional[float] = typer.Option(
+        None,
+        "--convergence-width",
+        help="Stop a level early once TTFT p50/p99 and throughput CIs are this narrow "
+        "(relative, e.g. 0.1); -n becomes the maximum",
+    ),
+    convergence_confidence: float = typer.Option(
+        0.95,
+        "--convergence-confidence",
+        help="Confidence level for --convergence-width",
+    ),
+    convergence_min: int = typer.Option(
+        100,
+        "--convergence-min",
+        min=1,
+        help="Requests per level before convergence is checked",
+    ),
+    profile: Optional[str] = typer.Option(
+        None,
+        "--profile",
+        help="Staged load profile replacing -c levels, e.g. "
+        "'ramp:64:60,constant:64:300,spike:64-256:30:10' (or a JSON file)",
+    ),
+    profile_dimension: str = typer.Option(
+        "concurrency",
+        "--profile-dimension",
+        help="What --profile drives: concurrency or request_rate (capped by -c)",
+    ),
+    timeline_interval: float = typer.Option(
+        1.0,
+        "--timeline-interval",
+        min=0.0,
+        help="Timeline bucket width in seconds for per-interval metrics (0 = off)",
+    ),
+    loop_lag_threshold: float = typer.Option(
+        10.0,
+        "--loop-lag-threshold",
+        min=0.1,
+        help="Client event-loop lag (ms) above which results are flagged client-saturated",
+    ),
+    http2: bool = typer.Option(
+        False,
+        "--http2",
+        help="Use HTTP/2 (ALPN over https, prior knowledge over http; needs the h2 package)",
+    ),
+    http2_max_streams: int = typer.Option(
+        100,
+        "--http2-max-streams",
+        min=1,
+        max=100,
+        help="Concurrent streams per HTTP/2 connection; more connections are opened as needed",
+    ),
+    uds: Optional[str] = typer.Option(
+        None,
+        "--uds",
+        help="Connect through this Unix domain socket (server on the same host)",
+    ),
+    tcp_nodelay: bool = typer.Option(
+        True,
+        "--tcp-nodelay/--no-tcp-nodelay",
+        help="Set TCP_NODELAY on connections (disable Nagle's algorithm)",
+    ),
+    tcp_keepalive: Optional[float] = typer.Option(
+        None,
+        "--tcp-keepalive",
+        min=1,
+        help="Enable TCP keep-alive probes after this many idle seconds",
+    ),
+    keepalive_expiry: float = typer.Option(
+        30.0,
+        "--keepalive-expiry",
+        min=0,
+        help="Close pooled connections idle for this many seconds",
+    ),
     output: Optional[Path] = typer.Option(
         None,
         "--output", "-o",
@@ -146,6 +387,30 @@ def run_command(
 
         # Duration-based test
         llm-loadtest run -s http://localhost:8000 -m qwen3-14b -c 50 --duration 60
+
+        # Open-loop Poisson arrivals at 10 req/s, at most 256 in flight
+        llm-loadtest run -s http://localhost:8000 -m qwen3-14b -c 256 --request-rate 10
+
+        # Prefix-cache study: 512-token system prompt shared by 80% of requests
+        llm-loadtest run -s http://localhost:8000 -m qwen3-14b --input-len 1024 --prefix-len 512 --prefix-share 0.8
+
+        # Varying request lengths (latency is also reported per length bin)
+        llm-loadtest run -s http://localhost:8000 -m qwen3-14b --input-len-dist lognormal:512,256 --output-len-dist uniform:64,512
+
+        # Stop each level once the 95% CIs are within 10% (at most 2000 requests)
+        llm-loadtest run -s http://localhost:8000 -m qwen3-14b -c 1,10,50 -n 2000 --convergence-width 0.1
+
+        # Ramp to 64 over 60s (excluded from results), hold 5 min, then a 10s spike to 256
+        llm-loadtest run -s http://localhost:8000 -m qwen3-14b --profile ramp:64:60,constant:64:300,spike:64-256:30:10
+
+        # Warm up at the first level until TTFT settles (at most 2 minutes)
+        llm-loadtest run -s http://localhost:8000 -m qwen3-14b -c 32,64 --warmup-mode steady
+
+        # Real prompts from a ShareGPT dataset
+        llm-loadtest run -s http://localhost:8000 -m qwen3-14b --dataset sharegpt.json
+
+        # Server on the same host, over a Unix domain socket with HTTP/2
+        llm-loadtest run -s http://localhost -m qwen3-14b --uds /tmp/vllm.sock --http2
     """
     print(f"[llm-loadtest] Starting load test...")
     print(f"[llm-loadtest] Server: {server}")
@@ -155,14 +420,62 @@ def run_command(
     # Parse options
     concurrency_levels = parse_concurrency(concurrency)
     goodput_thresholds = parse_goodput(goodput)
+    load_profile = parse_load_profile(profile, profile_dimension)
 
     print(f"[llm-loadtest] Concurrency levels: {concurrency_levels}")
 
-    if duration:
+    if load_profile:
+        total = sum(phase.duration_seconds for phase in load_profile.phases)
+        print(
+            f"[llm-loadtest] Load profile: {len(load_profile.phases)} phases over "
+            f"{total:g}s ({load_profile.dimension})"
+        )
+    elif duration:
         print(f"[llm-loadtest] Duration: {duration}s per concurrency level")
     else:
         print(f"[llm-loadtest] Prompts: {num_prompts} per concurrency level")
 
+    if warmup_mode == "steady":
+        print(
+            f"[llm-loadtest] Warmup: ramp {warmup_ramp:g}s, until TTFT CV <= "
+            f"{warmup_tolerance:.0%} (max {warmup_max:g}s)"
+        )
+    elif warmup_mode != "requests":
+        raise typer.BadParameter(f"Invalid warmup mode: {warmup_mode}")
+
+    if request_rate:
+        print(f"[llm-loadtest] Request rate: {request_rate} req/s ({arrival} arrivals)")
+
+    if workers > 1:
+        print(f"[llm-loadtest] Workers: {workers} processes")
+
+    transport = TransportConfig(
+        http_version="2" if http2 else "1.1",
+        http2_max_streams=http2_max_streams,
+        uds=uds,
+        tcp_nodelay=tcp_nodelay,
+        tcp_keepalive_seconds=tcp_keepalive,
+        keepalive_expiry=keepalive_expiry,
+    )
+    if http2 or uds:
+        via = f"unix:{uds}" if uds else "tcp"
+        streams = f", {http2_max_streams} streams/connection" if http2 else ""
+        print(f"[llm-loadtest] Transport: HTTP/{transport.http_version} over {via}{streams}")
+
+    if convergence_width:
+        print(
+            f"[llm-loadtest] Convergence: stop at {convergence_width:.0%} CI width "
+            f"({convergence_confidence:.0%} confidence, {convergence_min}~{num_prompts} requests)"
+        )
+
+    if dataset:
+        print(f"[llm-loadtest] Dataset: {dataset}")
+    elif prefix_len is not None:
+        print(
+            f"[llm-loadtest] Prompts: {prefix_len} shared prefix tokens "
+            f"on {prefix_share:.0%} of requests"
+        )
+
     if goodput_thresholds:
         thresholds_str = []
         if goodput_thresholds.ttft_ms:
@@ -184,9 +497,33 @@ def run_command(
         concurrency=concurrency_levels,
         stream=stream,
         warmup=warmup,
+        warmup_mode=warmup_mode,
+        warmup_ramp_seconds=warmup_ramp,
+        warmup_window=warmup_window,
+        warmup_tolerance=warmup_tolerance,
+        warmup_max_seconds=warmup_max,
         timeout=timeout,
         api_key=api_key,
         duration_seconds=duration,
+        request_rate=request_rate,
+        arrival_distribution=arrival,
+        burstiness=burstiness,
+        seed=seed,
+        metrics_mode=metrics_mode,
+        workers=workers,
+        dataset=str(dataset) if dataset else None,
+        dataset_format=dataset_format,
+        prefix_len=prefix_len,
+        prefix_share_ratio=prefix_share,
+        input_len_dist=parse_length_dist(input_len_dist),
+        output_len_dist=parse_length_dist(output_len_dist),
+        convergence_width=convergence_width,
+        convergence_confidence=convergence_confidence,
+        convergence_min_requests=convergence_min,
+        timeline_interval=timeline_interval or None,
+        loop_lag_threshold_ms=loop_lag_threshold,
+        load_profile=load_profile,
+        transport=transport,
         goodput_thresholds=goodput_thresholds,
     )
 
@@ -198,8 +535,10 @@ def run_command(
             model=model,
             api_key=api_key,
             timeout=timeout,
+            max_connections=max_connections_for(config),
+            transport=transport,
         )
-    except ValueError as e:
+    except (ValueError, ImportError) as e:
         print(f"[llm-loadtest] Error: {e}")
         raise typer.Exit(1)
 
@@ -212,20 +551,30 @@ def run_command(
         if not healthy:
             print(f"[llm-loadtest] Warning: Server health check failed, proceeding anyway...")
 
-        # Warmup
-        if warmup > 0:
+        # Warmup (steady mode runs inside the load generator)
+        warmup_result = None
+        if warmup_mode == "requests" and warmup > 0:
             print(f"[llm-loadtest] Running {warmup} warmup requests...")
-            await server_adapter.warmup(warmup, input_len // 4, output_len // 4)
+            warmup_result = await server_adapter.warmup(warmup, input_len // 4, output_len // 4)
+            check_warmup(warmup_result)
+        elif warmup_mode == "steady":
+            print(f"[llm-loadtest] Warming up until TTFT is stable...")
 
         # Run benchmark
         print(f"[llm-loadtest] Running load test...")
         result = await generator.run(config, progress_callback=print_progress)
         print()  # New line after progress bar
 
+        if warmup_result is not None:
+            result.warmup = warmup_result
         return result
 
     # Run async
-    result = asyncio.run(run_test())
+    try:
+        result = asyncio.run(run_test())
+    except WarmupError as e:
+        print(f"[llm-loadtest] Error: {e}")
+        raise typer.Exit(1)
 
     # Save result
     if output:
@@ -253,4 +602,51 @@ def run_command(
     if "avg_goodput_percent" in summary:
         print(f"[llm-loadtest]   Avg Goodput: {summary['avg_goodput_percent']:.1f}%")
 
+    if result.warmup:
+        warm = result.warmup
+        status = ""
+        if warm.stable is not None:
+            status = ", stable" if warm.stable else ", NOT stable (time limit)"
+        print(
+            f"[llm-loadtest]   Warmup: {warm.total_requests} requests in "
+            f"{warm.duration_seconds:.1f}s, {warm.failed_requests} failed{status}"
+        )
+
+    phase_results = [r for r in result.results + (result.transient_results or []) if r.phase]
+    for level in sorted(phase_results, key=lambda r: r.phase.index):
+        phase = level.phase
+        label = phase.name or phase.shape
+        steady = "" if phase.steady else " (transient)"
+        print(
+            f"[llm-loadtest]   Phase {phase.index + 1} {label}{steady}: "
+            f"{level.throughput_tokens_per_sec:.1f} tok/s, "
+            f"TTFT p50 {level.ttft.p50:.1f} ms, {level.total_requests} requests"
+        )
+
+    for level in result.results:
+        if level.e2e_corrected and level.e2e_corrected.p99 > level.e2e_latency.p99 * 1.05:
+            print(
+                f"[llm-loadtest]   c={level.concurrency}: E2E p99 {level.e2e_latency.p99:.1f} ms, "
+                f"{level.e2e_corrected.p99:.1f} ms corrected for coordinated omission"
+            )
+
+    for level in result.results:
+        if level.client_saturated:
+            print(
+                f"[llm-loadtest]   c={level.concurrency}: WARNING client saturated "
+                f"({level.saturated_requests} requests during event-loop lag up to "
+                f"{level.loop_lag.max:.1f} ms); latencies include client delay, try --workers"
+            )
+
+    for level in result.results:
+        if level.convergence:
+            conv = level.convergence
+            status = "converged" if conv.converged else "not converged"
+            p99 = conv.ttft_p99
+            p99_ci = f"{p99.lower:.1f}~{p99.upper:.1f} ms" if p99.lower is not None else "n/a"
+            print(
+                f"[llm-loadtest]   c={level.concurrency}: {status} after {conv.requests} "
+                f"requests (TTFT p99 CI {p99_ci})"
+            )
+
     print(f"[llm-loadtest] ─────────────────────────────────────────")
@@ -15,6 +15,7 @@ from llm_loadtest.commands.run import run_command
 from llm_loadtest.commands.info import info_command
 from llm_loadtest.commands.gpu import gpu_command
 from llm_loadtest.commands.recommend import recommend_command
+from llm_loadtest.commands.agent import agent_command
 
 app = typer.Typer(
     name="llm-loadtest",
@@ -72,6 +73,7 @@ app.command("run", help="Run load test against an LLM server")(run_command)
 app.command("info", help="Show system information")(info_command)
 app.command("gpu", help="Show GPU status")(gpu_command)
 app.command("recommend", help="Recommend GPU infrastructure for target workload")(recommend_command)
+app.command("agent", help="Run as a distributed load-generation agent")(agent_command)
 
 
 if __name__ == "__main__":
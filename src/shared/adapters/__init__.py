@@ -1,12 +1,16 @@
 """Server adapters for different LLM serving backends."""
 
 from shared.adapters.base import BaseAdapter, AdapterFactory
+from shared.adapters.mock import MockAdapter
 from shared.adapters.openai_compat import OpenAICompatibleAdapter
 from shared.adapters.triton import TritonAdapter
+from shared.adapters.triton_grpc import TritonGrpcAdapter
 
 __all__ = [
     "BaseAdapter",
     "AdapterFactory",
+    "MockAdapter",
     "OpenAICompatibleAdapter",
     "TritonAdapter",
+    "TritonGrpcAdapter",
 ]
@@ -1,9 +1,17 @@
 """Base adapter interface for LLM server backends."""
 
+import time
 from abc import ABC, abstractmethod
 from typing import Optional, Type
 
-from shared.core.models import RequestResult
+import httpx
+
+from shared.adapters.transport import build_transport
+from shared.core.models import RequestResult, TransportConfig, WarmupResult
+from shared.core.warmup import WarmupStats
+
+# Connection pool size used when the caller does not tie it to a concurrency level
+DEFAULT_MAX_CONNECTIONS = 100
 
 
 class BaseAdapter(ABC):
@@ -18,6 +26,8 @@ class BaseAdapter(ABC):
         model: str,
         api_key: Optional[str] = None,
         timeout: float = 120.0,
+        max_connections: Optional[int] = None,
+        transport: Optional[TransportConfig] = None,
     ):
         """Initialize the adapter.
 
@@ -26,11 +36,55 @@ class BaseAdapter(ABC):
             model: Model name to use.
             api_key: Optional API key for authentication.
             timeout: Request timeout in seconds.
+            max_connections: Connection pool size. Should be at least the highest
+                concurrency level so requests never queue for a connection.
+            transport: HTTP version, Unix socket and socket options.
         """
         self.server_url = server_url.rstrip("/")
         self.model = model
         self.api_key = api_key
         self.timeout = timeout
+        self.max_connections = max_connections or DEFAULT_MAX_CONNECTIONS
+        self.transport = transport or TransportConfig()
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_headers(self) -> dict[str, str]:
+        """Get HTTP headers for requests."""
+        headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        return headers
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create a pooled HTTP client sized to ``max_connections``."""
+        return httpx.AsyncClient(
+            base_url=self.server_url,
+            headers=self._get_headers(),
+            timeout=httpx.Timeout(self.timeout),
+            transport=build_transport(self.transport, self.max_connections, self.server_url),
+        )
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the long-lived HTTP client, creating it on first use.
+
+        The client is shared by all requests of this adapter so TCP (and TLS)
+        connections are reused via keep-alive instead of being re-established
+        for every request.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = self._create_client()
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client and release its connections.
+
+        Safe to call multiple times; the client is re-created lazily if the
+        adapter is used again afterwards.
+        """
+        if self._client is not None:
+            client = self._client
+            self._client = None
+            await client.aclose()
 
     @abstractmethod
     async def send_request(
@@ -67,20 +121,39 @@ class BaseAdapter(ABC):
         num_requests: int = 3,
         input_len: int = 64,
         output_len: int = 32,
-    ) -> None:
+    ) -> WarmupResult:
         """Run warmup requests before benchmark.
 
+        Requests are sent one after another; failures do not stop the warmup
+        but are counted in the returned report.
+
         Args:
             num_requests: Number of warmup requests.
             input_len: Input token length for warmup.
             output_len: Output token length for warmup.
+
+        Returns:
+            WarmupResult with request and failure counts.
         """
         prompt = "Hello, how are you? " * (input_len // 4)
+        stats = WarmupStats()
+        start_time = time.perf_counter()
         for i in range(num_requests):
             try:
-                await self.send_request(i, prompt, output_len, stream=False)
-            except Exception:
-                pass
+                result = await self.send_request(i, prompt, output_len, stream=False)
+            except Exception as e:
+                stats.add(False, f"{type(e).__name__}: {e}")
+            else:
+                stats.add(result.success, result.error_type)
+
+        return WarmupResult(
+            mode="requests",
+            concurrency=1,
+            total_requests=stats.total,
+            failed_requests=stats.failed,
+            duration_seconds=time.perf_counter() - start_time,
+            errors=stats.errors,
+        )
 
     @property
     @abstractmethod
@@ -112,6 +185,8 @@ class AdapterFactory:
         model: str,
         api_key: Optional[str] = None,
         timeout: float = 120.0,
+        max_connections: Optional[int] = None,
+        transport: Optional[TransportConfig] = None,
     ) -> BaseAdapter:
         """Create an adapter instance.
 
@@ -121,6 +196,8 @@ class AdapterFactory:
             model: Model name.
             api_key: Optional API key.
             timeout: Request timeout.
+            max_connections: Connection pool size (typically the max concurrency).
+            transport: HTTP transport options.
 
         Returns:
             Configured adapter instance.
@@ -138,6 +215,8 @@ class AdapterFactory:
             model=model,
             api_key=api_key,
             timeout=timeout,
+            max_connections=max_connections,
+            transport=transport,
         )
 
     @classmethod
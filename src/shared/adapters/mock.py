@@ -0,0 +1,304 @@
+"""Deterministic in-process adapter simulating a continuous-batching server.
+
+No network is involved: every adapter owns a ``BatchingEngine`` that runs
+the scheduling loop of a vLLM-style server on the event loop. Each engine
+step admits waiting requests FIFO (limited by the batch size, the per-step
+token budget and the KV-cache capacity), prefills them and decodes one token
+for every running sequence:
+
+    step_ms = decode_base_ms + decode_ms_per_seq * batch_size
+              + prefill_ms_per_token * prefilled_tokens
+
+The engine really sleeps through every step, paced against an absolute
+schedule so wall time tracks the engine clock, and the load generator sees
+the back-pressure it would see from a server. Reported latencies come from
+the engine's own clock: a request arriving during a step is stamped with the
+start of that step and its tokens with the end of the steps that produced
+them. The same workload therefore yields the same latencies on every run,
+whatever the host's scheduling jitter.
+
+The model is configured through query parameters of the server URL:
+
+    llm-loadtest run --adapter mock --server "mock://local?max_batch_size=64&decode_ms_per_seq=0.2"
+
+With ``--workers > 1`` every worker process simulates its own server.
+"""
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field, fields
+from typing import Optional
+from urllib.parse import parse_qsl, urlsplit
+
+from shared.adapters.base import AdapterFactory, BaseAdapter
+from shared.core.models import RequestResult, TransportConfig
+
+
+@dataclass
+class BatchingModel:
+    """Cost and capacity model of the simulated server.
+
+    Defaults roughly follow a 7-8B model on a single 80GB GPU.
+    """
+
+    max_batch_size: int = 256
+    max_batched_tokens: int = 8192
+    kv_capacity_tokens: int = 131072
+    prefill_ms_per_token: float = 0.05
+    decode_base_ms: float = 8.0
+    decode_ms_per_seq: float = 0.1
+    chars_per_token: int = 4
+
+    @classmethod
+    def from_url(cls, server_url: str) -> "BatchingModel":
+        """Build a model from the query parameters of ``server_url``.
+
+        Raises:
+            ValueError: If a parameter is unknown or not a number.
+        """
+        types = {f.name: f.type for f in fields(cls)}
+        overrides = {}
+        for name, value in parse_qsl(urlsplit(server_url).query):
+            if name not in types:
+                raise ValueError(
+                    f"Unknown mock server parameter: {name}. Available: {list(types)}"
+                )
+            overrides[name] = int(value) if types[name] in (int, "int") else float(value)
+        return cls(**overrides)
+
+    def step_ms(self, batch_size: int, prefill_tokens: int) -> float:
+        """Duration of one engine step."""
+        return (
+            self.decode_base_ms
+            + self.decode_ms_per_seq * batch_size
+            + self.prefill_ms_per_token * prefill_tokens
+        )
+
+
+@dataclass
+class Sequence:
+    """A request inside the simulated engine."""
+
+    input_tokens: int
+    output_tokens: int
+    arrival_ms: float
+    done: asyncio.Future
+    token_times_ms: list[float] = field(default_factory=list)
+
+    @property
+    def kv_tokens(self) -> int:
+        # KV 캐시는 입력+최대 출력 길이만큼 입장 시점에 예약
+        return self.input_tokens + self.output_tokens
+
+
+class BatchingEngine:
+    """Iteration-level scheduler of the simulated server.
+
+    Example:
+        >>> engine = BatchingEngine(BatchingModel(max_batch_size=8))
+        >>> seq = await engine.submit(input_tokens=128, output_tokens=64)
+        >>> ttft_ms = seq.token_times_ms[0] - seq.arrival_ms
+    """
+
+    def __init__(self, model: BatchingModel):
+        self.model = model
+        # 엔진 시계 (ms): 스텝이 끝날 때만 전진
+        self.clock_ms = 0.0
+        self.waiting: deque[Sequence] = deque()
+        self.running: list[Sequence] = []
+        self.kv_used = 0
+        self.steps = 0
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    async def submit(self, input_tokens: int, output_tokens: int) -> Sequence:
+        """Queue a request and wait until its last token is generated."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        seq = Sequence(
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            arrival_ms=self.clock_ms,
+            done=asyncio.get_running_loop().create_future(),
+        )
+        self.waiting.append(seq)
+        self._wakeup.set()
+        await seq.done
+        return seq
+
+    async def stop(self) -> None:
+        """Stop the scheduling loop, cancelling unfinished requests."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        for seq in [*self.running, *self.waiting]:
+            seq.done.cancel()
+        self.running.clear()
+        self.waiting.clear()
+        self.kv_used = 0
+
+    def _admit(self) -> int:
+        """Move waiting requests into the batch; returns the prefill tokens."""
+        model = self.model
+        # 스텝당 토큰 예산: 실행 중인 시퀀스의 디코드 토큰을 먼저 차감
+        budget = model.max_batched_tokens - len(self.running)
+        prefill = 0
+        while self.waiting and len(self.running) < model.max_batch_size:
+            seq = self.waiting[0]
+            if seq.done.cancelled():
+                self.waiting.popleft()
+                continue
+            if self.kv_used + seq.kv_tokens > model.kv_capacity_tokens:
+                break
+            # 예산보다 긴 프롬프트도 단독이면 한 스텝에 처리
+            if prefill and prefill + seq.input_tokens > budget:
+                break
+            self.waiting.popleft()
+            self.running.append(seq)
+            self.kv_used += seq.kv_tokens
+            prefill += seq.input_tokens
+        return prefill
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        # 엔진 시계 0에 해당하는 실제 시각 (유휴 후 재개할 때마다 재설정)
+        origin = loop.time()
+        while True:
+            if not self.waiting and not self.running:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                origin = loop.time() - self.clock_ms / 1000
+
+            prefill = self._admit()
+            step_ms = self.model.step_ms(len(self.running), prefill)
+            # 절대 일정 기준으로 대기하여 sleep 오차가 누적되지 않게 함
+            step_end = self.clock_ms + step_ms
+            await asyncio.sleep(max(origin + step_end / 1000 - loop.time(), 0))
+            self.clock_ms = step_end
+            self.steps += 1
+
+            finished = []
+            for seq in self.running:
+                seq.token_times_ms.append(self.clock_ms)
+                # 클라이언트가 취소한 요청은 실제 서버처럼 중단(abort)
+                if len(seq.token_times_ms) >= seq.output_tokens or seq.done.cancelled():
+                    finished.append(seq)
+            for seq in finished:
+                self.running.remove(seq)
+                self.kv_used -= seq.kv_tokens
+                if not seq.done.done():
+                    seq.done.set_result(None)
+
+
+class MockAdapter(BaseAdapter):
+    """Adapter backed by an in-process continuous-batching simulation.
+
+    For offline testing of the load generator, metrics and recommendation
+    pipeline; latencies follow ``BatchingModel`` instead of a real server.
+    """
+
+    def __init__(
+        self,
+        server_url: str,
+        model: str,
+        api_key: Optional[str] = None,
+        timeout: float = 120.0,
+        max_connections: Optional[int] = None,
+        transport: Optional[TransportConfig] = None,
+    ):
+        super().__init__(server_url, model, api_key, timeout, max_connections, transport)
+        self.batching = BatchingModel.from_url(server_url)
+        self._engine: Optional[BatchingEngine] = None
+
+    @property
+    def adapter_name(self) -> str:
+        return "mock"
+
+    @property
+    def engine(self) -> BatchingEngine:
+        """The simulated server, created on first use."""
+        if self._engine is None:
+            self._engine = BatchingEngine(self.batching)
+        return self._engine
+
+    async def send_request(
+        self,
+        request_id: int,
+        prompt: str,
+        max_tokens: int,
+        stream: bool,
+    ) -> RequestResult:
+        """Run a request through the simulated engine.
+
+        Args:
+            request_id: Request identifier.
+            prompt: Input prompt (its length sets the prefill cost).
+            max_tokens: Tokens to generate (always generated in full).
+            stream: Whether to report streaming timings (TTFT and ITL).
+
+        Returns:
+            RequestResult with simulated timing information.
+        """
+        input_tokens = max(1, len(prompt) // self.batching.chars_per_token)
+        output_tokens = max(1, max_tokens)
+
+        if input_tokens + output_tokens > self.batching.kv_capacity_tokens:
+            # 실제 서버라면 컨텍스트 길이 초과로 400 응답
+            return RequestResult(
+                request_id=request_id,
+                ttft_ms=0,
+                e2e_latency_ms=0,
+                input_tokens=input_tokens,
+                output_tokens=0,
+                success=False,
+                error_type="HTTP_400",
+            )
+
+        seq = await self.engine.submit(input_tokens, output_tokens)
+        times = seq.token_times_ms
+        e2e_ms = times[-1] - seq.arrival_ms
+
+        if not stream:
+            return RequestResult(
+                request_id=request_id,
+                ttft_ms=e2e_ms,
+                tpot_ms=e2e_ms / output_tokens,
+                e2e_latency_ms=e2e_ms,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                success=True,
+            )
+
+        ttft_ms = times[0] - seq.arrival_ms
+        itl_ms = [times[i] - times[i - 1] for i in range(1, len(times))]
+        return RequestResult(
+            request_id=request_id,
+            ttft_ms=ttft_ms,
+            tpot_ms=(e2e_ms - ttft_ms) / (output_tokens - 1) if output_tokens > 1 else None,
+            e2e_latency_ms=e2e_ms,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            success=True,
+            itl_ms=itl_ms or None,
+        )
+
+    async def health_check(self) -> bool:
+        """The simulated server is always reachable."""
+        return True
+
+    async def aclose(self) -> None:
+        """Stop the simulated server."""
+        if self._engine is not None:
+            engine = self._engine
+            self._engine = None
+            await engine.stop()
+        await super().aclose()
+
+
+# Register the adapter
+AdapterFactory.register("mock", MockAdapter)
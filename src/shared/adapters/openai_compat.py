@@ -1,41 +1,119 @@
 """OpenAI-compatible API adapter for vLLM, SGLang, Ollama, etc."""
 
 import json
-import time
 from typing import Optional
 
 import httpx
 
 from shared.adapters.base import BaseAdapter, AdapterFactory
+from shared.adapters.sse import DONE, SSEParser, scan_chunk
 from shared.core.models import RequestResult
+from shared.core.timing import elapsed_ms, now_ns
 from shared.core.tokenizer import TokenCounter
 
 
+def tokens_per_chunk(chunk_usage: list[Optional[int]], total_tokens: int) -> list[int]:
+    """Number of output tokens carried by each content chunk.
+
+    Servers may batch several tokens into one delta (multi-step scheduling,
+    speculative decoding). When every chunk reports cumulative usage the exact
+    per-chunk counts are used; otherwise ``total_tokens`` (the final usage) is
+    spread evenly over the chunks.
+
+    Args:
+        chunk_usage: Cumulative completion tokens per chunk, or None if unknown.
+        total_tokens: Total output tokens of the request.
+
+    Returns:
+        Token count per chunk (one per chunk when nothing better is known).
+    """
+    n = len(chunk_usage)
+    if n == 0:
+        return []
+
+    if all(c is not None for c in chunk_usage):
+        counts = [chunk_usage[0]] + [
+            chunk_usage[i] - chunk_usage[i - 1] for i in range(1, n)
+        ]
+        if all(c > 0 for c in counts):
+            return counts
+
+    if total_tokens <= n:
+        return [1] * n
+    base, extra = divmod(total_tokens, n)
+    return [base + 1 if i < extra else base for i in range(n)]
+
+
+def weighted_itl(chunk_times: list[int], chunk_tokens: list[int]) -> list[float]:
+    """Inter-token latencies (ms) weighted by tokens per chunk.
+
+    A gap of ``d`` before a chunk carrying ``k`` tokens contributes ``k``
+    samples of ``d / k``, so batched deltas do not show up as one long gap.
+
+    Args:
+        chunk_times: ``perf_counter_ns`` arrival timestamps of the content chunks.
+        chunk_tokens: Tokens carried by each chunk.
+
+    Returns:
+        ITL samples in milliseconds.
+    """
+    itl_ms: list[float] = []
+    for i in range(1, len(chunk_times)):
+        k = chunk_tokens[i]
+        gap_ms = elapsed_ms(chunk_times[i - 1], chunk_times[i])
+        if k == 1:
+            itl_ms.append(gap_ms)
+        else:
+            itl_ms.extend([gap_ms / k] * k)
+    return itl_ms
+
+
+def delta_text(payloads: list[bytes]) -> str:
+    """Concatenated ``delta.content`` of chat-completion chunk payloads."""
+    parts = []
+    for payload in payloads:
+        try:
+            data = json.loads(payload)
+        except json.JSONDecodeError:
+            continue
+        if not isinstance(data, dict):
+            continue
+        choices = data.get("choices") or []
+        if choices:
+            parts.append((choices[0].get("delta") or {}).get("content") or "")
+    return "".join(parts)
+
+
+# 알 수 없는 요청 필드를 거부할 때 쓰이는 상태 코드
+_VALIDATION_STATUSES = ("HTTP_400", "HTTP_422")
+
+
+def mentions_stream_options(detail: str) -> bool:
+    """Whether an error body blames the ``stream_options`` field."""
+    return "stream_options" in detail or "include_usage" in detail
+
+
 class OpenAICompatibleAdapter(BaseAdapter):
     """Adapter for OpenAI-compatible API servers.
 
     Supports: vLLM, SGLang, Ollama, LMDeploy, and other OpenAI API-compatible servers.
+
+    Streaming requests ask for ``stream_options.include_usage``. A 400/422
+    is retried once without the field if the error names it, or if no
+    request with the field has succeeded yet. The field is left out of later
+    requests (``include_usage`` turns False) only when the error names it or
+    the retry succeeds; output tokens are then counted locally from the
+    streamed text.
     """
 
+    include_usage: bool = True
+    # stream_options를 포함한 요청이 한 번이라도 성공했는지
+    usage_accepted: bool = False
+
     @property
     def adapter_name(self) -> str:
         return "openai"
 
-    def _get_headers(self) -> dict[str, str]:
-        """Get HTTP headers for requests."""
-        headers = {"Content-Type": "application/json"}
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
-        return headers
-
-    async def _create_client(self) -> httpx.AsyncClient:
-        """Create HTTP client."""
-        return httpx.AsyncClient(
-            base_url=self.server_url,
-            headers=self._get_headers(),
-            timeout=httpx.Timeout(self.timeout),
-        )
-
     async def send_request(
         self,
         request_id: int,
@@ -59,110 +137,185 @@ class OpenAICompatibleAdapter(BaseAdapter):
         else:
             return await self._send_non_streaming(request_id, prompt, max_tokens)
 
+    def _prompt_tokens(self, prompt: str, usage: Optional[dict]) -> int:
+        """Prompt token count, preferring the server-reported usage.
+
+        Re-tokenizing the prompt locally is only a fallback for servers that
+        do not report usage.
+        """
+        if usage and usage.get("prompt_tokens") is not None:
+            return usage["prompt_tokens"]
+        return TokenCounter.count(prompt, self.model)
+
     async def _send_streaming(
         self,
         request_id: int,
         prompt: str,
         max_tokens: int,
     ) -> RequestResult:
-        """Send a streaming request and measure latencies."""
+        """Send a streaming request and measure latencies.
+
+        Retries once without ``stream_options`` if the server may have
+        rejected it.
+        """
+        if not self.include_usage:
+            result, _ = await self._stream(request_id, prompt, max_tokens, False)
+            return result
+
+        result, detail = await self._stream(request_id, prompt, max_tokens, True)
+        if result.success:
+            self.usage_accepted = True
+            return result
+        if result.error_type not in _VALIDATION_STATUSES:
+            return result
+
+        named = mentions_stream_options(detail)
+        # 필드를 받아들인 서버의 400(컨텍스트 초과 등)은 재시도하지 않음
+        if not named and self.usage_accepted:
+            return result
+        retry, _ = await self._stream(request_id, prompt, max_tokens, False)
+        if named or retry.success:
+            self.include_usage = False
+        return retry if retry.success else result
+
+    async def _stream(
+        self,
+        request_id: int,
+        prompt: str,
+        max_tokens: int,
+        include_usage: bool,
+    ) -> tuple[RequestResult, str]:
+        """One streaming attempt, optionally asking for the usage chunk.
+
+        Returns:
+            The result and, for HTTP errors, the response body.
+        """
         payload = {
             "model": self.model,
             "messages": [{"role": "user", "content": prompt}],
             "max_tokens": max_tokens,
             "stream": True,
         }
-
-        start_time = time.perf_counter()
-        first_token_time: Optional[float] = None
-        token_times: list[float] = []
-        output_tokens = 0
+        if include_usage:
+            # 마지막 청크로 서버 측 usage를 받아 정확한 토큰 수 사용
+            payload["stream_options"] = {"include_usage": True}
+
+        # 클라이언트 생성(SSL 컨텍스트 로드 등)은 측정 구간에서 제외
+        client = self._get_client()
+        start_time = now_ns()
+        # 청크 도착 시각: 파싱 전, 네트워크 읽기가 반환된 시점
+        chunk_times: list[int] = []
+        # 청크별 누적 completion_tokens (서버가 청크마다 usage를 줄 때만 채워짐)
+        chunk_usage: list[Optional[int]] = []
+        # usage가 없을 때만 디코딩해 로컬로 셀 content 청크 원본
+        chunk_payloads: list[bytes] = []
+        usage: Optional[dict] = None
+        stream_error = False
 
         try:
-            async with await self._create_client() as client:
-                async with client.stream(
-                    "POST",
-                    "/v1/chat/completions",
-                    json=payload,
-                ) as response:
-                    response.raise_for_status()
-
-                    async for line in response.aiter_lines():
-                        if not line or not line.startswith("data: "):
-                            continue
-
-                        data_str = line[6:]
-                        if data_str == "[DONE]":
-                            break
-
-                        try:
-                            data = json.loads(data_str)
-                            choices = data.get("choices", [])
-                            if choices and choices[0].get("delta", {}).get("content"):
-                                current_time = time.perf_counter()
-
-                                if first_token_time is None:
-                                    first_token_time = current_time
-                                else:
-                                    token_times.append(current_time)
-
-                                output_tokens += 1
-                        except json.JSONDecodeError:
-                            continue
-
-            end_time = time.perf_counter()
+            async with client.stream(
+                "POST",
+                "/v1/chat/completions",
+                json=payload,
+            ) as response:
+                if response.is_error:
+                    # 오류 본문을 읽어 두어야 거부된 필드를 확인할 수 있음
+                    await response.aread()
+                response.raise_for_status()
 
-            if first_token_time is None:
-                first_token_time = end_time
+                parser = SSEParser()
+                done = False
+                async for raw in response.aiter_bytes():
+                    arrived = now_ns()
+                    for chunk in parser.feed(raw):
+                        if chunk == DONE:
+                            done = True
+                            break
 
-            ttft_ms = (first_token_time - start_time) * 1000
-            e2e_ms = (end_time - start_time) * 1000
+                        has_content, data = scan_chunk(chunk)
+                        cumulative = None
+                        if data is not None:
+                            if data.get("error"):
+                                stream_error = True
+                                done = True
+                                break
+                            if data.get("usage"):
+                                usage = data["usage"]
+                                cumulative = usage.get("completion_tokens")
+
+                        if has_content:
+                            chunk_times.append(arrived)
+                            chunk_usage.append(cumulative)
+                            chunk_payloads.append(chunk)
+                    if done:
+                        break
+
+            end_time = now_ns()
+            input_tokens = self._prompt_tokens(prompt, usage)
+
+            if stream_error:
+                return RequestResult(
+                    request_id=request_id,
+                    ttft_ms=0,
+                    e2e_latency_ms=elapsed_ms(start_time, end_time),
+                    input_tokens=input_tokens,
+                    output_tokens=len(chunk_times),
+                    success=False,
+                    error_type="StreamError",
+                ), ""
+
+            first_token_time = chunk_times[0] if chunk_times else end_time
+            if usage and usage.get("completion_tokens") is not None:
+                output_tokens = usage["completion_tokens"]
+            else:
+                # usage 미보고 서버: 스트림된 텍스트를 로컬 토크나이저로 계산
+                text = delta_text(chunk_payloads)
+                output_tokens = TokenCounter.count(text, self.model) if text else 0
+                output_tokens = output_tokens or len(chunk_times)
+
+            ttft_ms = elapsed_ms(start_time, first_token_time)
+            e2e_ms = elapsed_ms(start_time, end_time)
 
             tpot_ms: Optional[float] = None
-            itl_ms: Optional[list[float]] = None
-
             if output_tokens > 1:
-                tpot_ms = (end_time - first_token_time) * 1000 / (output_tokens - 1)
+                tpot_ms = elapsed_ms(first_token_time, end_time) / (output_tokens - 1)
 
-            if len(token_times) > 1:
-                itl_ms = [
-                    (token_times[i] - token_times[i - 1]) * 1000
-                    for i in range(1, len(token_times))
-                ]
+            chunk_tokens = tokens_per_chunk(chunk_usage, output_tokens)
+            itl_ms = weighted_itl(chunk_times, chunk_tokens) or None
 
             return RequestResult(
                 request_id=request_id,
                 ttft_ms=ttft_ms,
                 tpot_ms=tpot_ms,
                 e2e_latency_ms=e2e_ms,
-                input_tokens=TokenCounter.count(prompt, self.model),  # Approximate
+                input_tokens=input_tokens,
                 output_tokens=output_tokens,
                 success=True,
                 itl_ms=itl_ms,
-            )
+            ), ""
 
         except httpx.HTTPStatusError as e:
-            end_time = time.perf_counter()
+            end_time = now_ns()
             return RequestResult(
                 request_id=request_id,
                 ttft_ms=0,
-                e2e_latency_ms=(end_time - start_time) * 1000,
+                e2e_latency_ms=elapsed_ms(start_time, end_time),
                 input_tokens=TokenCounter.count(prompt, self.model),
                 output_tokens=0,
                 success=False,
                 error_type=f"HTTP_{e.response.status_code}",
-            )
+            ), e.response.text
         except Exception as e:
-            end_time = time.perf_counter()
+            end_time = now_ns()
             return RequestResult(
                 request_id=request_id,
                 ttft_ms=0,
-                e2e_latency_ms=(end_time - start_time) * 1000,
+                e2e_latency_ms=elapsed_ms(start_time, end_time),
                 input_tokens=TokenCounter.count(prompt, self.model),
                 output_tokens=0,
                 success=False,
                 error_type=type(e).__name__,
-            )
+            ), ""
 
     async def _send_non_streaming(
         self,
@@ -178,50 +331,52 @@ class OpenAICompatibleAdapter(BaseAdapter):
             "stream": False,
         }
 
-        start_time = time.perf_counter()
+        # 클라이언트 생성(SSL 컨텍스트 로드 등)은 측정 구간에서 제외
+        client = self._get_client()
+        start_time = now_ns()
 
         try:
-            async with await self._create_client() as client:
-                response = await client.post("/v1/chat/completions", json=payload)
-                response.raise_for_status()
+            response = await client.post("/v1/chat/completions", json=payload)
+            response.raise_for_status()
 
-                end_time = time.perf_counter()
-                data = response.json()
+            end_time = now_ns()
+            data = response.json()
 
-                output_tokens = data.get("usage", {}).get("completion_tokens", 0)
-                input_tokens = data.get("usage", {}).get("prompt_tokens", TokenCounter.count(prompt, self.model))
+            usage = data.get("usage") or {}
+            output_tokens = usage.get("completion_tokens", 0)
+            input_tokens = self._prompt_tokens(prompt, usage)
 
-                e2e_ms = (end_time - start_time) * 1000
-                ttft_ms = e2e_ms  # Non-streaming: TTFT = E2E
-                tpot_ms = e2e_ms / output_tokens if output_tokens > 0 else None
+            e2e_ms = elapsed_ms(start_time, end_time)
+            ttft_ms = e2e_ms  # Non-streaming: TTFT = E2E
+            tpot_ms = e2e_ms / output_tokens if output_tokens > 0 else None
 
-                return RequestResult(
-                    request_id=request_id,
-                    ttft_ms=ttft_ms,
-                    tpot_ms=tpot_ms,
-                    e2e_latency_ms=e2e_ms,
-                    input_tokens=input_tokens,
-                    output_tokens=output_tokens,
-                    success=True,
-                )
+            return RequestResult(
+                request_id=request_id,
+                ttft_ms=ttft_ms,
+                tpot_ms=tpot_ms,
+                e2e_latency_ms=e2e_ms,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                success=True,
+            )
 
         except httpx.HTTPStatusError as e:
-            end_time = time.perf_counter()
+            end_time = now_ns()
             return RequestResult(
                 request_id=request_id,
                 ttft_ms=0,
-                e2e_latency_ms=(end_time - start_time) * 1000,
+                e2e_latency_ms=elapsed_ms(start_time, end_time),
                 input_tokens=TokenCounter.count(prompt, self.model),
                 output_tokens=0,
                 success=False,
                 error_type=f"HTTP_{e.response.status_code}",
             )
         except Exception as e:
-            end_time = time.perf_counter()
+            end_time = now_ns()
             return RequestResult(
                 request_id=request_id,
                 ttft_ms=0,
-                e2e_latency_ms=(end_time - start_time) * 1000,
+                e2e_latency_ms=elapsed_ms(start_time, end_time),
                 input_tokens=TokenCounter.count(prompt, self.model),
                 output_tokens=0,
                 success=False,
@@ -230,20 +385,19 @@ class OpenAICompatibleAdapter(BaseAdapter):
 
     async def health_check(self) -> bool:
         """Check if the server is healthy and reachable."""
+        client = self._get_client()
         try:
-            async with await self._create_client() as client:
-                # Try /health first (vLLM)
-                response = await client.get("/health")
-                if response.status_code == 200:
-                    return True
+            # Try /health first (vLLM)
+            response = await client.get("/health")
+            if response.status_code == 200:
+                return True
         except Exception:
             pass
 
         try:
-            async with await self._create_client() as client:
-                # Try /v1/models (OpenAI standard)
-                response = await client.get("/v1/models")
-                return response.status_code == 200
+            # Try /v1/models (OpenAI standard)
+            response = await client.get("/v1/models")
+            return response.status_code == 200
         except Exception:
             return False
 
@@ -0,0 +1,102 @@
+"""Byte-level Server-Sent Events parser for OpenAI-style streams.
+
+Decoding every chunk with ``aiter_lines`` + ``json.loads`` only to learn
+whether ``delta.content`` is non-empty dominates client CPU at high
+concurrency. ``SSEParser`` splits ``aiter_bytes`` buffers into ``data:``
+payloads without decoding text, and ``scan_chunk`` classifies a payload with
+byte searches, falling back to a full JSON decode only for chunks that carry
+``usage``, a non-null ``finish_reason`` or an ``error``.
+"""
+
+import json
+import re
+from typing import Optional
+
+DONE = b"[DONE]"
+
+# 문자열 내부의 따옴표는 항상 이스케이프되므로 (\") 아래 패턴은 JSON 키에만 매칭됨
+_CONTENT_RE = re.compile(rb'"content"\s*:\s*"(?!")')
+_NEEDS_DECODE_RE = re.compile(
+    rb'"usage"\s*:\s*\{|"finish_reason"\s*:\s*"|"error"\s*:\s*[{"]'
+)
+
+
+class SSEParser:
+    """Incremental parser turning raw SSE bytes into ``data:`` payloads.
+
+    Network reads do not respect line boundaries, so a partial trailing line
+    is kept until the next ``feed``. Comments, ``event:``/``id:`` fields and
+    blank lines are dropped.
+
+    Example:
+        >>> parser = SSEParser()
+        >>> parser.feed(b'data: {"a": 1}\\n\\ndata: [DO')
+        [b'{"a": 1}']
+        >>> parser.feed(b'NE]\\n\\n')
+        [b'[DONE]']
+    """
+
+    __slots__ = ("_pending",)
+
+    def __init__(self):
+        self._pending = b""
+
+    def feed(self, data: bytes) -> list[bytes]:
+        """Consume a chunk of bytes and return the completed payloads.
+
+        Args:
+            data: Raw bytes read from the response body.
+
+        Returns:
+            ``data:`` field values of the lines completed by this chunk.
+        """
+        if self._pending:
+            data = self._pending + data
+        lines = data.split(b"\n")
+        self._pending = lines.pop()
+
+        payloads = []
+        for line in lines:
+            if not line.startswith(b"data:"):
+                continue
+            # "data:" 뒤의 공백 하나와 CRLF의 \r 제거
+            payload = line[5:].strip()
+            if payload:
+                payloads.append(payload)
+        return payloads
+
+    def flush(self) -> list[bytes]:
+        """Return the payload of an unterminated final line, if any."""
+        pending, self._pending = self._pending, b""
+        if pending.startswith(b"data:"):
+            payload = pending[5:].strip()
+            if payload:
+                return [payload]
+        return []
+
+
+def scan_chunk(payload: bytes) -> tuple[bool, Optional[dict]]:
+    """Classify a chat-completion chunk payload.
+
+    Args:
+        payload: ``data:`` value other than ``[DONE]``.
+
+    Returns:
+        ``(has_content, decoded)``. ``decoded`` is the parsed JSON object when
+        the chunk carries usage, a finish reason or an error (so the caller can
+        read them), otherwise None and ``has_content`` comes from the byte scan.
+        Malformed JSON is reported as ``(False, None)``.
+    """
+    if _NEEDS_DECODE_RE.search(payload) is None:
+        return _CONTENT_RE.search(payload) is not None, None
+
+    try:
+        data = json.loads(payload)
+    except json.JSONDecodeError:
+        return False, None
+    if not isinstance(data, dict):
+        return False, None
+
+    choices = data.get("choices") or []
+    has_content = bool(choices and (choices[0].get("delta") or {}).get("content"))
+    return has_content, data
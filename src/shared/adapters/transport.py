@@ -0,0 +1,138 @@
+"""HTTP transports shared by the HTTP-based adapters.
+
+``build_transport`` turns a ``TransportConfig`` into the httpx transport the
+adapter's client is created with:
+
+- HTTP/1.1 (default): one pooled connection per in-flight request.
+- HTTP/2: requests are multiplexed as streams. httpcore puts every stream on
+  a single connection (capped at 100, excess requests silently queue and
+  inflate TTFT), so ``HTTP2LaneTransport`` spreads them over
+  ``ceil(max_connections / http2_max_streams)`` connections instead.
+- Unix domain socket: same protocols without TCP, for a server on the same
+  host.
+
+Socket options (TCP_NODELAY, TCP keep-alive) apply to TCP connections only.
+"""
+
+import math
+import socket
+from typing import AsyncIterator, Callable, Optional
+
+import httpx
+
+from shared.core.models import TransportConfig
+
+
+def socket_options(transport: TransportConfig) -> list[tuple[int, int, int]]:
+    """Socket options for new TCP connections."""
+    if transport.uds:
+        return []
+
+    options = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, int(transport.tcp_nodelay))]
+    if transport.tcp_keepalive_seconds is not None:
+        seconds = max(1, round(transport.tcp_keepalive_seconds))
+        options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        # 리눅스 외 플랫폼에는 일부 상수가 없음
+        for name in ("TCP_KEEPIDLE", "TCP_KEEPINTVL"):
+            if hasattr(socket, name):
+                options.append((socket.IPPROTO_TCP, getattr(socket, name), seconds))
+    return options
+
+
+def build_transport(
+    transport: TransportConfig, max_connections: int, server_url: str
+) -> httpx.AsyncBaseTransport:
+    """Create the httpx transport for an adapter.
+
+    Args:
+        transport: Transport options.
+        max_connections: Highest number of concurrent requests.
+        server_url: Server base URL (decides ALPN vs. prior-knowledge HTTP/2).
+
+    Returns:
+        Transport to pass to ``httpx.AsyncClient``.
+    """
+    http2 = transport.http_version == "2"
+    options = dict(
+        # 평문 http:// 에서는 ALPN이 없으므로 HTTP/2 prior knowledge(h2c)로 연결
+        http1=not http2 or server_url.startswith("https://"),
+        http2=http2,
+        uds=transport.uds,
+        socket_options=socket_options(transport) or None,
+    )
+
+    if not http2:
+        return httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=transport.keepalive_expiry,
+            ),
+            **options,
+        )
+
+    lanes = math.ceil(max_connections / transport.http2_max_streams)
+    return HTTP2LaneTransport(
+        [
+            httpx.AsyncHTTPTransport(
+                limits=httpx.Limits(
+                    max_connections=1,
+                    max_keepalive_connections=1,
+                    keepalive_expiry=transport.keepalive_expiry,
+                ),
+                **options,
+            )
+            for _ in range(lanes)
+        ]
+    )
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response body that calls ``release`` once when closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release: Optional[Callable[[], None]] = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._release is not None:
+                self._release()
+                self._release = None
+
+
+class HTTP2LaneTransport(httpx.AsyncBaseTransport):
+    """HTTP/2 over several connections ("lanes") with a bounded stream count.
+
+    Each request goes to the lane with the fewest open streams; a stream
+    counts as open until its response body is closed.
+    """
+
+    def __init__(self, lanes: list[httpx.AsyncHTTPTransport]):
+        self._lanes = lanes
+        self.active = [0] * len(lanes)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        lane = min(range(len(self._lanes)), key=self.active.__getitem__)
+        self.active[lane] += 1
+
+        def release() -> None:
+            self.active[lane] -= 1
+
+        try:
+            response = await self._lanes[lane].handle_async_request(request)
+        except BaseException:
+            release()
+            raise
+        response.stream = _ReleasingStream(response.stream, release)
+        return response
+
+    async def aclose(self) -> None:
+        for lane in self._lanes:
+            await lane.aclose()
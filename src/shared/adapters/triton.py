@@ -4,13 +4,13 @@ Supports Triton Inference Server with TensorRT-LLM backend.
 """
 
 import json
-import time
 from typing import Optional
 
 import httpx
 
 from shared.adapters.base import BaseAdapter, AdapterFactory
-from shared.core.models import RequestResult
+from shared.core.models import RequestResult, TransportConfig
+from shared.core.timing import elapsed_ms, now_ns
 
 
 class TritonAdapter(BaseAdapter):
@@ -30,27 +30,14 @@ class TritonAdapter(BaseAdapter):
         model: str,
         api_key: Optional[str] = None,
         timeout: float = 120.0,
+        max_connections: Optional[int] = None,
+        transport: Optional[TransportConfig] = None,
     ):
-        super().__init__(server_url, model, api_key, timeout)
+        super().__init__(server_url, model, api_key, timeout, max_connections, transport)
         # Triton model name and version
         self.model_name = model
         self.model_version = "1"  # Default version
 
-    def _get_headers(self) -> dict[str, str]:
-        """Get HTTP headers for requests."""
-        headers = {"Content-Type": "application/json"}
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
-        return headers
-
-    async def _create_client(self) -> httpx.AsyncClient:
-        """Create HTTP client."""
-        return httpx.AsyncClient(
-            base_url=self.server_url,
-            headers=self._get_headers(),
-            timeout=httpx.Timeout(self.timeout),
-        )
-
     async def send_request(
         self,
         request_id: int,
@@ -83,66 +70,67 @@ class TritonAdapter(BaseAdapter):
             "top_p": 0.9,
         }
 
-        start_time = time.perf_counter()
-        first_token_time: Optional[float] = None
-        token_times: list[float] = []
+        # 클라이언트 생성(SSL 컨텍스트 로드 등)은 측정 구간에서 제외
+        client = self._get_client()
+        start_time = now_ns()
+        first_token_time: Optional[int] = None
+        token_times: list[int] = []
         output_tokens = 0
         output_text = ""
 
         try:
-            async with await self._create_client() as client:
-                # Triton streaming endpoint
-                endpoint = f"/v2/models/{self.model_name}/generate_stream"
-
-                async with client.stream(
-                    "POST",
-                    endpoint,
-                    json=payload,
-                ) as response:
-                    response.raise_for_status()
-
-                    async for line in response.aiter_lines():
-                        if not line:
-                            continue
+            # Triton streaming endpoint
+            endpoint = f"/v2/models/{self.model_name}/generate_stream"
+
+            async with client.stream(
+                "POST",
+                endpoint,
+                json=payload,
+            ) as response:
+                response.raise_for_status()
 
-                        # Triton returns JSON objects, one per line
-                        try:
-                            data = json.loads(line)
-                            text_output = data.get("text_output", "")
+                async for line in response.aiter_lines():
+                    # 파싱 전에 도착 시각 기록
+                    arrived = now_ns()
+                    if not line:
+                        continue
 
-                            if text_output:
-                                current_time = time.perf_counter()
+                    # Triton returns JSON objects, one per line
+                    try:
+                        data = json.loads(line)
+                        text_output = data.get("text_output", "")
 
-                                if first_token_time is None:
-                                    first_token_time = current_time
-                                else:
-                                    token_times.append(current_time)
+                        if text_output:
+                            if first_token_time is None:
+                                first_token_time = arrived
+                            else:
+                                token_times.append(arrived)
 
-                                # Count new tokens (approximate by word/space)
-                                new_text = text_output[len(output_text):]
-                                output_tokens += len(new_text.split())
-                                output_text = text_output
+                            # Count new tokens (approximate by word/space)
+                            new_text = text_output[len(output_text):]
+                            output_tokens += len(new_text.split())
+                            output_text = text_output
 
-                        except json.JSONDecodeError:
-                            continue
+                    except json.JSONDecodeError:
+                        continue
 
-            end_time = time.perf_counter()
+            end_time = now_ns()
 
             if first_token_time is None:
                 first_token_time = end_time
 
-            ttft_ms = (first_token_time - start_time) * 1000
-            e2e_ms = (end_time - start_time) * 1000
+            ttft_ms = elapsed_ms(start_time, first_token_time)
+            e2e_ms = elapsed_ms(start_time, end_time)
 
             tpot_ms: Optional[float] = None
             itl_ms: Optional[list[float]] = None
 
             if output_tokens > 1:
-                tpot_ms = (end_time - first_token_time) * 1000 / (output_tokens - 1)
+                tpot_ms = elapsed_ms(first_token_time, end_time) / (output_tokens - 1)
 
             if len(token_times) > 1:
                 itl_ms = [
-                    (token_times[i] - token_times[i - 1]) * 1000
+                    elapsed_ms(token_times[i - 1], token_times[i])
                     for i in range(1, len(token_times))
                 ]
 
@@ -158,22 +146,22 @@ class TritonAdapter(BaseAdapter):
             )
 
         except httpx.HTTPStatusError as e:
-            end_time = time.perf_counter()
+            end_time = now_ns()
             return RequestResult(
                 request_id=request_id,
                 ttft_ms=0,
-                e2e_latency_ms=(end_time - start_time) * 1000,
+                e2e_latency_ms=elapsed_ms(start_time, end_time),
                 input_tokens=len(prompt.split()),
                 output_tokens=0,
                 success=False,
                 error_type=f"HTTP_{e.response.status_code}",
             )
         except Exception as e:
-            end_time = time.perf_counter()
+            end_time = now_ns()
             return RequestResult(
                 request_id=request_id,
                 ttft_ms=0,
-                e2e_latency_ms=(end_time - start_time) * 1000,
+                e2e_latency_ms=elapsed_ms(start_time, end_time),
                 input_tokens=len(prompt.split()),
                 output_tokens=0,
                 success=False,
@@ -195,53 +183,54 @@ class TritonAdapter(BaseAdapter):
             "top_p": 0.9,
         }
 
-        start_time = time.perf_counter()
+        # 클라이언트 생성(SSL 컨텍스트 로드 등)은 측정 구간에서 제외
+        client = self._get_client()
+        start_time = now_ns()
 
         try:
-            async with await self._create_client() as client:
-                # Triton generate endpoint
-                endpoint = f"/v2/models/{self.model_name}/generate"
-                response = await client.post(endpoint, json=payload)
-                response.raise_for_status()
+            # Triton generate endpoint
+            endpoint = f"/v2/models/{self.model_name}/generate"
+            response = await client.post(endpoint, json=payload)
+            response.raise_for_status()
 
-                end_time = time.perf_counter()
-                data = response.json()
+            end_time = now_ns()
+            data = response.json()
 
-                text_output = data.get("text_output", "")
-                output_tokens = len(text_output.split())
-                input_tokens = len(prompt.split())
+            text_output = data.get("text_output", "")
+            output_tokens = len(text_output.split())
+            input_tokens = len(prompt.split())
 
-                e2e_ms = (end_time - start_time) * 1000
-                ttft_ms = e2e_ms
-                tpot_ms = e2e_ms / output_tokens if output_tokens > 0 else None
+            e2e_ms = elapsed_ms(start_time, end_time)
+            ttft_ms = e2e_ms
+            tpot_ms = e2e_ms / output_tokens if output_tokens > 0 else None
 
-                return RequestResult(
-                    request_id=request_id,
-                    ttft_ms=ttft_ms,
-                    tpot_ms=tpot_ms,
-                    e2e_latency_ms=e2e_ms,
-                    input_tokens=input_tokens,
-                    output_tokens=output_tokens,
-                    success=True,
-                )
+            return RequestResult(
+                request_id=request_id,
+                ttft_ms=ttft_ms,
+                tpot_ms=tpot_ms,
+                e2e_latency_ms=e2e_ms,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                success=True,
+            )
 
         except httpx.HTTPStatusError as e:
-            end_time = time.perf_counter()
+            end_time = now_ns()
             return RequestResult(
                 request_id=request_id,
                 ttft_ms=0,
-                e2e_latency_ms=(end_time - start_time) * 1000,
+                e2e_latency_ms=elapsed_ms(start_time, end_time),
                 input_tokens=len(prompt.split()),
                 output_tokens=0,
                 success=False,
                 error_type=f"HTTP_{e.response.status_code}",
             )
         except Exception as e:
-            end_time = time.perf_counter()
+            end_time = now_ns()
             return RequestResult(
                 request_id=request_id,
                 ttft_ms=0,
-                e2e_latency_ms=(end_time - start_time) * 1000,
+                e2e_latency_ms=elapsed_ms(start_time, end_time),
                 input_tokens=len(prompt.split()),
                 output_tokens=0,
                 success=False,
@@ -251,18 +240,18 @@ class TritonAdapter(BaseAdapter):
     async def health_check(self) -> bool:
         """Check if Triton server is healthy."""
         try:
-            async with await self._create_client() as client:
-                # Triton health endpoint
-                response = await client.get("/v2/health/ready")
-                return response.status_code == 200
+            client = self._get_client()
+            # Triton health endpoint
+            response = await client.get("/v2/health/ready")
+            return response.status_code == 200
         except Exception:
             return False
 
         # Also check model status
         try:
-            async with await self._create_client() as client:
-                response = await client.get(f"/v2/models/{self.model_name}/ready")
-                return response.status_code == 200
+            client = self._get_client()
+            response = await client.get(f"/v2/models/{self.model_name}/ready")
+            return response.status_code == 200
         except Exception:
             return False
 
@@ -0,0 +1,339 @@
+"""Triton Inference Server gRPC streaming adapter.
+
+Sends each request as one ``ModelStreamInfer`` bidirectional stream, the
+protocol Triton uses for decoupled models such as the TensorRT-LLM
+ensemble: the server sends one response per decoding step and a final
+response flagged with the ``triton_final_response`` parameter.
+
+Unlike the HTTP ``generate_stream`` adapter, output tokens are counted per
+response instead of re-splitting the cumulative text:
+
+- If the model returns ``output_ids``, its last dimension is the number of
+  tokens carried by the response (several with speculative decoding).
+- Otherwise (e.g. the default TensorRT-LLM ensemble, which returns only
+  ``text_output``) the response's delta text is counted with
+  ``TokenCounter`` once the stream has ended.
+
+Requests are spread over ``ceil(max_connections / http2_max_streams)``
+channels, each with its own HTTP/2 connection, routing every stream to the
+channel with the fewest open streams.
+
+Requires the ``tritonclient[grpc]`` package:
+
+    llm-loadtest run --adapter triton-grpc --server grpc://localhost:8001 --model ensemble
+"""
+
+import math
+import struct
+from typing import Optional
+from urllib.parse import urlsplit
+
+from shared.adapters.base import AdapterFactory, BaseAdapter
+from shared.adapters.openai_compat import weighted_itl
+from shared.core.models import RequestResult, TransportConfig
+from shared.core.timing import elapsed_ms, now_ns
+from shared.core.tokenizer import TokenCounter
+
+# Same limit as tritonclient: prompts of long-context workloads exceed the 4MB default
+MAX_GRPC_MESSAGE_SIZE = 2**31 - 1
+
+# Lazy import to avoid import errors if tritonclient[grpc] is not installed
+_grpc = None
+
+
+def _get_grpc():
+    """Lazy load grpc and the Triton gRPC service definitions.
+
+    Returns:
+        Tuple of (grpc, service_pb2, service_pb2_grpc).
+
+    Raises:
+        ImportError: If tritonclient[grpc] is not installed.
+    """
+    global _grpc
+    if _grpc is None:
+        try:
+            import grpc
+            from tritonclient.grpc import service_pb2, service_pb2_grpc
+        except ImportError as e:
+            raise ImportError(
+                "The triton-grpc adapter requires tritonclient[grpc]. "
+                "Install with: pip install 'llm-loadtest[triton-grpc]'"
+            ) from e
+        _grpc = (grpc, service_pb2, service_pb2_grpc)
+    return _grpc
+
+
+def grpc_target(server_url: str, transport: TransportConfig) -> tuple[str, bool]:
+    """gRPC channel target and whether TLS is used.
+
+    Accepts ``grpc://host:port``, ``grpcs://host:port``, ``http(s)://host:port``
+    or a bare ``host:port``. A Unix socket from the transport options wins.
+    """
+    if "://" in server_url:
+        parts = urlsplit(server_url)
+        address, secure = parts.netloc, parts.scheme in ("grpcs", "https")
+    else:
+        address, secure = server_url, False
+    if transport.uds:
+        return f"unix:{transport.uds}", False
+    return address, secure
+
+
+def channel_options(transport: TransportConfig) -> list[tuple[str, int]]:
+    """gRPC channel arguments for the transport options.
+
+    gRPC always uses HTTP/2 with TCP_NODELAY; ``tcp_keepalive_seconds`` maps
+    to HTTP/2 keep-alive pings.
+    """
+    options = [
+        ("grpc.max_send_message_length", MAX_GRPC_MESSAGE_SIZE),
+        ("grpc.max_receive_message_length", MAX_GRPC_MESSAGE_SIZE),
+        # 채널이 같은 대상이라도 서브채널(TCP 연결)을 공유하지 않도록 설정
+        ("grpc.use_local_subchannel_pool", 1),
+    ]
+    if transport.tcp_keepalive_seconds is not None:
+        options += [
+            ("grpc.keepalive_time_ms", max(1, round(transport.tcp_keepalive_seconds * 1000))),
+            ("grpc.keepalive_permit_without_calls", 1),
+        ]
+    return options
+
+
+def output_tokens(response, output_name: str = "output_ids") -> Optional[int]:
+    """Tokens carried by a ``ModelInferResponse``, if it returns ``output_name``."""
+    for output in response.outputs:
+        if output.name == output_name:
+            return output.shape[-1] if output.shape else 0
+    return None
+
+
+def text_output(response, output_name: str = "text_output") -> str:
+    """First element of the BYTES output ``output_name`` (empty if absent)."""
+    for index, output in enumerate(response.outputs):
+        if output.name != output_name:
+            continue
+        if index < len(response.raw_output_contents):
+            raw = response.raw_output_contents[index]
+            # BYTES 텐서: 원소마다 4바이트 길이 + 본문
+            if len(raw) >= 4:
+                (length,) = struct.unpack_from("<I", raw)
+                return raw[4:4 + length].decode("utf-8", errors="replace")
+        elif output.contents.bytes_contents:
+            return output.contents.bytes_contents[0].decode("utf-8", errors="replace")
+    return ""
+
+
+class TritonStreamError(Exception):
+    """Error reported by the server inside a ``ModelStreamInfer`` stream."""
+
+
+class TritonGrpcAdapter(BaseAdapter):
+    """Adapter for Triton Inference Server over gRPC streaming.
+
+    For TensorRT-LLM (or any decoupled model) taking ``text_input``,
+    ``max_tokens`` and ``stream`` inputs.
+    """
+
+    @property
+    def adapter_name(self) -> str:
+        return "triton-grpc"
+
+    def __init__(
+        self,
+        server_url: str,
+        model: str,
+        api_key: Optional[str] = None,
+        timeout: float = 120.0,
+        max_connections: Optional[int] = None,
+        transport: Optional[TransportConfig] = None,
+    ):
+        super().__init__(server_url, model, api_key, timeout, max_connections, transport)
+        # 의존성이 없으면 생성 시점에 실패
+        _get_grpc()
+        self.target, self.secure = grpc_target(self.server_url, self.transport)
+        self.metadata = (("authorization", f"Bearer {api_key}"),) if api_key else None
+        self._channels: list = []
+        self._stubs: list = []
+        self.active: list[int] = []
+
+    def _open_channels(self) -> None:
+        """Open one channel per ``http2_max_streams`` concurrent requests."""
+        grpc, _, service_pb2_grpc = _get_grpc()
+        lanes = math.ceil(self.max_connections / self.transport.http2_max_streams)
+        options = channel_options(self.transport)
+        for _ in range(lanes):
+            if self.secure:
+                channel = grpc.aio.secure_channel(
+                    self.target, grpc.ssl_channel_credentials(), options=options
+                )
+            else:
+                channel = grpc.aio.insecure_channel(self.target, options=options)
+            self._channels.append(channel)
+            self._stubs.append(service_pb2_grpc.GRPCInferenceServiceStub(channel))
+        self.active = [0] * lanes
+
+    def _build_request(self, request_id: int, prompt: str, max_tokens: int, stream: bool):
+        """Build the ``ModelInferRequest`` with raw (pre-serialized) input tensors."""
+        _, service_pb2, _ = _get_grpc()
+        request = service_pb2.ModelInferRequest(model_name=self.model, id=str(request_id))
+        request.parameters["triton_enable_empty_final_response"].bool_param = True
+
+        text = prompt.encode("utf-8")
+        for name, datatype, raw in (
+            ("text_input", "BYTES", struct.pack("<I", len(text)) + text),
+            ("max_tokens", "INT32", struct.pack("<i", max_tokens)),
+            ("stream", "BOOL", struct.pack("<?", stream)),
+        ):
+            request.inputs.add(name=name, datatype=datatype, shape=[1, 1])
+            request.raw_input_contents.append(raw)
+        return request
+
+    async def send_request(
+        self,
+        request_id: int,
+        prompt: str,
+        max_tokens: int,
+        stream: bool,
+    ) -> RequestResult:
+        """Send a request as one ``ModelStreamInfer`` stream.
+
+        Non-streaming requests use the same RPC with ``stream`` set to false,
+        since decoupled models reject unary ``ModelInfer``.
+        """
+        grpc, service_pb2, _ = _get_grpc()
+        # 채널 생성과 요청 직렬화는 측정 구간에서 제외
+        if not self._stubs:
+            self._open_channels()
+        lane = min(range(len(self._stubs)), key=self.active.__getitem__)
+        request = self._build_request(request_id, prompt, max_tokens, stream)
+
+        async def requests():
+            yield request
+
+        self.active[lane] += 1
+        start_time = now_ns()
+        chunk_times: list[int] = []
+        chunk_tokens: list[int] = []
+        # output_ids가 없는 응답: (청크 인덱스, 델타 텍스트)
+        chunk_texts: list[tuple[int, str]] = []
+        call = None
+
+        try:
+            call = self._stubs[lane].ModelStreamInfer(
+                requests(), metadata=self.metadata, timeout=self.timeout
+            )
+            async for message in call:
+                # 파싱 전에 도착 시각 기록
+                arrived = now_ns()
+                if message.error_message:
+                    raise TritonStreamError(message.error_message)
+
+                response = message.infer_response
+                if response.outputs:
+                    tokens = output_tokens(response)
+                    if tokens is None:
+                        # 토큰화는 스트림이 끝난 뒤로 미뤄 수신 경로를 가볍게 유지
+                        chunk_texts.append((len(chunk_times), text_output(response)))
+                        tokens = 0
+                    chunk_times.append(arrived)
+                    chunk_tokens.append(tokens)
+
+                if response.parameters["triton_final_response"].bool_param:
+                    break
+
+            end_time = now_ns()
+            input_tokens = TokenCounter.count(prompt, self.model)
+            for index, text in chunk_texts:
+                chunk_tokens[index] = TokenCounter.count(text, self.model) if text else 0
+            # 토큰이 없는 응답(빈 델타)은 TTFT·ITL에서 제외
+            chunks = [(t, k) for t, k in zip(chunk_times, chunk_tokens) if k > 0]
+            chunk_times = [t for t, _ in chunks]
+            chunk_tokens = [k for _, k in chunks]
+            total = sum(chunk_tokens)
+
+            if not stream:
+                e2e_ms = elapsed_ms(start_time, end_time)
+                return RequestResult(
+                    request_id=request_id,
+                    ttft_ms=e2e_ms,
+                    tpot_ms=e2e_ms / total if total > 0 else None,
+                    e2e_latency_ms=e2e_ms,
+                    input_tokens=input_tokens,
+                    output_tokens=total,
+                    success=True,
+                )
+
+            first_token_time = chunk_times[0] if chunk_times else end_time
+            tpot_ms: Optional[float] = None
+            if total > 1:
+                tpot_ms = elapsed_ms(first_token_time, end_time) / (total - 1)
+
+            return RequestResult(
+                request_id=request_id,
+                ttft_ms=elapsed_ms(start_time, first_token_time),
+                tpot_ms=tpot_ms,
+                e2e_latency_ms=elapsed_ms(start_time, end_time),
+                input_tokens=input_tokens,
+                output_tokens=total,
+                success=True,
+                itl_ms=weighted_itl(chunk_times, chunk_tokens) or None,
+            )
+
+        except grpc.aio.AioRpcError as e:
+            return self._failure(request_id, prompt, start_time, f"GRPC_{e.code().name}")
+        except Exception as e:
+            return self._failure(request_id, prompt, start_time, type(e).__name__)
+        finally:
+            self.active[lane] -= 1
+            if call is not None:
+                # 최종 응답 이후 스트림을 닫아 서버 측 자원을 즉시 해제
+                call.cancel()
+
+    def _failure(
+        self, request_id: int, prompt: str, start_time: int, error_type: str
+    ) -> RequestResult:
+        """Result of a failed request."""
+        return RequestResult(
+            request_id=request_id,
+            ttft_ms=0,
+            e2e_latency_ms=elapsed_ms(start_time, now_ns()),
+            input_tokens=TokenCounter.count(prompt, self.model),
+            output_tokens=0,
+            success=False,
+            error_type=error_type,
+        )
+
+    async def health_check(self) -> bool:
+        """Check that the server and the model are ready."""
+        _, service_pb2, _ = _get_grpc()
+        if not self._stubs:
+            self._open_channels()
+        stub = self._stubs[0]
+        try:
+            server = await stub.ServerReady(
+                service_pb2.ServerReadyRequest(), metadata=self.metadata, timeout=self.timeout
+            )
+            model = await stub.ModelReady(
+                service_pb2.ModelReadyRequest(name=self.model),
+                metadata=self.metadata,
+                timeout=self.timeout,
+            )
+            return server.ready and model.ready
+        except Exception:
+            return False
+
+    async def aclose(self) -> None:
+        """Close all gRPC channels.
+
+        Safe to call multiple times; channels are re-opened lazily if the
+        adapter is used again afterwards.
+        """
+        channels, self._channels, self._stubs, self.active = self._channels, [], [], []
+        for channel in channels:
+            await channel.close()
+        await super().aclose()
+
+
+# Register the adapter
+AdapterFactory.register("triton-grpc", TritonGrpcAdapter)
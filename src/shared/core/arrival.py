@@ -0,0 +1,110 @@
+"""Inter-arrival schedulers for open-loop (request-rate) load generation.
+
+Closed-loop load (a fixed number of concurrent workers) only sends a new
+request when a previous one finishes, so the offered load drops as soon as
+the server slows down. Open-loop load sends requests on a schedule that is
+independent of the server, which is how production traffic behaves.
+"""
+
+from typing import Iterator, Literal, Optional
+
+import numpy as np
+
+ArrivalDistribution = Literal["poisson", "constant", "gamma"]
+
+# Number of inter-arrival times drawn per batch when the schedule is unbounded
+_BATCH_SIZE = 1024
+
+
+class ArrivalScheduler:
+    """Generate request send times for a target request rate.
+
+    Distributions:
+        - poisson: exponential inter-arrival times (memoryless traffic).
+        - constant: fixed 1/rate spacing.
+        - gamma: gamma inter-arrival times with shape ``burstiness``.
+          burstiness < 1 is burstier than Poisson, > 1 is smoother,
+          and 1.0 is equivalent to Poisson.
+
+    Example:
+        >>> scheduler = ArrivalScheduler(request_rate=10.0, distribution="poisson", seed=0)
+        >>> offsets = scheduler.offsets(100)  # seconds since start
+    """
+
+    def __init__(
+        self,
+        request_rate: float,
+        distribution: ArrivalDistribution = "poisson",
+        burstiness: float = 1.0,
+        seed: Optional[int] = None,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            request_rate: Target mean request rate (requests/second).
+            distribution: Inter-arrival distribution.
+            burstiness: Gamma shape factor (only used for "gamma").
+            seed: Optional random seed for a reproducible schedule.
+
+        Raises:
+            ValueError: If rate or burstiness is not positive, or the
+                distribution is unknown.
+        """
+        if request_rate <= 0:
+            raise ValueError(f"request_rate must be positive, got {request_rate}")
+        if burstiness <= 0:
+            raise ValueError(f"burstiness must be positive, got {burstiness}")
+        if distribution not in ("poisson", "constant", "gamma"):
+            raise ValueError(f"Unknown arrival distribution: {distribution}")
+
+        self.request_rate = request_rate
+        self.distribution = distribution
+        self.burstiness = burstiness
+        self._rng = np.random.default_rng(seed)
+
+    def intervals(self, n: int) -> np.ndarray:
+        """Draw ``n`` inter-arrival times in seconds.
+
+        Args:
+            n: Number of intervals to draw.
+
+        Returns:
+            Array of inter-arrival times (seconds) with mean 1/request_rate.
+        """
+        mean_interval = 1.0 / self.request_rate
+
+        if self.distribution == "constant":
+            return np.full(n, mean_interval)
+        if self.distribution == "gamma":
+            # shape * scale = mean, so scale = mean / shape
+            return self._rng.gamma(self.burstiness, mean_interval / self.burstiness, n)
+        return self._rng.exponential(mean_interval, n)
+
+    def offsets(self, n: int) -> np.ndarray:
+        """Return send times (seconds since start) for ``n`` requests.
+
+        The first request is sent immediately at offset 0.
+
+        Args:
+            n: Number of requests.
+
+        Returns:
+            Monotonically non-decreasing array of send offsets.
+        """
+        if n <= 0:
+            return np.empty(0)
+        intervals = self.intervals(n - 1)
+        return np.concatenate(([0.0], np.cumsum(intervals)))
+
+    def iter_offsets(self) -> Iterator[float]:
+        """Yield an unbounded sequence of send offsets (seconds since start).
+
+        Used by duration-based runs where the request count is not known
+        in advance. Intervals are drawn in batches to keep the hot loop cheap.
+        """
+        current = 0.0
+        yield current
+        while True:
+            for interval in self.intervals(_BATCH_SIZE):
+                current += float(interval)
+                yield current
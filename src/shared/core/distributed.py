@@ -0,0 +1,744 @@
+"""Distributed load generation across multiple client hosts.
+
+One client NIC and CPU cannot saturate a multi-node inference cluster, so a
+run can be spread over several agent hosts:
+
+1. Agents register with a coordinator (the API service) and poll for work.
+2. ``DistributedCoordinator.create_run`` shards every concurrency level of a
+   BenchmarkConfig across the registered agents (same sharding as
+   ``--workers``: concurrency, request count and request rate are split,
+   request ids are interleaved).
+3. With ``warmup > 0`` every agent first sends its warmup requests; the
+   first level opens once all agents have reported their warmup.
+4. Each level opens at a coordinator timestamp. Agents correct for clock
+   offset measured at registration and start together.
+5. Agents upload their serialized MetricsAggregator (columnar records or
+   sketches). When every shard of a level is in, the coordinator merges them
+   into one ConcurrencyResult and opens the next level.
+6. After the last level the coordinator assembles a single BenchmarkResult.
+
+A stage (warmup or level) that is not complete ``level_timeout`` seconds
+after it opened (plus ``duration_seconds`` in duration mode) fails the run,
+e.g. when an agent dies mid-level.
+
+Steady-state warmup, load profiles, multi-process workers and convergence
+stopping are not supported and are rejected by ``create_run``.
+"""
+
+import asyncio
+import logging
+import socket
+import time
+import uuid
+from datetime import datetime
+from typing import Callable, Optional
+
+import httpx
+from pydantic import BaseModel, Field
+
+from shared.core.load_generator import LoadGenerator
+from shared.core.metrics import MetricsAggregator
+from shared.core.models import (
+    BenchmarkConfig,
+    BenchmarkResult,
+    ConcurrencyResult,
+    WarmupResult,
+)
+from shared.core.warmup import MAX_REPORTED_ERRORS
+from shared.core.workers import (
+    AdapterBuilder,
+    WorkerShard,
+    adapter_builder_from_config,
+    plan_shards,
+)
+
+logger = logging.getLogger(__name__)
+
+# Time between run creation and the first level start (seconds)
+DEFAULT_START_DELAY = 2.0
+
+# Time between the last report of a level and the next level start (seconds)
+DEFAULT_LEVEL_GAP = 1.0
+
+# Agent polling interval (seconds)
+DEFAULT_POLL_INTERVAL = 0.5
+
+# Time a warmup or level may take before the run is failed (seconds)
+DEFAULT_LEVEL_TIMEOUT = 1800.0
+
+
+class AgentRegistration(BaseModel):
+    """Agent registration request."""
+
+    name: str = Field(description="Agent display name (usually the hostname)")
+
+
+class AgentInfo(BaseModel):
+    """Registered agent."""
+
+    agent_id: str = Field(description="Agent identifier")
+    name: str = Field(description="Agent display name")
+    registered_at: datetime = Field(description="Registration timestamp")
+
+
+class RegistrationResponse(BaseModel):
+    """Response to an agent registration."""
+
+    agent_id: str = Field(description="Assigned agent identifier")
+    server_time: float = Field(description="Coordinator Unix time (for clock offset)")
+
+
+class RunAssignment(BaseModel):
+    """A distributed run an agent should take part in."""
+
+    run_id: str = Field(description="Distributed run identifier")
+    config: BenchmarkConfig = Field(description="Full benchmark configuration")
+    num_levels: int = Field(description="Number of concurrency levels")
+
+
+class LevelAssignment(BaseModel):
+    """An agent's part of one concurrency level."""
+
+    run_id: str = Field(description="Distributed run identifier")
+    level: int = Field(description="Concurrency level index")
+    concurrency: int = Field(description="Total concurrency of the level")
+    ready: bool = Field(description="Whether the level start time is set")
+    start_at: Optional[float] = Field(default=None, description="Coordinator Unix start time")
+    shard: Optional[WorkerShard] = Field(
+        default=None, description="This agent's shard (None if it sits this level out)"
+    )
+    server_time: float = Field(description="Coordinator Unix time")
+    failed: bool = Field(default=False, description="Run failed; agents stop working on it")
+
+
+class WarmupReport(BaseModel):
+    """Warmup results uploaded by an agent."""
+
+    agent_id: str = Field(description="Reporting agent")
+    warmup: WarmupResult = Field(description="The agent's warmup report")
+
+
+class LevelReport(BaseModel):
+    """Per-level results uploaded by an agent."""
+
+    agent_id: str = Field(description="Reporting agent")
+    duration_seconds: float = Field(description="Agent-measured level duration")
+    aggregator: dict = Field(description="Serialized MetricsAggregator")
+
+
+class DistributedRunStatus(BaseModel):
+    """Progress of a distributed run."""
+
+    run_id: str = Field(description="Distributed run identifier")
+    status: str = Field(description="running, completed or failed")
+    agent_ids: list[str] = Field(description="Participating agents")
+    completed_levels: int = Field(description="Levels merged so far")
+    total_levels: int = Field(description="Number of concurrency levels")
+    error: Optional[str] = Field(default=None, description="Why the run failed")
+
+
+def check_distributed_config(config: BenchmarkConfig) -> None:
+    """Reject options the agents cannot apply.
+
+    Raises:
+        ValueError: If the config uses an option distributed runs do not support.
+    """
+    unsupported = []
+    if config.warmup > 0 and config.warmup_mode == "steady":
+        unsupported.append("warmup_mode=steady")
+    if config.load_profile is not None:
+        unsupported.append("load_profile")
+    if config.workers > 1:
+        unsupported.append("workers > 1 (add agents instead)")
+    if config.convergence_width is not None:
+        unsupported.append("convergence_width")
+    if unsupported:
+        raise ValueError(f"Not supported in distributed runs: {', '.join(unsupported)}")
+
+
+def merge_warmups(reports: list[WarmupResult]) -> WarmupResult:
+    """Combine the agents' warmups, which run in parallel, into one report."""
+    errors: list[str] = []
+    for report in reports:
+        for error in report.errors:
+            if error not in errors and len(errors) < MAX_REPORTED_ERRORS:
+                errors.append(error)
+    return WarmupResult(
+        mode="requests",
+        concurrency=len(reports),
+        total_requests=sum(r.total_requests for r in reports),
+        failed_requests=sum(r.failed_requests for r in reports),
+        duration_seconds=max(r.duration_seconds for r in reports),
+        errors=errors,
+    )
+
+
+class _DistributedRun:
+    """Coordinator-side state of one distributed run."""
+
+    def __init__(
+        self,
+        run_id: str,
+        config: BenchmarkConfig,
+        agent_ids: list[str],
+        start_at: float,
+        level_timeout: float,
+        on_complete: Optional[Callable[[BenchmarkResult], None]] = None,
+        on_fail: Optional[Callable[[str, str], None]] = None,
+    ):
+        self.run_id = run_id
+        self.config = config
+        self.agent_ids = agent_ids
+        self.level_timeout = level_timeout
+        self.on_complete = on_complete
+        self.on_fail = on_fail
+        self.started_at = datetime.now()
+
+        # Per level: agent_id -> shard (agents without a shard sit the level out)
+        self.shards: list[dict[str, WorkerShard]] = []
+        for concurrency in config.concurrency:
+            level_shards = plan_shards(config, concurrency, len(agent_ids))
+            self.shards.append(dict(zip(agent_ids, level_shards)))
+
+        # With warmup the first level opens once every agent has warmed up
+        self.level_start: dict[int, float] = {} if config.warmup > 0 else {0: start_at}
+        self.warmup_reports: dict[str, WarmupResult] = {}
+        self.warmup: Optional[WarmupResult] = None
+        self.reports: dict[int, dict[str, LevelReport]] = {}
+        self.results: list[ConcurrencyResult] = []
+        self.result: Optional[BenchmarkResult] = None
+        self.error: Optional[str] = None
+
+        # Unix time by which the current stage must complete
+        self.deadline: Optional[float] = None
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def completed(self) -> bool:
+        return self.result is not None
+
+    @property
+    def failed(self) -> bool:
+        return self.error is not None
+
+    @property
+    def finished(self) -> bool:
+        return self.completed or self.failed
+
+    def missing_agents(self) -> list[str]:
+        """Agents that have not reported the current stage yet."""
+        if 0 not in self.level_start:
+            return [a for a in self.agent_ids if a not in self.warmup_reports]
+        level = len(self.results)
+        reports = self.reports.get(level, {})
+        return [a for a in self.shards[level] if a not in reports]
+
+
+class DistributedCoordinator:
+    """Hands out shards to agents and merges their per-level results.
+
+    The coordinator is transport-agnostic; the API exposes it over HTTP
+    (see ``llm_loadtest_api.routers.distributed``).
+
+    Example:
+        >>> coordinator = DistributedCoordinator()
+        >>> agent = coordinator.register_agent("loadgen-1")
+        >>> run_id = coordinator.create_run(config)
+    """
+
+    def __init__(
+        self,
+        start_delay: float = DEFAULT_START_DELAY,
+        level_gap: float = DEFAULT_LEVEL_GAP,
+        level_timeout: float = DEFAULT_LEVEL_TIMEOUT,
+    ):
+        """Initialize the coordinator.
+
+        Args:
+            start_delay: Seconds between run creation (or the end of the warmup)
+                and the first level start.
+            level_gap: Seconds between a level completing and the next one starting.
+            level_timeout: Seconds a warmup or level may take before the run fails.
+        """
+        self.start_delay = start_delay
+        self.level_gap = level_gap
+        self.level_timeout = level_timeout
+        self.agents: dict[str, AgentInfo] = {}
+        self.runs: dict[str, _DistributedRun] = {}
+        # agent_id -> run_ids already handed out
+        self._claimed: dict[str, set[str]] = {}
+
+    def register_agent(self, name: str) -> AgentInfo:
+        """Register a new agent.
+
+        Args:
+            name: Agent display name.
+
+        Returns:
+            AgentInfo with the assigned id.
+        """
+        agent = AgentInfo(agent_id=str(uuid.uuid4()), name=name, registered_at=datetime.now())
+        self.agents[agent.agent_id] = agent
+        self._claimed[agent.agent_id] = set()
+        logger.info(f"Agent registered: {name} ({agent.agent_id})")
+        return agent
+
+    def list_agents(self) -> list[AgentInfo]:
+        """List registered agents."""
+        return list(self.agents.values())
+
+    def create_run(
+        self,
+        config: BenchmarkConfig,
+        agent_ids: Optional[list[str]] = None,
+        on_complete: Optional[Callable[[BenchmarkResult], None]] = None,
+        on_fail: Optional[Callable[[str, str], None]] = None,
+        level_timeout: Optional[float] = None,
+    ) -> str:
+        """Create a distributed run over registered agents.
+
+        Args:
+            config: Benchmark configuration to shard.
+            agent_ids: Agents to use (all registered agents if None).
+            on_complete: Called with the merged BenchmarkResult.
+            on_fail: Called with the run id and error when the run fails.
+            level_timeout: Per-stage timeout in seconds (coordinator default if None).
+
+        Returns:
+            Distributed run id.
+
+        Raises:
+            ValueError: If no agents are available, an agent is unknown or the
+                config uses an unsupported option.
+        """
+        check_distributed_config(config)
+        agent_ids = list(agent_ids) if agent_ids else list(self.agents)
+        if not agent_ids:
+            raise ValueError("No agents registered")
+        unknown = [agent_id for agent_id in agent_ids if agent_id not in self.agents]
+        if unknown:
+            raise ValueError(f"Unknown agents: {unknown}")
+
+        run_id = str(uuid.uuid4())
+        run = _DistributedRun(
+            run_id,
+            config,
+            agent_ids,
+            start_at=time.time() + self.start_delay,
+            level_timeout=level_timeout or self.level_timeout,
+            on_complete=on_complete,
+            on_fail=on_fail,
+        )
+        self.runs[run_id] = run
+        if 0 in run.level_start:
+            self._arm_deadline(run, self._level_deadline(run, run.level_start[0]))
+        else:
+            self._arm_deadline(run, time.time() + run.level_timeout)
+        logger.info(f"Distributed run {run_id} created with {len(agent_ids)} agents")
+        return run_id
+
+    def _get_run(self, run_id: str) -> _DistributedRun:
+        run = self.runs.get(run_id)
+        if run is None:
+            raise KeyError(f"Unknown run: {run_id}")
+        return run
+
+    def get_assignment(self, agent_id: str) -> Optional[RunAssignment]:
+        """Return the next unclaimed run for an agent.
+
+        Args:
+            agent_id: Polling agent.
+
+        Returns:
+            RunAssignment, or None if there is no new work.
+
+        Raises:
+            KeyError: If the agent is not registered.
+        """
+        if agent_id not in self.agents:
+            raise KeyError(f"Unknown agent: {agent_id}")
+
+        claimed = self._claimed[agent_id]
+        for run in self.runs.values():
+            if run.finished or run.run_id in claimed or agent_id not in run.agent_ids:
+                continue
+            claimed.add(run.run_id)
+            return RunAssignment(
+                run_id=run.run_id,
+                config=run.config,
+                num_levels=len(run.config.concurrency),
+            )
+        return None
+
+    def get_level(self, run_id: str, level: int, agent_id: str) -> LevelAssignment:
+        """Return an agent's shard and start time for one level.
+
+        Raises:
+            KeyError: If the run or level does not exist.
+        """
+        run = self._get_run(run_id)
+        if not 0 <= level < len(run.shards):
+            raise KeyError(f"Unknown level: {level}")
+        self._check_deadline(run)
+
+        start_at = run.level_start.get(level)
+        return LevelAssignment(
+            run_id=run_id,
+            level=level,
+            concurrency=run.config.concurrency[level],
+            ready=start_at is not None,
+            start_at=start_at,
+            shard=run.shards[level].get(agent_id),
+            server_time=time.time(),
+            failed=run.failed,
+        )
+
+    def submit_warmup(self, run_id: str, report: WarmupReport) -> bool:
+        """Record an agent's warmup; open the first level once all agents are warm.
+
+        Returns:
+            False if the run has already finished and the report was ignored.
+
+        Raises:
+            KeyError: If the run does not exist.
+            ValueError: If the agent does not take part in the run.
+        """
+        run = self._get_run(run_id)
+        if report.agent_id not in run.agent_ids:
+            raise ValueError(f"Agent {report.agent_id} is not part of run {run_id}")
+        self._check_deadline(run)
+        if run.finished or 0 in run.level_start:
+            return False
+
+        run.warmup_reports[report.agent_id] = report.warmup
+        if len(run.warmup_reports) < len(run.agent_ids):
+            return True
+
+        run.warmup = merge_warmups(list(run.warmup_reports.values()))
+        if run.warmup.total_requests and run.warmup.failed_requests == run.warmup.total_requests:
+            self._fail(run, f"All warmup requests failed: {run.warmup.errors}")
+            return True
+
+        start_at = time.time() + self.start_delay
+        run.level_start[0] = start_at
+        self._arm_deadline(run, self._level_deadline(run, start_at))
+        return True
+
+    def submit_level(self, run_id: str, level: int, report: LevelReport) -> bool:
+        """Record an agent's level results; merge when the level is complete.
+
+        Returns:
+            False if the run has already finished and the report was ignored.
+
+        Raises:
+            KeyError: If the run or level does not exist.
+            ValueError: If the agent has no shard in this level.
+        """
+        run = self._get_run(run_id)
+        if not 0 <= level < len(run.shards):
+            raise KeyError(f"Unknown level: {level}")
+        if report.agent_id not in run.shards[level]:
+            raise ValueError(f"Agent {report.agent_id} has no shard in level {level}")
+        self._check_deadline(run)
+        if run.finished:
+            return False
+
+        reports = run.reports.setdefault(level, {})
+        reports[report.agent_id] = report
+        if len(reports) < len(run.shards[level]) or len(run.results) > level:
+            return True
+
+        self._merge_level(run, level)
+        if level + 1 < len(run.shards):
+            start_at = time.time() + self.level_gap
+            run.level_start[level + 1] = start_at
+            self._arm_deadline(run, self._level_deadline(run, start_at))
+        else:
+            self._complete(run)
+        return True
+
+    def _level_deadline(self, run: _DistributedRun, start_at: float) -> float:
+        """Deadline of a level opening at ``start_at``."""
+        return start_at + run.level_timeout + (run.config.duration_seconds or 0)
+
+    def _arm_deadline(self, run: _DistributedRun, deadline: float) -> None:
+        """Fail the run unless the current stage completes by ``deadline``."""
+        run.deadline = deadline
+        if run.timer is not None:
+            run.timer.cancel()
+            run.timer = None
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # 이벤트 루프 밖에서는 다음 조회 때 확인
+            return
+        run.timer = loop.call_later(
+            max(deadline - time.time(), 0.0), self._check_deadline, run
+        )
+
+    def _check_deadline(self, run: _DistributedRun) -> None:
+        """Fail the run if its current stage is past the deadline."""
+        if run.finished or run.deadline is None or time.time() < run.deadline:
+            return
+        stage = "Warmup" if 0 not in run.level_start else f"Level {len(run.results)}"
+        self._fail(
+            run,
+            f"{stage} did not complete within {run.level_timeout:g}s "
+            f"(no report from agents {run.missing_agents()})",
+        )
+
+    def _fail(self, run: _DistributedRun, error: str) -> None:
+        run.error = error
+        if run.timer is not None:
+            run.timer.cancel()
+            run.timer = None
+        # Free the raw uploads of the abandoned level
+        run.reports.clear()
+        logger.warning(f"Distributed run {run.run_id} failed: {error}")
+        if run.on_fail:
+            run.on_fail(run.run_id, error)
+
+    def _merge_level(self, run: _DistributedRun, level: int) -> None:
+        config = run.config
+        merged: Optional[MetricsAggregator] = None
+        duration = 0.0
+        for report in run.reports[level].values():
+            aggregator = MetricsAggregator.from_dict(report.aggregator, config.goodput_thresholds)
+            if merged is None:
+                merged = aggregator
+            else:
+                merged.merge(aggregator)
+            duration = max(duration, report.duration_seconds)
+
+        run.results.append(
+            merged.finalize(
+                duration,
+                config.concurrency[level],
+                request_rate_target=config.request_rate,
+            )
+        )
+        # Free the raw uploads once merged
+        run.reports[level] = {}
+
+    def _complete(self, run: _DistributedRun) -> None:
+        if run.timer is not None:
+            run.timer.cancel()
+            run.timer = None
+        completed_at = datetime.now()
+        run.result = BenchmarkResult(
+            run_id=run.run_id,
+            server_url=run.config.server_url,
+            model=run.config.model,
+            adapter=run.config.adapter,
+            config=run.config,
+            results=run.results,
+            warmup=run.warmup,
+            started_at=run.started_at,
+            completed_at=completed_at,
+            duration_seconds=(completed_at - run.started_at).total_seconds(),
+        )
+        logger.info(f"Distributed run {run.run_id} completed")
+        if run.on_complete:
+            run.on_complete(run.result)
+
+    def get_status(self, run_id: str) -> DistributedRunStatus:
+        """Return run progress.
+
+        Raises:
+            KeyError: If the run does not exist.
+        """
+        run = self._get_run(run_id)
+        self._check_deadline(run)
+        if run.completed:
+            status = "completed"
+        elif run.failed:
+            status = "failed"
+        else:
+            status = "running"
+        return DistributedRunStatus(
+            run_id=run_id,
+            status=status,
+            agent_ids=run.agent_ids,
+            completed_levels=len(run.results),
+            total_levels=len(run.shards),
+            error=run.error,
+        )
+
+    def get_result(self, run_id: str) -> Optional[BenchmarkResult]:
+        """Return the merged result, or None while the run is in progress.
+
+        Raises:
+            KeyError: If the run does not exist.
+        """
+        run = self._get_run(run_id)
+        self._check_deadline(run)
+        return run.result
+
+
+class DistributedAgent:
+    """Load-generation agent that takes shards from a coordinator.
+
+    Example:
+        >>> agent = DistributedAgent("http://coordinator:8080")
+        >>> await agent.serve()
+    """
+
+    def __init__(
+        self,
+        coordinator_url: str,
+        name: Optional[str] = None,
+        adapter_builder: Optional[AdapterBuilder] = None,
+        api_key: Optional[str] = None,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        client: Optional[httpx.AsyncClient] = None,
+    ):
+        """Initialize the agent.
+
+        Args:
+            coordinator_url: Coordinator API base URL.
+            name: Agent display name (hostname if None).
+            adapter_builder: Creates the server adapter for a shard
+                (built from the run config via AdapterFactory if None).
+            api_key: Coordinator API key (X-API-Key header).
+            poll_interval: Seconds between polls for work and level starts.
+            client: Optional preconfigured HTTP client (e.g. for tests).
+        """
+        self.base_url = f"{coordinator_url.rstrip('/')}/api/v1/distributed"
+        self.name = name or socket.gethostname()
+        self.adapter_builder = adapter_builder
+        self.poll_interval = poll_interval
+        headers = {"X-API-Key": api_key} if api_key else None
+        self._client = client or httpx.AsyncClient(headers=headers, timeout=30.0)
+        self.agent_id: Optional[str] = None
+        # coordinator clock minus local clock (seconds)
+        self.clock_offset = 0.0
+
+    async def register(self) -> str:
+        """Register with the coordinator and estimate clock offset.
+
+        Returns:
+            Assigned agent id.
+        """
+        sent = time.time()
+        response = await self._client.post(
+            f"{self.base_url}/agents", json={"name": self.name}
+        )
+        received = time.time()
+        response.raise_for_status()
+
+        data = RegistrationResponse.model_validate(response.json())
+        self.agent_id = data.agent_id
+        # Assume the server stamped the reply halfway through the round trip
+        self.clock_offset = data.server_time - (sent + received) / 2
+        logger.info(f"Registered as {self.agent_id} (clock offset {self.clock_offset:+.3f}s)")
+        return self.agent_id
+
+    async def run_once(self) -> Optional[str]:
+        """Poll for one run and execute it.
+
+        Returns:
+            The executed run id, or None if there was no work.
+        """
+        if self.agent_id is None:
+            await self.register()
+
+        response = await self._client.get(f"{self.base_url}/agents/{self.agent_id}/assignment")
+        response.raise_for_status()
+        if response.status_code == 204:
+            return None
+
+        assignment = RunAssignment.model_validate(response.json())
+        if assignment.config.warmup > 0:
+            await self._warmup(assignment)
+        for level in range(assignment.num_levels):
+            if not await self._run_level(assignment, level):
+                logger.warning(f"Run {assignment.run_id} failed on the coordinator; stopping")
+                break
+        return assignment.run_id
+
+    async def serve(self) -> None:
+        """Poll for and execute runs until cancelled."""
+        try:
+            while True:
+                if await self.run_once() is None:
+                    await asyncio.sleep(self.poll_interval)
+        finally:
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the coordinator HTTP client."""
+        await self._client.aclose()
+
+    async def _wait_for_level(self, run_id: str, level: int) -> LevelAssignment:
+        while True:
+            response = await self._client.get(
+                f"{self.base_url}/runs/{run_id}/levels/{level}",
+                params={"agent_id": self.agent_id},
+            )
+            response.raise_for_status()
+            assignment = LevelAssignment.model_validate(response.json())
+            if assignment.ready or assignment.failed:
+                return assignment
+            await asyncio.sleep(self.poll_interval)
+
+    async def _warmup(self, assignment: RunAssignment) -> None:
+        """Send the warmup requests and report them (same as a local run)."""
+        config = assignment.config
+        builder = self.adapter_builder or adapter_builder_from_config(config)
+        adapter = builder(1)
+        try:
+            warmup = await adapter.warmup(
+                config.warmup, config.input_len // 4, config.output_len // 4
+            )
+        finally:
+            await adapter.aclose()
+
+        report = WarmupReport(agent_id=self.agent_id, warmup=warmup)
+        response = await self._client.post(
+            f"{self.base_url}/runs/{assignment.run_id}/warmup",
+            json=report.model_dump(mode="json"),
+        )
+        response.raise_for_status()
+
+    async def _run_level(self, assignment: RunAssignment, level: int) -> bool:
+        """Run this agent's shard of a level.
+
+        Returns:
+            False if the run has failed on the coordinator.
+        """
+        config = assignment.config
+        level_assignment = await self._wait_for_level(assignment.run_id, level)
+        if level_assignment.failed:
+            return False
+        shard = level_assignment.shard
+        if shard is None:
+            # More agents than shards at this level
+            return True
+
+        builder = self.adapter_builder or adapter_builder_from_config(config)
+        adapter = builder(shard.concurrency)
+        generator = LoadGenerator(adapter)
+        aggregator = MetricsAggregator.for_config(config)
+
+        try:
+            # Translate the coordinator start time into the local clock
+            delay = level_assignment.start_at - self.clock_offset - time.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            duration = await generator.run_level(
+                aggregator, config, shard.concurrency, shard=shard
+            )
+        finally:
+            await adapter.aclose()
+
+        report = LevelReport(
+            agent_id=self.agent_id,
+            duration_seconds=duration,
+            aggregator=aggregator.to_dict(),
+        )
+        response = await self._client.post(
+            f"{self.base_url}/runs/{assignment.run_id}/levels/{level}",
+            json=report.model_dump(mode="json"),
+        )
+        response.raise_for_status()
+        return response.json().get("status") == "accepted"
@@ -0,0 +1,223 @@
+"""Constant-time running metrics for live progress updates.
+
+The WebSocket progress stream asks for a metrics snapshot every few
+completions. ``RunningMetrics`` keeps only counters, sums, a P² median
+estimator and a short sliding window of completions, so both updating it and
+taking a snapshot cost O(1) regardless of how many requests have finished.
+"""
+
+import time
+from collections import deque
+from typing import Optional
+
+from shared.core.models import RequestResult
+
+# Window used for the "current" throughput figure (seconds)
+DEFAULT_THROUGHPUT_WINDOW = 10.0
+
+
+class P2Quantile:
+    """Streaming quantile estimator (Jain & Chlamtac P² algorithm).
+
+    Keeps five markers and adjusts them with piecewise-parabolic
+    interpolation; memory and update cost are constant.
+
+    Example:
+        >>> median = P2Quantile(0.5)
+        >>> for v in ttft_values:
+        ...     median.add(v)
+        >>> median.value()
+    """
+
+    def __init__(self, q: float):
+        """Initialize the estimator.
+
+        Args:
+            q: Target quantile in (0, 1).
+
+        Raises:
+            ValueError: If q is not in (0, 1).
+        """
+        if not 0 < q < 1:
+            raise ValueError(f"q must be in (0, 1), got {q}")
+
+        self.q = q
+        self.count = 0
+        self._heights: list[float] = []
+        self._positions = [1, 2, 3, 4, 5]
+        self._desired = [1, 1 + 2 * q, 1 + 4 * q, 3 + 2 * q, 5]
+        self._increments = [0, q / 2, q, (1 + q) / 2, 1]
+
+    def add(self, value: float) -> None:
+        """Add one observation."""
+        self.count += 1
+        heights = self._heights
+
+        # Collect the first five observations verbatim
+        if self.count <= 5:
+            heights.append(value)
+            heights.sort()
+            return
+
+        positions = self._positions
+
+        if value < heights[0]:
+            heights[0] = value
+            k = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            k = 3
+        else:
+            k = 0
+            while value >= heights[k + 1]:
+                k += 1
+
+        for i in range(k + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        # Adjust the three middle markers
+        for i in range(1, 4):
+            d = self._desired[i] - positions[i]
+            if (d >= 1 and positions[i + 1] - positions[i] > 1) or (
+                d <= -1 and positions[i - 1] - positions[i] < -1
+            ):
+                step = 1 if d > 0 else -1
+                candidate = self._parabolic(i, step)
+                if not heights[i - 1] < candidate < heights[i + 1]:
+                    candidate = self._linear(i, step)
+                heights[i] = candidate
+                positions[i] += step
+
+    def _parabolic(self, i: int, step: int) -> float:
+        h, n = self._heights, self._positions
+        return h[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (h[i + 1] - h[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (h[i] - h[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def _linear(self, i: int, step: int) -> float:
+        h, n = self._heights, self._positions
+        return h[i] + step * (h[i + step] - h[i]) / (n[i + step] - n[i])
+
+    def value(self) -> float:
+        """Current quantile estimate (0.0 before any observation)."""
+        if self.count == 0:
+            return 0.0
+        if self.count <= 5:
+            # Exact (linear interpolation) while we still hold every sample
+            rank = self.q * (self.count - 1)
+            lower = int(rank)
+            upper = min(lower + 1, self.count - 1)
+            frac = rank - lower
+            return self._heights[lower] * (1 - frac) + self._heights[upper] * frac
+        return self._heights[2]
+
+
+class RunningMetrics:
+    """Running aggregate for live progress metrics.
+
+    Example:
+        >>> live = RunningMetrics()
+        >>> live.add(result)  # per completed request
+        >>> live.snapshot(concurrency=10, elapsed=3.2)
+    """
+
+    def __init__(self, window_seconds: float = DEFAULT_THROUGHPUT_WINDOW):
+        """Initialize empty running metrics.
+
+        Args:
+            window_seconds: Sliding window for the current throughput.
+        """
+        self.window_seconds = window_seconds
+
+        self.completed = 0
+        self.success_count = 0
+        self.total_output_tokens = 0
+        self._ttft_sum = 0.0
+        self._e2e_sum = 0.0
+        self._ttft_p50 = P2Quantile(0.5)
+
+        # (completion time, output tokens) within the throughput window
+        self._window: deque[tuple[float, int]] = deque()
+        self._window_tokens = 0
+
+    @property
+    def error_count(self) -> int:
+        return self.completed - self.success_count
+
+    def add(self, result: RequestResult, now: Optional[float] = None) -> None:
+        """Fold one completed request in.
+
+        Args:
+            result: Completed request result.
+            now: Completion time (``time.perf_counter()``); defaults to now.
+        """
+        self.completed += 1
+        if not result.success:
+            return
+
+        if now is None:
+            now = time.perf_counter()
+
+        self.success_count += 1
+        self.total_output_tokens += result.output_tokens
+        self._ttft_sum += result.ttft_ms
+        self._e2e_sum += result.e2e_latency_ms
+        self._ttft_p50.add(result.ttft_ms)
+
+        self._window.append((now, result.output_tokens))
+        self._window_tokens += result.output_tokens
+        self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        cutoff = now - self.window_seconds
+        window = self._window
+        while window and window[0][0] < cutoff:
+            self._window_tokens -= window.popleft()[1]
+
+    def current_throughput(self, elapsed: float, now: Optional[float] = None) -> float:
+        """Output tokens per second over the last ``window_seconds``.
+
+        Args:
+            elapsed: Seconds since the level started (bounds the window early on).
+            now: Current time (``time.perf_counter()``); defaults to now.
+        """
+        if now is None:
+            now = time.perf_counter()
+        self._evict(now)
+
+        span = min(self.window_seconds, elapsed)
+        return self._window_tokens / span if span > 0 else 0.0
+
+    def snapshot(
+        self,
+        concurrency: int,
+        elapsed: float,
+        now: Optional[float] = None,
+    ) -> dict | None:
+        """Build the partial-metrics payload for progress callbacks.
+
+        Args:
+            concurrency: Current concurrency level.
+            elapsed: Elapsed time in seconds.
+            now: Current time (``time.perf_counter()``); defaults to now.
+
+        Returns:
+            Dictionary with partial metrics or None if no successful results.
+        """
+        if self.success_count == 0:
+            return None
+
+        return {
+            "concurrency": concurrency,
+            "completed": self.completed,
+            "success_count": self.success_count,
+            "error_count": self.error_count,
+            "ttft_avg": self._ttft_sum / self.success_count,
+            "ttft_p50": self._ttft_p50.value(),
+            "e2e_avg": self._e2e_sum / self.success_count,
+            "throughput_current": self.current_throughput(elapsed, now),
+            "timestamp": time.time(),  # Unix timestamp for time-series charts
+        }
@@ -1,21 +1,37 @@
 """Asyncio-based load generator for LLM servers."""
 
 import asyncio
+import contextlib
 import logging
 import time
 import uuid
 from datetime import datetime
-from typing import Callable, Optional, Protocol
+from typing import AsyncIterator, Callable, Optional, Protocol
 
-from shared.core.metrics import MetricsCalculator
+from shared.core.arrival import ArrivalScheduler
+from shared.core.live_metrics import RunningMetrics
+from shared.core.metrics import MetricsAggregator
 from shared.core.models import (
     BenchmarkConfig,
     BenchmarkResult,
     ConcurrencyResult,
     RequestResult,
     ValidationResult,
+    WarmupResult,
 )
+from shared.core.omission import PaceEstimator
+from shared.core.profile import ProfileRunner
+from shared.core.stats import ConvergenceMonitor
+from shared.core.timing import LoopLagMonitor, now_ns
 from shared.core.validator import MetricsValidator, format_validation_result
+from shared.core.warmup import SteadyStateWarmup, first_concurrency
+from shared.core.workload import PromptSource, prompt_source_for
+from shared.core.workers import (
+    AdapterBuilder,
+    MultiProcessRunner,
+    WorkerShard,
+    adapter_builder_from_config,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -37,10 +53,16 @@ class ServerAdapter(Protocol):
         """Check server health."""
         ...
 
-    async def warmup(self, num_requests: int, input_len: int, output_len: int) -> None:
+    async def warmup(
+        self, num_requests: int, input_len: int, output_len: int
+    ) -> Optional[WarmupResult]:
         """Run warmup requests."""
         ...
 
+    async def aclose(self) -> None:
+        """Release pooled connections."""
+        ...
+
 
 ProgressCallback = Callable[[int, int, Optional[str | dict]], None]
 
@@ -48,176 +70,218 @@ ProgressCallback = Callable[[int, int, Optional[str | dict]], None]
 class LoadGenerator:
     """Asyncio-based load generator for LLM server benchmarking."""
 
-    def __init__(self, adapter: ServerAdapter):
+    def __init__(
+        self,
+        adapter: ServerAdapter,
+        adapter_builder: Optional[AdapterBuilder] = None,
+    ):
         """Initialize load generator with a server adapter.
 
         Args:
             adapter: Server adapter implementing ServerAdapter protocol.
+            adapter_builder: Picklable callable creating an adapter inside each
+                worker process (``config.workers > 1``). Defaults to building
+                one from the config via AdapterFactory.
         """
         self.adapter = adapter
+        self.adapter_builder = adapter_builder
+        self._lag_monitor: Optional[LoopLagMonitor] = None
 
-    def _generate_prompt(self, input_len: int) -> str:
-        """Generate a prompt with approximately the specified token count.
-
-        Args:
-            input_len: Target input token length.
+    async def send_request(
+        self,
+        request_id: int,
+        prompt: str,
+        max_tokens: int,
+        stream: bool,
+    ) -> RequestResult:
+        """Send one request through the adapter.
 
-        Returns:
-            Generated prompt string.
+        The result is flagged ``client_saturated`` when the event loop lagged
+        past the threshold while it was in flight (see ``track_loop_lag``).
         """
-        base_prompt = "Write a detailed explanation about the following topic: "
-        filler = "artificial intelligence and machine learning " * (input_len // 5)
-        return base_prompt + filler[: input_len * 4]
-
-    def _calculate_partial_metrics(
+        started = now_ns()
+        result = await self.adapter.send_request(request_id, prompt, max_tokens, stream)
+        monitor = self._lag_monitor
+        if monitor is not None and monitor.saturated_since(started):
+            result.client_saturated = True
+        return result
+
+    @contextlib.asynccontextmanager
+    async def track_loop_lag(
         self,
-        results: list[RequestResult],
-        elapsed: float,
-        concurrency: int,
-    ) -> dict | None:
-        """Calculate partial metrics from in-progress results.
+        config: BenchmarkConfig,
+        sink: Optional[Callable[[float], None]] = None,
+    ) -> AsyncIterator[LoopLagMonitor]:
+        """Probe event-loop lag while the block runs.
 
         Args:
-            results: List of completed request results.
-            elapsed: Elapsed time in seconds.
-            concurrency: Current concurrency level.
+            config: Benchmark configuration (lag threshold).
+            sink: Called with every lag sample (ms).
 
-        Returns:
-            Dictionary with partial metrics or None if no successful results.
+        Yields:
+            The running LoopLagMonitor.
         """
-        successful = [r for r in results if r.success]
-        if not successful:
-            return None
+        monitor = LoopLagMonitor.for_config(config, sink)
+        monitor.start()
+        self._lag_monitor = monitor
+        try:
+            yield monitor
+        finally:
+            self._lag_monitor = None
+            await monitor.stop()
+
+    @staticmethod
+    def _build_request_log(request_id: int, result: RequestResult) -> dict:
+        """Build a per-request log entry for progress callbacks.
 
-        ttfts = [r.ttft_ms for r in successful if r.ttft_ms is not None]
-        e2es = [r.e2e_latency_ms for r in successful if r.e2e_latency_ms is not None]
-        total_tokens = sum(r.output_tokens for r in successful if r.output_tokens)
+        Args:
+            request_id: Request identifier.
+            result: Completed request result.
 
+        Returns:
+            Dictionary describing the request outcome.
+        """
         return {
-            "concurrency": concurrency,
-            "completed": len(results),
-            "success_count": len(successful),
-            "error_count": len(results) - len(successful),
-            "ttft_avg": sum(ttfts) / len(ttfts) if ttfts else 0,
-            "ttft_p50": sorted(ttfts)[len(ttfts) // 2] if ttfts else 0,
-            "e2e_avg": sum(e2es) / len(e2es) if e2es else 0,
-            "throughput_current": total_tokens / elapsed if elapsed > 0 else 0,
-            "timestamp": time.time(),  # Unix timestamp for time-series charts
+            "request_id": request_id,
+            "status": "completed" if result.success else "failed",
+            "ttft_ms": result.ttft_ms,
+            "e2e_ms": result.e2e_latency_ms,
+            "output_tokens": result.output_tokens,
+            "success": result.success,
+            "error_type": result.error_type,
+            "timestamp": time.time(),
         }
 
     async def _run_concurrent_requests(
         self,
+        aggregator: MetricsAggregator,
         concurrency: int,
         num_requests: int,
-        input_len: int,
-        output_len: int,
+        prompts: PromptSource,
         stream: bool,
         progress_callback: Optional[ProgressCallback] = None,
-    ) -> tuple[list[RequestResult], float]:
+        id_offset: int = 0,
+        id_stride: int = 1,
+        monitor: Optional[ConvergenceMonitor] = None,
+    ) -> float:
         """Run concurrent requests at specified concurrency level.
 
         Args:
+            aggregator: Aggregator that each completed result is folded into.
             concurrency: Number of concurrent requests.
             num_requests: Total number of requests to send.
-            input_len: Input token length.
-            output_len: Output token length.
+            prompts: Prompt and max_tokens for each request id.
             stream: Whether to use streaming.
             progress_callback: Optional callback for progress updates.
+            id_offset: First request id (worker index in multi-process mode).
+            id_stride: Step between request ids (number of workers).
+            monitor: Stop sending new requests once its CIs have converged
+                (``num_requests`` is then the maximum).
 
         Returns:
-            Tuple of (results list, duration in seconds).
+            Duration in seconds.
         """
-        results: list[RequestResult] = []
         semaphore = asyncio.Semaphore(concurrency)
-        prompt = self._generate_prompt(input_len)
-        completed = 0
+        live = RunningMetrics()
+        pace = PaceEstimator()
         last_metrics_at = 0
         lock = asyncio.Lock()
         metrics_interval = max(10, num_requests // 20)  # 최소 10개, 또는 5%마다
+        converged = False
 
         start_time = time.perf_counter()
+        if monitor:
+            monitor.start(start_time)
 
-        async def send_request(request_id: int) -> RequestResult:
-            nonlocal completed, last_metrics_at
+        async def send_request(request_id: int) -> None:
+            nonlocal last_metrics_at, converged
+            prompt, max_tokens = prompts.get(request_id)
             async with semaphore:
-                result = await self.adapter.send_request(
-                    request_id, prompt, output_len, stream
+                # 수렴 이후 대기 중인 요청은 보내지 않음 (진행 중인 요청은 완료까지 집계)
+                if converged:
+                    return
+                result = await self.send_request(
+                    request_id, prompt, max_tokens, stream
                 )
 
+                # 집계는 O(1) 갱신만 lock 안에서 수행
+                emit_metrics = False
+                partial_metrics = None
                 async with lock:
-                    results.append(result)  # 결과 즉시 저장
-                    completed += 1
+                    now = time.perf_counter()
+                    # 워커의 의도된 전송 간격 (coordinated omission 보정용)
+                    result.expected_interval_ms = pace.interval_ms
+                    if result.success:
+                        pace.add(result.e2e_latency_ms)
+                    aggregator.add(result)  # 결과 즉시 집계
+                    live.add(result, now)
+                    completed = live.completed
+                    if monitor and monitor.add(result, now) and monitor.converged(aggregator):
+                        converged = True
+
+                    # 매 N개 요청마다 실시간 메트릭 스냅샷
+                    if progress_callback and completed - last_metrics_at >= metrics_interval:
+                        last_metrics_at = completed
+                        emit_metrics = True
+                        partial_metrics = live.snapshot(concurrency, now - start_time, now)
+
+                # 콜백(WebSocket 전송 등)은 lock 밖에서 호출
+                if progress_callback:
+                    # 요청별 로그 정보 생성
+                    request_log = self._build_request_log(request_id, result)
+
+                    if emit_metrics:
+                        # 메트릭과 요청 로그 함께 전달
+                        progress_callback(
+                            completed,
+                            num_requests,
+                            {"metrics": partial_metrics, "request_log": request_log},
+                        )
+                    else:
+                        # 요청 로그만 전달
+                        progress_callback(
+                            completed,
+                            num_requests,
+                            {"request_log": request_log},
+                        )
 
-                    if progress_callback:
-                        # 요청별 로그 정보 생성
-                        request_log = {
-                            "request_id": request_id,
-                            "status": "completed" if result.success else "failed",
-                            "ttft_ms": result.ttft_ms,
-                            "e2e_ms": result.e2e_latency_ms,
-                            "output_tokens": result.output_tokens,
-                            "success": result.success,
-                            "error_type": result.error_type,
-                            "timestamp": time.time(),
-                        }
-
-                        # 매 N개 요청마다 실시간 메트릭 계산
-                        if completed - last_metrics_at >= metrics_interval:
-                            last_metrics_at = completed
-                            elapsed = time.perf_counter() - start_time
-                            partial_metrics = self._calculate_partial_metrics(
-                                results, elapsed, concurrency
-                            )
-                            # 메트릭과 요청 로그 함께 전달
-                            progress_callback(
-                                completed,
-                                num_requests,
-                                {"metrics": partial_metrics, "request_log": request_log},
-                            )
-                        else:
-                            # 요청 로그만 전달
-                            progress_callback(
-                                completed,
-                                num_requests,
-                                {"request_log": request_log},
-                            )
-
-                return result
-
-        tasks = [send_request(i) for i in range(num_requests)]
+        tasks = [send_request(id_offset + i * id_stride) for i in range(num_requests)]
         await asyncio.gather(*tasks)
 
         end_time = time.perf_counter()
         duration = end_time - start_time
 
-        return results, duration
+        return duration
 
     async def _run_duration_based(
         self,
+        aggregator: MetricsAggregator,
         concurrency: int,
         duration_seconds: int,
-        input_len: int,
-        output_len: int,
+        prompts: PromptSource,
         stream: bool,
         progress_callback: Optional[ProgressCallback] = None,
-    ) -> tuple[list[RequestResult], float]:
+        id_offset: int = 0,
+        id_stride: int = 1,
+    ) -> float:
         """Run requests for a specified duration.
 
         Args:
+            aggregator: Aggregator that each completed result is folded into.
             concurrency: Number of concurrent requests.
             duration_seconds: How long to run the test.
-            input_len: Input token length.
-            output_len: Output token length.
+            prompts: Prompt and max_tokens for each request id.
             stream: Whether to use streaming.
             progress_callback: Optional callback for progress updates.
+            id_offset: First request id (worker index in multi-process mode).
+            id_stride: Step between request ids (number of workers).
 
         Returns:
-            Tuple of (results list, actual duration in seconds).
+            Actual duration in seconds.
         """
-        results: list[RequestResult] = []
-        prompt = self._generate_prompt(input_len)
-        request_id = 0
+        request_id = id_offset
         lock = asyncio.Lock()
+        pace = PaceEstimator()
 
         start_time = time.perf_counter()
         end_time = start_time + duration_seconds
@@ -227,27 +291,271 @@ class LoadGenerator:
             while time.perf_counter() < end_time:
                 async with lock:
                     current_id = request_id
-                    request_id += 1
+                    request_id += id_stride
 
-                result = await self.adapter.send_request(
-                    current_id, prompt, output_len, stream
+                prompt, max_tokens = prompts.get(current_id)
+                result = await self.send_request(
+                    current_id, prompt, max_tokens, stream
                 )
 
                 async with lock:
-                    results.append(result)
+                    # 응답을 기다리는 동안 보내지 못한 요청은 집계 시 보정
+                    result.expected_interval_ms = pace.interval_ms
+                    if result.success:
+                        pace.add(result.e2e_latency_ms)
+                    aggregator.add(result)
                     if progress_callback:
                         elapsed = time.perf_counter() - start_time
                         progress_callback(
                             int(elapsed),
                             duration_seconds,
-                            f"{len(results)} requests",
+                            f"{aggregator.total_requests} requests",
                         )
 
         workers = [worker() for _ in range(concurrency)]
         await asyncio.gather(*workers)
 
         actual_duration = time.perf_counter() - start_time
-        return results, actual_duration
+        return actual_duration
+
+    async def _run_rate_based(
+        self,
+        aggregator: MetricsAggregator,
+        scheduler: ArrivalScheduler,
+        max_concurrency: int,
+        prompts: PromptSource,
+        stream: bool,
+        num_requests: Optional[int] = None,
+        duration_seconds: Optional[int] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+        id_offset: int = 0,
+        id_stride: int = 1,
+        start_delay: float = 0.0,
+    ) -> float:
+        """Run open-loop requests following an arrival schedule.
+
+        Requests are launched at the scheduled times regardless of whether
+        earlier requests have finished, so the offered load stays fixed even
+        when the server slows down. ``max_concurrency`` caps in-flight requests;
+        any time a request waits for a slot (or the event loop falls behind)
+        shows up in its ``send_lag_ms``.
+
+        Args:
+            aggregator: Aggregator that each completed result is folded into.
+            scheduler: Arrival scheduler producing send offsets.
+            max_concurrency: Maximum number of in-flight requests.
+            prompts: Prompt and max_tokens for each request id.
+            stream: Whether to use streaming.
+            num_requests: Number of requests to send (count-based).
+            duration_seconds: Stop scheduling after this many seconds (duration-based).
+            progress_callback: Optional callback for progress updates.
+            id_offset: First request id (worker index in multi-process mode).
+            id_stride: Step between request ids (number of workers).
+            start_delay: Seconds added to every scheduled offset (phase shift).
+
+        Returns:
+            Duration in seconds.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        tasks: list[asyncio.Task] = []
+        total = num_requests if num_requests is not None else duration_seconds or 0
+
+        start_time = time.perf_counter()
+
+        async def send_request(request_id: int, scheduled_time: float) -> None:
+            prompt, max_tokens = prompts.get(request_id)
+            async with semaphore:
+                sent_time = time.perf_counter()
+                result = await self.send_request(
+                    request_id, prompt, max_tokens, stream
+                )
+
+            result.send_lag_ms = (sent_time - scheduled_time) * 1000
+            aggregator.add(result)
+
+            if progress_callback:
+                if num_requests is not None:
+                    progress_callback(
+                        aggregator.total_requests,
+                        total,
+                        {"request_log": self._build_request_log(request_id, result)},
+                    )
+                else:
+                    elapsed = time.perf_counter() - start_time
+                    progress_callback(
+                        min(int(elapsed), total),
+                        total,
+                        f"{aggregator.total_requests} requests",
+                    )
+
+        for index, offset in enumerate(scheduler.iter_offsets()):
+            if num_requests is not None and index >= num_requests:
+                break
+            offset += start_delay
+            if duration_seconds is not None and offset >= duration_seconds:
+                break
+
+            scheduled_time = start_time + offset
+            delay = scheduled_time - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            request_id = id_offset + index * id_stride
+            tasks.append(asyncio.create_task(send_request(request_id, scheduled_time)))
+
+        await asyncio.gather(*tasks)
+
+        duration = time.perf_counter() - start_time
+        return duration
+
+    async def run_level(
+        self,
+        aggregator: MetricsAggregator,
+        config: BenchmarkConfig,
+        concurrency: int,
+        progress_callback: Optional[ProgressCallback] = None,
+        shard: Optional[WorkerShard] = None,
+        monitor: Optional[ConvergenceMonitor] = None,
+    ) -> float:
+        """Run one concurrency level, or one worker's shard of it.
+
+        Args:
+            aggregator: Aggregator that each completed result is folded into.
+            config: Benchmark configuration.
+            concurrency: Concurrency level.
+            progress_callback: Optional callback for progress updates.
+            shard: This process's share of the level (whole level if None).
+            monitor: Convergence monitor for early stopping (request
+                count-based mode only).
+
+        Returns:
+            Duration in seconds.
+        """
+        async with self.track_loop_lag(config, aggregator.add_loop_lag):
+            return await self._run_level(
+                aggregator, config, concurrency, progress_callback, shard, monitor
+            )
+
+    async def _run_level(
+        self,
+        aggregator: MetricsAggregator,
+        config: BenchmarkConfig,
+        concurrency: int,
+        progress_callback: Optional[ProgressCallback],
+        shard: Optional[WorkerShard],
+        monitor: Optional[ConvergenceMonitor],
+    ) -> float:
+        """Dispatch one level to the mode-specific runner (see ``run_level``)."""
+        if shard is None:
+            shard = WorkerShard.whole_level(config, concurrency)
+        prompts = prompt_source_for(config)
+        if aggregator.timeline is not None:
+            # 타임라인 구간은 레벨 시작 시점부터 계산
+            aggregator.timeline.start()
+
+        if config.request_rate:
+            # Open-loop request-rate mode (concurrency caps in-flight requests)
+            scheduler = ArrivalScheduler(
+                request_rate=shard.request_rate,
+                distribution=config.arrival_distribution,
+                burstiness=config.burstiness,
+                seed=shard.seed,
+            )
+            return await self._run_rate_based(
+                aggregator=aggregator,
+                scheduler=scheduler,
+                max_concurrency=shard.concurrency,
+                prompts=prompts,
+                stream=config.stream,
+                num_requests=None if config.duration_seconds else shard.num_requests,
+                duration_seconds=config.duration_seconds,
+                progress_callback=progress_callback,
+                id_offset=shard.index,
+                id_stride=shard.stride,
+                start_delay=shard.start_delay,
+            )
+
+        if config.duration_seconds:
+            # Duration-based mode
+            return await self._run_duration_based(
+                aggregator=aggregator,
+                concurrency=shard.concurrency,
+                duration_seconds=config.duration_seconds,
+                prompts=prompts,
+                stream=config.stream,
+                progress_callback=progress_callback,
+                id_offset=shard.index,
+                id_stride=shard.stride,
+            )
+
+        # Request count-based mode
+        return await self._run_concurrent_requests(
+            aggregator=aggregator,
+            concurrency=shard.concurrency,
+            num_requests=shard.num_requests,
+            prompts=prompts,
+            stream=config.stream,
+            progress_callback=progress_callback,
+            id_offset=shard.index,
+            id_stride=shard.stride,
+            monitor=monitor,
+        )
+
+    async def measure_level(
+        self,
+        config: BenchmarkConfig,
+        concurrency: int,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> ConcurrencyResult:
+        """Run one concurrency level and compute its metrics.
+
+        Uses worker processes when ``config.workers > 1``. Pooled connections
+        are left open so callers can measure several levels in a row. With
+        ``config.convergence_width`` a request count-based level stops once its
+        confidence intervals converge and reports them in ``convergence``.
+
+        Args:
+            config: Benchmark configuration.
+            concurrency: Concurrency level.
+            progress_callback: Optional callback for progress updates.
+
+        Returns:
+            ConcurrencyResult for the level.
+        """
+        monitor = None
+        if not (config.duration_seconds or config.request_rate):
+            monitor = ConvergenceMonitor.for_config(config)
+
+        if config.workers > 1:
+            if monitor:
+                logger.warning("convergence_width is ignored with workers > 1")
+                monitor = None
+            # 워커 프로세스별 집계를 병합
+            runner = MultiProcessRunner(
+                config.workers,
+                self.adapter_builder or adapter_builder_from_config(config),
+            )
+            aggregator, duration = await runner.run_level(
+                config, concurrency, progress_callback=progress_callback
+            )
+        else:
+            aggregator = MetricsAggregator.for_config(config)
+            duration = await self.run_level(
+                aggregator,
+                config,
+                concurrency,
+                progress_callback=progress_callback,
+                monitor=monitor,
+            )
+
+        result = aggregator.finalize(
+            duration,
+            concurrency,
+            request_rate_target=config.request_rate,
+        )
+        if monitor:
+            result.convergence = monitor.report(aggregator)
+        return result
 
     async def run(
         self,
@@ -288,39 +596,33 @@ class LoadGenerator:
             logger.info("Validation enabled: collecting server metrics before benchmark")
 
         concurrency_results: list[ConcurrencyResult] = []
+        transient_results: Optional[list[ConcurrencyResult]] = None
+        warmup: Optional[WarmupResult] = None
+
+        try:
+            if config.warmup_mode == "steady":
+                # 첫 동시성까지 램프업 후 TTFT가 안정될 때까지 워밍업 (측정 제외)
+                warmup = await SteadyStateWarmup.for_config(config, self.adapter).run(
+                    config, first_concurrency(config)
+                )
 
-        for concurrency in config.concurrency:
-            if progress_callback:
-                progress_callback(0, 1, f"Concurrency: {concurrency}")
-
-            if config.duration_seconds:
-                # Duration-based mode
-                results, duration = await self._run_duration_based(
-                    concurrency=concurrency,
-                    duration_seconds=config.duration_seconds,
-                    input_len=config.input_len,
-                    output_len=config.output_len,
-                    stream=config.stream,
-                    progress_callback=progress_callback,
+            if config.load_profile:
+                # 단계별 부하 프로파일: ramp 구간은 transient_results로 분리
+                concurrency_results, transient_results = await ProfileRunner(self).run(
+                    config, progress_callback=progress_callback
                 )
             else:
-                # Request count-based mode
-                results, duration = await self._run_concurrent_requests(
-                    concurrency=concurrency,
-                    num_requests=config.num_prompts,
-                    input_len=config.input_len,
-                    output_len=config.output_len,
-                    stream=config.stream,
-                    progress_callback=progress_callback,
-                )
+                for concurrency in config.concurrency:
+                    if progress_callback:
+                        progress_callback(0, 1, f"Concurrency: {concurrency}")
 
-            concurrency_result = MetricsCalculator.aggregate_results(
-                results,
-                duration,
-                concurrency,
-                goodput_thresholds=config.goodput_thresholds,
-            )
-            concurrency_results.append(concurrency_result)
+                    concurrency_result = await self.measure_level(
+                        config, concurrency, progress_callback=progress_callback
+                    )
+                    concurrency_results.append(concurrency_result)
+        finally:
+            # Close pooled connections so sockets do not outlive the run
+            await self.adapter.aclose()
 
         completed_at = datetime.now()
         total_duration = (completed_at - started_at).total_seconds()
@@ -362,6 +664,8 @@ class LoadGenerator:
             adapter=config.adapter,
             config=config,
             results=concurrency_results,
+            transient_results=transient_results,
+            warmup=warmup,
             started_at=started_at,
             completed_at=completed_at,
             duration_seconds=total_duration,
@@ -1,32 +1,70 @@
 """Metrics calculation utilities including Goodput."""
 
-from typing import Optional
+from typing import Literal, Optional
 
 import numpy as np
 
 from shared.core.models import (
+    BenchmarkConfig,
     ConcurrencyResult,
     GoodputResult,
     GoodputThresholds,
     LatencyStats,
+    LengthBucketStats,
     RequestResult,
 )
+from shared.core.omission import corrected_values
+from shared.core.result_buffer import ResultBuffer
+from shared.core.sketch import DEFAULT_RELATIVE_ACCURACY, LatencySketch
+from shared.core.stats import latency_ci, throughput_ci
+from shared.core.timeline import TimelineRecorder
+
+MetricsMode = Literal["auto", "exact", "sketch"]
+
+# In "auto" mode, exact samples are kept until this many values are stored
+# (result rows plus ITL samples; ITL dominates), then everything moves to sketches.
+EXACT_SAMPLE_LIMIT = 2_000_000
+
+# Latency metrics tracked per concurrency level
+METRICS = ("ttft", "e2e", "tpot", "itl", "send_lag", "ttft_corrected", "e2e_corrected")
+
+# Coordinated-omission corrected metrics and the raw metric each is derived from
+CORRECTED_METRICS = {"ttft_corrected": "ttft", "e2e_corrected": "e2e"}
+
+# Token-length bin edges for per-length latency; the last bin is open-ended
+LENGTH_BIN_EDGES = np.array([0, 64, 128, 256, 512, 1024, 2048, 4096, 8192])
+LENGTH_AXES = ("input", "output")
+BUCKET_METRICS = ("ttft", "tpot", "e2e")
+
+
+def length_bins(tokens: int | np.ndarray) -> int | np.ndarray:
+    """Index of the ``LENGTH_BIN_EDGES`` bin each token count falls in."""
+    return np.searchsorted(LENGTH_BIN_EDGES, tokens, side="right") - 1
+
+
+def _bucket_bounds(bin_index: int) -> tuple[int, Optional[int]]:
+    upper = bin_index + 1
+    return (
+        int(LENGTH_BIN_EDGES[bin_index]),
+        int(LENGTH_BIN_EDGES[upper]) if upper < len(LENGTH_BIN_EDGES) else None,
+    )
 
 
 class MetricsCalculator:
     """Calculate benchmark metrics from raw results."""
 
     @staticmethod
-    def calculate_latency_stats(values: list[float]) -> LatencyStats:
+    def calculate_latency_stats(values: list[float] | np.ndarray) -> LatencyStats:
         """Calculate latency statistics from a list of values.
 
         Args:
-            values: List of latency values in milliseconds.
+            values: List or array of latency values in milliseconds.
 
         Returns:
-            LatencyStats object with min, max, mean, median, percentiles, and std.
+            LatencyStats object with min, max, mean, median, percentiles, std
+            and confidence intervals of the mean and percentiles.
         """
-        if not values:
+        if len(values) == 0:
             return LatencyStats(
                 min=0.0,
                 max=0.0,
@@ -39,15 +77,24 @@ class MetricsCalculator:
             )
 
         arr = np.array(values)
+        mean = float(np.mean(arr))
+        std = float(np.std(arr))
+        ci = latency_ci(
+            lambda qs: np.percentile(arr, np.asarray(qs) * 100).tolist(),
+            len(arr),
+            mean,
+            std,
+        )
         return LatencyStats(
             min=float(np.min(arr)),
             max=float(np.max(arr)),
-            mean=float(np.mean(arr)),
-            median=float(np.median(arr)),
-            p50=float(np.percentile(arr, 50)),
-            p95=float(np.percentile(arr, 95)),
-            p99=float(np.percentile(arr, 99)),
-            std=float(np.std(arr)),
+            mean=mean,
+            median=ci.p50.estimate,
+            p50=ci.p50.estimate,
+            p95=ci.p95.estimate,
+            p99=ci.p99.estimate,
+            std=std,
+            ci=ci,
         )
 
     @staticmethod
@@ -70,6 +117,7 @@ class MetricsCalculator:
         duration_seconds: float,
         concurrency: int,
         goodput_thresholds: Optional[GoodputThresholds] = None,
+        request_rate_target: Optional[float] = None,
     ) -> ConcurrencyResult:
         """Aggregate individual request results into concurrency-level statistics.
 
@@ -78,62 +126,769 @@ class MetricsCalculator:
             duration_seconds: Total test duration in seconds.
             concurrency: Concurrency level for this batch.
             goodput_thresholds: Optional SLO thresholds for Goodput calculation.
+            request_rate_target: Target request rate when run in request-rate mode.
 
         Returns:
             ConcurrencyResult with aggregated statistics.
         """
-        successful = [r for r in results if r.success]
-        failed = [r for r in results if not r.success]
+        return MetricsCalculator.aggregate_buffer(
+            ResultBuffer.from_results(results),
+            duration_seconds,
+            concurrency,
+            goodput_thresholds=goodput_thresholds,
+            request_rate_target=request_rate_target,
+        )
 
-        # Extract metric values
-        ttft_values = [r.ttft_ms for r in successful]
-        e2e_values = [r.e2e_latency_ms for r in successful]
-        tpot_values = [r.tpot_ms for r in successful if r.tpot_ms is not None]
+    @staticmethod
+    def aggregate_buffer(
+        buffer: ResultBuffer,
+        duration_seconds: float,
+        concurrency: int,
+        goodput_thresholds: Optional[GoodputThresholds] = None,
+        request_rate_target: Optional[float] = None,
+        length_buckets: bool = False,
+    ) -> ConcurrencyResult:
+        """Aggregate a columnar result buffer into concurrency-level statistics.
 
-        itl_all: list[float] = []
-        for r in successful:
-            if r.itl_ms:
-                itl_all.extend(r.itl_ms)
+        Args:
+            buffer: Columnar request results.
+            duration_seconds: Total test duration in seconds.
+            concurrency: Concurrency level for this batch.
+            goodput_thresholds: Optional SLO thresholds for Goodput calculation.
+            request_rate_target: Target request rate when run in request-rate mode.
+            length_buckets: Also report latency per input/output length bin.
 
-        # Token counts
-        total_input = sum(r.input_tokens for r in successful)
-        total_output = sum(r.output_tokens for r in successful)
-
-        # Calculate statistics
-        ttft_stats = MetricsCalculator.calculate_latency_stats(ttft_values)
-        e2e_stats = MetricsCalculator.calculate_latency_stats(e2e_values)
-        tpot_stats = (
-            MetricsCalculator.calculate_latency_stats(tpot_values) if tpot_values else None
-        )
-        itl_stats = MetricsCalculator.calculate_latency_stats(itl_all) if itl_all else None
+        Returns:
+            ConcurrencyResult with aggregated statistics.
+        """
+        success = buffer.success
+        total = len(buffer)
+        successful = int(np.count_nonzero(success))
+        failed = total - successful
+
+        # Extract metric values with boolean masks
+        ttft_values = buffer.ttft_ms[success]
+        e2e_values = buffer.e2e_ms[success]
+        tpot_values = buffer.tpot_ms[success]
+        tpot_values = tpot_values[~np.isnan(tpot_values)]
+        itl_values = buffer.itl_for(success)
+        lag_values = buffer.send_lag_ms[~np.isnan(buffer.send_lag_ms)]
+        success_lag = buffer.send_lag_ms[success]
+        intervals = buffer.expected_interval_ms[success]
+        ttft_corrected = corrected_values(ttft_values, success_lag, intervals, e2e_values)
+        e2e_corrected = corrected_values(e2e_values, success_lag, intervals)
 
-        # Throughput and rates
-        throughput = MetricsCalculator.calculate_throughput(total_output, duration_seconds)
-        request_rate = MetricsCalculator.calculate_request_rate(len(successful), duration_seconds)
-        error_rate = len(failed) / len(results) * 100 if results else 0.0
+        # Token counts
+        output_tokens = buffer.output_tokens[success]
+        total_input = int(buffer.input_tokens[success].sum(dtype=np.int64))
+        total_output = int(output_tokens.sum(dtype=np.int64))
+        output_tokens_sq = float(np.square(output_tokens, dtype=np.float64).sum())
 
-        # Calculate Goodput if thresholds provided
         goodput_result = None
         if goodput_thresholds:
-            goodput_result = GoodputCalculator.calculate(successful, goodput_thresholds)
+            goodput_result = GoodputCalculator.calculate_columnar(
+                ttft_values, buffer.tpot_ms[success], e2e_values, goodput_thresholds
+            )
 
+        calc = MetricsCalculator.calculate_latency_stats
         return ConcurrencyResult(
             concurrency=concurrency,
-            ttft=ttft_stats,
-            tpot=tpot_stats,
-            itl=itl_stats,
-            e2e_latency=e2e_stats,
-            throughput_tokens_per_sec=throughput,
-            request_rate_per_sec=request_rate,
-            total_requests=len(results),
-            successful_requests=len(successful),
-            failed_requests=len(failed),
-            error_rate_percent=error_rate,
+            ttft=calc(ttft_values),
+            tpot=calc(tpot_values) if len(tpot_values) else None,
+            itl=calc(itl_values) if len(itl_values) else None,
+            e2e_latency=calc(e2e_values),
+            throughput_tokens_per_sec=MetricsCalculator.calculate_throughput(
+                total_output, duration_seconds
+            ),
+            throughput_ci=throughput_ci(total_output, output_tokens_sq, duration_seconds),
+            request_rate_per_sec=MetricsCalculator.calculate_request_rate(
+                successful, duration_seconds
+            ),
+            total_requests=total,
+            successful_requests=successful,
+            failed_requests=failed,
+            error_rate_percent=failed / total * 100 if total else 0.0,
             total_input_tokens=total_input,
             total_output_tokens=total_output,
             duration_seconds=duration_seconds,
             goodput=goodput_result,
+            request_rate_target=request_rate_target,
+            send_lag=calc(lag_values) if len(lag_values) else None,
+            ttft_corrected=calc(ttft_corrected) if successful else None,
+            e2e_corrected=calc(e2e_corrected) if successful else None,
+            length_buckets=(
+                MetricsCalculator.length_bucket_stats(buffer) if length_buckets else None
+            ),
+            metrics_mode="exact",
+        )
+
+    @staticmethod
+    def length_bucket_stats(buffer: ResultBuffer) -> list[LengthBucketStats]:
+        """Latency statistics of successful requests per token-length bin.
+
+        Args:
+            buffer: Columnar request results.
+
+        Returns:
+            Non-empty input-length bins followed by output-length bins.
+        """
+        success = buffer.success
+        ttft = buffer.ttft_ms[success]
+        tpot = buffer.tpot_ms[success]
+        e2e = buffer.e2e_ms[success]
+        calc = MetricsCalculator.calculate_latency_stats
+
+        buckets: list[LengthBucketStats] = []
+        for axis, tokens in (("input", buffer.input_tokens), ("output", buffer.output_tokens)):
+            bins = length_bins(tokens[success])
+            for bin_index in np.unique(bins):
+                mask = bins == bin_index
+                bucket_tpot = tpot[mask]
+                bucket_tpot = bucket_tpot[~np.isnan(bucket_tpot)]
+                min_tokens, max_tokens = _bucket_bounds(int(bin_index))
+                buckets.append(
+                    LengthBucketStats(
+                        axis=axis,
+                        min_tokens=min_tokens,
+                        max_tokens=max_tokens,
+                        count=int(np.count_nonzero(mask)),
+                        ttft=calc(ttft[mask]),
+                        tpot=calc(bucket_tpot) if len(bucket_tpot) else None,
+                        e2e_latency=calc(e2e[mask]),
+                    )
+                )
+        return buckets
+
+    @staticmethod
+    def calculate_sketch_stats(sketch: LatencySketch) -> LatencyStats:
+        """Calculate latency statistics from a quantile sketch.
+
+        min/max/mean/std are exact; percentiles are within the sketch's
+        relative accuracy.
+
+        Args:
+            sketch: Populated latency sketch.
+
+        Returns:
+            LatencyStats object.
+        """
+        if sketch.count == 0:
+            return MetricsCalculator.calculate_latency_stats([])
+
+        ci = latency_ci(sketch.quantiles, sketch.count, sketch.mean, sketch.std)
+        return LatencyStats(
+            min=float(sketch.min),
+            max=float(sketch.max),
+            mean=sketch.mean,
+            median=ci.p50.estimate,
+            p50=ci.p50.estimate,
+            p95=ci.p95.estimate,
+            p99=ci.p99.estimate,
+            std=sketch.std,
+            ci=ci,
+        )
+
+
+class MetricsAggregator:
+    """Incrementally aggregate request results for one concurrency level.
+
+    Results are folded in as they complete, so the load generator never has
+    to hold every RequestResult (and every ITL list) in memory.
+
+    Modes:
+        - exact: copy every result into a columnar ResultBuffer; percentiles
+          match ``np.percentile`` exactly.
+        - sketch: keep only mergeable quantile sketches (bounded memory,
+          percentiles within ``relative_accuracy``).
+        - auto: exact until ``exact_limit`` values (rows plus ITL samples)
+          are stored, then switch to sketches for the rest of the level.
+
+    Example:
+        >>> aggregator = MetricsAggregator(mode="auto")
+        >>> aggregator.add(result)  # per completed request
+        >>> level = aggregator.finalize(duration_seconds=12.3, concurrency=10)
+    """
+
+    def __init__(
+        self,
+        mode: MetricsMode = "auto",
+        goodput_thresholds: Optional[GoodputThresholds] = None,
+        exact_limit: int = EXACT_SAMPLE_LIMIT,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        length_buckets: bool = False,
+        timeline_interval: Optional[float] = None,
+    ):
+        """Initialize the aggregator.
+
+        Args:
+            mode: Accuracy mode ("auto", "exact" or "sketch").
+            goodput_thresholds: Optional SLO thresholds for Goodput.
+            exact_limit: Value budget before "auto" switches to sketches.
+            relative_accuracy: Sketch relative accuracy.
+            length_buckets: Also track latency per input/output length bin.
+            timeline_interval: Also record a per-interval timeline with
+                buckets of this many seconds.
+
+        Raises:
+            ValueError: If mode is unknown.
+        """
+        if mode not in ("auto", "exact", "sketch"):
+            raise ValueError(f"Unknown metrics mode: {mode}")
+
+        self.mode = mode
+        self.goodput_thresholds = goodput_thresholds
+        self.exact_limit = exact_limit
+        self.relative_accuracy = relative_accuracy
+        self.length_buckets = length_buckets
+
+        self._buffer: Optional[ResultBuffer] = ResultBuffer() if mode != "sketch" else None
+        self._sketches: Optional[dict[str, LatencySketch]] = (
+            None if mode != "sketch" else self._empty_sketches()
+        )
+        # 스케치 모드의 길이 구간별 스케치: (axis, bin) -> metric -> sketch
+        self._bucket_sketches: dict[tuple[str, int], dict[str, LatencySketch]] = {}
+        # 클라이언트 이벤트 루프 지연 (항상 스케치)
+        self.loop_lag = LatencySketch(relative_accuracy)
+        self.saturated_requests = 0
+        self.timeline: Optional[TimelineRecorder] = (
+            TimelineRecorder(timeline_interval, relative_accuracy=relative_accuracy)
+            if timeline_interval
+            else None
+        )
+
+        self.total_requests = 0
+        self.successful_requests = 0
+        self.total_input_tokens = 0
+        self.total_output_tokens = 0
+        # 처리량 신뢰구간용 요청별 출력 토큰 제곱합
+        self.output_tokens_sq = 0
+
+        # Goodput counters (sketch mode; exact mode computes them from the buffer)
+        self.goodput_satisfied = 0
+        self.ttft_satisfied = 0
+        self.tpot_satisfied = 0
+        self.e2e_satisfied = 0
+
+    @classmethod
+    def for_config(cls, config: BenchmarkConfig) -> "MetricsAggregator":
+        """Aggregator for one level of a benchmark run.
+
+        Length buckets are tracked when request lengths vary (length
+        distributions or a dataset).
+        """
+        return cls(
+            mode=config.metrics_mode,
+            goodput_thresholds=config.goodput_thresholds,
+            length_buckets=bool(
+                config.input_len_dist or config.output_len_dist or config.dataset
+            ),
+            timeline_interval=config.timeline_interval,
+        )
+
+    @property
+    def failed_requests(self) -> int:
+        return self.total_requests - self.successful_requests
+
+    @property
+    def is_exact(self) -> bool:
+        """Whether percentiles are still computed from exact samples."""
+        return self._buffer is not None
+
+    def _empty_sketches(self) -> dict[str, LatencySketch]:
+        return {metric: LatencySketch(self.relative_accuracy) for metric in METRICS}
+
+    def _values(self, metric: str) -> np.ndarray:
+        """Exact values of one metric from the buffer (exact mode only)."""
+        buffer = self._buffer
+        if metric == "send_lag":
+            # Send lag covers every scheduled request, failed ones included
+            lag = buffer.send_lag_ms
+            return lag[~np.isnan(lag)]
+
+        success = buffer.success
+        if metric in CORRECTED_METRICS:
+            raw = self._values(CORRECTED_METRICS[metric])
+            return corrected_values(
+                raw,
+                buffer.send_lag_ms[success],
+                buffer.expected_interval_ms[success],
+                buffer.e2e_ms[success] if metric == "ttft_corrected" else None,
+            )
+        if metric == "ttft":
+            return buffer.ttft_ms[success]
+        if metric == "e2e":
+            return buffer.e2e_ms[success]
+        if metric == "tpot":
+            tpot = buffer.tpot_ms[success]
+            return tpot[~np.isnan(tpot)]
+        if metric == "itl":
+            return buffer.itl_for(success)
+        raise ValueError(f"Unknown metric: {metric}")
+
+    def _build_sketches(self) -> dict[str, LatencySketch]:
+        """Sketch the buffer contents without modifying this aggregator."""
+        return {
+            metric: LatencySketch.from_values(self._values(metric), self.relative_accuracy)
+            for metric in METRICS
+        }
+
+    def _new_bucket(self) -> dict[str, LatencySketch]:
+        return {metric: LatencySketch(self.relative_accuracy) for metric in BUCKET_METRICS}
+
+    def _build_bucket_sketches(self) -> dict[tuple[str, int], dict[str, LatencySketch]]:
+        """Sketch the buffer contents per length bin (exact mode only)."""
+        if not self.length_buckets:
+            return {}
+
+        buffer = self._buffer
+        success = buffer.success
+        values = {
+            "ttft": buffer.ttft_ms[success],
+            "tpot": buffer.tpot_ms[success],
+            "e2e": buffer.e2e_ms[success],
+        }
+        buckets: dict[tuple[str, int], dict[str, LatencySketch]] = {}
+        for axis, tokens in (("input", buffer.input_tokens), ("output", buffer.output_tokens)):
+            bins = length_bins(tokens[success])
+            for bin_index in np.unique(bins):
+                mask = bins == bin_index
+                bucket = self._new_bucket()
+                for metric, metric_values in values.items():
+                    selected = metric_values[mask]
+                    bucket[metric].add_many(selected[~np.isnan(selected)])
+                buckets[(axis, int(bin_index))] = bucket
+        return buckets
+
+    def _goodput_counts(self) -> tuple[int, int, int, int]:
+        """Return (all, ttft, tpot, e2e) satisfied counts."""
+        if self._buffer is None or not self.goodput_thresholds:
+            return (
+                self.goodput_satisfied,
+                self.ttft_satisfied,
+                self.tpot_satisfied,
+                self.e2e_satisfied,
+            )
+
+        buffer = self._buffer
+        success = buffer.success
+        goodput = GoodputCalculator.calculate_columnar(
+            buffer.ttft_ms[success],
+            buffer.tpot_ms[success],
+            buffer.e2e_ms[success],
+            self.goodput_thresholds,
+        )
+        return (
+            goodput.satisfied_requests,
+            goodput.ttft_satisfied or 0,
+            goodput.tpot_satisfied or 0,
+            goodput.e2e_satisfied or 0,
+        )
+
+    def _switch_to_sketch(self) -> None:
+        if self._buffer is None:
+            return
+        (
+            self.goodput_satisfied,
+            self.ttft_satisfied,
+            self.tpot_satisfied,
+            self.e2e_satisfied,
+        ) = self._goodput_counts()
+        self._sketches = self._build_sketches()
+        self._bucket_sketches = self._build_bucket_sketches()
+        self._buffer = None
+
+    def add(self, result: RequestResult) -> None:
+        """Fold one completed request into the aggregate.
+
+        Args:
+            result: Completed request result.
+        """
+        self.total_requests += 1
+        if result.success:
+            self.successful_requests += 1
+            self.total_input_tokens += result.input_tokens
+            self.total_output_tokens += result.output_tokens
+            self.output_tokens_sq += result.output_tokens * result.output_tokens
+        if result.client_saturated:
+            self.saturated_requests += 1
+        if self.timeline is not None:
+            self.timeline.add(result)
+
+        if self._buffer is not None:
+            self._buffer.append(result)
+            if (
+                self.mode == "auto"
+                and len(self._buffer) + self._buffer.itl_size > self.exact_limit
+            ):
+                self._switch_to_sketch()
+            return
+
+        sketches = self._sketches
+        if result.send_lag_ms is not None:
+            sketches["send_lag"].add(result.send_lag_ms)
+
+        if result.success:
+            sketches["ttft"].add(result.ttft_ms)
+            sketches["e2e"].add(result.e2e_latency_ms)
+            if result.tpot_ms is not None:
+                sketches["tpot"].add(result.tpot_ms)
+            if result.itl_ms:
+                sketches["itl"].add_many(np.asarray(result.itl_ms, dtype=np.float64))
+            self._add_corrected(result)
+
+            if self.goodput_thresholds:
+                self._count_goodput(result)
+
+            if self.length_buckets:
+                self._add_to_buckets(result)
+
+    def add_loop_lag(self, lag_ms: float) -> None:
+        """Record one client event-loop lag sample (ms)."""
+        self.loop_lag.add(lag_ms)
+
+    def _add_corrected(self, result: RequestResult) -> None:
+        """Add a successful request's latencies from its intended start (sketch mode)."""
+        lag = result.send_lag_ms or 0.0
+        interval = result.expected_interval_ms
+        blocked = result.e2e_latency_ms + lag
+        self._sketches["ttft_corrected"].add(result.ttft_ms + lag)
+        self._sketches["e2e_corrected"].add(blocked)
+        # 워커가 E2E 동안 막혀 보내지 못한 요청: 워커 대기 E2E - k*I (>= I)
+        if interval and blocked >= 2 * interval:
+            waits = blocked - interval * np.arange(1, int(blocked // interval))
+            self._sketches["ttft_corrected"].add_many(waits + result.ttft_ms)
+            self._sketches["e2e_corrected"].add_many(waits)
+
+    def _add_to_buckets(self, result: RequestResult) -> None:
+        """Add a successful request to its input and output length bins."""
+        for axis, tokens in (("input", result.input_tokens), ("output", result.output_tokens)):
+            key = (axis, int(length_bins(tokens)))
+            bucket = self._bucket_sketches.get(key)
+            if bucket is None:
+                bucket = self._bucket_sketches[key] = self._new_bucket()
+            bucket["ttft"].add(result.ttft_ms)
+            bucket["e2e"].add(result.e2e_latency_ms)
+            if result.tpot_ms is not None:
+                bucket["tpot"].add(result.tpot_ms)
+
+    def _count_goodput(self, result: RequestResult) -> None:
+        """Update Goodput counters for a successful request."""
+        thresholds = self.goodput_thresholds
+        meets_all = True
+
+        if thresholds.ttft_ms is not None:
+            if result.ttft_ms <= thresholds.ttft_ms:
+                self.ttft_satisfied += 1
+            else:
+                meets_all = False
+
+        if thresholds.tpot_ms is not None:
+            if result.tpot_ms is not None and result.tpot_ms <= thresholds.tpot_ms:
+                self.tpot_satisfied += 1
+            else:
+                meets_all = False
+
+        if thresholds.e2e_ms is not None:
+            if result.e2e_latency_ms <= thresholds.e2e_ms:
+                self.e2e_satisfied += 1
+            else:
+                meets_all = False
+
+        if meets_all:
+            self.goodput_satisfied += 1
+
+    def count(self, metric: str) -> int:
+        """Number of samples recorded for a metric."""
+        if self._buffer is not None:
+            return len(self._values(metric))
+        return self._sketches[metric].count
+
+    def mean(self, metric: str) -> float:
+        """Mean of a metric (0.0 if empty)."""
+        if self._buffer is not None:
+            values = self._values(metric)
+            return float(np.mean(values)) if len(values) else 0.0
+        return self._sketches[metric].mean
+
+    def percentile(self, metric: str, p: float) -> float:
+        """Percentile of a metric in [0, 100] (0.0 if empty)."""
+        if self._buffer is not None:
+            values = self._values(metric)
+            return float(np.percentile(values, p)) if len(values) else 0.0
+        return self._sketches[metric].percentile(p)
+
+    def quantiles(self, metric: str, qs: list[float]) -> list[float]:
+        """Values of a metric at several quantiles in [0, 1] (0.0 if empty).
+
+        Exact mode reads the samples once for all quantiles.
+        """
+        if self._buffer is not None:
+            values = self._values(metric)
+            if not len(values):
+                return [0.0] * len(qs)
+            return np.percentile(values, [q * 100 for q in qs]).tolist()
+        return self._sketches[metric].quantiles(qs)
+
+    def merge(self, other: "MetricsAggregator") -> None:
+        """Merge another aggregator (e.g. from another worker) into this one.
+
+        Args:
+            other: Aggregator built with the same Goodput thresholds.
+        """
+        if self._buffer is not None and other._buffer is not None:
+            self._buffer.extend(other._buffer)
+        else:
+            self._switch_to_sketch()
+            theirs = other._sketches if other._sketches is not None else other._build_sketches()
+            for metric in METRICS:
+                self._sketches[metric].merge(theirs[metric])
+
+            their_buckets = (
+                other._bucket_sketches if other._buffer is None else other._build_bucket_sketches()
+            )
+            for key, bucket in their_buckets.items():
+                mine = self._bucket_sketches.setdefault(key, self._new_bucket())
+                for metric in BUCKET_METRICS:
+                    mine[metric].merge(bucket[metric])
+
+            satisfied, ttft, tpot, e2e = other._goodput_counts()
+            self.goodput_satisfied += satisfied
+            self.ttft_satisfied += ttft
+            self.tpot_satisfied += tpot
+            self.e2e_satisfied += e2e
+
+        self.total_requests += other.total_requests
+        self.successful_requests += other.successful_requests
+        self.total_input_tokens += other.total_input_tokens
+        self.total_output_tokens += other.total_output_tokens
+        self.output_tokens_sq += other.output_tokens_sq
+        self.loop_lag.merge(other.loop_lag)
+        self.saturated_requests += other.saturated_requests
+
+        if other.timeline is not None:
+            if self.timeline is None:
+                self.timeline = TimelineRecorder.from_dict(other.timeline.to_dict())
+            else:
+                self.timeline.merge(other.timeline)
+
+    def to_dict(self) -> dict:
+        """Serialize to a JSON-compatible dict (for shipping between hosts).
+
+        Exact mode ships the columnar buffer, sketch mode ships the sketches;
+        either way the receiver can ``merge`` the rebuilt aggregator.
+        """
+        return {
+            "mode": self.mode,
+            "exact_limit": self.exact_limit,
+            "relative_accuracy": self.relative_accuracy,
+            "length_buckets": self.length_buckets,
+            "total_requests": self.total_requests,
+            "successful_requests": self.successful_requests,
+            "total_input_tokens": self.total_input_tokens,
+            "total_output_tokens": self.total_output_tokens,
+            "output_tokens_sq": self.output_tokens_sq,
+            "goodput_counts": list(self._goodput_counts()),
+            "loop_lag": self.loop_lag.to_dict(),
+            "saturated_requests": self.saturated_requests,
+            "buffer": self._buffer.to_dict() if self._buffer is not None else None,
+            "sketches": (
+                {metric: sketch.to_dict() for metric, sketch in self._sketches.items()}
+                if self._sketches is not None
+                else None
+            ),
+            "bucket_sketches": [
+                [axis, bin_index, {metric: sketch.to_dict() for metric, sketch in bucket.items()}]
+                for (axis, bin_index), bucket in self._bucket_sketches.items()
+            ],
+            "timeline": self.timeline.to_dict() if self.timeline is not None else None,
+        }
+
+    @classmethod
+    def from_dict(
+        cls,
+        data: dict,
+        goodput_thresholds: Optional[GoodputThresholds] = None,
+    ) -> "MetricsAggregator":
+        """Rebuild an aggregator serialized with ``to_dict``.
+
+        Args:
+            data: Serialized aggregator.
+            goodput_thresholds: SLO thresholds the sender used.
+
+        Returns:
+            MetricsAggregator ready to merge or finalize.
+        """
+        aggregator = cls(
+            mode=data["mode"],
+            goodput_thresholds=goodput_thresholds,
+            exact_limit=data["exact_limit"],
+            relative_accuracy=data["relative_accuracy"],
+            length_buckets=data.get("length_buckets", False),
         )
+        aggregator.total_requests = data["total_requests"]
+        aggregator.successful_requests = data["successful_requests"]
+        aggregator.total_input_tokens = data["total_input_tokens"]
+        aggregator.total_output_tokens = data["total_output_tokens"]
+        aggregator.output_tokens_sq = data.get("output_tokens_sq", 0)
+        if data.get("loop_lag") is not None:
+            aggregator.loop_lag = LatencySketch.from_dict(data["loop_lag"])
+        aggregator.saturated_requests = data.get("saturated_requests", 0)
+        (
+            aggregator.goodput_satisfied,
+            aggregator.ttft_satisfied,
+            aggregator.tpot_satisfied,
+            aggregator.e2e_satisfied,
+        ) = data["goodput_counts"]
+        if data.get("timeline") is not None:
+            aggregator.timeline = TimelineRecorder.from_dict(data["timeline"])
+
+        if data["buffer"] is not None:
+            aggregator._buffer = ResultBuffer.from_dict(data["buffer"])
+            aggregator._sketches = None
+        else:
+            aggregator._buffer = None
+            aggregator._sketches = aggregator._empty_sketches()
+            aggregator._sketches.update(
+                {
+                    metric: LatencySketch.from_dict(sketch)
+                    for metric, sketch in data["sketches"].items()
+                }
+            )
+            aggregator._bucket_sketches = {
+                (axis, bin_index): {
+                    metric: LatencySketch.from_dict(sketch) for metric, sketch in bucket.items()
+                }
+                for axis, bin_index, bucket in data.get("bucket_sketches", [])
+            }
+        return aggregator
+
+    def _goodput_result(self) -> Optional[GoodputResult]:
+        thresholds = self.goodput_thresholds
+        if not thresholds:
+            return None
+
+        total = self.successful_requests
+        if total == 0:
+            return GoodputResult(
+                thresholds=thresholds,
+                satisfied_requests=0,
+                total_requests=0,
+                goodput_percent=0.0,
+            )
+
+        return GoodputResult(
+            thresholds=thresholds,
+            satisfied_requests=self.goodput_satisfied,
+            total_requests=total,
+            goodput_percent=self.goodput_satisfied / total * 100,
+            ttft_satisfied=self.ttft_satisfied if thresholds.ttft_ms is not None else None,
+            tpot_satisfied=self.tpot_satisfied if thresholds.tpot_ms is not None else None,
+            e2e_satisfied=self.e2e_satisfied if thresholds.e2e_ms is not None else None,
+        )
+
+    def finalize(
+        self,
+        duration_seconds: float,
+        concurrency: int,
+        request_rate_target: Optional[float] = None,
+    ) -> ConcurrencyResult:
+        """Build the concurrency-level result.
+
+        Args:
+            duration_seconds: Total test duration in seconds.
+            concurrency: Concurrency level for this batch.
+            request_rate_target: Target request rate when run in request-rate mode.
+
+        Returns:
+            ConcurrencyResult with aggregated statistics.
+        """
+        if self._buffer is not None:
+            result = MetricsCalculator.aggregate_buffer(
+                self._buffer,
+                duration_seconds,
+                concurrency,
+                goodput_thresholds=self.goodput_thresholds,
+                request_rate_target=request_rate_target,
+                length_buckets=self.length_buckets,
+            )
+        else:
+            result = self._finalize_sketches(duration_seconds, concurrency, request_rate_target)
+
+        if self.timeline is not None:
+            result.timeline = self.timeline.finalize(duration_seconds)
+        if self.loop_lag.count:
+            result.loop_lag = MetricsCalculator.calculate_sketch_stats(self.loop_lag)
+        result.saturated_requests = self.saturated_requests
+        result.client_saturated = self.saturated_requests > 0
+        return result
+
+    def _finalize_sketches(
+        self,
+        duration_seconds: float,
+        concurrency: int,
+        request_rate_target: Optional[float],
+    ) -> ConcurrencyResult:
+        """Build the level result from the quantile sketches."""
+
+        def stats(metric: str) -> Optional[LatencyStats]:
+            sketch = self._sketches[metric]
+            return MetricsCalculator.calculate_sketch_stats(sketch) if sketch.count else None
+
+        total = self.total_requests
+        error_rate = self.failed_requests / total * 100 if total else 0.0
+
+        return ConcurrencyResult(
+            concurrency=concurrency,
+            ttft=MetricsCalculator.calculate_sketch_stats(self._sketches["ttft"]),
+            tpot=stats("tpot"),
+            itl=stats("itl"),
+            e2e_latency=MetricsCalculator.calculate_sketch_stats(self._sketches["e2e"]),
+            throughput_tokens_per_sec=MetricsCalculator.calculate_throughput(
+                self.total_output_tokens, duration_seconds
+            ),
+            throughput_ci=throughput_ci(
+                self.total_output_tokens, self.output_tokens_sq, duration_seconds
+            ),
+            request_rate_per_sec=MetricsCalculator.calculate_request_rate(
+                self.successful_requests, duration_seconds
+            ),
+            total_requests=total,
+            successful_requests=self.successful_requests,
+            failed_requests=self.failed_requests,
+            error_rate_percent=error_rate,
+            total_input_tokens=self.total_input_tokens,
+            total_output_tokens=self.total_output_tokens,
+            duration_seconds=duration_seconds,
+            goodput=self._goodput_result(),
+            request_rate_target=request_rate_target,
+            send_lag=stats("send_lag"),
+            ttft_corrected=stats("ttft_corrected"),
+            e2e_corrected=stats("e2e_corrected"),
+            length_buckets=self._sketch_length_buckets() if self.length_buckets else None,
+            metrics_mode="sketch",
+        )
+
+    def _sketch_length_buckets(self) -> list[LengthBucketStats]:
+        """Per-length-bin statistics from the bucket sketches."""
+        calc = MetricsCalculator.calculate_sketch_stats
+        buckets: list[LengthBucketStats] = []
+        for axis, bin_index in sorted(
+            self._bucket_sketches, key=lambda key: (LENGTH_AXES.index(key[0]), key[1])
+        ):
+            bucket = self._bucket_sketches[(axis, bin_index)]
+            min_tokens, max_tokens = _bucket_bounds(bin_index)
+            buckets.append(
+                LengthBucketStats(
+                    axis=axis,
+                    min_tokens=min_tokens,
+                    max_tokens=max_tokens,
+                    count=bucket["ttft"].count,
+                    ttft=calc(bucket["ttft"]),
+                    tpot=calc(bucket["tpot"]) if bucket["tpot"].count else None,
+                    e2e_latency=calc(bucket["e2e"]),
+                )
+            )
+        return buckets
 
 
 class GoodputCalculator:
@@ -157,7 +912,31 @@ class GoodputCalculator:
         Returns:
             GoodputResult with satisfaction counts and percentage.
         """
-        if not results:
+        buffer = ResultBuffer.from_results(results)
+        return GoodputCalculator.calculate_columnar(
+            buffer.ttft_ms, buffer.tpot_ms, buffer.e2e_ms, thresholds
+        )
+
+    @staticmethod
+    def calculate_columnar(
+        ttft_ms: np.ndarray,
+        tpot_ms: np.ndarray,
+        e2e_ms: np.ndarray,
+        thresholds: GoodputThresholds,
+    ) -> GoodputResult:
+        """Calculate Goodput from metric columns with vectorized masks.
+
+        Args:
+            ttft_ms: TTFT per successful request.
+            tpot_ms: TPOT per successful request (NaN when unavailable).
+            e2e_ms: End-to-end latency per successful request.
+            thresholds: SLO thresholds to check against.
+
+        Returns:
+            GoodputResult with satisfaction counts and percentage.
+        """
+        total = len(ttft_ms)
+        if total == 0:
             return GoodputResult(
                 thresholds=thresholds,
                 satisfied_requests=0,
@@ -165,48 +944,36 @@ class GoodputCalculator:
                 goodput_percent=0.0,
             )
 
-        total = len(results)
+        # Requests meeting ALL thresholds
+        meets_all = np.ones(total, dtype=np.bool_)
 
-        # Count per-threshold satisfaction
         ttft_satisfied = None
         tpot_satisfied = None
         e2e_satisfied = None
 
         if thresholds.ttft_ms is not None:
-            ttft_satisfied = sum(1 for r in results if r.ttft_ms <= thresholds.ttft_ms)
+            mask = ttft_ms <= thresholds.ttft_ms
+            ttft_satisfied = int(np.count_nonzero(mask))
+            meets_all &= mask
 
         if thresholds.tpot_ms is not None:
-            tpot_satisfied = sum(
-                1 for r in results
-                if r.tpot_ms is not None and r.tpot_ms <= thresholds.tpot_ms
-            )
+            # NaN (no TPOT) compares False, so it never satisfies the SLO
+            mask = tpot_ms <= thresholds.tpot_ms
+            tpot_satisfied = int(np.count_nonzero(mask))
+            meets_all &= mask
 
         if thresholds.e2e_ms is not None:
-            e2e_satisfied = sum(1 for r in results if r.e2e_latency_ms <= thresholds.e2e_ms)
-
-        # Count requests meeting ALL thresholds
-        satisfied = 0
-        for r in results:
-            meets_all = True
-
-            if thresholds.ttft_ms is not None and r.ttft_ms > thresholds.ttft_ms:
-                meets_all = False
-            if thresholds.tpot_ms is not None:
-                if r.tpot_ms is None or r.tpot_ms > thresholds.tpot_ms:
-                    meets_all = False
-            if thresholds.e2e_ms is not None and r.e2e_latency_ms > thresholds.e2e_ms:
-                meets_all = False
-
-            if meets_all:
-                satisfied += 1
+            mask = e2e_ms <= thresholds.e2e_ms
+            e2e_satisfied = int(np.count_nonzero(mask))
+            meets_all &= mask
 
-        goodput_percent = (satisfied / total * 100) if total > 0 else 0.0
+        satisfied = int(np.count_nonzero(meets_all))
 
         return GoodputResult(
             thresholds=thresholds,
             satisfied_requests=satisfied,
             total_requests=total,
-            goodput_percent=goodput_percent,
+            goodput_percent=satisfied / total * 100,
             ttft_satisfied=ttft_satisfied,
             tpot_satisfied=tpot_satisfied,
             e2e_satisfied=e2e_satisfied,
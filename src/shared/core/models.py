@@ -1,11 +1,36 @@
 """Data models for LLM load testing."""
 
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import BaseModel, Field
 
 
+class ConfidenceInterval(BaseModel):
+    """Confidence interval of one statistic."""
+
+    estimate: float = Field(description="Point estimate")
+    lower: Optional[float] = Field(
+        default=None, description="Lower bound (None if too few samples)"
+    )
+    upper: Optional[float] = Field(
+        default=None, description="Upper bound (None if too few samples)"
+    )
+    relative_width: Optional[float] = Field(
+        default=None, description="(upper - lower) / estimate (None if too few samples)"
+    )
+
+
+class LatencyCI(BaseModel):
+    """Confidence intervals of the mean and percentiles of a latency metric."""
+
+    confidence: float = Field(description="Confidence level")
+    mean: ConfidenceInterval = Field(description="Mean CI (ms)")
+    p50: ConfidenceInterval = Field(description="50th percentile CI (ms)")
+    p95: ConfidenceInterval = Field(description="95th percentile CI (ms)")
+    p99: ConfidenceInterval = Field(description="99th percentile CI (ms)")
+
+
 class LatencyStats(BaseModel):
     """Latency statistics in milliseconds."""
 
@@ -17,6 +42,9 @@ class LatencyStats(BaseModel):
     p95: float = Field(description="95th percentile (ms)")
     p99: float = Field(description="99th percentile (ms)")
     std: float = Field(description="Standard deviation (ms)")
+    ci: Optional[LatencyCI] = Field(
+        default=None, description="Confidence intervals of mean and percentiles"
+    )
 
 
 class GoodputThresholds(BaseModel):
@@ -33,7 +61,7 @@ class GoodputResult(BaseModel):
     thresholds: GoodputThresholds = Field(description="SLO thresholds used")
     satisfied_requests: int = Field(description="Requests meeting all SLOs")
     total_requests: int = Field(description="Total requests")
-    goodput_percent: float = Field(description="Percentage meeting SLOs")
+    goodput_percent: float = Field(description="Percentage of successful requests meeting SLOs")
 
     # Per-threshold breakdown
     ttft_satisfied: Optional[int] = Field(default=None, description="Requests meeting TTFT SLO")
@@ -66,6 +94,106 @@ class RequestResult(BaseModel):
     success: bool = Field(default=True, description="Request success status")
     error_type: Optional[str] = Field(default=None, description="Error type if failed")
     itl_ms: Optional[list[float]] = Field(default=None, description="Inter-token latencies")
+    send_lag_ms: Optional[float] = Field(
+        default=None, description="Actual minus scheduled send time (ms, request-rate mode)"
+    )
+    expected_interval_ms: Optional[float] = Field(
+        default=None,
+        description="Interval the closed-loop worker intended to send at (ms), "
+        "for coordinated-omission correction",
+    )
+    client_saturated: bool = Field(
+        default=False, description="Client event loop lagged past the threshold during the request"
+    )
+
+
+class LengthDistribution(BaseModel):
+    """Per-request token length distribution.
+
+    - uniform: integers in [min, max]
+    - normal / lognormal: given mean and std of the lengths
+    - empirical: resampled from observed lengths in ``path``
+
+    Samples are rounded and clipped to [min, max] (min defaults to 1).
+    """
+
+    kind: Literal["uniform", "normal", "lognormal", "empirical"] = Field(
+        description="Distribution family"
+    )
+    min: Optional[int] = Field(default=None, ge=1, description="Lower bound (tokens)")
+    max: Optional[int] = Field(default=None, ge=1, description="Upper bound (tokens)")
+    mean: Optional[float] = Field(default=None, gt=0, description="Mean length (tokens)")
+    std: Optional[float] = Field(default=None, ge=0, description="Length standard deviation")
+    path: Optional[str] = Field(
+        default=None, description="File of observed lengths (JSON array or one per line)"
+    )
+
+
+class LoadPhase(BaseModel):
+    """One phase of a load profile.
+
+    Shapes (``start`` -> ``target`` over ``duration_seconds``):
+        - constant: hold ``target``.
+        - ramp: linear from ``start`` to ``target``.
+        - step: ``steps`` equal steps from ``start`` up (or down) to ``target``.
+        - spike: ``start`` with a burst to ``target`` for ``spike_seconds``
+          in the middle of the phase.
+        - sine: ``start`` -> ``target`` -> ``start`` every ``period_seconds``.
+    """
+
+    shape: Literal["constant", "ramp", "step", "spike", "sine"] = Field(
+        description="Load shape of the phase"
+    )
+    duration_seconds: float = Field(gt=0, description="Phase duration in seconds")
+    target: float = Field(ge=0, description="Target (or peak) concurrency or request rate")
+    start: Optional[float] = Field(
+        default=None, ge=0, description="Level at phase start (previous phase's end when unset)"
+    )
+    steps: int = Field(default=4, ge=1, description="Number of steps (step)")
+    spike_seconds: Optional[float] = Field(
+        default=None, gt=0, description="Spike width (a third of the phase when unset)"
+    )
+    period_seconds: Optional[float] = Field(
+        default=None, gt=0, description="Sine period (the phase duration when unset)"
+    )
+    steady: Optional[bool] = Field(
+        default=None,
+        description="Count toward steady-state results (every shape but ramp when unset)",
+    )
+    name: Optional[str] = Field(default=None, description="Phase label")
+
+
+class LoadProfile(BaseModel):
+    """Time-varying load made of consecutive phases."""
+
+    dimension: Literal["concurrency", "request_rate"] = Field(
+        default="concurrency", description="Load dimension the phases drive"
+    )
+    phases: list[LoadPhase] = Field(min_length=1, description="Phases run back to back")
+
+
+class TransportConfig(BaseModel):
+    """HTTP transport shared by all HTTP-based adapters."""
+
+    http_version: Literal["1.1", "2"] = Field(
+        default="1.1", description="HTTP version (2: ALPN over TLS, prior knowledge over http://)"
+    )
+    http2_max_streams: int = Field(
+        default=100,
+        ge=1,
+        le=100,
+        description="Concurrent streams per HTTP/2 connection (more connections are opened)",
+    )
+    uds: Optional[str] = Field(
+        default=None, description="Unix domain socket path (replaces TCP to the server host)"
+    )
+    tcp_nodelay: bool = Field(default=True, description="Disable Nagle's algorithm (TCP_NODELAY)")
+    tcp_keepalive_seconds: Optional[float] = Field(
+        default=None, gt=0, description="TCP keep-alive idle time and probe interval (None: OS)"
+    )
+    keepalive_expiry: float = Field(
+        default=30.0, ge=0, description="Idle pooled connections are closed after this (seconds)"
+    )
 
 
 class BenchmarkConfig(BaseModel):
@@ -80,18 +208,186 @@ class BenchmarkConfig(BaseModel):
     concurrency: list[int] = Field(default=[1], description="Concurrency levels to test")
     stream: bool = Field(default=True, description="Enable streaming")
     warmup: int = Field(default=3, description="Number of warmup requests")
+
+    # Warmup: fixed serial requests, or ramp to concurrency[0] until TTFT stabilizes
+    warmup_mode: Literal["requests", "steady"] = Field(
+        default="requests", description="Warmup mode (requests, steady)"
+    )
+    warmup_ramp_seconds: float = Field(
+        default=10.0, ge=0, description="Steady warmup ramp-up time to the first concurrency"
+    )
+    warmup_window: int = Field(
+        default=20, ge=2, description="Completions per TTFT window (steady warmup)"
+    )
+    warmup_tolerance: float = Field(
+        default=0.05,
+        gt=0,
+        description="Stable once the CV of the last TTFT window means is at most this",
+    )
+    warmup_max_seconds: float = Field(
+        default=120.0, gt=0, description="Give up on steady state after this many seconds"
+    )
     timeout: float = Field(default=120.0, description="Request timeout (seconds)")
     api_key: Optional[str] = Field(default=None, description="API key")
 
     # Duration mode (alternative to num_prompts)
     duration_seconds: Optional[int] = Field(default=None, description="Test duration in seconds")
 
+    # Open-loop request-rate mode (concurrency then caps in-flight requests)
+    request_rate: Optional[float] = Field(
+        default=None, gt=0, description="Target request rate (requests/second)"
+    )
+    arrival_distribution: Literal["poisson", "constant", "gamma"] = Field(
+        default="poisson", description="Inter-arrival distribution for request-rate mode"
+    )
+    burstiness: float = Field(
+        default=1.0, gt=0, description="Gamma shape factor (<1 burstier, >1 smoother)"
+    )
+    seed: Optional[int] = Field(default=None, description="Random seed for arrival schedule")
+
+    # Metrics accuracy: exact samples, bounded-memory sketches, or auto-switch
+    metrics_mode: Literal["auto", "exact", "sketch"] = Field(
+        default="auto", description="Percentile accuracy mode (auto, exact, sketch)"
+    )
+
+    # Dataset-driven prompts (synthetic filler prompts of input_len when unset)
+    dataset: Optional[str] = Field(
+        default=None, description="Prompt dataset path (JSONL or ShareGPT-style JSON)"
+    )
+    dataset_format: Literal["auto", "jsonl", "sharegpt"] = Field(
+        default="auto", description="Dataset file format"
+    )
+
+    # Synthetic prompts: unset prefix_len keeps one fixed prompt (always a prefix-cache hit)
+    prefix_len: Optional[int] = Field(
+        default=None, ge=0, description="Shared prefix tokens; enables unique random prompts"
+    )
+    prefix_share_ratio: float = Field(
+        default=1.0, ge=0, le=1, description="Fraction of requests carrying the shared prefix"
+    )
+
+    # Per-request length distributions (override input_len/output_len when set)
+    input_len_dist: Optional[LengthDistribution] = Field(
+        default=None, description="Input length distribution (synthetic prompts)"
+    )
+    output_len_dist: Optional[LengthDistribution] = Field(
+        default=None, description="Output length (max_tokens) distribution"
+    )
+
+    # Convergence-based early stop (count mode): num_prompts becomes the maximum
+    convergence_width: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Stop a level once TTFT p50/p99 and throughput CIs are this narrow "
+        "(relative width, e.g. 0.1)",
+    )
+    convergence_confidence: float = Field(
+        default=0.95, gt=0, lt=1, description="Confidence level of the convergence CIs"
+    )
+    convergence_min_requests: int = Field(
+        default=100, ge=1, description="Requests before convergence is first checked"
+    )
+
+    # Per-interval metric timeline (None disables it)
+    timeline_interval: Optional[float] = Field(
+        default=1.0, gt=0, description="Timeline bucket width in seconds"
+    )
+
+    # Event-loop lag above which results are flagged client_saturated
+    loop_lag_threshold_ms: float = Field(
+        default=10.0, gt=0, description="Client event-loop lag threshold (ms)"
+    )
+
+    # Staged load profile (replaces the concurrency sweep; concurrency caps request-rate profiles)
+    load_profile: Optional[LoadProfile] = Field(
+        default=None, description="Ramp/step/spike/sine load profile"
+    )
+
+    # HTTP transport (HTTP/2, Unix domain socket, socket options)
+    transport: TransportConfig = Field(
+        default_factory=TransportConfig, description="HTTP transport options"
+    )
+
+    # Multi-process load generation (concurrency and requests sharded across workers)
+    workers: int = Field(default=1, ge=1, description="Number of load-generator processes")
+
     # Goodput thresholds
     goodput_thresholds: Optional[GoodputThresholds] = Field(
         default=None, description="SLO thresholds for Goodput"
     )
 
 
+class LengthBucketStats(BaseModel):
+    """Latency of requests whose input or output length falls in one bin."""
+
+    axis: Literal["input", "output"] = Field(description="Length the requests are binned by")
+    min_tokens: int = Field(description="Bin lower bound (inclusive)")
+    max_tokens: Optional[int] = Field(
+        default=None, description="Bin upper bound (exclusive, None if open-ended)"
+    )
+    count: int = Field(description="Successful requests in the bin")
+    ttft: LatencyStats = Field(description="TTFT statistics")
+    tpot: Optional[LatencyStats] = Field(default=None, description="TPOT statistics")
+    e2e_latency: LatencyStats = Field(description="E2E latency statistics")
+
+
+class ConvergenceStats(BaseModel):
+    """Confidence intervals reached by a level run with convergence stopping."""
+
+    confidence: float = Field(description="Confidence level")
+    target_width: float = Field(description="Target relative CI width")
+    converged: bool = Field(description="Stopped early because every CI reached the target")
+    requests: int = Field(description="Requests completed when the level stopped")
+    ttft_p50: ConfidenceInterval = Field(description="TTFT p50 CI (ms)")
+    ttft_p99: ConfidenceInterval = Field(description="TTFT p99 CI (ms)")
+    throughput: ConfidenceInterval = Field(description="Output throughput CI (tokens/s)")
+
+
+class Timeline(BaseModel):
+    """Per-interval metrics of one level, stored column-wise.
+
+    Bucket ``i`` covers ``[i * interval_seconds, (i + 1) * interval_seconds)``
+    seconds after the level started. Latency quantiles are None for buckets
+    without successful completions.
+    """
+
+    interval_seconds: float = Field(description="Bucket width in seconds")
+    requests: list[int] = Field(description="Requests completed per bucket")
+    errors: list[int] = Field(description="Failed requests per bucket")
+    throughput_tokens_per_sec: list[float] = Field(description="Output tokens/s per bucket")
+    in_flight: list[float] = Field(description="Average in-flight requests per bucket")
+    ttft_p50: list[Optional[float]] = Field(description="TTFT p50 per bucket (ms)")
+    ttft_p99: list[Optional[float]] = Field(description="TTFT p99 per bucket (ms)")
+    e2e_p50: list[Optional[float]] = Field(description="E2E latency p50 per bucket (ms)")
+    e2e_p99: list[Optional[float]] = Field(description="E2E latency p99 per bucket (ms)")
+
+
+class SignificanceTest(BaseModel):
+    """Whether a statistic differs significantly between two runs."""
+
+    metric: str = Field(description="Compared statistic")
+    baseline: float = Field(description="Baseline run estimate")
+    value: float = Field(description="Compared run estimate")
+    diff_percent: Optional[float] = Field(
+        default=None, description="Relative difference from the baseline (%)"
+    )
+    p_value: Optional[float] = Field(
+        default=None, description="Two-sided p-value (None without confidence intervals)"
+    )
+    significant: bool = Field(description="Difference is statistically significant")
+
+
+class PhaseTag(BaseModel):
+    """Load profile phase a result belongs to."""
+
+    index: int = Field(description="Phase index in the profile")
+    name: Optional[str] = Field(default=None, description="Phase label")
+    shape: str = Field(description="Load shape of the phase")
+    steady: bool = Field(description="Counted toward steady-state results")
+    start_seconds: float = Field(description="Phase start since the profile started")
+    duration_seconds: float = Field(description="Phase duration in seconds")
+
+
 class ConcurrencyResult(BaseModel):
     """Results for a specific concurrency level."""
 
@@ -101,6 +397,9 @@ class ConcurrencyResult(BaseModel):
     itl: Optional[LatencyStats] = Field(default=None, description="ITL statistics")
     e2e_latency: LatencyStats = Field(description="E2E latency statistics")
     throughput_tokens_per_sec: float = Field(description="Tokens per second")
+    throughput_ci: Optional[ConfidenceInterval] = Field(
+        default=None, description="Throughput confidence interval (tokens/s)"
+    )
     request_rate_per_sec: float = Field(description="Requests per second")
     total_requests: int = Field(description="Total requests")
     successful_requests: int = Field(description="Successful requests")
@@ -113,6 +412,69 @@ class ConcurrencyResult(BaseModel):
     # Goodput (optional)
     goodput: Optional[GoodputResult] = Field(default=None, description="Goodput result")
 
+    # Request-rate mode (optional)
+    request_rate_target: Optional[float] = Field(
+        default=None, description="Target request rate (requests/second)"
+    )
+    send_lag: Optional[LatencyStats] = Field(
+        default=None, description="Scheduled-vs-actual send lag statistics (ms)"
+    )
+
+    # Latency measured from intended start times (coordinated-omission corrected)
+    ttft_corrected: Optional[LatencyStats] = Field(
+        default=None, description="TTFT statistics corrected for coordinated omission"
+    )
+    e2e_corrected: Optional[LatencyStats] = Field(
+        default=None, description="E2E latency statistics corrected for coordinated omission"
+    )
+
+    # Client-side event-loop lag (load generator saturation)
+    loop_lag: Optional[LatencyStats] = Field(
+        default=None, description="Client event-loop lag statistics (ms)"
+    )
+    client_saturated: bool = Field(
+        default=False, description="Some results were gathered while the client loop lagged"
+    )
+    saturated_requests: int = Field(
+        default=0, description="Requests completed while the client loop lagged"
+    )
+
+    # Latency by input/output length bin (runs with varying request lengths)
+    length_buckets: Optional[list[LengthBucketStats]] = Field(
+        default=None, description="Latency statistics per token-length bin"
+    )
+
+    # Achieved confidence intervals (runs with convergence_width)
+    convergence: Optional[ConvergenceStats] = Field(
+        default=None, description="Confidence intervals at the end of the level"
+    )
+
+    # Load profile phase (profile runs; requests are attributed to the phase they were sent in)
+    phase: Optional[PhaseTag] = Field(default=None, description="Load profile phase")
+
+    # Metrics over time within the level (runs with timeline_interval)
+    timeline: Optional[Timeline] = Field(default=None, description="Per-interval timeline")
+
+    # How percentiles were computed ("exact" samples or bounded-memory "sketch")
+    metrics_mode: str = Field(default="exact", description="Percentile computation mode")
+
+
+class WarmupResult(BaseModel):
+    """What the warmup sent and whether the server reached steady state."""
+
+    mode: Literal["requests", "steady"] = Field(description="Warmup mode")
+    concurrency: int = Field(description="Warmup concurrency")
+    total_requests: int = Field(description="Warmup requests sent")
+    failed_requests: int = Field(description="Failed warmup requests")
+    duration_seconds: float = Field(description="Warmup duration in seconds")
+    stable: Optional[bool] = Field(
+        default=None, description="TTFT reached steady state (steady mode only)"
+    )
+    ttft_mean_ms: Optional[float] = Field(
+        default=None, description="Mean TTFT of the last window (steady mode only)"
+    )
+    errors: list[str] = Field(default_factory=list, description="Distinct error messages")
+
 
 class BenchmarkResult(BaseModel):
     """Complete benchmark result."""
@@ -123,10 +485,14 @@ class BenchmarkResult(BaseModel):
     adapter: str = Field(default="openai", description="Adapter type")
     config: BenchmarkConfig = Field(description="Benchmark configuration")
     results: list[ConcurrencyResult] = Field(description="Results per concurrency level")
+    transient_results: Optional[list[ConcurrencyResult]] = Field(
+        default=None, description="Non-steady (ramp) profile phases, excluded from results"
+    )
     gpu_metrics: Optional[GPUMetrics] = Field(default=None, description="GPU metrics (deprecated)")
     started_at: datetime = Field(description="Start timestamp")
     completed_at: datetime = Field(description="Completion timestamp")
     duration_seconds: float = Field(description="Total duration in seconds")
+    warmup: Optional[WarmupResult] = Field(default=None, description="Warmup report")
 
     # Server infrastructure info (for AI analysis)
     server_infra: Optional["ServerInfraInfo"] = Field(
@@ -170,6 +536,34 @@ class BenchmarkResult(BaseModel):
         return summary
 
 
+class SearchPoint(BaseModel):
+    """One level measured by the adaptive concurrency/request-rate search."""
+
+    value: float = Field(description="Concurrency or request rate measured")
+    passed: bool = Field(description="Goodput met the target at this level")
+    goodput_percent: float = Field(
+        description="Requests meeting all SLOs over all requests sent (%)"
+    )
+    result: ConcurrencyResult = Field(description="Metrics of the level")
+
+
+class SearchResult(BaseModel):
+    """Outcome of an adaptive search for the highest load meeting the SLOs."""
+
+    dimension: Literal["concurrency", "request_rate"] = Field(
+        description="Load dimension that was searched"
+    )
+    goodput_target_percent: float = Field(description="Goodput target (%)")
+    points: list[SearchPoint] = Field(description="Measured levels sorted by value")
+    optimum: Optional[SearchPoint] = Field(
+        default=None, description="Highest passing level (None if none passed)"
+    )
+    knee: Optional[float] = Field(
+        default=None, description="Lowest failing level above the optimum"
+    )
+    total_requests: int = Field(description="Requests sent across all levels")
+
+
 # ============================================================
 # Phase 5: Infrastructure Recommendation Models
 # ============================================================
@@ -211,14 +605,16 @@ class InfraProfile(BaseModel):
     )
     throughput_tokens_per_sec: float = Field(description="Throughput (tokens/sec)")
     goodput_at_max_concurrency: float = Field(
-        description="Goodput percentage at max concurrency"
+        description="Goodput percentage at max concurrency (failed requests count as misses)"
     )
 
     # Saturation analysis
     saturation_concurrency: int = Field(
         description="Concurrency level where performance starts degrading"
     )
-    saturation_goodput: float = Field(description="Goodput at saturation point")
+    saturation_goodput: float = Field(
+        description="Goodput at saturation point (failed requests count as misses)"
+    )
 
 
 class InfraRecommendation(BaseModel):
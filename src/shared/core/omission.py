@@ -0,0 +1,117 @@
+"""Coordinated-omission correction of latency percentiles.
+
+A closed-loop worker only sends its next request once the previous response
+arrives, so while the server stalls it silently stops sending: the requests
+real users would have issued during the stall are never measured, and the
+reported tail looks better than what users experience.
+
+Every request is measured against its intended start time instead:
+
+- open loop (request-rate mode): the intended start is the scheduled arrival,
+  so the corrected latency is the raw latency plus ``send_lag_ms``.
+- closed loop: a worker intends to send every ``expected_interval_ms`` (its
+  normal pace, the running median E2E latency of the level). A request that
+  takes ``L`` blocks the intended sends at ``I, 2I, ...`` after its own; like
+  HdrHistogram's ``recordValueWithExpectedInterval`` each of them is counted
+  with latency ``L - k*I`` for every ``L - k*I >= I``.
+
+The worker is blocked for a request's whole E2E latency, so the omitted
+requests always follow from ``L = E2E``, also for TTFT: an omitted request
+first waits ``E2E - k*I`` for the worker and then its own TTFT, so a stall
+during decode shows up in the corrected TTFT tail as well.
+"""
+
+from collections import deque
+from typing import Optional
+
+import numpy as np
+
+# Raw E2E latencies the closed-loop pace is estimated from
+PACE_WINDOW = 256
+
+# Samples before a pace is reported (no correction before that)
+MIN_PACE_SAMPLES = 16
+
+# The median is recomputed after this many new samples
+PACE_REFRESH = 16
+
+
+class PaceEstimator:
+    """Running estimate of the interval a closed-loop worker intends to send at.
+
+    The median of the most recent E2E latencies is used, so a stall (a
+    handful of very slow requests) does not stretch the schedule it is
+    measured against.
+
+    Example:
+        >>> pace = PaceEstimator()
+        >>> result.expected_interval_ms = pace.interval_ms
+        >>> pace.add(result.e2e_latency_ms)
+    """
+
+    def __init__(self, window: int = PACE_WINDOW, min_samples: int = MIN_PACE_SAMPLES):
+        """Initialize the estimator.
+
+        Args:
+            window: Number of recent latencies kept.
+            min_samples: Latencies needed before ``interval_ms`` is set.
+        """
+        self.min_samples = min_samples
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._pending = 0
+        self.interval_ms: Optional[float] = None
+
+    def add(self, e2e_ms: float) -> None:
+        """Add the E2E latency of a successful request."""
+        self._latencies.append(e2e_ms)
+        self._pending += 1
+        if len(self._latencies) < self.min_samples:
+            return
+        if self.interval_ms is None or self._pending >= PACE_REFRESH:
+            self.interval_ms = float(np.median(self._latencies))
+            self._pending = 0
+
+
+def corrected_values(
+    values: np.ndarray,
+    send_lag_ms: np.ndarray,
+    expected_interval_ms: np.ndarray,
+    e2e_ms: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Latencies measured from intended start times, omitted requests included.
+
+    Args:
+        values: Raw latencies (ms) of successful requests.
+        send_lag_ms: Actual minus scheduled send time per request (NaN when
+            the request was not scheduled).
+        expected_interval_ms: Closed-loop pace per request (NaN when unknown).
+        e2e_ms: E2E latencies of the same requests when ``values`` is a part
+            of it such as TTFT (None when ``values`` are the E2E latencies).
+            The omitted requests follow from the E2E latency, and each adds
+            its wait for the worker, ``E2E - k*I``, to the request's value.
+
+    Returns:
+        Corrected latencies: one per request plus the synthesized omitted ones.
+    """
+    lag = np.nan_to_num(send_lag_ms, nan=0.0)
+    raw = np.asarray(values, dtype=np.float64)
+    values = raw + lag
+    blocked = values if e2e_ms is None else np.asarray(e2e_ms, dtype=np.float64) + lag
+    interval = np.asarray(expected_interval_ms, dtype=np.float64)
+
+    # 요청당 누락 건수: E2E - k*I >= I 를 만족하는 k (1..floor(E2E/I) - 1)
+    missing = np.zeros(len(values), dtype=np.int64)
+    valid = interval > 0
+    missing[valid] = np.maximum(np.floor(blocked[valid] / interval[valid]) - 1, 0)
+    total = int(missing.sum())
+    if total == 0:
+        return values
+
+    rows = np.repeat(np.arange(len(values)), missing)
+    starts = np.cumsum(missing) - missing
+    k = np.arange(total) - np.repeat(starts, missing) + 1
+    # 워커가 풀릴 때까지 기다린 시간 (E2E 자체라면 그 값이 곧 지연)
+    omitted = blocked[rows] - k * interval[rows]
+    if e2e_ms is not None:
+        omitted += raw[rows]
+    return np.concatenate([values, omitted])
@@ -0,0 +1,426 @@
+"""Staged load profiles: ramp, step, spike and sine phases.
+
+A ``LoadProfile`` drives either the number of concurrent workers (closed
+loop) or the request rate (open loop) as a function of time. Every request is
+attributed to the phase it was sent in and each phase gets its own
+``ConcurrencyResult``; ramp phases are tagged non-steady so warm-up and
+transition periods stay out of the steady-state results.
+
+Time-varying request rates use time rescaling: unit-rate inter-arrival times
+from ``ArrivalScheduler`` (Poisson, constant or gamma) are mapped through the
+inverse of the cumulative rate, so the arrival process keeps its shape while
+its rate follows the profile.
+"""
+
+import asyncio
+import bisect
+import logging
+import math
+import time
+from typing import TYPE_CHECKING, Iterator, Optional
+
+import numpy as np
+
+from shared.core.arrival import ArrivalScheduler
+from shared.core.metrics import MetricsAggregator
+from shared.core.models import (
+    BenchmarkConfig,
+    ConcurrencyResult,
+    LoadPhase,
+    LoadProfile,
+    PhaseTag,
+    RequestResult,
+)
+from shared.core.omission import PaceEstimator
+from shared.core.workload import prompt_source_for
+
+if TYPE_CHECKING:
+    from shared.core.load_generator import LoadGenerator, ProgressCallback
+
+logger = logging.getLogger(__name__)
+
+# Resolution of the cumulative-rate grid used to place arrivals (seconds)
+RATE_GRID_SECONDS = 0.01
+
+# How often the concurrency controller re-reads the profile (seconds)
+CONTROL_TICK_SECONDS = 0.05
+
+
+def is_steady(phase: LoadPhase) -> bool:
+    """Whether a phase counts toward steady-state results."""
+    return phase.steady if phase.steady is not None else phase.shape != "ramp"
+
+
+def phase_levels(phase: LoadPhase, start_level: float, t: np.ndarray) -> np.ndarray:
+    """Load level of a phase at times ``t`` (seconds since the phase started).
+
+    Args:
+        phase: Phase definition.
+        start_level: Level at the phase start.
+        t: Times within the phase.
+
+    Returns:
+        Concurrency or request rate at each time.
+    """
+    t = np.asarray(t, dtype=np.float64)
+    start, target, duration = start_level, phase.target, phase.duration_seconds
+
+    if phase.shape == "constant":
+        return np.full_like(t, target)
+    if phase.shape == "ramp":
+        return start + (target - start) * np.clip(t / duration, 0.0, 1.0)
+    if phase.shape == "step":
+        step = np.minimum(np.floor(t / duration * phase.steps) + 1, phase.steps)
+        return start + (target - start) * step / phase.steps
+    if phase.shape == "spike":
+        width = phase.spike_seconds or duration / 3
+        return np.where(np.abs(t - duration / 2) < width / 2, target, start)
+    # sine
+    period = phase.period_seconds or duration
+    return start + (target - start) * (1 - np.cos(2 * np.pi * t / period)) / 2
+
+
+class ProfileSchedule:
+    """Load level over time for a whole profile.
+
+    Example:
+        >>> schedule = ProfileSchedule(profile)
+        >>> schedule.level(12.5), schedule.phase_index(12.5)
+    """
+
+    def __init__(self, profile: LoadProfile):
+        """Resolve phase boundaries and start levels.
+
+        Args:
+            profile: Load profile.
+
+        Raises:
+            ValueError: If no phase counts toward steady-state results.
+        """
+        if not any(is_steady(phase) for phase in profile.phases):
+            raise ValueError("A load profile needs at least one steady (non-ramp) phase")
+
+        self.profile = profile
+        self.phases = profile.phases
+        self.starts: list[float] = []
+        self.start_levels: list[float] = []
+
+        elapsed = 0.0
+        level = 0.0
+        for phase in self.phases:
+            start_level = phase.start if phase.start is not None else level
+            self.starts.append(elapsed)
+            self.start_levels.append(start_level)
+            elapsed += phase.duration_seconds
+            level = float(phase_levels(phase, start_level, [phase.duration_seconds])[0])
+        self.duration = elapsed
+
+    def phase_index(self, t: float) -> int:
+        """Index of the phase running at ``t`` seconds (the last one after the end)."""
+        return max(bisect.bisect_right(self.starts, t) - 1, 0)
+
+    def level(self, t: float) -> float:
+        """Load level at ``t`` seconds since the profile started."""
+        index = self.phase_index(t)
+        offset = min(t - self.starts[index], self.phases[index].duration_seconds)
+        return float(phase_levels(self.phases[index], self.start_levels[index], [offset])[0])
+
+    def levels(self, t: np.ndarray) -> np.ndarray:
+        """Vectorized ``level`` over sorted times."""
+        t = np.asarray(t, dtype=np.float64)
+        levels = np.empty_like(t)
+        indices = np.clip(np.searchsorted(self.starts, t, side="right") - 1, 0, None)
+        for index, phase in enumerate(self.phases):
+            mask = indices == index
+            if mask.any():
+                offset = np.minimum(t[mask] - self.starts[index], phase.duration_seconds)
+                levels[mask] = phase_levels(phase, self.start_levels[index], offset)
+        return levels
+
+    def phase_range(self, index: int) -> tuple[float, float]:
+        """Minimum and maximum level within a phase."""
+        phase = self.phases[index]
+        cells = max(int(phase.duration_seconds / RATE_GRID_SECONDS), 1)
+        t = np.linspace(0.0, phase.duration_seconds, cells + 1)
+        levels = phase_levels(phase, self.start_levels[index], t)
+        return float(levels.min()), float(levels.max())
+
+    def max_level(self) -> float:
+        """Highest level anywhere in the profile."""
+        return max(self.phase_range(index)[1] for index in range(len(self.phases)))
+
+    def _cumulative_rate(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Grid edges, expected arrivals up to each edge, and per-cell rates."""
+        cells = max(int(math.ceil(self.duration / RATE_GRID_SECONDS)), 1)
+        edges = np.linspace(0.0, self.duration, cells + 1)
+        rates = self.levels((edges[:-1] + edges[1:]) / 2)
+        cumulative = np.concatenate(([0.0], np.cumsum(rates * np.diff(edges))))
+        return edges, cumulative, rates
+
+    def mean_rate(self, index: int) -> float:
+        """Average request rate of a phase (request-rate profiles)."""
+        phase = self.phases[index]
+        cells = max(int(phase.duration_seconds / RATE_GRID_SECONDS), 1)
+        t = (np.arange(cells) + 0.5) * (phase.duration_seconds / cells)
+        return float(phase_levels(phase, self.start_levels[index], t).mean())
+
+    def arrival_offsets(
+        self,
+        distribution: str = "poisson",
+        burstiness: float = 1.0,
+        seed: Optional[int] = None,
+    ) -> Iterator[float]:
+        """Send offsets (seconds since the profile started) following the rate profile.
+
+        Args:
+            distribution: Inter-arrival distribution.
+            burstiness: Gamma shape factor.
+            seed: Optional random seed for a reproducible schedule.
+
+        Yields:
+            Non-decreasing send offsets until the profile ends.
+        """
+        edges, cumulative, rates = self._cumulative_rate()
+        total = cumulative[-1]
+        unit = ArrivalScheduler(
+            request_rate=1.0, distribution=distribution, burstiness=burstiness, seed=seed
+        )
+        for tau in unit.iter_offsets():
+            # 운영 시간 tau -> 실제 시간 (누적 도착률의 역함수)
+            tau = max(tau, 1e-12)
+            if tau >= total:
+                return
+            cell = int(np.searchsorted(cumulative, tau, side="left")) - 1
+            yield float(edges[cell] + (tau - cumulative[cell]) / rates[cell])
+
+
+def max_connections_for(config: BenchmarkConfig) -> int:
+    """Connection pool size covering the most in-flight requests of a config.
+
+    Concurrency profiles start ``ceil(max_level())`` workers, which may be
+    more than ``max(config.concurrency)``; request-rate profiles are capped
+    at ``max(config.concurrency)``.
+    """
+    peak = max(config.concurrency)
+    profile = config.load_profile
+    if profile is not None and profile.dimension == "concurrency":
+        peak = max(peak, int(math.ceil(ProfileSchedule(profile).max_level())))
+    return peak
+
+
+class ProfileRunner:
+    """Run a load profile and report one result per phase.
+
+    Example:
+        >>> runner = ProfileRunner(load_generator)
+        >>> steady, transient = await runner.run(config)
+    """
+
+    def __init__(self, load_generator: "LoadGenerator"):
+        """Initialize runner with a load generator.
+
+        Args:
+            load_generator: LoadGenerator instance configured with server adapter.
+        """
+        self.load_generator = load_generator
+
+    async def run(
+        self,
+        config: BenchmarkConfig,
+        progress_callback: Optional["ProgressCallback"] = None,
+    ) -> tuple[list[ConcurrencyResult], list[ConcurrencyResult]]:
+        """Run ``config.load_profile`` once, back to back.
+
+        ``num_prompts``, ``duration_seconds`` and ``request_rate`` are ignored;
+        request-rate profiles cap in-flight requests at ``max(config.concurrency)``.
+
+        Args:
+            config: Benchmark configuration with ``load_profile`` set.
+            progress_callback: Optional callback for progress updates.
+
+        Returns:
+            ``(steady, transient)`` phase results, each in profile order.
+
+        Raises:
+            ValueError: If the config has no load profile.
+        """
+        profile = config.load_profile
+        if profile is None:
+            raise ValueError("ProfileRunner requires config.load_profile")
+        if config.workers > 1:
+            logger.warning("load_profile runs in a single process; workers is ignored")
+
+        schedule = ProfileSchedule(profile)
+        aggregators = [MetricsAggregator.for_config(config) for _ in schedule.phases]
+
+        start_time = time.perf_counter()
+        for aggregator, phase_start in zip(aggregators, schedule.starts):
+            if aggregator.timeline is not None:
+                aggregator.timeline.start(start_time + phase_start)
+
+        def add_loop_lag(lag_ms: float) -> None:
+            # 루프 지연 표본도 관측 시점의 단계에 귀속
+            index = schedule.phase_index(time.perf_counter() - start_time)
+            aggregators[index].add_loop_lag(lag_ms)
+
+        async with self.load_generator.track_loop_lag(config, add_loop_lag):
+            if profile.dimension == "request_rate":
+                await self._run_rate(
+                    config, schedule, aggregators, start_time, progress_callback
+                )
+            else:
+                await self._run_concurrency(
+                    config, schedule, aggregators, start_time, progress_callback
+                )
+
+        steady: list[ConcurrencyResult] = []
+        transient: list[ConcurrencyResult] = []
+        for index, (phase, aggregator) in enumerate(zip(schedule.phases, aggregators)):
+            result = self._phase_result(config, schedule, index, aggregator)
+            (steady if is_steady(phase) else transient).append(result)
+        return steady, transient
+
+    def _phase_result(
+        self,
+        config: BenchmarkConfig,
+        schedule: ProfileSchedule,
+        index: int,
+        aggregator: MetricsAggregator,
+    ) -> ConcurrencyResult:
+        phase = schedule.phases[index]
+        if schedule.profile.dimension == "request_rate":
+            concurrency = max(config.concurrency)
+            rate_target = schedule.mean_rate(index)
+        else:
+            concurrency = int(round(schedule.phase_range(index)[1]))
+            rate_target = None
+
+        result = aggregator.finalize(
+            phase.duration_seconds, concurrency, request_rate_target=rate_target
+        )
+        result.phase = PhaseTag(
+            index=index,
+            name=phase.name,
+            shape=phase.shape,
+            steady=is_steady(phase),
+            start_seconds=schedule.starts[index],
+            duration_seconds=phase.duration_seconds,
+        )
+        return result
+
+    def _record(
+        self,
+        aggregators: list[MetricsAggregator],
+        index: int,
+        result: RequestResult,
+        schedule: ProfileSchedule,
+        start_time: float,
+        progress_callback: Optional["ProgressCallback"],
+    ) -> None:
+        aggregators[index].add(result)
+        if progress_callback:
+            elapsed = time.perf_counter() - start_time
+            total = int(math.ceil(schedule.duration))
+            phase = schedule.phases[index]
+            progress_callback(
+                min(int(elapsed), total),
+                total,
+                f"Phase {index + 1}/{len(schedule.phases)} ({phase.name or phase.shape}): "
+                f"{aggregators[index].total_requests} requests",
+            )
+
+    async def _run_concurrency(
+        self,
+        config: BenchmarkConfig,
+        schedule: ProfileSchedule,
+        aggregators: list[MetricsAggregator],
+        start_time: float,
+        progress_callback: Optional["ProgressCallback"],
+    ) -> None:
+        """Closed loop: worker ``i`` sends only while the level is above ``i``."""
+        generator = self.load_generator
+        prompts = prompt_source_for(config)
+        level = 0
+        done = False
+        next_id = 0
+        changed = asyncio.Condition()
+        pace = PaceEstimator()
+
+        async def controller() -> None:
+            nonlocal level, done
+            while True:
+                elapsed = time.perf_counter() - start_time
+                if elapsed >= schedule.duration:
+                    done = True
+                else:
+                    level = int(round(schedule.level(elapsed)))
+                async with changed:
+                    changed.notify_all()
+                if done:
+                    return
+                await asyncio.sleep(CONTROL_TICK_SECONDS)
+
+        async def worker(slot: int) -> None:
+            nonlocal next_id
+            while True:
+                async with changed:
+                    await changed.wait_for(lambda: done or slot < level)
+                if done:
+                    return
+
+                # 요청은 전송 시점의 단계에 귀속
+                index = schedule.phase_index(time.perf_counter() - start_time)
+                request_id = next_id
+                next_id += 1
+                prompt, max_tokens = prompts.get(request_id)
+                result = await generator.send_request(
+                    request_id, prompt, max_tokens, config.stream
+                )
+                result.expected_interval_ms = pace.interval_ms
+                if result.success:
+                    pace.add(result.e2e_latency_ms)
+                self._record(
+                    aggregators, index, result, schedule, start_time, progress_callback
+                )
+
+        slots = int(math.ceil(schedule.max_level()))
+        await asyncio.gather(controller(), *(worker(slot) for slot in range(slots)))
+
+    async def _run_rate(
+        self,
+        config: BenchmarkConfig,
+        schedule: ProfileSchedule,
+        aggregators: list[MetricsAggregator],
+        start_time: float,
+        progress_callback: Optional["ProgressCallback"],
+    ) -> None:
+        """Open loop: arrivals follow the rate profile, capped by max concurrency."""
+        generator = self.load_generator
+        prompts = prompt_source_for(config)
+        semaphore = asyncio.Semaphore(max(config.concurrency))
+        tasks: list[asyncio.Task] = []
+
+        async def send_request(request_id: int, index: int, scheduled_time: float) -> None:
+            prompt, max_tokens = prompts.get(request_id)
+            async with semaphore:
+                sent_time = time.perf_counter()
+                result = await generator.send_request(
+                    request_id, prompt, max_tokens, config.stream
+                )
+            result.send_lag_ms = (sent_time - scheduled_time) * 1000
+            self._record(
+                aggregators, index, result, schedule, start_time, progress_callback
+            )
+
+        offsets = schedule.arrival_offsets(
+            config.arrival_distribution, config.burstiness, config.seed
+        )
+        for request_id, offset in enumerate(offsets):
+            scheduled_time = start_time + offset
+            delay = scheduled_time - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            index = schedule.phase_index(offset)
+            tasks.append(asyncio.create_task(send_request(request_id, index, scheduled_time)))
+
+        await asyncio.gather(*tasks)
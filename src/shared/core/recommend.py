@@ -9,6 +9,8 @@ Reference: PRD Phase 5 - Infrastructure Recommendation
 """
 
 import math
+import uuid
+from datetime import datetime
 from typing import Callable, Optional
 
 from shared.core.gpu_monitor import get_gpu_info
@@ -22,6 +24,7 @@ from shared.core.models import (
     InfraRecommendation,
     WorkloadSpec,
 )
+from shared.core.search import DEFAULT_MAX_CONCURRENCY, ConcurrencySearch, goodput_of
 
 
 ProgressCallback = Callable[[str, int, int], None]
@@ -60,6 +63,8 @@ class InfraRecommender:
         num_requests_per_step: int = 50,
         headroom: float = 0.2,
         progress_callback: Optional[ProgressCallback] = None,
+        adaptive: bool = False,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ) -> tuple[InfraRecommendation, BenchmarkResult]:
         """Run profiling tests and generate infrastructure recommendation.
 
@@ -70,6 +75,9 @@ class InfraRecommender:
             num_requests_per_step: Number of requests per concurrency level.
             headroom: Safety margin percentage (default: 20%).
             progress_callback: Optional callback(stage, current, total) for progress.
+            adaptive: Search for the knee (exponential ramp + binary search
+                driven by goodput) instead of testing ``concurrency_steps``.
+            max_concurrency: Upper bound of the adaptive search.
 
         Returns:
             Tuple of (InfraRecommendation, BenchmarkResult from profiling).
@@ -101,9 +109,14 @@ class InfraRecommender:
             if progress_callback:
                 progress_callback(f"Testing: {msg or ''}", current, total)
 
-        benchmark_result = await self.load_generator.run(
-            profile_config, progress_callback=benchmark_progress
-        )
+        if adaptive:
+            benchmark_result = await self._run_search(
+                profile_config, workload, max_concurrency, benchmark_progress
+            )
+        else:
+            benchmark_result = await self.load_generator.run(
+                profile_config, progress_callback=benchmark_progress
+            )
 
         # Step 2: Build infrastructure profile from results
         if progress_callback:
@@ -129,6 +142,49 @@ class InfraRecommender:
 
         return recommendation, benchmark_result
 
+    async def _run_search(
+        self,
+        profile_config: BenchmarkConfig,
+        workload: WorkloadSpec,
+        max_concurrency: int,
+        progress_callback: Callable[[int, int, Optional[str]], None],
+    ) -> BenchmarkResult:
+        """Profile with an adaptive concurrency search.
+
+        Args:
+            profile_config: Profiling configuration with goodput thresholds.
+            workload: Target workload specification.
+            max_concurrency: Upper bound of the search.
+            progress_callback: Load generator progress callback.
+
+        Returns:
+            BenchmarkResult holding every measured level, sorted by concurrency.
+        """
+        started_at = datetime.now()
+        search_result = await ConcurrencySearch(self.load_generator).search(
+            profile_config,
+            goodput_target_percent=workload.goodput_target_percent,
+            start=min(profile_config.concurrency),
+            max_value=max_concurrency,
+            progress_callback=progress_callback,
+        )
+        completed_at = datetime.now()
+
+        results = [point.result for point in search_result.points]
+        return BenchmarkResult(
+            run_id=str(uuid.uuid4()),
+            server_url=profile_config.server_url,
+            model=profile_config.model,
+            adapter=profile_config.adapter,
+            config=profile_config.model_copy(
+                update={"concurrency": [r.concurrency for r in results]}
+            ),
+            results=results,
+            started_at=started_at,
+            completed_at=completed_at,
+            duration_seconds=(completed_at - started_at).total_seconds(),
+        )
+
     def _build_infra_profile(
         self,
         benchmark_result: BenchmarkResult,
@@ -173,7 +229,7 @@ class InfraRecommender:
             if result.concurrency == max_concurrency_at_slo:
                 throughput = result.throughput_tokens_per_sec
                 if result.goodput:
-                    goodput_at_max = result.goodput.goodput_percent
+                    goodput_at_max = goodput_of(result)
                 break
 
         # If no exact match, use the best result
@@ -181,7 +237,7 @@ class InfraRecommender:
             best = max(benchmark_result.results, key=lambda r: r.throughput_tokens_per_sec)
             throughput = best.throughput_tokens_per_sec
             if best.goodput:
-                goodput_at_max = best.goodput.goodput_percent
+                goodput_at_max = goodput_of(best)
 
         return InfraProfile(
             gpu_model=gpu_model,
@@ -227,7 +283,7 @@ class InfraRecommender:
 
             # Check Goodput if available
             if result.goodput:
-                if result.goodput.goodput_percent < workload.goodput_target_percent:
+                if goodput_of(result) < workload.goodput_target_percent:
                     meets_slo = False
 
             if meets_slo:
@@ -258,7 +314,7 @@ class InfraRecommender:
 
         if len(results) == 1:
             result = results[0]
-            goodput = result.goodput.goodput_percent if result.goodput else 100.0
+            goodput = goodput_of(result) if result.goodput else 100.0
             return (result.concurrency, goodput)
 
         # Sort by concurrency ascending
@@ -270,7 +326,7 @@ class InfraRecommender:
         saturation_goodput = 100.0
 
         for i, result in enumerate(sorted_results):
-            current_goodput = result.goodput.goodput_percent if result.goodput else 100.0
+            current_goodput = goodput_of(result) if result.goodput else 100.0
 
             # Saturation indicators:
             # 1. Goodput drop > 10% from previous
@@ -291,7 +347,7 @@ class InfraRecommender:
                 if i > 0:
                     prev_result = sorted_results[i - 1]
                     saturation_concurrency = prev_result.concurrency
-                    saturation_goodput = prev_result.goodput.goodput_percent if prev_result.goodput else 100.0
+                    saturation_goodput = goodput_of(prev_result) if prev_result.goodput else 100.0
                 else:
                     saturation_concurrency = result.concurrency
                     saturation_goodput = current_goodput
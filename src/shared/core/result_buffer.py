@@ -0,0 +1,351 @@
+"""Columnar (struct-of-arrays) storage for request results.
+
+Holding one pydantic ``RequestResult`` per request costs an object, a dict
+and a Python list of ITL floats each. ``ResultBuffer`` copies the fields of
+each completed request into preallocated NumPy columns instead, so a long
+duration-mode run stores ~60 bytes per request plus 4 bytes per ITL sample,
+and metrics are computed with vectorized masks over the columns.
+"""
+
+import base64
+from typing import Iterable, Optional
+
+import numpy as np
+
+from shared.core.models import RequestResult
+
+# Initial row / ITL capacity; both double when full
+DEFAULT_CAPACITY = 1024
+
+# error_code 0 means "no error"
+NO_ERROR = 0
+
+
+class ResultBuffer:
+    """Growable struct-of-arrays buffer of request results.
+
+    Optional float fields (``tpot_ms``, ``send_lag_ms``, ``expected_interval_ms``)
+    are stored as NaN
+    when absent. Error types are interned into small integer codes, and the
+    ITL samples of row ``i`` live in ``itl_values[itl_offsets[i]:itl_offsets[i + 1]]``.
+
+    Example:
+        >>> buffer = ResultBuffer()
+        >>> buffer.append(result)
+        >>> buffer.ttft_ms[buffer.success].mean()
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        """Initialize an empty buffer.
+
+        Args:
+            capacity: Initial number of rows to preallocate.
+        """
+        capacity = max(1, capacity)
+        self._size = 0
+        self._capacity = capacity
+
+        self._request_id = np.empty(capacity, dtype=np.int64)
+        self._ttft_ms = np.empty(capacity, dtype=np.float64)
+        self._tpot_ms = np.empty(capacity, dtype=np.float64)
+        self._e2e_ms = np.empty(capacity, dtype=np.float64)
+        self._send_lag_ms = np.empty(capacity, dtype=np.float64)
+        self._expected_interval_ms = np.empty(capacity, dtype=np.float64)
+        self._input_tokens = np.empty(capacity, dtype=np.int32)
+        self._output_tokens = np.empty(capacity, dtype=np.int32)
+        self._success = np.empty(capacity, dtype=np.bool_)
+        self._error_code = np.empty(capacity, dtype=np.int16)
+
+        # itl_offsets has one more entry than rows
+        self._itl_offsets = np.zeros(capacity + 1, dtype=np.int64)
+        self._itl_size = 0
+        self._itl_values = np.empty(capacity * 8, dtype=np.float32)
+
+        self._error_codes: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def itl_size(self) -> int:
+        """Total number of ITL samples stored."""
+        return self._itl_size
+
+    def _columns(self) -> tuple[str, ...]:
+        return (
+            "_request_id",
+            "_ttft_ms",
+            "_tpot_ms",
+            "_e2e_ms",
+            "_send_lag_ms",
+            "_expected_interval_ms",
+            "_input_tokens",
+            "_output_tokens",
+            "_success",
+            "_error_code",
+        )
+
+    def _reserve(self, rows: int) -> None:
+        """Ensure room for ``rows`` more rows."""
+        needed = self._size + rows
+        if needed <= self._capacity:
+            return
+
+        capacity = self._capacity
+        while capacity < needed:
+            capacity *= 2
+
+        for name in self._columns():
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[: self._size] = old[: self._size]
+            setattr(self, name, new)
+
+        offsets = np.zeros(capacity + 1, dtype=np.int64)
+        offsets[: self._size + 1] = self._itl_offsets[: self._size + 1]
+        self._itl_offsets = offsets
+        self._capacity = capacity
+
+    def _reserve_itl(self, samples: int) -> None:
+        """Ensure room for ``samples`` more ITL values."""
+        needed = self._itl_size + samples
+        if needed <= len(self._itl_values):
+            return
+
+        capacity = max(len(self._itl_values), 1)
+        while capacity < needed:
+            capacity *= 2
+
+        values = np.empty(capacity, dtype=np.float32)
+        values[: self._itl_size] = self._itl_values[: self._itl_size]
+        self._itl_values = values
+
+    def _error_code_for(self, error_type: Optional[str]) -> int:
+        if error_type is None:
+            return NO_ERROR
+        code = self._error_codes.get(error_type)
+        if code is None:
+            code = len(self._error_codes) + 1
+            self._error_codes[error_type] = code
+        return code
+
+    def append(self, result: RequestResult) -> None:
+        """Copy one request result into the buffer.
+
+        Args:
+            result: Completed request result.
+        """
+        self._reserve(1)
+        i = self._size
+
+        self._request_id[i] = result.request_id
+        self._ttft_ms[i] = result.ttft_ms
+        self._tpot_ms[i] = np.nan if result.tpot_ms is None else result.tpot_ms
+        self._e2e_ms[i] = result.e2e_latency_ms
+        self._send_lag_ms[i] = np.nan if result.send_lag_ms is None else result.send_lag_ms
+        interval = result.expected_interval_ms
+        self._expected_interval_ms[i] = np.nan if interval is None else interval
+        self._input_tokens[i] = result.input_tokens
+        self._output_tokens[i] = result.output_tokens
+        self._success[i] = result.success
+        self._error_code[i] = self._error_code_for(result.error_type)
+
+        itl = result.itl_ms
+        if itl:
+            n = len(itl)
+            self._reserve_itl(n)
+            self._itl_values[self._itl_size : self._itl_size + n] = itl
+            self._itl_size += n
+        self._itl_offsets[i + 1] = self._itl_size
+        self._size += 1
+
+    def extend(self, other: "ResultBuffer") -> None:
+        """Append all rows of another buffer.
+
+        Args:
+            other: Buffer to copy rows from.
+        """
+        n = len(other)
+        if n == 0:
+            return
+
+        self._reserve(n)
+        start, end = self._size, self._size + n
+        for name in self._columns():
+            getattr(self, name)[start:end] = getattr(other, name)[:n]
+
+        # Re-intern the other buffer's error codes into ours
+        if other._error_codes:
+            remap = np.zeros(len(other._error_codes) + 1, dtype=np.int16)
+            for error_type, code in other._error_codes.items():
+                remap[code] = self._error_code_for(error_type)
+            self._error_code[start:end] = remap[other._error_code[:n]]
+
+        self._reserve_itl(other.itl_size)
+        self._itl_values[self._itl_size : self._itl_size + other.itl_size] = other.itl_values
+        self._itl_offsets[start + 1 : end + 1] = other.itl_offsets[1:] + self._itl_size
+        self._itl_size += other.itl_size
+        self._size = end
+
+    # Trimmed, zero-copy column views
+    @property
+    def request_id(self) -> np.ndarray:
+        return self._request_id[: self._size]
+
+    @property
+    def ttft_ms(self) -> np.ndarray:
+        return self._ttft_ms[: self._size]
+
+    @property
+    def tpot_ms(self) -> np.ndarray:
+        return self._tpot_ms[: self._size]
+
+    @property
+    def e2e_ms(self) -> np.ndarray:
+        return self._e2e_ms[: self._size]
+
+    @property
+    def send_lag_ms(self) -> np.ndarray:
+        return self._send_lag_ms[: self._size]
+
+    @property
+    def expected_interval_ms(self) -> np.ndarray:
+        return self._expected_interval_ms[: self._size]
+
+    @property
+    def input_tokens(self) -> np.ndarray:
+        return self._input_tokens[: self._size]
+
+    @property
+    def output_tokens(self) -> np.ndarray:
+        return self._output_tokens[: self._size]
+
+    @property
+    def success(self) -> np.ndarray:
+        return self._success[: self._size]
+
+    @property
+    def error_code(self) -> np.ndarray:
+        return self._error_code[: self._size]
+
+    @property
+    def itl_offsets(self) -> np.ndarray:
+        return self._itl_offsets[: self._size + 1]
+
+    @property
+    def itl_values(self) -> np.ndarray:
+        return self._itl_values[: self._itl_size]
+
+    def itl_for(self, mask: np.ndarray) -> np.ndarray:
+        """Return the flat ITL samples of the rows selected by ``mask``.
+
+        Args:
+            mask: Boolean row mask.
+
+        Returns:
+            float32 array of ITL samples (ms).
+        """
+        counts = np.diff(self.itl_offsets)
+        return self.itl_values[np.repeat(mask, counts)]
+
+    def error_counts(self) -> dict[str, int]:
+        """Count failed requests per error type."""
+        codes = np.bincount(self.error_code, minlength=len(self._error_codes) + 1)
+        return {
+            error_type: int(codes[code])
+            for error_type, code in self._error_codes.items()
+            if codes[code]
+        }
+
+    def to_dict(self) -> dict:
+        """Serialize to a compact JSON-compatible dict.
+
+        Columns are shipped as base64-encoded little-endian NumPy buffers,
+        so a row costs ~80 bytes on the wire instead of a JSON object.
+        """
+
+        def encode(values: np.ndarray) -> str:
+            little_endian = values.astype(values.dtype.newbyteorder("<"), copy=False)
+            return base64.b64encode(little_endian.tobytes()).decode()
+
+        return {
+            "size": self._size,
+            "columns": {
+                name.lstrip("_"): encode(getattr(self, name)[: self._size])
+                for name in self._columns()
+            },
+            "itl_offsets": encode(self.itl_offsets),
+            "itl_values": encode(self.itl_values),
+            "error_codes": dict(self._error_codes),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ResultBuffer":
+        """Rebuild a buffer serialized with ``to_dict``."""
+        size = int(data["size"])
+        buffer = cls(capacity=size or DEFAULT_CAPACITY)
+
+        def decode(encoded: str, dtype: np.dtype) -> np.ndarray:
+            raw = base64.b64decode(encoded)
+            return np.frombuffer(raw, dtype=np.dtype(dtype).newbyteorder("<")).astype(dtype)
+
+        for name in buffer._columns():
+            column = getattr(buffer, name)
+            encoded = data["columns"].get(name.lstrip("_"))
+            if encoded is None:
+                # 이전 버전 버퍼에 없는 선택 열
+                column[:size] = np.nan
+                continue
+            column[:size] = decode(encoded, column.dtype)
+
+        itl_values = decode(data["itl_values"], np.float32)
+        buffer._reserve_itl(len(itl_values))
+        buffer._itl_values[: len(itl_values)] = itl_values
+        buffer._itl_size = len(itl_values)
+        buffer._itl_offsets[: size + 1] = decode(data["itl_offsets"], np.int64)
+        buffer._error_codes = {str(k): int(v) for k, v in data["error_codes"].items()}
+        buffer._size = size
+        return buffer
+
+    def to_results(self) -> list[RequestResult]:
+        """Rebuild RequestResult objects (for export and debugging)."""
+        names = {code: error_type for error_type, code in self._error_codes.items()}
+        offsets = self.itl_offsets
+        results: list[RequestResult] = []
+        for i in range(self._size):
+            tpot = float(self._tpot_ms[i])
+            lag = float(self._send_lag_ms[i])
+            interval = float(self._expected_interval_ms[i])
+            itl = self._itl_values[offsets[i] : offsets[i + 1]]
+            results.append(
+                RequestResult(
+                    request_id=int(self._request_id[i]),
+                    ttft_ms=float(self._ttft_ms[i]),
+                    tpot_ms=None if np.isnan(tpot) else tpot,
+                    e2e_latency_ms=float(self._e2e_ms[i]),
+                    input_tokens=int(self._input_tokens[i]),
+                    output_tokens=int(self._output_tokens[i]),
+                    success=bool(self._success[i]),
+                    error_type=names.get(int(self._error_code[i])),
+                    itl_ms=itl.astype(float).tolist() if len(itl) else None,
+                    send_lag_ms=None if np.isnan(lag) else lag,
+                    expected_interval_ms=None if np.isnan(interval) else interval,
+                )
+            )
+        return results
+
+    @classmethod
+    def from_results(cls, results: Iterable[RequestResult]) -> "ResultBuffer":
+        """Build a buffer from existing RequestResult objects.
+
+        Args:
+            results: Request results to copy.
+
+        Returns:
+            Populated ResultBuffer.
+        """
+        results = list(results)
+        buffer = cls(capacity=len(results) or DEFAULT_CAPACITY)
+        for result in results:
+            buffer.append(result)
+        return buffer
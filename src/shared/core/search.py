@@ -0,0 +1,195 @@
+"""Adaptive search for the highest load that still meets the goodput SLO.
+
+Instead of benchmarking a hand-picked list of concurrency levels, the search
+ramps the load exponentially until goodput first falls below the target and
+then bisects between the last passing and the first failing level. Only the
+levels around the knee are measured, so locating the optimum takes a handful
+of levels instead of a full sweep.
+"""
+
+from typing import Literal, Optional
+
+from shared.core.load_generator import LoadGenerator, ProgressCallback
+from shared.core.models import BenchmarkConfig, ConcurrencyResult, SearchPoint, SearchResult
+
+SearchDimension = Literal["concurrency", "request_rate"]
+
+DEFAULT_MAX_CONCURRENCY = 512
+DEFAULT_MAX_REQUEST_RATE = 1000.0
+
+
+def goodput_of(result: ConcurrencyResult) -> float:
+    """Goodput over every request sent, failed requests counting as misses.
+
+    ``GoodputResult`` only covers successful requests, so a level where half
+    of the requests error out could otherwise still look healthy. This is the
+    goodput that the search and ``InfraRecommender`` judge levels by.
+
+    Args:
+        result: Metrics of one level (computed with goodput thresholds).
+
+    Returns:
+        Percentage of all requests that met every SLO.
+    """
+    if result.goodput is None or result.total_requests == 0:
+        return 0.0
+    return result.goodput.satisfied_requests / result.total_requests * 100
+
+
+class ConcurrencySearch:
+    """Exponential ramp + binary search on concurrency or request rate.
+
+    Example:
+        >>> search = ConcurrencySearch(load_generator)
+        >>> result = await search.search(config, goodput_target_percent=95)
+        >>> print(result.optimum.value, result.total_requests)
+    """
+
+    def __init__(self, load_generator: LoadGenerator):
+        """Initialize search with a load generator.
+
+        Args:
+            load_generator: LoadGenerator instance configured with server adapter.
+        """
+        self.load_generator = load_generator
+
+    async def search(
+        self,
+        config: BenchmarkConfig,
+        goodput_target_percent: float = 95.0,
+        dimension: SearchDimension = "concurrency",
+        start: Optional[float] = None,
+        max_value: Optional[float] = None,
+        growth: float = 2.0,
+        precision: float = 0.1,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> SearchResult:
+        """Find the highest concurrency (or request rate) meeting the goodput target.
+
+        Each level sends ``config.num_prompts`` requests (at least one per
+        concurrency slot) or runs for ``config.duration_seconds``. In
+        request-rate mode ``max(config.concurrency)`` caps in-flight requests.
+
+        Args:
+            config: Benchmark configuration with ``goodput_thresholds`` set.
+            goodput_target_percent: Minimum goodput (%) for a level to pass.
+            dimension: Load dimension to search.
+            start: First level of the ramp (1 by default).
+            max_value: Upper bound of the search.
+            growth: Ramp multiplier between consecutive levels.
+            precision: Stop bisecting once the pass/fail gap is within this
+                fraction of the passing level (at least 1 for concurrency).
+            progress_callback: Optional callback for progress updates.
+
+        Returns:
+            SearchResult with the measured curve and the optimum.
+
+        Raises:
+            ValueError: If goodput thresholds are missing or bounds are invalid.
+        """
+        if config.goodput_thresholds is None:
+            raise ValueError("Adaptive search requires goodput_thresholds")
+        if growth <= 1:
+            raise ValueError(f"growth must be greater than 1, got {growth}")
+
+        is_rate = dimension == "request_rate"
+        if start is None:
+            start = 1.0 if is_rate else 1
+        if max_value is None:
+            max_value = DEFAULT_MAX_REQUEST_RATE if is_rate else DEFAULT_MAX_CONCURRENCY
+        if not is_rate:
+            start, max_value = int(start), int(max_value)
+        if start <= 0 or max_value < start:
+            raise ValueError(f"Invalid search bounds: start={start}, max={max_value}")
+
+        points: dict[float, SearchPoint] = {}
+
+        async def probe(value: float) -> bool:
+            if progress_callback:
+                progress_callback(0, 1, f"Search: {dimension}={value:g}")
+            result = await self._measure(config, dimension, value, progress_callback)
+            goodput = goodput_of(result)
+            points[value] = SearchPoint(
+                value=value,
+                passed=goodput >= goodput_target_percent,
+                goodput_percent=goodput,
+                result=result,
+            )
+            return points[value].passed
+
+        lo: Optional[float] = None
+        hi: Optional[float] = None
+
+        try:
+            # 1) 지수 증가: 첫 실패 지점(또는 상한)까지
+            value = start
+            while True:
+                if not await probe(value):
+                    hi = value
+                    break
+                lo = value
+                if value >= max_value:
+                    break
+                value = min(self._grow(value, growth, is_rate), max_value)
+
+            # 2) 이분 탐색: 마지막 통과 ~ 첫 실패 사이의 knee
+            if lo is not None and hi is not None:
+                while not self._converged(lo, hi, precision, is_rate):
+                    mid = (lo + hi) / 2 if is_rate else (lo + hi) // 2
+                    if await probe(mid):
+                        lo = mid
+                    else:
+                        hi = mid
+        finally:
+            # Close pooled connections so sockets do not outlive the search
+            await self.load_generator.adapter.aclose()
+
+        curve = [points[v] for v in sorted(points)]
+        return SearchResult(
+            dimension=dimension,
+            goodput_target_percent=goodput_target_percent,
+            points=curve,
+            optimum=points[lo] if lo is not None else None,
+            knee=hi,
+            total_requests=sum(p.result.total_requests for p in curve),
+        )
+
+    async def _measure(
+        self,
+        config: BenchmarkConfig,
+        dimension: SearchDimension,
+        value: float,
+        progress_callback: Optional[ProgressCallback],
+    ) -> ConcurrencyResult:
+        """Run a single level of the search."""
+        if dimension == "request_rate":
+            level_config = config.model_copy(
+                update={"request_rate": value, "concurrency": [max(config.concurrency)]}
+            )
+            concurrency = max(config.concurrency)
+        else:
+            concurrency = int(value)
+            level_config = config.model_copy(
+                update={
+                    "concurrency": [concurrency],
+                    # 동시성 슬롯마다 최소 1개 요청이 돌도록 보장
+                    "num_prompts": max(config.num_prompts, concurrency),
+                }
+            )
+        return await self.load_generator.measure_level(
+            level_config, concurrency, progress_callback=progress_callback
+        )
+
+    @staticmethod
+    def _grow(value: float, growth: float, is_rate: bool) -> float:
+        """Next level of the exponential ramp."""
+        if is_rate:
+            return value * growth
+        return max(int(value) + 1, int(value * growth))
+
+    @staticmethod
+    def _converged(lo: float, hi: float, precision: float, is_rate: bool) -> bool:
+        """Whether the pass/fail gap is small enough to stop bisecting."""
+        if is_rate:
+            return hi - lo <= precision * lo
+        return hi - lo <= max(1, int(precision * lo))
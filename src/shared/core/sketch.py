@@ -0,0 +1,250 @@
+"""Mergeable streaming quantile sketch for latency metrics.
+
+The sketch is an HDR-style log-bucketed histogram (the DDSketch layout):
+every positive value ``v`` is counted in bucket ``ceil(log(v) / log(gamma))``
+where ``gamma = (1 + a) / (1 - a)``. Any quantile read back from the sketch is
+within relative error ``a`` of the true value, memory grows with the
+*range* of the data (a few hundred buckets for 1µs..1h at 1%) instead of the
+number of samples, and two sketches merge by adding bucket counts.
+"""
+
+import math
+from typing import Optional
+
+import numpy as np
+
+# Default relative accuracy of quantiles (1%)
+DEFAULT_RELATIVE_ACCURACY = 0.01
+
+# Values at or below this are counted in the zero bucket (ms)
+_MIN_TRACKED_VALUE = 1e-6
+
+
+class LatencySketch:
+    """Mergeable quantile sketch with bounded relative error.
+
+    Tracks count, min, max, mean and variance exactly (Welford), and
+    percentiles with relative error ``relative_accuracy``.
+
+    Example:
+        >>> sketch = LatencySketch()
+        >>> for v in (120.0, 95.5, 300.2):
+        ...     sketch.add(v)
+        >>> round(sketch.percentile(50))
+        120
+    """
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY):
+        """Initialize an empty sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of reported quantiles.
+
+        Raises:
+            ValueError: If relative_accuracy is not in (0, 1).
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError(f"relative_accuracy must be in (0, 1), got {relative_accuracy}")
+
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets: dict[int, int] = {}
+        self._zero_count = 0
+
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def _index(self, value: float) -> int:
+        """Return the bucket index for a positive value."""
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _bucket_value(self, index: int) -> float:
+        """Return the representative value of a bucket."""
+        return 2 * self._gamma**index / (self._gamma + 1)
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Add a value to the sketch.
+
+        Args:
+            value: Value to add (ms).
+            count: Number of times to add the value (weight).
+        """
+        if count <= 0:
+            return
+
+        if value > _MIN_TRACKED_VALUE:
+            index = self._index(value)
+            self._buckets[index] = self._buckets.get(index, 0) + count
+        else:
+            self._zero_count += count
+
+        # Welford update for a weighted value
+        new_count = self.count + count
+        delta = value - self._mean
+        self._mean += delta * count / new_count
+        self._m2 += delta * (value - self._mean) * count
+        self.count = new_count
+
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def add_many(self, values: np.ndarray) -> None:
+        """Add an array of values in one vectorized pass.
+
+        Args:
+            values: Array of values (ms).
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if values.size == 0:
+            return
+
+        positive = values[values > _MIN_TRACKED_VALUE]
+        self._zero_count += int(values.size - positive.size)
+        if positive.size:
+            indices = np.ceil(np.log(positive) / self._log_gamma).astype(np.int64)
+            unique, counts = np.unique(indices, return_counts=True)
+            for index, count in zip(unique.tolist(), counts.tolist()):
+                self._buckets[index] = self._buckets.get(index, 0) + count
+
+        self._merge_moments(
+            int(values.size), float(np.mean(values)), float(np.var(values) * values.size)
+        )
+        self.min = min(self.min, float(np.min(values)))
+        self.max = max(self.max, float(np.max(values)))
+
+    def _merge_moments(self, count: int, mean: float, m2: float) -> None:
+        """Combine running mean/variance with another partition (Chan et al.)."""
+        if count == 0:
+            return
+        total = self.count + count
+        delta = mean - self._mean
+        self._mean += delta * count / total
+        self._m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+
+    def merge(self, other: "LatencySketch") -> None:
+        """Merge another sketch into this one.
+
+        Args:
+            other: Sketch with the same relative accuracy.
+
+        Raises:
+            ValueError: If the sketches use different relative accuracy.
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        if other.count == 0:
+            return
+
+        for index, count in other._buckets.items():
+            self._buckets[index] = self._buckets.get(index, 0) + count
+        self._zero_count += other._zero_count
+
+        self._merge_moments(other.count, other._mean, other._m2)
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def mean(self) -> float:
+        """Exact mean of added values."""
+        return self._mean if self.count else 0.0
+
+    @property
+    def std(self) -> float:
+        """Exact population standard deviation of added values."""
+        return math.sqrt(self._m2 / self.count) if self.count else 0.0
+
+    def quantiles(self, qs: list[float]) -> list[float]:
+        """Return several quantiles with a single pass over the buckets.
+
+        Args:
+            qs: Quantiles in [0, 1].
+
+        Returns:
+            Estimated value for each quantile (0.0 if the sketch is empty).
+        """
+        if self.count == 0:
+            return [0.0 for _ in qs]
+
+        indices = sorted(self._buckets)
+        counts = np.array([self._buckets[i] for i in indices], dtype=np.int64)
+        cumulative = self._zero_count + np.cumsum(counts)
+
+        values: list[float] = []
+        for q in qs:
+            rank = q * (self.count - 1)
+            if rank < self._zero_count:
+                value = 0.0
+            else:
+                position = int(np.searchsorted(cumulative, rank, side="right"))
+                position = min(position, len(indices) - 1)
+                value = self._bucket_value(indices[position])
+            values.append(min(max(value, self.min), self.max))
+        return values
+
+    def quantile(self, q: float) -> float:
+        """Return a single quantile in [0, 1]."""
+        return self.quantiles([q])[0]
+
+    def percentile(self, p: float) -> float:
+        """Return a single percentile in [0, 100]."""
+        return self.quantile(p / 100)
+
+    def bucket_count(self) -> int:
+        """Number of non-empty buckets (memory footprint indicator)."""
+        return len(self._buckets) + (1 if self._zero_count else 0)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def to_dict(self) -> dict:
+        """Serialize to a JSON-compatible dict (for shipping between hosts)."""
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "buckets": [[index, count] for index, count in self._buckets.items()],
+            "zero_count": self._zero_count,
+            "count": self.count,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "mean": self._mean,
+            "m2": self._m2,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LatencySketch":
+        """Rebuild a sketch serialized with ``to_dict``."""
+        sketch = cls(data["relative_accuracy"])
+        sketch._buckets = {int(index): int(count) for index, count in data["buckets"]}
+        sketch._zero_count = int(data["zero_count"])
+        sketch.count = int(data["count"])
+        if sketch.count:
+            sketch.min = float(data["min"])
+            sketch.max = float(data["max"])
+        sketch._mean = float(data["mean"])
+        sketch._m2 = float(data["m2"])
+        return sketch
+
+    @classmethod
+    def from_values(
+        cls,
+        values: np.ndarray,
+        relative_accuracy: Optional[float] = None,
+    ) -> "LatencySketch":
+        """Build a sketch from an array of values.
+
+        Args:
+            values: Values to add.
+            relative_accuracy: Optional relative accuracy override.
+
+        Returns:
+            Populated LatencySketch.
+        """
+        sketch = cls(relative_accuracy or DEFAULT_RELATIVE_ACCURACY)
+        sketch.add_many(values)
+        return sketch
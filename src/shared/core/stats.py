@@ -0,0 +1,403 @@
+"""Confidence intervals, significance tests and convergence-based early stopping.
+
+All intervals are analytic, so they cost one extra quantile lookup and work
+on exact samples and quantile sketches alike:
+
+- Percentiles: distribution-free interval between two order statistics
+  (normal approximation of the binomial rank distribution).
+- Mean: normal approximation, ``mean ± z * std / sqrt(n)``.
+- Throughput: completions treated as a compound Poisson process, so the
+  variance of the token total is estimated by the sum of squared per-request
+  token counts.
+
+``ConvergenceMonitor`` tracks TTFT p50/p99 and batch-mean throughput
+intervals while a level runs and signals when all of them are within a
+target relative width, so a level can stop before ``num_prompts``.
+"""
+
+import math
+from statistics import NormalDist
+from typing import TYPE_CHECKING, Callable, Optional
+
+import numpy as np
+
+from shared.core.models import (
+    BenchmarkConfig,
+    ConfidenceInterval,
+    ConvergenceStats,
+    LatencyCI,
+    RequestResult,
+    SignificanceTest,
+)
+
+if TYPE_CHECKING:
+    from shared.core.metrics import MetricsAggregator
+
+DEFAULT_CONFIDENCE = 0.95
+DEFAULT_BATCH_SIZE = 20
+MIN_BATCHES = 5
+
+# Percentiles reported with confidence intervals in LatencyStats.ci
+CI_QUANTILES = (0.50, 0.95, 0.99)
+
+
+def z_score(confidence: float) -> float:
+    """Two-sided standard normal critical value for a confidence level."""
+    return NormalDist().inv_cdf(0.5 + confidence / 2)
+
+
+def quantile_rank_bounds(n: int, q: float, confidence: float) -> Optional[tuple[int, int]]:
+    """Order-statistic ranks bracketing the ``q`` quantile.
+
+    Args:
+        n: Number of samples.
+        q: Quantile in (0, 1).
+        confidence: Confidence level.
+
+    Returns:
+        ``(lower, upper)`` 0-based ranks into the sorted samples, or None when
+        the interval would fall outside the samples (too few for this quantile,
+        e.g. p99 needs roughly 400 samples at 95%).
+    """
+    if n < 2:
+        return None
+    half = z_score(confidence) * math.sqrt(n * q * (1 - q))
+    lower = math.floor(n * q - half)
+    upper = math.ceil(n * q + half)
+    if lower < 1 or upper > n:
+        return None
+    return lower - 1, upper - 1
+
+
+def _interval(estimate: float, lower: float, upper: float) -> ConfidenceInterval:
+    width = upper - lower
+    if estimate > 0:
+        relative_width = width / estimate
+    else:
+        relative_width = 0.0 if width == 0 else None
+    return ConfidenceInterval(
+        estimate=estimate, lower=lower, upper=upper, relative_width=relative_width
+    )
+
+
+def _quantile_intervals(
+    quantiles: Callable[[list[float]], list[float]],
+    count: int,
+    qs: list[float] | tuple[float, ...],
+    confidence: float,
+) -> list[ConfidenceInterval]:
+    """Intervals of several quantiles from a single ``quantiles`` lookup."""
+    # 추정치와 순위 경계를 한 번의 quantile 조회로 계산
+    levels: list[float] = []
+    bounds: list[Optional[tuple[int, int]]] = []
+    for q in qs:
+        ranks = quantile_rank_bounds(count, q, confidence)
+        bounds.append(ranks)
+        levels.append(q)
+        if ranks is not None:
+            # 순위 r은 분위수 r / (n - 1)에 해당 (np.percentile 선형 보간 기준)
+            levels.extend(rank / (count - 1) for rank in ranks)
+    values = iter(quantiles(levels))
+
+    intervals = []
+    for ranks in bounds:
+        estimate = next(values)
+        if ranks is None:
+            intervals.append(ConfidenceInterval(estimate=estimate))
+        else:
+            lower, upper = next(values), next(values)
+            intervals.append(_interval(estimate, lower, upper))
+    return intervals
+
+
+def latency_ci(
+    quantiles: Callable[[list[float]], list[float]],
+    count: int,
+    mean: float,
+    std: float,
+    confidence: float = DEFAULT_CONFIDENCE,
+) -> LatencyCI:
+    """Confidence intervals of the mean and ``CI_QUANTILES`` of a metric.
+
+    Args:
+        quantiles: Returns the values at several quantiles in [0, 1] (e.g.
+            ``np.percentile`` over exact samples or ``LatencySketch.quantiles``).
+        count: Number of samples.
+        mean: Sample mean.
+        std: Sample standard deviation.
+        confidence: Confidence level.
+
+    Returns:
+        LatencyCI (percentile bounds None when there are too few samples).
+    """
+    p50, p95, p99 = _quantile_intervals(quantiles, count, CI_QUANTILES, confidence)
+
+    if count >= 2:
+        half = z_score(confidence) * std / math.sqrt(count)
+        mean_interval = _interval(mean, mean - half, mean + half)
+    else:
+        mean_interval = ConfidenceInterval(estimate=mean)
+
+    return LatencyCI(confidence=confidence, mean=mean_interval, p50=p50, p95=p95, p99=p99)
+
+
+def throughput_ci(
+    total_tokens: int,
+    tokens_sq: float,
+    duration_seconds: float,
+    confidence: float = DEFAULT_CONFIDENCE,
+) -> Optional[ConfidenceInterval]:
+    """Confidence interval of output throughput (tokens/s).
+
+    Args:
+        total_tokens: Output tokens of successful requests.
+        tokens_sq: Sum of squared per-request output token counts.
+        duration_seconds: Level duration.
+        confidence: Confidence level.
+
+    Returns:
+        ConfidenceInterval, or None without tokens or duration.
+    """
+    if total_tokens <= 0 or duration_seconds <= 0:
+        return None
+    estimate = total_tokens / duration_seconds
+    half = z_score(confidence) * math.sqrt(tokens_sq) / duration_seconds
+    return _interval(estimate, max(estimate - half, 0.0), estimate + half)
+
+
+def compare_intervals(
+    metric: str,
+    baseline: ConfidenceInterval,
+    other: ConfidenceInterval,
+    confidence: float = DEFAULT_CONFIDENCE,
+) -> SignificanceTest:
+    """Two-sided z-test of the difference between two estimates.
+
+    Standard errors are recovered from the interval widths, so asymmetric
+    percentile intervals are approximated by their half-width.
+
+    Args:
+        metric: Name of the compared statistic.
+        baseline: Baseline estimate and interval.
+        other: Compared estimate and interval.
+        confidence: Confidence level the intervals were computed at; also the
+            significance threshold (``p < 1 - confidence``).
+
+    Returns:
+        SignificanceTest (p_value None when either interval is open).
+    """
+    diff = other.estimate - baseline.estimate
+    diff_percent = diff / baseline.estimate * 100 if baseline.estimate else None
+
+    p_value = None
+    if None not in (baseline.lower, baseline.upper, other.lower, other.upper):
+        z = z_score(confidence)
+        se = math.hypot(
+            (baseline.upper - baseline.lower) / (2 * z),
+            (other.upper - other.lower) / (2 * z),
+        )
+        if se > 0:
+            p_value = 2 * (1 - NormalDist().cdf(abs(diff) / se))
+        else:
+            p_value = 1.0 if diff == 0 else 0.0
+
+    return SignificanceTest(
+        metric=metric,
+        baseline=baseline.estimate,
+        value=other.estimate,
+        diff_percent=diff_percent,
+        p_value=p_value,
+        significant=p_value is not None and p_value < 1 - confidence,
+    )
+
+
+def quantile_cis(
+    aggregator: "MetricsAggregator",
+    metric: str,
+    qs: list[float],
+    confidence: float,
+) -> list[ConfidenceInterval]:
+    """Confidence intervals of several latency quantiles.
+
+    Estimates and rank bounds of all quantiles come from one
+    ``MetricsAggregator.quantiles`` call (a single ``np.percentile`` pass in
+    exact mode).
+
+    Args:
+        aggregator: Aggregator holding the level's samples.
+        metric: Metric name ("ttft", "tpot", "e2e", ...).
+        qs: Quantiles in (0, 1).
+        confidence: Confidence level.
+
+    Returns:
+        One ConfidenceInterval per quantile (bounds None when there are too
+        few samples).
+    """
+    return _quantile_intervals(
+        lambda levels: aggregator.quantiles(metric, levels),
+        aggregator.count(metric),
+        qs,
+        confidence,
+    )
+
+
+def quantile_ci(
+    aggregator: "MetricsAggregator",
+    metric: str,
+    q: float,
+    confidence: float,
+) -> ConfidenceInterval:
+    """Confidence interval of a latency quantile.
+
+    Args:
+        aggregator: Aggregator holding the level's samples.
+        metric: Metric name ("ttft", "tpot", "e2e", ...).
+        q: Quantile in (0, 1).
+        confidence: Confidence level.
+
+    Returns:
+        ConfidenceInterval (bounds None when there are too few samples).
+    """
+    return quantile_cis(aggregator, metric, [q], confidence)[0]
+
+
+def mean_ci(values: list[float] | np.ndarray, confidence: float) -> ConfidenceInterval:
+    """Normal-approximation confidence interval of a mean.
+
+    Args:
+        values: Samples (batch means).
+        confidence: Confidence level.
+
+    Returns:
+        ConfidenceInterval (bounds None with fewer than ``MIN_BATCHES`` samples).
+    """
+    values = np.asarray(values, dtype=np.float64)
+    estimate = float(values.mean()) if len(values) else 0.0
+    if len(values) < MIN_BATCHES:
+        return ConfidenceInterval(estimate=estimate)
+
+    half = z_score(confidence) * float(values.std(ddof=1)) / math.sqrt(len(values))
+    return _interval(estimate, estimate - half, estimate + half)
+
+
+class ConvergenceMonitor:
+    """Decide when a level's statistics have converged.
+
+    Example:
+        >>> monitor = ConvergenceMonitor(target_width=0.1)
+        >>> monitor.start(time.perf_counter())
+        >>> if monitor.add(result, now) and monitor.converged(aggregator):
+        ...     stop_sending()
+    """
+
+    def __init__(
+        self,
+        target_width: float,
+        confidence: float = 0.95,
+        min_requests: int = 100,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        """Initialize the monitor.
+
+        Args:
+            target_width: Maximum relative CI width, (upper - lower) / estimate.
+            confidence: Confidence level of the intervals.
+            min_requests: Completed requests before convergence is checked.
+            batch_size: Completions per throughput batch (and per check).
+        """
+        self.target_width = target_width
+        self.confidence = confidence
+        self.min_requests = min_requests
+        self.batch_size = batch_size
+
+        self._batch_start = 0.0
+        self._batch_tokens = 0
+        self._batch_count = 0
+        self._batch_rates: list[float] = []
+
+    @classmethod
+    def for_config(cls, config: BenchmarkConfig) -> Optional["ConvergenceMonitor"]:
+        """Monitor for one level, or None when convergence stopping is off."""
+        if config.convergence_width is None:
+            return None
+        return cls(
+            target_width=config.convergence_width,
+            confidence=config.convergence_confidence,
+            min_requests=config.convergence_min_requests,
+        )
+
+    def start(self, now: float) -> None:
+        """Mark the start of the level (first throughput batch)."""
+        self._batch_start = now
+        self._batch_tokens = 0
+        self._batch_count = 0
+        self._batch_rates = []
+
+    def add(self, result: RequestResult, now: float) -> bool:
+        """Record a completed request.
+
+        Args:
+            result: Completed request result.
+            now: perf_counter timestamp of the completion.
+
+        Returns:
+            True when a throughput batch just closed (a good time to check).
+        """
+        self._batch_count += 1
+        if result.success:
+            self._batch_tokens += result.output_tokens
+
+        if self._batch_count < self.batch_size:
+            return False
+
+        span = now - self._batch_start
+        if span > 0:
+            self._batch_rates.append(self._batch_tokens / span)
+        self._batch_start = now
+        self._batch_tokens = 0
+        self._batch_count = 0
+        return True
+
+    def throughput_ci(self) -> ConfidenceInterval:
+        """Confidence interval of output throughput (tokens/s) from batch means."""
+        return mean_ci(self._batch_rates, self.confidence)
+
+    def _intervals(self, aggregator: "MetricsAggregator") -> tuple[ConfidenceInterval, ...]:
+        # 배치마다 호출되므로 p50·p99와 경계를 한 번의 조회로 계산
+        ttft_p50, ttft_p99 = quantile_cis(aggregator, "ttft", [0.50, 0.99], self.confidence)
+        return ttft_p50, ttft_p99, self.throughput_ci()
+
+    def _within_target(self, intervals: tuple[ConfidenceInterval, ...]) -> bool:
+        return all(
+            ci.relative_width is not None and ci.relative_width <= self.target_width
+            for ci in intervals
+        )
+
+    def converged(self, aggregator: "MetricsAggregator") -> bool:
+        """Whether every tracked CI is within the target width.
+
+        Args:
+            aggregator: Aggregator holding the level's samples.
+
+        Returns:
+            True once at least ``min_requests`` completed and all CIs converged.
+        """
+        if aggregator.total_requests < self.min_requests:
+            return False
+        return self._within_target(self._intervals(aggregator))
+
+    def report(self, aggregator: "MetricsAggregator") -> ConvergenceStats:
+        """Achieved confidence intervals for the level result."""
+        ttft_p50, ttft_p99, throughput = self._intervals(aggregator)
+        return ConvergenceStats(
+            confidence=self.confidence,
+            target_width=self.target_width,
+            converged=(
+                aggregator.total_requests >= self.min_requests
+                and self._within_target((ttft_p50, ttft_p99, throughput))
+            ),
+            requests=aggregator.total_requests,
+            ttft_p50=ttft_p50,
+            ttft_p99=ttft_p99,
+            throughput=throughput,
+        )
@@ -0,0 +1,300 @@
+"""Per-interval metric timeline of one concurrency level.
+
+A level is summarized by a single ``ConcurrencyResult``, which hides
+degradation over time (KV-cache eviction, preemption, thermal throttling).
+``TimelineRecorder`` buckets completions by time since the level started and
+keeps, per bucket, the completed/failed request counts, output tokens,
+average in-flight requests and TTFT/E2E quantile sketches.
+
+Storage is a fixed number of buckets preallocated as numpy arrays. When a
+run outlives them, adjacent buckets are merged pairwise and the interval
+doubles, so memory stays bounded while the whole run is kept.
+"""
+
+import math
+import time
+from typing import Optional
+
+import numpy as np
+
+from shared.core.models import RequestResult, Timeline
+from shared.core.sketch import DEFAULT_RELATIVE_ACCURACY, LatencySketch
+
+DEFAULT_TIMELINE_INTERVAL = 1.0
+# 1초 간격 기준 약 17분, 이후에는 간격이 2배씩 늘어남
+DEFAULT_MAX_BUCKETS = 1024
+
+TIMELINE_METRICS = ("ttft", "e2e")
+
+
+class TimelineRecorder:
+    """Bucket completed requests by time since the level started.
+
+    In-flight requests are derived from each request's start
+    (completion minus E2E latency): a request adds the fraction of every
+    bucket it overlaps, so the value is the time-averaged in-flight count.
+    Fully covered buckets go through a difference array, keeping ``add`` O(1).
+
+    Example:
+        >>> recorder = TimelineRecorder(interval_seconds=1.0)
+        >>> recorder.start()
+        >>> recorder.add(result)  # per completed request
+        >>> timeline = recorder.finalize(duration_seconds=60.0)
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float = DEFAULT_TIMELINE_INTERVAL,
+        max_buckets: int = DEFAULT_MAX_BUCKETS,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+    ):
+        """Initialize an empty timeline.
+
+        Args:
+            interval_seconds: Bucket width in seconds.
+            max_buckets: Number of buckets before adjacent ones are merged
+                (must be even).
+            relative_accuracy: Relative accuracy of the per-bucket sketches.
+
+        Raises:
+            ValueError: If interval_seconds or max_buckets is invalid.
+        """
+        if interval_seconds <= 0:
+            raise ValueError(f"interval_seconds must be positive, got {interval_seconds}")
+        if max_buckets < 2 or max_buckets % 2:
+            raise ValueError(f"max_buckets must be an even number >= 2, got {max_buckets}")
+
+        self.interval_seconds = interval_seconds
+        self.max_buckets = max_buckets
+        self.relative_accuracy = relative_accuracy
+        self.origin = time.perf_counter()
+
+        self._requests = np.zeros(max_buckets, dtype=np.int64)
+        self._errors = np.zeros(max_buckets, dtype=np.int64)
+        self._tokens = np.zeros(max_buckets, dtype=np.int64)
+        # 부분적으로 겹친 구간의 in-flight 기여분 (구간 폭 단위)
+        self._busy = np.zeros(max_buckets, dtype=np.float64)
+        # 완전히 덮인 구간은 차분 배열로 누적 (구간당 +1)
+        self._busy_diff = np.zeros(max_buckets + 1, dtype=np.float64)
+        self._sketches: list[Optional[dict[str, LatencySketch]]] = [None] * max_buckets
+        self._used = 0
+
+    def start(self, now: Optional[float] = None) -> None:
+        """Set the level start (``time.perf_counter()``) that buckets count from."""
+        self.origin = time.perf_counter() if now is None else now
+
+    def __len__(self) -> int:
+        """Number of buckets in use."""
+        return self._used
+
+    def _index(self, offset: float) -> int:
+        """Bucket index of an offset in seconds, merging buckets if it is past the end."""
+        index = int(offset // self.interval_seconds)
+        while index >= self.max_buckets:
+            self._coarsen()
+            index = int(offset // self.interval_seconds)
+        return index
+
+    def add(self, result: RequestResult, now: Optional[float] = None) -> None:
+        """Record a completed request.
+
+        Args:
+            result: Completed request result.
+            now: Completion time (``time.perf_counter()``); defaults to now.
+        """
+        if now is None:
+            now = time.perf_counter()
+        end = max(now - self.origin, 0.0)
+        index = self._index(end)
+        self._used = max(self._used, index + 1)
+
+        self._requests[index] += 1
+        if result.success:
+            self._tokens[index] += result.output_tokens
+            sketches = self._sketches[index]
+            if sketches is None:
+                sketches = self._sketches[index] = self._new_sketches()
+            sketches["ttft"].add(result.ttft_ms)
+            sketches["e2e"].add(result.e2e_latency_ms)
+        else:
+            self._errors[index] += 1
+
+        start = max(end - result.e2e_latency_ms / 1000, 0.0)
+        self._add_busy(start / self.interval_seconds, end / self.interval_seconds)
+
+    def _add_busy(self, start: float, end: float) -> None:
+        """Add one request alive over ``[start, end)`` (in bucket units)."""
+        first = int(start)
+        last = min(int(end), self.max_buckets - 1)
+        if first == last:
+            self._busy[first] += end - start
+            return
+        self._busy[first] += first + 1 - start
+        self._busy[last] += end - last
+        # first+1 .. last-1 구간은 완전히 덮임
+        self._busy_diff[first + 1] += 1
+        self._busy_diff[last] -= 1
+
+    def _new_sketches(self) -> dict[str, LatencySketch]:
+        return {metric: LatencySketch(self.relative_accuracy) for metric in TIMELINE_METRICS}
+
+    def _in_flight(self) -> np.ndarray:
+        """Average in-flight requests of every bucket."""
+        return self._busy + np.cumsum(self._busy_diff)[: self.max_buckets]
+
+    def _materialize(self) -> None:
+        """Fold the difference array into ``_busy``."""
+        self._busy = self._in_flight()
+        self._busy_diff[:] = 0
+
+    def _coarsen(self) -> None:
+        """Merge adjacent bucket pairs and double the interval."""
+        half = self.max_buckets // 2
+        self._materialize()
+
+        for name in ("_requests", "_errors", "_tokens"):
+            values = getattr(self, name)
+            merged = np.zeros_like(values)
+            merged[:half] = values[0::2] + values[1::2]
+            setattr(self, name, merged)
+
+        busy = np.zeros_like(self._busy)
+        # 평균 in-flight이므로 두 구간의 평균
+        busy[:half] = (self._busy[0::2] + self._busy[1::2]) / 2
+        self._busy = busy
+
+        sketches: list[Optional[dict[str, LatencySketch]]] = [None] * self.max_buckets
+        for i in range(half):
+            left, right = self._sketches[2 * i], self._sketches[2 * i + 1]
+            if left is not None and right is not None:
+                for metric in TIMELINE_METRICS:
+                    left[metric].merge(right[metric])
+            sketches[i] = left if left is not None else right
+        self._sketches = sketches
+
+        self.interval_seconds *= 2
+        self._used = math.ceil(self._used / 2)
+
+    def merge(self, other: "TimelineRecorder") -> None:
+        """Merge a timeline recorded in parallel (e.g. by another worker).
+
+        Both timelines must share the base interval and ``max_buckets``; the
+        finer one is coarsened until their intervals match.
+
+        Args:
+            other: Timeline of the same level.
+
+        Raises:
+            ValueError: If the intervals are not a power of two apart.
+        """
+        ratio = math.log2(self.interval_seconds / other.interval_seconds)
+        if not math.isclose(ratio, round(ratio)) or self.max_buckets != other.max_buckets:
+            raise ValueError("Timelines with different base intervals cannot be merged")
+
+        other = TimelineRecorder.from_dict(other.to_dict())
+        while other.interval_seconds < self.interval_seconds:
+            other._coarsen()
+        while self.interval_seconds < other.interval_seconds:
+            self._coarsen()
+
+        self._materialize()
+        other._materialize()
+        self._requests += other._requests
+        self._errors += other._errors
+        self._tokens += other._tokens
+        self._busy += other._busy
+        for i in range(other._used):
+            theirs = other._sketches[i]
+            if theirs is None:
+                continue
+            mine = self._sketches[i]
+            if mine is None:
+                self._sketches[i] = theirs
+            else:
+                for metric in TIMELINE_METRICS:
+                    mine[metric].merge(theirs[metric])
+        self._used = max(self._used, other._used)
+
+    def to_dict(self) -> dict:
+        """Serialize to a JSON-compatible dict (used buckets only)."""
+        used = self._used
+        return {
+            "interval_seconds": self.interval_seconds,
+            "max_buckets": self.max_buckets,
+            "relative_accuracy": self.relative_accuracy,
+            "requests": self._requests[:used].tolist(),
+            "errors": self._errors[:used].tolist(),
+            "tokens": self._tokens[:used].tolist(),
+            "in_flight": self._in_flight()[:used].tolist(),
+            "sketches": [
+                {metric: sketch.to_dict() for metric, sketch in sketches.items()}
+                if sketches is not None
+                else None
+                for sketches in self._sketches[:used]
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TimelineRecorder":
+        """Rebuild a timeline serialized with ``to_dict``."""
+        recorder = cls(
+            interval_seconds=data["interval_seconds"],
+            max_buckets=data["max_buckets"],
+            relative_accuracy=data["relative_accuracy"],
+        )
+        used = recorder._used = len(data["requests"])
+        recorder._requests[:used] = data["requests"]
+        recorder._errors[:used] = data["errors"]
+        recorder._tokens[:used] = data["tokens"]
+        recorder._busy[:used] = data["in_flight"]
+        for i, sketches in enumerate(data["sketches"]):
+            if sketches is not None:
+                recorder._sketches[i] = {
+                    metric: LatencySketch.from_dict(sketch) for metric, sketch in sketches.items()
+                }
+        return recorder
+
+    def finalize(self, duration_seconds: Optional[float] = None) -> Timeline:
+        """Build the timeline for the level result.
+
+        Args:
+            duration_seconds: Level duration; sizes the trailing buckets
+                (an idle tail or a partial last bucket) when given.
+
+        Returns:
+            Timeline with one entry per bucket.
+        """
+        interval = self.interval_seconds
+        used = self._used
+        if duration_seconds:
+            used = min(max(used, math.ceil(duration_seconds / interval)), self.max_buckets)
+
+        # 마지막 구간은 실제 경과 시간으로 나눔
+        widths = np.full(used, interval)
+        if duration_seconds and used:
+            last = duration_seconds - (used - 1) * interval
+            if 0 < last < interval:
+                widths[-1] = last
+
+        in_flight = self._in_flight()[:used] * interval / widths
+        quantiles: dict[str, list[Optional[float]]] = {
+            name: [] for name in ("ttft_p50", "ttft_p99", "e2e_p50", "e2e_p99")
+        }
+        for sketches in self._sketches[:used]:
+            for metric in TIMELINE_METRICS:
+                if sketches is None or not sketches[metric].count:
+                    quantiles[f"{metric}_p50"].append(None)
+                    quantiles[f"{metric}_p99"].append(None)
+                else:
+                    p50, p99 = sketches[metric].quantiles([0.50, 0.99])
+                    quantiles[f"{metric}_p50"].append(p50)
+                    quantiles[f"{metric}_p99"].append(p99)
+
+        return Timeline(
+            interval_seconds=interval,
+            requests=self._requests[:used].tolist(),
+            errors=self._errors[:used].tolist(),
+            throughput_tokens_per_sec=(self._tokens[:used] / widths).tolist(),
+            in_flight=in_flight.tolist(),
+            **quantiles,
+        )
@@ -0,0 +1,127 @@
+"""Client-side timing: nanosecond timestamps and event-loop lag tracking.
+
+Adapters stamp requests with ``time.perf_counter_ns()`` (integer, monotonic,
+no float rounding) and stamp response data when a network read returns,
+before any parsing, so CPU spent decoding other chunks is not attributed to
+the server.
+
+What a timestamp cannot show is how long the bytes sat in the socket before
+the event loop got around to resuming the reader: under heavy load that
+scheduling delay is silently folded into TTFT and ITL. ``LoopLagMonitor``
+runs a probe task that sleeps a fixed interval and measures how late it
+wakes up. Results completed while the lag exceeded a threshold are flagged
+``client_saturated``: the load generator, not the server, was the bottleneck.
+"""
+
+import asyncio
+import time
+from typing import Callable, Optional
+
+from shared.core.models import BenchmarkConfig
+
+# Probe wake-up interval (seconds)
+DEFAULT_PROBE_INTERVAL = 0.01
+
+# Loop lag above which the client counts as saturated (ms)
+DEFAULT_LAG_THRESHOLD_MS = 10.0
+
+NS_PER_MS = 1_000_000
+
+now_ns = time.perf_counter_ns
+
+
+def elapsed_ms(start_ns: int, end_ns: int) -> float:
+    """Milliseconds between two ``perf_counter_ns`` timestamps."""
+    return (end_ns - start_ns) / NS_PER_MS
+
+
+class LoopLagMonitor:
+    """Background probe measuring event-loop scheduling lag.
+
+    Example:
+        >>> monitor = LoopLagMonitor(threshold_ms=10.0, sink=aggregator.add_loop_lag)
+        >>> monitor.start()
+        >>> started = now_ns()
+        >>> result = await adapter.send_request(...)
+        >>> result.client_saturated = monitor.saturated_since(started)
+        >>> await monitor.stop()
+    """
+
+    def __init__(
+        self,
+        threshold_ms: float = DEFAULT_LAG_THRESHOLD_MS,
+        interval_seconds: float = DEFAULT_PROBE_INTERVAL,
+        sink: Optional[Callable[[float], None]] = None,
+    ):
+        """Initialize the monitor.
+
+        Args:
+            threshold_ms: Lag above which the client counts as saturated.
+            interval_seconds: Probe sleep interval.
+            sink: Called with every lag sample (ms).
+        """
+        self.threshold_ms = threshold_ms
+        self.interval_seconds = interval_seconds
+        self.sink = sink
+        self.max_lag_ms = 0.0
+        self.samples = 0
+        self._threshold_ns = int(threshold_ms * NS_PER_MS)
+        # 마지막으로 임계값을 넘은 지연이 끝난 시각
+        self._last_saturated_ns = -1
+        self._next_wake_ns: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def for_config(
+        cls, config: BenchmarkConfig, sink: Optional[Callable[[float], None]] = None
+    ) -> "LoopLagMonitor":
+        """Monitor with the configured saturation threshold."""
+        return cls(threshold_ms=config.loop_lag_threshold_ms, sink=sink)
+
+    def start(self) -> None:
+        """Start the probe task on the running loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._probe())
+
+    async def stop(self) -> None:
+        """Stop the probe task."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._next_wake_ns = None
+
+    async def _probe(self) -> None:
+        interval_ns = int(self.interval_seconds * 1e9)
+        while True:
+            self._next_wake_ns = now_ns() + interval_ns
+            await asyncio.sleep(self.interval_seconds)
+            woke = now_ns()
+            lag_ns = max(woke - self._next_wake_ns, 0)
+            self.record(lag_ns, woke)
+
+    def record(self, lag_ns: int, at_ns: int) -> None:
+        """Record one lag sample observed at ``at_ns``."""
+        lag_ms = lag_ns / NS_PER_MS
+        self.samples += 1
+        self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+        if lag_ns > self._threshold_ns:
+            self._last_saturated_ns = at_ns
+        if self.sink is not None:
+            self.sink(lag_ms)
+
+    def saturated_since(self, start_ns: int) -> bool:
+        """Whether the loop lagged past the threshold since ``start_ns``.
+
+        Also true when the probe is overdue right now, i.e. a stall is still
+        in progress when the caller checks.
+        """
+        if self._last_saturated_ns >= start_ns:
+            return True
+        if self._next_wake_ns is None:
+            return False
+        return now_ns() - self._next_wake_ns > self._threshold_ns
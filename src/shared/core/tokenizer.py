@@ -1,6 +1,7 @@
 """Token counting utility using tiktoken."""
 
-from typing import Optional
+from collections import OrderedDict
+from typing import Iterable, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -9,6 +10,10 @@ logger = logging.getLogger(__name__)
 _tiktoken = None
 _encoders: dict[str, "tiktoken.Encoding"] = {}
 
+# Bounded LRU of token counts keyed by (encoding name, prompt hash, prompt length)
+DEFAULT_CACHE_SIZE = 4096
+_count_cache: "OrderedDict[tuple[str, int, int], int]" = OrderedDict()
+
 
 def _get_tiktoken():
     """Lazy load tiktoken module."""
@@ -31,8 +36,16 @@ class TokenCounter:
 
     Supports OpenAI models and falls back to approximate counting
     for unknown models or when tiktoken is not installed.
+
+    ``count`` results are memoized in a bounded LRU cache, so the identical
+    prompt sent by every request of a level is encoded only once.
     """
 
+    # Maximum number of cached prompt counts
+    cache_size: int = DEFAULT_CACHE_SIZE
+    _cache_hits: int = 0
+    _cache_misses: int = 0
+
     # Model to encoding mapping for non-OpenAI models
     MODEL_ENCODING_MAP = {
         # Qwen models use similar tokenization to GPT-4
@@ -88,9 +101,74 @@ class TokenCounter:
             Token count.
         """
         encoder = cls.get_encoder(model)
-        if encoder:
-            return len(encoder.encode(text))
-        return cls.count_approximate(text)
+        if not encoder:
+            return cls.count_approximate(text)
+
+        # str 해시는 객체에 캐시되므로 같은 프롬프트 객체의 조회는 O(1)
+        key = (encoder.name, hash(text), len(text))
+        cached = _count_cache.get(key)
+        if cached is not None:
+            _count_cache.move_to_end(key)
+            cls._cache_hits += 1
+            return cached
+
+        cls._cache_misses += 1
+        count = len(encoder.encode(text))
+        cls._store(key, count)
+        return count
+
+    @classmethod
+    def count_many(cls, texts: Iterable[str], model: str = "gpt-4") -> list[int]:
+        """Count tokens for many texts at once and warm the cache.
+
+        Intended for pre-tokenizing a workload at load time. The caller keeps
+        the returned counts (e.g. ``PromptDataset.input_tokens``); the shared
+        cache keeps its configured size and holds only the last ``cache_size``
+        texts.
+
+        Args:
+            texts: Texts to count tokens for.
+            model: Model name for tokenizer selection.
+
+        Returns:
+            Token count per text, in input order.
+        """
+        texts = list(texts)
+        encoder = cls.get_encoder(model)
+        if not encoder:
+            return [cls.count_approximate(text) for text in texts]
+
+        counts = [len(tokens) for tokens in encoder.encode_batch(texts)]
+        # 캐시 한도를 넘는 앞부분은 어차피 밀려나므로 저장하지 않음
+        start = max(len(texts) - cls.cache_size, 0)
+        for text, count in zip(texts[start:], counts[start:]):
+            cls._store((encoder.name, hash(text), len(text)), count)
+        return counts
+
+    @classmethod
+    def _store(cls, key: tuple[str, int, int], count: int) -> None:
+        """Insert a count, evicting the least recently used entries."""
+        _count_cache[key] = count
+        _count_cache.move_to_end(key)
+        while len(_count_cache) > cls.cache_size:
+            _count_cache.popitem(last=False)
+
+    @classmethod
+    def cache_info(cls) -> dict[str, int]:
+        """Return cache statistics (hits, misses, size, maxsize)."""
+        return {
+            "hits": cls._cache_hits,
+            "misses": cls._cache_misses,
+            "size": len(_count_cache),
+            "maxsize": cls.cache_size,
+        }
+
+    @classmethod
+    def cache_clear(cls) -> None:
+        """Drop cached counts and reset the hit/miss counters."""
+        _count_cache.clear()
+        cls._cache_hits = 0
+        cls._cache_misses = 0
 
     @classmethod
     def count_approximate(cls, text: str) -> int:
@@ -0,0 +1,253 @@
+"""Concurrent warmup that runs until TTFT reaches steady state.
+
+A few serial requests do not exercise the batch sizes the benchmark will use
+(CUDA graphs are captured per batch size, the KV cache and allocator grow
+with concurrency), so the first level would absorb those costs.
+``SteadyStateWarmup`` ramps linearly up to the first concurrency level and
+keeps that load until the TTFT stops drifting: completions are grouped into
+windows of ``window`` requests, and the server counts as warm once the
+coefficient of variation of the last ``windows`` window means is within
+``tolerance``.
+
+Failures are counted and reported; a warmup in which no request succeeds
+raises ``WarmupError`` instead of letting the benchmark run against a broken
+server.
+"""
+
+import asyncio
+import math
+import time
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+
+from shared.core.models import BenchmarkConfig, WarmupResult
+from shared.core.workload import prompt_source_for
+
+if TYPE_CHECKING:
+    from shared.core.load_generator import ServerAdapter
+
+# Warmup request ids start here so they never reuse a benchmark prompt
+# (a warmed prefix cache would flatter the first level)
+WARMUP_REQUEST_ID_OFFSET = 1_000_000_000
+
+# Window means compared by the stability check
+DEFAULT_STABLE_WINDOWS = 3
+
+# Distinct error messages kept in the report
+MAX_REPORTED_ERRORS = 5
+
+
+class WarmupError(RuntimeError):
+    """Every warmup request failed."""
+
+    def __init__(self, result: WarmupResult):
+        errors = "; ".join(result.errors) or "unknown error"
+        super().__init__(f"All {result.total_requests} warmup requests failed: {errors}")
+        self.result = result
+
+
+def check_warmup(result: WarmupResult) -> WarmupResult:
+    """Raise ``WarmupError`` when no warmup request succeeded.
+
+    Args:
+        result: Warmup report.
+
+    Returns:
+        The same report, for chaining.
+
+    Raises:
+        WarmupError: If requests were sent and all of them failed.
+    """
+    if result.total_requests and result.failed_requests == result.total_requests:
+        raise WarmupError(result)
+    return result
+
+
+class WarmupStats:
+    """Request and error counts shared by both warmup modes."""
+
+    def __init__(self):
+        self.total = 0
+        self.failed = 0
+        self.errors: list[str] = []
+
+    def add(self, success: bool, error: Optional[str] = None) -> None:
+        self.total += 1
+        if success:
+            return
+        self.failed += 1
+        message = error or "request failed"
+        if message not in self.errors and len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(message)
+
+
+class SteadyStateDetector:
+    """Decide when TTFT has stopped drifting.
+
+    Example:
+        >>> detector = SteadyStateDetector(window=20, tolerance=0.05)
+        >>> for ttft in samples:
+        ...     if detector.add(ttft):
+        ...         break
+    """
+
+    def __init__(
+        self,
+        window: int = 20,
+        tolerance: float = 0.05,
+        windows: int = DEFAULT_STABLE_WINDOWS,
+    ):
+        """Initialize the detector.
+
+        Args:
+            window: TTFT samples per window.
+            tolerance: Maximum coefficient of variation of the window means.
+            windows: Number of most recent window means compared.
+        """
+        self.window = window
+        self.tolerance = tolerance
+        self.windows = windows
+        self._current: list[float] = []
+        self.means: list[float] = []
+
+    def add(self, ttft_ms: float) -> bool:
+        """Add one TTFT sample.
+
+        Returns:
+            True once the last ``windows`` window means are within tolerance.
+        """
+        self._current.append(ttft_ms)
+        if len(self._current) >= self.window:
+            self.means.append(float(np.mean(self._current)))
+            self._current = []
+        return self.stable
+
+    @property
+    def stable(self) -> bool:
+        """Whether the recent window means are within tolerance."""
+        if len(self.means) < self.windows:
+            return False
+        recent = np.asarray(self.means[-self.windows:])
+        mean = recent.mean()
+        if mean <= 0:
+            return True
+        return float(recent.std(ddof=1) / mean) <= self.tolerance
+
+
+class SteadyStateWarmup:
+    """Ramp up to a concurrency level and hold it until TTFT is stable.
+
+    Example:
+        >>> warmup = SteadyStateWarmup.for_config(config, adapter)
+        >>> report = await warmup.run(config, concurrency=config.concurrency[0])
+    """
+
+    def __init__(
+        self,
+        adapter: "ServerAdapter",
+        ramp_seconds: float = 10.0,
+        window: int = 20,
+        tolerance: float = 0.05,
+        max_seconds: float = 120.0,
+    ):
+        """Initialize the warmup.
+
+        Args:
+            adapter: Server adapter.
+            ramp_seconds: Time to bring all concurrency slots online.
+            window: Completions per TTFT window.
+            tolerance: Maximum coefficient of variation of the last window means.
+            max_seconds: Stop (not stable) after this long.
+        """
+        self.adapter = adapter
+        self.ramp_seconds = ramp_seconds
+        self.window = window
+        self.tolerance = tolerance
+        self.max_seconds = max_seconds
+
+    @classmethod
+    def for_config(cls, config: BenchmarkConfig, adapter: "ServerAdapter") -> "SteadyStateWarmup":
+        """Warmup configured by ``config.warmup_*``."""
+        return cls(
+            adapter,
+            ramp_seconds=config.warmup_ramp_seconds,
+            window=config.warmup_window,
+            tolerance=config.warmup_tolerance,
+            max_seconds=config.warmup_max_seconds,
+        )
+
+    async def run(self, config: BenchmarkConfig, concurrency: int) -> WarmupResult:
+        """Warm the server up with the benchmark's own prompts.
+
+        Args:
+            config: Benchmark configuration (prompts, stream).
+            concurrency: Concurrency to ramp up to.
+
+        Returns:
+            WarmupResult (``stable`` False when ``max_seconds`` ran out).
+
+        Raises:
+            WarmupError: If every warmup request failed.
+        """
+        prompts = prompt_source_for(config)
+        detector = SteadyStateDetector(self.window, self.tolerance)
+        stats = WarmupStats()
+        done = False
+        next_id = WARMUP_REQUEST_ID_OFFSET
+        start_time = time.perf_counter()
+        deadline = start_time + self.max_seconds
+
+        async def worker(slot: int) -> None:
+            nonlocal done, next_id
+            # 선형 램프업: 슬롯마다 시작 시점을 분산
+            delay = self.ramp_seconds * slot / concurrency
+            if delay:
+                await asyncio.sleep(min(delay, self.max_seconds))
+
+            while not done and time.perf_counter() < deadline:
+                request_id = next_id
+                next_id += 1
+                sent = time.perf_counter()
+                prompt, max_tokens = prompts.get(request_id)
+                try:
+                    result = await self.adapter.send_request(
+                        request_id, prompt, max_tokens, config.stream
+                    )
+                except Exception as e:
+                    stats.add(False, f"{type(e).__name__}: {e}")
+                else:
+                    stats.add(result.success, result.error_type)
+                    # 램프업이 끝난 뒤 보낸 요청만 안정성 판정에 사용
+                    if result.success and sent - start_time >= self.ramp_seconds:
+                        if detector.add(result.ttft_ms):
+                            done = True
+
+                # 성공 없이 한 윈도우만큼 실패하면 서버 이상으로 판단
+                if stats.failed >= self.window and stats.failed == stats.total:
+                    done = True
+
+        await asyncio.gather(*(worker(slot) for slot in range(concurrency)))
+
+        result = WarmupResult(
+            mode="steady",
+            concurrency=concurrency,
+            total_requests=stats.total,
+            failed_requests=stats.failed,
+            duration_seconds=time.perf_counter() - start_time,
+            stable=detector.stable,
+            ttft_mean_ms=detector.means[-1] if detector.means else None,
+            errors=stats.errors,
+        )
+        return check_warmup(result)
+
+
+def first_concurrency(config: BenchmarkConfig) -> int:
+    """Concurrency the steady warmup ramps up to (the first level)."""
+    profile = config.load_profile
+    if profile is not None and profile.dimension == "concurrency":
+        # 프로파일 첫 단계의 시작 수준 (0이면 첫 단계 목표치)
+        phase = profile.phases[0]
+        level = phase.start if phase.start else phase.target
+        return max(int(math.ceil(level)), 1)
+    return config.concurrency[0]
@@ -0,0 +1,319 @@
+"""Multi-process load generation.
+
+A single asyncio event loop tops out at a few thousand SSE chunks per second
+because JSON decoding and result construction all run on one core. With
+``BenchmarkConfig.workers > 1`` each concurrency level is sharded across N
+processes: every worker runs its own event loop and adapter with a slice of
+the concurrency, request count and request rate, and returns its
+MetricsAggregator, which the parent merges into one ConcurrencyResult.
+
+While a level runs, workers send their completed request counts over a
+queue; the parent sums them and reports progress every ``PROGRESS_INTERVAL``.
+"""
+
+import asyncio
+import functools
+import logging
+import multiprocessing
+import queue
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from shared.core.metrics import MetricsAggregator
+from shared.core.models import BenchmarkConfig, TransportConfig
+
+logger = logging.getLogger(__name__)
+
+# Creates a server adapter inside a worker; receives that worker's connection pool size.
+# Must be picklable (a module-level function or functools.partial of one).
+AdapterBuilder = Callable[[int], Any]
+
+# How long workers wait for each other before starting a level (seconds)
+START_BARRIER_TIMEOUT = 120.0
+
+# Seconds between progress messages from a worker (and progress reports in the parent)
+PROGRESS_INTERVAL = 0.2
+
+# Start barrier shared by the worker processes of one level
+_start_barrier: Optional[Any] = None
+
+# Queue of (shard index, completed requests) read by the parent, if it reports progress
+_progress_queue: Optional[Any] = None
+
+
+def split_evenly(total: int, parts: int) -> list[int]:
+    """Split an integer into ``parts`` near-equal non-negative integers.
+
+    Example:
+        >>> split_evenly(10, 4)
+        [3, 3, 2, 2]
+    """
+    base, remainder = divmod(total, parts)
+    return [base + (1 if i < remainder else 0) for i in range(parts)]
+
+
+@dataclass
+class WorkerShard:
+    """One worker's share of a concurrency level.
+
+    Request ids are interleaved (``index``, ``index + stride``, ...) so they
+    stay unique across workers.
+    """
+
+    index: int
+    stride: int
+    concurrency: int
+    num_requests: int
+    request_rate: Optional[float] = None
+    seed: Optional[int] = None
+    start_delay: float = 0.0
+
+    @classmethod
+    def whole_level(cls, config: BenchmarkConfig, concurrency: int) -> "WorkerShard":
+        """Shard covering the whole level (single-process mode)."""
+        return cls(
+            index=0,
+            stride=1,
+            concurrency=concurrency,
+            num_requests=config.num_prompts,
+            request_rate=config.request_rate,
+            seed=config.seed,
+        )
+
+
+def plan_shards(config: BenchmarkConfig, concurrency: int, workers: int) -> list[WorkerShard]:
+    """Shard one concurrency level across worker processes.
+
+    Concurrency and request count are split evenly; in request-rate mode each
+    worker offers ``rate / n`` with its own seed, and constant arrivals are
+    phase-shifted so the merged schedule stays evenly spaced.
+
+    Args:
+        config: Benchmark configuration.
+        concurrency: Concurrency level to shard.
+        workers: Requested number of worker processes.
+
+    Returns:
+        Non-empty shards (fewer than ``workers`` if there is not enough work).
+    """
+    n = max(1, min(workers, concurrency))
+    if not config.duration_seconds:
+        n = max(1, min(n, config.num_prompts))
+
+    concurrencies = split_evenly(concurrency, n)
+    num_requests = split_evenly(config.num_prompts, n)
+
+    shards: list[WorkerShard] = []
+    for i in range(n):
+        request_rate = None
+        start_delay = 0.0
+        if config.request_rate:
+            request_rate = config.request_rate / n
+            if config.arrival_distribution == "constant":
+                start_delay = i / config.request_rate
+
+        shards.append(
+            WorkerShard(
+                index=i,
+                stride=n,
+                concurrency=concurrencies[i],
+                num_requests=num_requests[i],
+                request_rate=request_rate,
+                seed=None if config.seed is None else config.seed + i,
+                start_delay=start_delay,
+            )
+        )
+    return shards
+
+
+def _create_adapter(
+    name: str,
+    server_url: str,
+    model: str,
+    api_key: Optional[str],
+    timeout: float,
+    transport: TransportConfig,
+    max_connections: int,
+):
+    """Create a registered adapter inside a worker process."""
+    # Importing the package registers the built-in adapters in this process
+    from shared.adapters import AdapterFactory
+
+    return AdapterFactory.create(
+        name=name,
+        server_url=server_url,
+        model=model,
+        api_key=api_key,
+        timeout=timeout,
+        max_connections=max_connections,
+        transport=transport,
+    )
+
+
+def adapter_builder_from_config(config: BenchmarkConfig) -> AdapterBuilder:
+    """Build a picklable adapter builder from a benchmark config."""
+    return functools.partial(
+        _create_adapter,
+        config.adapter,
+        config.server_url,
+        config.model,
+        config.api_key,
+        config.timeout,
+        config.transport,
+    )
+
+
+def _init_worker(barrier: Any, progress_queue: Optional[Any] = None) -> None:
+    """Process-pool initializer: keep the shared start barrier and progress queue."""
+    global _start_barrier, _progress_queue
+    _start_barrier = barrier
+    _progress_queue = progress_queue
+
+
+async def _run_shard_async(
+    config: BenchmarkConfig,
+    shard: WorkerShard,
+    adapter_builder: AdapterBuilder,
+) -> tuple[MetricsAggregator, float]:
+    from shared.core.load_generator import LoadGenerator
+
+    adapter = adapter_builder(shard.concurrency)
+    generator = LoadGenerator(adapter)
+    aggregator = MetricsAggregator.for_config(config)
+
+    progress_queue = _progress_queue
+    progress_callback = None
+    if progress_queue is not None:
+        last_sent = 0.0
+
+        def progress_callback(current: int, total: int, info: Any) -> None:
+            # 요청마다 보내지 않고 PROGRESS_INTERVAL마다 완료 건수만 전달
+            nonlocal last_sent
+            now = time.monotonic()
+            if now - last_sent >= PROGRESS_INTERVAL:
+                last_sent = now
+                progress_queue.put((shard.index, aggregator.total_requests))
+
+    try:
+        # Start all workers together so their durations overlap
+        if _start_barrier is not None:
+            _start_barrier.wait(START_BARRIER_TIMEOUT)
+        duration = await generator.run_level(
+            aggregator, config, shard.concurrency, progress_callback, shard=shard
+        )
+    finally:
+        await adapter.aclose()
+
+    if progress_queue is not None:
+        progress_queue.put((shard.index, aggregator.total_requests))
+    return aggregator, duration
+
+
+def _run_shard(
+    config: BenchmarkConfig,
+    shard: WorkerShard,
+    adapter_builder: AdapterBuilder,
+) -> tuple[MetricsAggregator, float]:
+    """Worker-process entry point: run one shard on a fresh event loop."""
+    return asyncio.run(_run_shard_async(config, shard, adapter_builder))
+
+
+class MultiProcessRunner:
+    """Run concurrency levels across several load-generator processes.
+
+    Example:
+        >>> runner = MultiProcessRunner(4, adapter_builder_from_config(config))
+        >>> aggregator, duration = await runner.run_level(config, concurrency=512)
+    """
+
+    def __init__(self, workers: int, adapter_builder: AdapterBuilder):
+        """Initialize the runner.
+
+        Args:
+            workers: Number of worker processes.
+            adapter_builder: Picklable callable creating an adapter in each worker.
+        """
+        self.workers = workers
+        self.adapter_builder = adapter_builder
+
+    async def run_level(
+        self,
+        config: BenchmarkConfig,
+        concurrency: int,
+        progress_callback: Optional[Callable[[int, int, Any], None]] = None,
+    ) -> tuple[MetricsAggregator, float]:
+        """Run one concurrency level sharded across worker processes.
+
+        Args:
+            config: Benchmark configuration.
+            concurrency: Total concurrency level.
+            progress_callback: Optional ``(current, total, message)`` callback,
+                called every ``PROGRESS_INTERVAL`` with the requests completed
+                by all workers (elapsed seconds in duration-based mode).
+
+        Returns:
+            Tuple of (merged aggregator, level duration in seconds).
+        """
+        shards = plan_shards(config, concurrency, self.workers)
+        logger.info(f"Concurrency {concurrency}: {len(shards)} worker processes")
+
+        # spawn: workers must not inherit the parent's event loop or sockets
+        context = multiprocessing.get_context("spawn")
+        barrier = context.Barrier(len(shards))
+        progress_queue = context.Queue() if progress_callback else None
+        loop = asyncio.get_running_loop()
+
+        completed = [0] * len(shards)
+        start_time = time.perf_counter()
+
+        def report() -> None:
+            # 큐를 비운 뒤 워커별 최신 완료 건수를 합산해 보고
+            while True:
+                try:
+                    index, count = progress_queue.get_nowait()
+                except queue.Empty:
+                    break
+                completed[index] = count
+            done = sum(completed)
+            if config.duration_seconds:
+                elapsed = int(time.perf_counter() - start_time)
+                total = config.duration_seconds
+                progress_callback(min(elapsed, total), total, f"{done} requests")
+            else:
+                progress_callback(done, config.num_prompts, f"{done} requests")
+
+        async def forward_progress() -> None:
+            while True:
+                await asyncio.sleep(PROGRESS_INTERVAL)
+                report()
+
+        with ProcessPoolExecutor(
+            max_workers=len(shards),
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(barrier, progress_queue),
+        ) as pool:
+            forwarder = asyncio.create_task(forward_progress()) if progress_callback else None
+            try:
+                outputs = await asyncio.gather(
+                    *[
+                        loop.run_in_executor(
+                            pool, _run_shard, config, shard, self.adapter_builder
+                        )
+                        for shard in shards
+                    ]
+                )
+            finally:
+                if forwarder is not None:
+                    forwarder.cancel()
+
+        if progress_callback:
+            report()
+
+        merged, duration = outputs[0]
+        for aggregator, worker_duration in outputs[1:]:
+            merged.merge(aggregator)
+            duration = max(duration, worker_duration)
+        return merged, duration
@@ -0,0 +1,587 @@
+"""Prompt workloads: synthetic filler text or real datasets.
+
+A dataset (JSONL or ShareGPT-style JSON) is parsed and tokenized once, then
+cached as two files keyed by the source path, size, mtime and model:
+
+* ``<key>.idx.npy`` - structured array (offset, nbytes, input_tokens, output_tokens)
+* ``<key>.bin``     - the UTF-8 prompt bytes, concatenated
+
+Both are memory-mapped on later runs, so large datasets load in milliseconds
+and worker processes share the page cache instead of receiving pickled
+prompts. Request ``i`` uses record ``order[i % n]`` of a seeded permutation,
+so sharded workers need no coordination to sample disjoint prompts.
+
+Without a dataset, prompts are synthetic: either one fixed filler prompt
+(every request is a full prefix-cache hit) or ``PrefixSharingPrompts``,
+which controls exactly how much prompt text requests share. Per-request
+input/output lengths can be drawn from a ``LengthDistribution``.
+"""
+
+import functools
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Iterator, Literal, Optional, Protocol
+
+import numpy as np
+
+from shared.core.models import BenchmarkConfig, LengthDistribution
+from shared.core.tokenizer import TokenCounter
+
+logger = logging.getLogger(__name__)
+
+DatasetFormat = Literal["auto", "jsonl", "sharegpt"]
+
+# Bump when the on-disk index layout changes
+CACHE_VERSION = 1
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "llm-loadtest" / "datasets"
+
+# output_tokens 값이 없을 때 (데이터셋에 응답이 없음) 사용하는 표시값
+UNKNOWN_OUTPUT = -1
+
+INDEX_DTYPE = np.dtype(
+    [
+        ("offset", "<i8"),
+        ("nbytes", "<i4"),
+        ("input_tokens", "<i4"),
+        ("output_tokens", "<i4"),
+    ]
+)
+
+# Common words used to build synthetic prompts; each is one token (with a
+# leading space) in typical BPE vocabularies, so lengths are exact
+_WORDS = (
+    "the of and to in is for on that with as by at from this be are was it an "
+    "or not have has data model system time use user value result process "
+    "state server request response token memory cache network input output "
+    "query table field report policy market energy water city river garden "
+    "music paper story light color green blue north south winter summer "
+    "review design simple method number point level power range order"
+).split()
+
+_PROMPT_KEYS = ("prompt", "input", "text", "question")
+_OUTPUT_KEYS = ("completion", "output", "response", "answer")
+_OUTPUT_LEN_KEYS = ("output_len", "max_tokens", "output_tokens")
+
+
+def synthetic_prompt(input_len: int) -> str:
+    """Generate a filler prompt with approximately ``input_len`` tokens."""
+    base_prompt = "Write a detailed explanation about the following topic: "
+    filler = "artificial intelligence and machine learning " * (input_len // 5)
+    return base_prompt + filler[: input_len * 4]
+
+
+def _from_conversation(turns: list) -> tuple[Optional[str], Optional[str]]:
+    """First user turn and the assistant reply that follows it."""
+    prompt = None
+    for turn in turns:
+        if not isinstance(turn, dict):
+            continue
+        role = turn.get("from") or turn.get("role")
+        text = turn.get("value") if "value" in turn else turn.get("content")
+        if prompt is None and role in ("human", "user"):
+            prompt = text
+        elif prompt is not None and role in ("gpt", "assistant"):
+            return prompt, text
+    return prompt, None
+
+
+def _parse_record(record: dict) -> tuple[Optional[str], Optional[str], Optional[int]]:
+    """Extract (prompt, completion text, explicit output length) from a record."""
+    turns = record.get("conversations") or record.get("messages")
+    if isinstance(turns, list):
+        prompt, completion = _from_conversation(turns)
+    else:
+        prompt = next((record[k] for k in _PROMPT_KEYS if record.get(k)), None)
+        completion = next((record[k] for k in _OUTPUT_KEYS if record.get(k)), None)
+
+    output_len = next(
+        (int(record[k]) for k in _OUTPUT_LEN_KEYS if record.get(k) is not None), None
+    )
+    if not isinstance(prompt, str):
+        prompt = None
+    if not isinstance(completion, str):
+        completion = None
+    return prompt, completion, output_len
+
+
+def _iter_records(path: Path, format: DatasetFormat) -> Iterator[dict]:
+    """Yield raw JSON records from a JSONL or JSON-array file."""
+    if format == "auto":
+        with open(path, "rb") as f:
+            head = f.read(64).lstrip()
+        format = "sharegpt" if head.startswith(b"[") else "jsonl"
+
+    if format == "sharegpt":
+        with open(path, encoding="utf-8") as f:
+            records = json.load(f)
+        if not isinstance(records, list):
+            raise ValueError(f"{path}: expected a JSON array of conversations")
+        yield from (r for r in records if isinstance(r, dict))
+        return
+
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}:{line_no}: invalid JSON ({e.msg})") from e
+            if isinstance(record, dict):
+                yield record
+
+
+class PromptDataset:
+    """Memory-mapped prompts with pre-computed token lengths.
+
+    Example:
+        >>> dataset = PromptDataset.load("sharegpt.json", model="qwen3-14b")
+        >>> dataset.prompt(0), dataset.input_tokens[0]
+    """
+
+    def __init__(
+        self,
+        index: np.ndarray,
+        blob: np.ndarray,
+        cache_files: Optional[tuple[Path, Path]] = None,
+    ):
+        """Initialize from an index and prompt byte buffer.
+
+        Args:
+            index: Structured array with ``INDEX_DTYPE`` fields.
+            blob: uint8 array of concatenated UTF-8 prompts.
+            cache_files: (index, blob) paths the arrays are mapped from, if any.
+        """
+        self._index = index
+        self._blob = blob
+        self._cache_files = cache_files
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __getstate__(self) -> dict:
+        # 캐시 파일이 있으면 경로만 전달하고 워커에서 다시 mmap (복사 없음)
+        if self._cache_files is not None:
+            return {"cache_files": self._cache_files}
+        return {"index": self._index, "blob": self._blob, "cache_files": None}
+
+    def __setstate__(self, state: dict) -> None:
+        if state["cache_files"] is not None:
+            index, blob = self._map(*state["cache_files"])
+            self.__init__(index, blob, state["cache_files"])
+        else:
+            self.__init__(state["index"], state["blob"])
+
+    @property
+    def input_tokens(self) -> np.ndarray:
+        """Prompt token counts."""
+        return self._index["input_tokens"]
+
+    @property
+    def output_tokens(self) -> np.ndarray:
+        """Reference output token counts (``UNKNOWN_OUTPUT`` if absent)."""
+        return self._index["output_tokens"]
+
+    def prompt(self, i: int) -> str:
+        """Return prompt ``i``."""
+        offset, nbytes = int(self._index["offset"][i]), int(self._index["nbytes"][i])
+        return self._blob[offset : offset + nbytes].tobytes().decode("utf-8")
+
+    @staticmethod
+    def _cache_key(path: Path, model: str, format: DatasetFormat) -> str:
+        stat = path.stat()
+        raw = f"{CACHE_VERSION}|{path.resolve()}|{stat.st_size}|{stat.st_mtime_ns}|{format}|{model}"
+        return hashlib.sha256(raw.encode()).hexdigest()[:32]
+
+    @staticmethod
+    def _map(index_file: Path, blob_file: Path) -> tuple[np.ndarray, np.ndarray]:
+        index = np.load(index_file, mmap_mode="r")
+        if index.dtype != INDEX_DTYPE:
+            raise ValueError(f"{index_file}: unexpected index layout")
+        if blob_file.stat().st_size == 0:
+            return index, np.zeros(0, dtype=np.uint8)
+        return index, np.memmap(blob_file, dtype=np.uint8, mode="r")
+
+    @classmethod
+    def build(
+        cls,
+        path: str | Path,
+        model: str,
+        format: DatasetFormat = "auto",
+    ) -> "PromptDataset":
+        """Parse and tokenize a dataset in memory.
+
+        Args:
+            path: JSONL file (one record per line) or ShareGPT-style JSON array.
+            model: Model name for tokenizer selection.
+            format: ``jsonl``, ``sharegpt`` or ``auto`` (detected from content).
+
+        Returns:
+            In-memory PromptDataset.
+
+        Raises:
+            ValueError: If the file is malformed or contains no prompts.
+        """
+        path = Path(path)
+        prompts: list[str] = []
+        completions: list[Optional[str]] = []
+        output_lens: list[Optional[int]] = []
+        for record in _iter_records(path, format):
+            prompt, completion, output_len = _parse_record(record)
+            if not prompt:
+                continue
+            prompts.append(prompt)
+            completions.append(completion)
+            output_lens.append(output_len)
+
+        if not prompts:
+            raise ValueError(f"{path}: no prompts found")
+
+        encoded = [p.encode("utf-8") for p in prompts]
+        index = np.zeros(len(prompts), dtype=INDEX_DTYPE)
+        index["nbytes"] = [len(b) for b in encoded]
+        index["offset"][1:] = np.cumsum(index["nbytes"][:-1])
+        index["input_tokens"] = TokenCounter.count_many(prompts, model)
+
+        # 응답 텍스트가 있으면 토큰화, 명시적 길이가 있으면 우선 사용
+        output_tokens = np.full(len(prompts), UNKNOWN_OUTPUT, dtype=np.int32)
+        with_text = [i for i, c in enumerate(completions) if c and output_lens[i] is None]
+        if with_text:
+            output_tokens[with_text] = TokenCounter.count_many(
+                [completions[i] for i in with_text], model
+            )
+        for i, output_len in enumerate(output_lens):
+            if output_len is not None:
+                output_tokens[i] = output_len
+        index["output_tokens"] = output_tokens
+
+        blob = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+        return cls(index, blob)
+
+    @classmethod
+    def load(
+        cls,
+        path: str | Path,
+        model: str,
+        format: DatasetFormat = "auto",
+        cache_dir: Optional[str | Path] = None,
+    ) -> "PromptDataset":
+        """Load a dataset, building the memory-mapped cache on first use.
+
+        Args:
+            path: Dataset file.
+            model: Model name for tokenizer selection (part of the cache key).
+            format: ``jsonl``, ``sharegpt`` or ``auto``.
+            cache_dir: Cache directory (default ``~/.cache/llm-loadtest/datasets``).
+
+        Returns:
+            PromptDataset backed by the cache files.
+        """
+        path = Path(path)
+        cache_dir = Path(cache_dir) if cache_dir is not None else DEFAULT_CACHE_DIR
+        key = cls._cache_key(path, model, format)
+        index_file = cache_dir / f"{key}.idx.npy"
+        blob_file = cache_dir / f"{key}.bin"
+
+        if index_file.exists() and blob_file.exists():
+            index, blob = cls._map(index_file, blob_file)
+            return cls(index, blob, (index_file, blob_file))
+
+        dataset = cls.build(path, model, format)
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            # 임시 파일에 쓴 뒤 rename 하여 동시 실행 시 깨진 캐시를 읽지 않도록 함
+            tmp_blob = blob_file.with_suffix(f".{os.getpid()}.tmp")
+            tmp_index = index_file.with_suffix(f".{os.getpid()}.tmp")
+            dataset._blob.tofile(tmp_blob)
+            with open(tmp_index, "wb") as f:
+                np.save(f, dataset._index)
+            os.replace(tmp_blob, blob_file)
+            os.replace(tmp_index, index_file)
+        except OSError as e:
+            logger.warning(f"Could not write dataset cache to {cache_dir}: {e}")
+            return dataset
+
+        logger.info(f"Cached {len(dataset)} prompts from {path} in {cache_dir}")
+        index, blob = cls._map(index_file, blob_file)
+        return cls(index, blob, (index_file, blob_file))
+
+
+class PromptSource(Protocol):
+    """Provides the prompt and max_tokens for each request id."""
+
+    def get(self, request_id: int) -> tuple[str, int]:
+        """Return (prompt, max_tokens) for a request."""
+        ...
+
+
+class LengthSampler:
+    """Per-request token lengths drawn from a ``LengthDistribution``.
+
+    Each request id seeds its own generator, so lengths are reproducible and
+    independent of which worker sends the request.
+    """
+
+    def __init__(self, dist: LengthDistribution, seed: Optional[int] = None, stream: int = 0):
+        """Initialize the sampler.
+
+        Args:
+            dist: Length distribution spec.
+            seed: Random seed.
+            stream: Distinguishes independent samplers sharing a seed
+                (e.g. input vs. output lengths).
+
+        Raises:
+            ValueError: If the parameters the distribution needs are missing.
+        """
+        self.dist = dist
+        self.seed = 0 if seed is None else seed
+        self.stream = stream
+        self.low = dist.min or 1
+        self.high = dist.max
+
+        if dist.kind == "uniform" and (dist.min is None or dist.max is None):
+            raise ValueError("uniform length distribution needs min and max")
+        if dist.kind in ("normal", "lognormal") and (dist.mean is None or dist.std is None):
+            raise ValueError(f"{dist.kind} length distribution needs mean and std")
+        if dist.kind == "empirical" and not dist.path:
+            raise ValueError("empirical length distribution needs a path")
+        if self.high is not None and self.high < self.low:
+            raise ValueError("length distribution max is below min")
+
+        self._values = _load_lengths(dist.path) if dist.kind == "empirical" else None
+        if dist.kind == "lognormal":
+            # 길이의 평균/표준편차를 로그 공간 파라미터로 변환
+            variance = np.log1p((dist.std / dist.mean) ** 2)
+            self._mu = np.log(dist.mean) - variance / 2
+            self._sigma = np.sqrt(variance)
+
+    def sample(self, request_id: int) -> int:
+        """Token length for a request."""
+        rng = np.random.default_rng([self.seed, request_id, self.stream])
+        kind = self.dist.kind
+        if kind == "uniform":
+            value = rng.integers(self.low, self.high + 1)
+        elif kind == "normal":
+            value = rng.normal(self.dist.mean, self.dist.std)
+        elif kind == "lognormal":
+            value = rng.lognormal(self._mu, self._sigma)
+        else:
+            value = self._values[rng.integers(len(self._values))]
+
+        length = max(self.low, int(round(value)))
+        if self.high is not None:
+            length = min(length, self.high)
+        return length
+
+
+@functools.lru_cache(maxsize=8)
+def _load_lengths(path: str) -> np.ndarray:
+    """Observed lengths from a JSON array or whitespace/comma separated file."""
+    text = Path(path).read_text()
+    if text.lstrip().startswith("["):
+        values = json.loads(text)
+    else:
+        values = text.replace(",", " ").split()
+    lengths = np.array([int(float(v)) for v in values], dtype=np.int64)
+    lengths = lengths[lengths > 0]
+    if len(lengths) == 0:
+        raise ValueError(f"{path}: no positive lengths found")
+    return lengths
+
+
+class SyntheticPrompts:
+    """The same filler prompt for every request."""
+
+    def __init__(
+        self,
+        input_len: int,
+        output_len: int,
+        output_lengths: Optional[LengthSampler] = None,
+    ):
+        self._prompt = synthetic_prompt(input_len)
+        self._output_len = output_len
+        self._output_lengths = output_lengths
+
+    def get(self, request_id: int) -> tuple[str, int]:
+        if self._output_lengths is not None:
+            return self._prompt, self._output_lengths.sample(request_id)
+        return self._prompt, self._output_len
+
+
+class DatasetPrompts:
+    """Dataset prompts in a seeded random order.
+
+    Sampling records uniformly reproduces the dataset's joint input/output
+    length distribution. Each request's ``max_tokens`` is the record's
+    reference output length, or ``default_output_len`` when unknown; an
+    ``output_lengths`` sampler overrides both.
+    """
+
+    def __init__(
+        self,
+        dataset: PromptDataset,
+        default_output_len: int,
+        seed: Optional[int] = None,
+        output_lengths: Optional[LengthSampler] = None,
+    ):
+        self._dataset = dataset
+        self._default_output_len = default_output_len
+        self._output_lengths = output_lengths
+        rng = np.random.default_rng(0 if seed is None else seed)
+        self._order = rng.permutation(len(dataset))
+
+    def get(self, request_id: int) -> tuple[str, int]:
+        i = int(self._order[request_id % len(self._order)])
+        if self._output_lengths is not None:
+            output_len = self._output_lengths.sample(request_id)
+        else:
+            output_len = int(self._dataset.output_tokens[i])
+            if output_len <= 0:
+                output_len = self._default_output_len
+        return self._dataset.prompt(i), output_len
+
+
+class PrefixSharingPrompts:
+    """Synthetic prompts with exact token lengths and a controlled shared prefix.
+
+    A fraction ``share_ratio`` of requests start with the same ``prefix_len``
+    token prefix (a shared system prompt); the rest of every prompt is a
+    random suffix unique to the request id. ``prefix_len=0`` makes every
+    prompt unique (prefix-cache misses), ``share_ratio=1`` with a long prefix
+    measures cache hits deliberately. With ``input_lengths`` each prompt gets
+    its own sampled length, and the prefix is truncated for shorter prompts.
+
+    Prompts are drawn from single-token words and decoded with
+    ``TokenCounter.decode``, so each prompt has an exact token length.
+    Without tiktoken the word count is used as the token count.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        input_len: int,
+        output_len: int,
+        prefix_len: int = 0,
+        share_ratio: float = 1.0,
+        seed: Optional[int] = None,
+        input_lengths: Optional[LengthSampler] = None,
+        output_lengths: Optional[LengthSampler] = None,
+    ):
+        """Initialize the generator.
+
+        Args:
+            model: Model name for tokenizer selection.
+            input_len: Prompt length in tokens.
+            output_len: max_tokens for every request.
+            prefix_len: Length of the shared prefix in tokens.
+            share_ratio: Fraction of requests that carry the shared prefix.
+            seed: Random seed (prefix text and per-request suffixes).
+            input_lengths: Per-request prompt lengths (overrides ``input_len``).
+            output_lengths: Per-request max_tokens (overrides ``output_len``).
+
+        Raises:
+            ValueError: If ``prefix_len`` exceeds ``input_len`` or the ratio
+                is outside [0, 1].
+        """
+        if prefix_len < 0 or (input_lengths is None and prefix_len > input_len):
+            raise ValueError(f"prefix_len must be between 0 and input_len ({input_len})")
+        if not 0.0 <= share_ratio <= 1.0:
+            raise ValueError("share_ratio must be between 0 and 1")
+
+        self.model = model
+        self.input_len = input_len
+        self.output_len = output_len
+        self.prefix_len = prefix_len
+        self.share_ratio = share_ratio
+        self.seed = 0 if seed is None else seed
+        self.input_lengths = input_lengths
+        self.output_lengths = output_lengths
+
+        # 단어별 토큰 id (leading space 포함 1토큰인 단어만 사용)
+        vocab = []
+        for word in _WORDS:
+            tokens = TokenCounter.encode(" " + word, model)
+            if len(tokens) == 1:
+                vocab.append(tokens[0])
+        self._token_ids = np.array(vocab, dtype=np.int64) if vocab else None
+
+        rng = np.random.default_rng([self.seed, 2**32 - 1])
+        self._prefix_picks = self._pick(rng, prefix_len)
+        self.prefix = self._render(self._prefix_picks)
+
+    def _vocab_size(self) -> int:
+        return len(self._token_ids) if self._token_ids is not None else len(_WORDS)
+
+    def _pick(self, rng: np.random.Generator, length: int) -> np.ndarray:
+        """Random vocabulary indices."""
+        return rng.integers(self._vocab_size(), size=length)
+
+    def _render(self, picks: np.ndarray) -> str:
+        if len(picks) == 0:
+            return ""
+        if self._token_ids is None:
+            return "".join(" " + _WORDS[i] for i in picks)
+        return TokenCounter.decode(self._token_ids[picks].tolist(), self.model)
+
+    def shares_prefix(self, request_id: int) -> bool:
+        """Whether a request carries the shared prefix."""
+        if self.prefix_len == 0:
+            return False
+        rng = np.random.default_rng([self.seed, request_id])
+        return bool(rng.random() < self.share_ratio)
+
+    def get(self, request_id: int) -> tuple[str, int]:
+        length = self.input_len
+        if self.input_lengths is not None:
+            length = self.input_lengths.sample(request_id)
+        output_len = self.output_len
+        if self.output_lengths is not None:
+            output_len = self.output_lengths.sample(request_id)
+
+        rng = np.random.default_rng([self.seed, request_id])
+        if self.prefix_len and rng.random() < self.share_ratio:
+            shared = min(self.prefix_len, length)
+            suffix = self._pick(rng, length - shared)
+            if shared == self.prefix_len:
+                prompt = self.prefix + self._render(suffix)
+            else:
+                prompt = self._render(np.concatenate([self._prefix_picks[:shared], suffix]))
+        else:
+            prompt = self._render(self._pick(rng, length))
+        return prompt, output_len
+
+
+@functools.lru_cache(maxsize=4)
+def _load_dataset(path: str, model: str, format: DatasetFormat) -> PromptDataset:
+    # 레벨마다 다시 로드하지 않도록 프로세스 단위로 재사용
+    return PromptDataset.load(path, model, format)
+
+
+def prompt_source_for(config: BenchmarkConfig) -> PromptSource:
+    """Build the prompt source described by a benchmark config."""
+    input_lengths = output_lengths = None
+    if config.input_len_dist is not None:
+        input_lengths = LengthSampler(config.input_len_dist, config.seed, stream=1)
+    if config.output_len_dist is not None:
+        output_lengths = LengthSampler(config.output_len_dist, config.seed, stream=2)
+
+    if config.dataset:
+        dataset = _load_dataset(config.dataset, config.model, config.dataset_format)
+        return DatasetPrompts(dataset, config.output_len, config.seed, output_lengths)
+    if config.prefix_len is not None or input_lengths is not None:
+        return PrefixSharingPrompts(
+            model=config.model,
+            input_len=config.input_len,
+            output_len=config.output_len,
+            prefix_len=config.prefix_len or 0,
+            share_ratio=config.prefix_share_ratio,
+            seed=config.seed,
+            input_lengths=input_lengths,
+            output_lengths=output_lengths,
+        )
+    return SyntheticPrompts(config.input_len, config.output_len, output_lengths)
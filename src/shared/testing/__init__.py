@@ -0,0 +1,8 @@
+"""LLM Loadtest Testing - Local servers for measuring the client itself."""
+
+from shared.testing.mock_server import MockOpenAIServer, MockServerThread
+
+__all__ = [
+    "MockOpenAIServer",
+    "MockServerThread",
+]
@@ -0,0 +1,5 @@
+"""Entry point: ``python -m shared.testing`` runs the mock server."""
+
+from shared.testing.mock_server import main
+
+main()
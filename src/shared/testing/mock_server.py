@@ -0,0 +1,487 @@
+"""Local mock OpenAI-compatible server with injected latencies.
+
+``MockOpenAIServer`` speaks just enough HTTP/1.1 (keep-alive, chunked
+transfer encoding) and, when the ``h2`` package is installed, HTTP/2 with
+prior knowledge to serve ``/v1/chat/completions`` in streaming (SSE) and
+non-streaming form, plus ``/health`` and ``/v1/models``, over TCP or a Unix
+domain socket. Every response follows a known schedule: the first content
+chunk is sent ``ttft_ms`` after the request was read, then one chunk every
+``itl_ms``. Because the injected latencies are known exactly, a client
+measuring this server measures its own overhead and error.
+
+It runs in-process (``async with MockOpenAIServer() as server``), in a
+background thread (``MockServerThread``) or as its own process(es), which is
+what client-ceiling benchmarks need so the server does not share the
+client's CPU:
+
+    python -m shared.testing --port 8100 --ttft-ms 50 --itl-ms 10 --processes 2
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import signal
+import sys
+import threading
+import time
+from typing import AsyncIterator, Optional, Union
+
+# Upper bound on the request head (request line + headers)
+MAX_HEADER_BYTES = 64 * 1024
+
+# HTTP/2 client connection preface (prior knowledge, no Upgrade)
+H2_PREFACE = b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n"
+
+# Concurrent streams the server allows per HTTP/2 connection
+H2_MAX_STREAMS = 1000
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed"}
+
+
+class MockOpenAIServer:
+    """Asyncio mock of an OpenAI-compatible chat completions server.
+
+    Example:
+        >>> async with MockOpenAIServer(ttft_ms=50, itl_ms=10) as server:
+        ...     adapter = OpenAICompatibleAdapter(server.url, "mock-model")
+        ...     result = await adapter.send_request(0, "hello", 32, stream=True)
+    """
+
+    def __init__(
+        self,
+        ttft_ms: float = 0.0,
+        itl_ms: float = 0.0,
+        output_tokens: Optional[int] = None,
+        tokens_per_chunk: int = 1,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        uds: Optional[str] = None,
+        reuse_port: bool = False,
+    ):
+        """Initialize the server (call ``start`` to listen).
+
+        Args:
+            ttft_ms: Delay from reading the request to the first content chunk.
+            itl_ms: Delay between content chunks.
+            output_tokens: Completion tokens per response (None: the request's
+                ``max_tokens``).
+            tokens_per_chunk: Tokens carried by each content chunk.
+            host: Host to bind.
+            port: TCP port (0 picks a free one).
+            uds: Unix domain socket path; replaces host/port when set.
+            reuse_port: Set SO_REUSEPORT so several processes share the port.
+        """
+        self.ttft_ms = ttft_ms
+        self.itl_ms = itl_ms
+        self.output_tokens = output_tokens
+        self.tokens_per_chunk = max(1, tokens_per_chunk)
+        self.host = host
+        self.port = port
+        self.uds = uds
+        self.reuse_port = reuse_port
+
+        self.requests = 0
+        self.chunks = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server (``http://localhost`` for a Unix socket)."""
+        if self.uds:
+            return "http://localhost"
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self) -> None:
+        """Start listening."""
+        if self.uds:
+            self._server = await asyncio.start_unix_server(self._handle, path=self.uds)
+            return
+        self._server = await asyncio.start_server(
+            self._handle, self.host, self.port, reuse_port=self.reuse_port or None
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """Stop listening and close open connections."""
+        if self._server is None:
+            return
+        self._server.close()
+        if hasattr(self._server, "close_clients"):
+            self._server.close_clients()
+        await self._server.wait_closed()
+        self._server = None
+
+    async def serve_forever(self) -> None:
+        """Start (if needed) and serve until cancelled."""
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+
+    async def __aenter__(self) -> "MockOpenAIServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve requests of one keep-alive connection."""
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                    return
+                if len(head) > MAX_HEADER_BYTES:
+                    return
+
+                lines = head.decode("latin-1").split("\r\n")
+                method, path, _ = lines[0].split(" ", 2)
+                if method == "PRI":
+                    # HTTP/2 prior knowledge (h2c): 연결 서문의 나머지를 읽고 전환
+                    preface = head + await reader.readexactly(len(H2_PREFACE) - len(head))
+                    await self._handle_h2(reader, writer, preface)
+                    return
+
+                headers = {}
+                for line in lines[1:]:
+                    if ":" in line:
+                        name, value = line.split(":", 1)
+                        headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0))
+                body = await reader.readexactly(length) if length else b""
+                received = time.perf_counter()
+
+                status, content_type, response = await self._route(method, path, body, received)
+                await self._send_http1(writer, status, content_type, response)
+                if headers.get("connection", "").lower() == "close":
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+    async def _route(
+        self, method: str, path: str, body: bytes, received: float
+    ) -> tuple[int, str, Union[bytes, AsyncIterator[bytes]]]:
+        """Response status, content type and body (bytes or SSE events)."""
+        if path in ("/health", "/v1/models") and method == "GET":
+            payload = {"object": "list", "data": [{"id": "mock-model", "object": "model"}]}
+            return self._json(200, payload if path == "/v1/models" else {})
+        if path != "/v1/chat/completions":
+            return self._json(404, {"error": {"message": f"Unknown path {path}"}})
+        if method != "POST":
+            return self._json(405, {"error": {"message": "Use POST"}})
+
+        try:
+            request = json.loads(body)
+        except ValueError:
+            return self._json(400, {"error": {"message": "Invalid JSON"}})
+
+        self.requests += 1
+        prompt = "".join(
+            str(message.get("content", "")) for message in request.get("messages", [])
+        )
+        prompt_tokens = max(1, len(prompt.split()))
+        tokens = self.output_tokens or int(request.get("max_tokens") or 16)
+        model = request.get("model", "mock-model")
+
+        if request.get("stream"):
+            return 200, "text/event-stream", self._events(model, prompt_tokens, tokens, received)
+
+        await self._sleep_until(received, self.ttft_ms + self.itl_ms * max(tokens - 1, 0))
+        return self._json(
+            200,
+            {
+                "id": "chatcmpl-mock",
+                "object": "chat.completion",
+                "model": model,
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": " tok" * tokens},
+                        "finish_reason": "length",
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": tokens,
+                    "total_tokens": prompt_tokens + tokens,
+                },
+            },
+        )
+
+    async def _events(
+        self, model: str, prompt_tokens: int, tokens: int, received: float
+    ) -> AsyncIterator[bytes]:
+        """SSE events following the TTFT/ITL schedule."""
+        sent = 0
+        index = 0
+        while sent < tokens:
+            n = min(self.tokens_per_chunk, tokens - sent)
+            # 도착 시각이 아니라 일정 기준으로 대기하여 지연이 누적되지 않게 함
+            await self._sleep_until(received, self.ttft_ms + self.itl_ms * index)
+            sent += n
+            index += 1
+            event = {
+                "id": "chatcmpl-mock",
+                "object": "chat.completion.chunk",
+                "model": model,
+                "choices": [
+                    {
+                        "index": 0,
+                        "delta": {"content": " tok" * n},
+                        "finish_reason": "length" if sent >= tokens else None,
+                    }
+                ],
+                "usage": None,
+            }
+            self.chunks += 1
+            yield b"data: " + json.dumps(event).encode() + b"\n\n"
+
+        usage = {
+            "id": "chatcmpl-mock",
+            "object": "chat.completion.chunk",
+            "model": model,
+            "choices": [],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": tokens,
+                "total_tokens": prompt_tokens + tokens,
+            },
+        }
+        yield b"data: " + json.dumps(usage).encode() + b"\n\ndata: [DONE]\n\n"
+
+    @staticmethod
+    async def _send_http1(
+        writer: asyncio.StreamWriter,
+        status: int,
+        content_type: str,
+        body: Union[bytes, AsyncIterator[bytes]],
+    ) -> None:
+        head = f"HTTP/1.1 {status} {_REASONS[status]}\r\nContent-Type: {content_type}\r\n"
+        if isinstance(body, bytes):
+            writer.write(f"{head}Content-Length: {len(body)}\r\n\r\n".encode() + body)
+            await writer.drain()
+            return
+
+        writer.write(f"{head}Transfer-Encoding: chunked\r\n\r\n".encode())
+        async for data in body:
+            writer.write(b"%x\r\n%s\r\n" % (len(data), data))
+            await writer.drain()
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+    async def _handle_h2(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, preface: bytes
+    ) -> None:
+        """Serve one HTTP/2 connection (requires the ``h2`` package)."""
+        try:
+            import h2.config
+            import h2.connection
+            import h2.events
+            import h2.settings
+        except ImportError:
+            return
+
+        conn = h2.connection.H2Connection(
+            h2.config.H2Configuration(client_side=False, header_encoding="utf-8")
+        )
+        conn.initiate_connection()
+        conn.update_settings({h2.settings.SettingCodes.MAX_CONCURRENT_STREAMS: H2_MAX_STREAMS})
+        # 흐름 제어 창이 열리면 전송 대기 중인 스트림을 깨움
+        window_open = asyncio.Event()
+        pending: dict[int, tuple[dict, bytearray]] = {}
+        tasks: set[asyncio.Task] = set()
+
+        data = preface
+        try:
+            while data:
+                received = time.perf_counter()
+                for event in conn.receive_data(data):
+                    if isinstance(event, h2.events.RequestReceived):
+                        pending[event.stream_id] = (dict(event.headers), bytearray())
+                    elif isinstance(event, h2.events.DataReceived):
+                        pending[event.stream_id][1].extend(event.data)
+                        conn.acknowledge_received_data(
+                            event.flow_controlled_length, event.stream_id
+                        )
+                    elif isinstance(event, h2.events.StreamEnded):
+                        headers, body = pending.pop(event.stream_id)
+                        task = asyncio.create_task(
+                            self._respond_h2(
+                                conn, writer, window_open, event.stream_id, headers, bytes(body), received
+                            )
+                        )
+                        tasks.add(task)
+                        task.add_done_callback(tasks.discard)
+                    elif isinstance(event, h2.events.WindowUpdated):
+                        window_open.set()
+                    elif isinstance(event, h2.events.ConnectionTerminated):
+                        return
+                writer.write(conn.data_to_send())
+                await writer.drain()
+                data = await reader.read(65536)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _respond_h2(
+        self,
+        conn,
+        writer: asyncio.StreamWriter,
+        window_open: asyncio.Event,
+        stream_id: int,
+        headers: dict,
+        body: bytes,
+        received: float,
+    ) -> None:
+        import h2.exceptions
+
+        status, content_type, response = await self._route(
+            headers.get(":method", ""), headers.get(":path", ""), body, received
+        )
+        try:
+            conn.send_headers(stream_id, [(":status", str(status)), ("content-type", content_type)])
+            if isinstance(response, bytes):
+                await self._send_h2_data(conn, writer, window_open, stream_id, response)
+            else:
+                async for data in response:
+                    await self._send_h2_data(conn, writer, window_open, stream_id, data)
+            conn.end_stream(stream_id)
+            writer.write(conn.data_to_send())
+            await writer.drain()
+        except (h2.exceptions.StreamClosedError, h2.exceptions.ProtocolError, ConnectionError):
+            pass
+
+    @staticmethod
+    async def _send_h2_data(
+        conn, writer: asyncio.StreamWriter, window_open: asyncio.Event, stream_id: int, data: bytes
+    ) -> None:
+        while data:
+            size = min(conn.local_flow_control_window(stream_id), conn.max_outbound_frame_size)
+            if size <= 0:
+                window_open.clear()
+                await window_open.wait()
+                continue
+            conn.send_data(stream_id, data[:size])
+            data = data[size:]
+            writer.write(conn.data_to_send())
+            await writer.drain()
+
+    @staticmethod
+    async def _sleep_until(start: float, delay_ms: float) -> None:
+        remaining = start + delay_ms / 1000 - time.perf_counter()
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+
+    @staticmethod
+    def _json(status: int, payload: dict) -> tuple[int, str, bytes]:
+        return status, "application/json", json.dumps(payload).encode()
+
+
+class MockServerThread:
+    """Run a ``MockOpenAIServer`` on its own event loop in a daemon thread.
+
+    Keeps the server's work off the caller's event loop (it still shares the
+    GIL; use the command-line entry point for a separate process).
+
+    Example:
+        >>> with MockServerThread(ttft_ms=20, itl_ms=5) as server:
+        ...     config = BenchmarkConfig(server_url=server.url, ...)
+    """
+
+    def __init__(self, **kwargs):
+        """Initialize with ``MockOpenAIServer`` keyword arguments."""
+        self.server = MockOpenAIServer(**kwargs)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return self.server.url
+
+    def start(self) -> None:
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self.server.start(), self._loop).result()
+
+    def stop(self) -> None:
+        asyncio.run_coroutine_threadsafe(self.server.stop(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def __enter__(self) -> "MockServerThread":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def _serve(options: dict, ready: Optional["multiprocessing.synchronize.Event"] = None) -> None:
+    """Serve in this process until interrupted."""
+
+    async def main() -> None:
+        server = MockOpenAIServer(**options)
+        await server.start()
+        if ready is not None:
+            ready.set()
+        await server.serve_forever()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Mock OpenAI-compatible SSE server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--uds", default=None, help="Unix domain socket path")
+    parser.add_argument("--ttft-ms", type=float, default=0.0)
+    parser.add_argument("--itl-ms", type=float, default=0.0)
+    parser.add_argument("--output-tokens", type=int, default=None)
+    parser.add_argument("--tokens-per-chunk", type=int, default=1)
+    parser.add_argument(
+        "--processes", type=int, default=1, help="Server processes sharing the port"
+    )
+    args = parser.parse_args()
+
+    options = {
+        "ttft_ms": args.ttft_ms,
+        "itl_ms": args.itl_ms,
+        "output_tokens": args.output_tokens,
+        "tokens_per_chunk": args.tokens_per_chunk,
+        "host": args.host,
+        "port": args.port,
+        "uds": args.uds,
+        "reuse_port": args.processes > 1,
+    }
+    if args.uds and args.processes > 1:
+        parser.error("--processes > 1 requires a TCP port")
+
+    processes = []
+    for _ in range(args.processes):
+        ready = multiprocessing.Event()
+        process = multiprocessing.Process(target=_serve, args=(options, ready), daemon=True)
+        process.start()
+        ready.wait()
+        processes.append(process)
+
+    # SIGTERM도 정상 종료로 처리하여 데몬 자식 프로세스가 함께 종료되게 함
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+    where = args.uds or f"{args.host}:{args.port}"
+    print(f"mock server listening on {where} ({args.processes} processes)", flush=True)
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -26,6 +26,7 @@ def mock_service():
     service.start_benchmark = AsyncMock(return_value="test-run-id-123")
     service.get_status.return_value = None
     service.get_result.return_value = None
+    service.get_timeline.return_value = None
     service.list_runs.return_value = []
     service.delete_run.return_value = False
     service.compare_runs.return_value = {}
@@ -365,6 +366,68 @@ class TestBenchmarkCompareEndpoint:
         assert "comparison" in data
 
 
+class TestCompareSignificance:
+    """Tests for significance testing in BenchmarkService.compare_runs."""
+
+    @staticmethod
+    def stored_result(run_id: str, ttft_ms: float, num_requests: int) -> dict:
+        from shared.core.metrics import MetricsAggregator
+        from shared.core.models import RequestResult
+
+        aggregator = MetricsAggregator(mode="exact")
+        for i in range(num_requests):
+            ttft = ttft_ms + (i % 20)
+            aggregator.add(
+                RequestResult(
+                    request_id=i,
+                    ttft_ms=ttft,
+                    tpot_ms=20.0,
+                    e2e_latency_ms=ttft + 500.0,
+                    input_tokens=100,
+                    output_tokens=25,
+                    success=True,
+                )
+            )
+        level = aggregator.finalize(duration_seconds=10.0, concurrency=10)
+        return {"run_id": run_id, "results": [level.model_dump(mode="json")]}
+
+    def test_reports_significant_differences(self):
+        """Test that a large TTFT shift is significant and equal throughput is not."""
+        from llm_loadtest_api.services.benchmark_service import BenchmarkService
+
+        results = {
+            "base": self.stored_result("base", ttft_ms=100.0, num_requests=2000),
+            "slow": self.stored_result("slow", ttft_ms=150.0, num_requests=2000),
+        }
+        db = MagicMock()
+        db.get_result.side_effect = results.get
+        service = BenchmarkService(db)
+
+        comparison = service.compare_runs(["base", "slow"])
+
+        significance = comparison["significance"]
+        assert significance["baseline_run_id"] == "base"
+        tests = {t["metric"]: t for t in significance["runs"][0]["by_concurrency"]["10"]}
+        assert tests["ttft_p50"]["significant"]
+        assert tests["ttft_p50"]["diff_percent"] > 40
+        assert not tests["throughput"]["significant"]
+
+    def test_results_without_intervals(self):
+        """Test that results stored without intervals are skipped."""
+        from llm_loadtest_api.services.benchmark_service import BenchmarkService
+
+        legacy = {"run_id": "old", "results": [{"concurrency": 10, "ttft": {"p50": 1.0}}]}
+        db = MagicMock()
+        db.get_result.side_effect = {
+            "old": legacy,
+            "new": self.stored_result("new", ttft_ms=100.0, num_requests=100),
+        }.get
+
+        comparison = BenchmarkService(db).compare_runs(["old", "new"])
+
+        assert comparison["significance"]["runs"][0]["by_concurrency"] == {}
+
+
 class TestBenchmarkExportEndpoint:
     """Tests for GET /api/v1/benchmark/result/{run_id}/export endpoint."""
 
@@ -391,6 +454,77 @@ class TestBenchmarkExportEndpoint:
         assert "attachment" in response.headers["content-disposition"]
 
 
+class TestBenchmarkTimelineEndpoint:
+    """Tests for GET /api/v1/benchmark/result/{run_id}/timeline endpoint."""
+
+    @staticmethod
+    def stored_result() -> dict:
+        from shared.core.metrics import MetricsAggregator
+        from shared.core.models import RequestResult
+
+        levels = []
+        for concurrency in (1, 10):
+            aggregator = MetricsAggregator(mode="exact", timeline_interval=1.0)
+            aggregator.timeline.start(0.0)
+            for i in range(30):
+                aggregator.timeline.add(
+                    RequestResult(
+                        request_id=i,
+                        ttft_ms=50.0,
+                        e2e_latency_ms=500.0,
+                        input_tokens=10,
+                        output_tokens=20,
+                        success=True,
+                    ),
+                    now=i * 0.1 + 0.5,
+                )
+            levels.append(
+                aggregator.finalize(duration_seconds=3.5, concurrency=concurrency).model_dump(
+                    mode="json"
+                )
+            )
+        return {"run_id": "test-run-id", "results": levels}
+
+    def test_get_timeline(self, app):
+        """Test that the service extracts one timeline per level."""
+        from llm_loadtest_api.services.benchmark_service import BenchmarkService
+
+        db = MagicMock()
+        db.get_result.return_value = self.stored_result()
+        app.dependency_overrides[benchmarks.get_service] = lambda: BenchmarkService(db)
+
+        client = TestClient(app)
+        response = client.get("/api/v1/benchmark/result/test-run-id/timeline")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [level["concurrency"] for level in data["levels"]] == [1, 10]
+        timeline = data["levels"][0]["timeline"]
+        assert timeline["interval_seconds"] == 1.0
+        assert timeline["requests"] == [5, 10, 10, 5]
+        assert len(timeline["ttft_p50"]) == 4
+
+        response = client.get("/api/v1/benchmark/result/test-run-id/timeline?concurrency=10")
+        assert [level["concurrency"] for level in response.json()["levels"]] == [10]
+
+        response = client.get("/api/v1/benchmark/result/test-run-id/timeline?concurrency=5")
+        assert response.status_code == 404
+
+    def test_get_timeline_returns_404_for_missing_run(self, app, mock_service):
+        client = TestClient(app)
+        response = client.get("/api/v1/benchmark/result/non-existent-id/timeline")
+
+        assert response.status_code == 404
+
+    def test_get_timeline_returns_202_for_running(self, app, mock_service):
+        mock_service.get_status.return_value = {"id": "test-run-id", "status": "running"}
+
+        client = TestClient(app)
+        response = client.get("/api/v1/benchmark/result/test-run-id/timeline")
+
+        assert response.status_code == 202
+
+
 class TestRecommendEndpoint:
     """Tests for /api/v1/benchmark/recommend endpoints."""
 
@@ -0,0 +1,241 @@
+"""Distributed coordinator/agent tests with several agents on localhost."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+sys.path.insert(0, str(project_root / "src" / "services" / "api" / "src"))
+
+from llm_loadtest_api.main import create_app
+from llm_loadtest_api.routers import distributed
+from shared.core.distributed import DistributedAgent, DistributedCoordinator
+from shared.core.models import BenchmarkConfig, RequestResult, WarmupResult
+
+
+class FixedLatencyAdapter:
+    """Adapter returning fixed latencies without network access."""
+
+    def __init__(self, max_connections: int):
+        self.max_connections = max_connections
+
+    async def send_request(
+        self, request_id: int, prompt: str, max_tokens: int, stream: bool = True
+    ) -> RequestResult:
+        await asyncio.sleep(0.001)
+        return RequestResult(
+            request_id=request_id,
+            ttft_ms=50.0 + request_id % 10,
+            tpot_ms=5.0,
+            e2e_latency_ms=100.0,
+            input_tokens=16,
+            output_tokens=max_tokens,
+            itl_ms=[5.0] * (max_tokens - 1),
+        )
+
+    async def warmup(self, num_requests: int, input_len: int, output_len: int) -> WarmupResult:
+        await asyncio.sleep(0.001)
+        return WarmupResult(
+            mode="requests",
+            concurrency=1,
+            total_requests=num_requests,
+            failed_requests=0,
+            duration_seconds=0.001 * num_requests,
+        )
+
+    async def aclose(self) -> None:
+        pass
+
+
+CONFIG = {
+    "server_url": "http://llm:8000",
+    "model": "test-model",
+    "input_len": 16,
+    "output_len": 4,
+    "num_prompts": 31,
+    "concurrency": [2, 6],
+    "warmup": 0,
+}
+
+
+@pytest.fixture
+def coordinator() -> DistributedCoordinator:
+    """Coordinator with short start delays for fast tests."""
+    return DistributedCoordinator(start_delay=0.2, level_gap=0.05)
+
+
+@pytest.fixture
+def app(coordinator):
+    """API app wired to the test coordinator."""
+    test_app = create_app()
+    test_app.dependency_overrides[distributed.get_coordinator] = lambda: coordinator
+    return test_app
+
+
+def make_agent(app, name: str) -> DistributedAgent:
+    """Create an agent talking to the app in-process."""
+    client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://coordinator"
+    )
+    return DistributedAgent(
+        "http://coordinator",
+        name=name,
+        adapter_builder=FixedLatencyAdapter,
+        poll_interval=0.02,
+        client=client,
+    )
+
+
+class TestDistributedRun:
+    """End-to-end coordinator/agent tests."""
+
+    @pytest.mark.asyncio
+    async def test_three_agents_merge_into_one_result(self, app, coordinator):
+        """Test that shards from three agents merge into a single result."""
+        agents = [make_agent(app, f"agent-{i}") for i in range(3)]
+        for agent in agents:
+            await agent.register()
+
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://coordinator"
+        ) as client:
+            response = await client.post(
+                "/api/v1/distributed/runs",
+                json={
+                    "config": {
+                        "server_url": "http://llm:8000",
+                        "model": "test-model",
+                        "input_len": 16,
+                        "output_len": 4,
+                        "num_prompts": 31,
+                        "concurrency": [2, 6],
+                        "warmup": 0,
+                    },
+                    "save_result": False,
+                },
+            )
+            assert response.status_code == 200
+            run_id = response.json()["run_id"]
+            assert len(response.json()["agent_ids"]) == 3
+
+            executed = await asyncio.gather(*(agent.run_once() for agent in agents))
+            assert executed == [run_id] * 3
+
+            status = (await client.get(f"/api/v1/distributed/runs/{run_id}")).json()
+            assert status["status"] == "completed"
+
+            response = await client.get(f"/api/v1/distributed/runs/{run_id}/result")
+            assert response.status_code == 200
+            result = response.json()
+
+        # Level 1 (concurrency 2) uses two agents, level 2 uses all three
+        assert [r["concurrency"] for r in result["results"]] == [2, 6]
+        assert [r["total_requests"] for r in result["results"]] == [31, 31]
+        assert result["results"][1]["total_output_tokens"] == 31 * 4
+        assert result["results"][1]["itl"]["mean"] == pytest.approx(5.0)
+
+        for agent in agents:
+            await agent.aclose()
+
+    @pytest.mark.asyncio
+    async def test_no_agents_is_rejected(self, app):
+        """Test that a run cannot start without registered agents."""
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://coordinator"
+        ) as client:
+            response = await client.post(
+                "/api/v1/distributed/runs",
+                json={
+                    "config": {"server_url": "http://llm:8000", "model": "m"},
+                    "save_result": False,
+                },
+            )
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_idle_agent_gets_no_assignment(self, app):
+        """Test that polling without runs returns no work."""
+        agent = make_agent(app, "idle")
+        assert await agent.run_once() is None
+        await agent.aclose()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {"warmup_mode": "steady"},
+            {"workers": 2},
+            {"convergence_width": 0.1},
+            {
+                "load_profile": {
+                    "phases": [{"shape": "constant", "target": 4, "duration_seconds": 1}]
+                }
+            },
+        ],
+    )
+    async def test_unsupported_options_are_rejected(self, app, coordinator, options):
+        """Test that options the agents cannot apply fail the request."""
+        coordinator.register_agent("agent")
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://coordinator"
+        ) as client:
+            response = await client.post(
+                "/api/v1/distributed/runs",
+                json={"config": {**CONFIG, "warmup": 1, **options}, "save_result": False},
+            )
+        assert response.status_code == 400
+        assert "Not supported in distributed runs" in response.json()["detail"]
+
+    @pytest.mark.asyncio
+    async def test_warmup_runs_on_every_agent(self, app, coordinator):
+        """Test that agents warm up before the first level and the reports merge."""
+        agents = [make_agent(app, f"agent-{i}") for i in range(2)]
+        for agent in agents:
+            await agent.register()
+
+        run_id = coordinator.create_run(BenchmarkConfig(**{**CONFIG, "warmup": 3}))
+        await asyncio.gather(*(agent.run_once() for agent in agents))
+
+        result = coordinator.get_result(run_id)
+        assert result.warmup.total_requests == 6
+        assert result.warmup.concurrency == 2
+        assert [r.total_requests for r in result.results] == [31, 31]
+
+        for agent in agents:
+            await agent.aclose()
+
+    @pytest.mark.asyncio
+    async def test_dead_agent_fails_the_run(self, app, coordinator):
+        """Test that a level missing an agent's report fails at the deadline."""
+        failures = []
+        coordinator.level_timeout = 0.3
+        alive, dead = make_agent(app, "alive"), make_agent(app, "dead")
+        await alive.register()
+        dead_id = await dead.register()
+
+        run_id = coordinator.create_run(
+            BenchmarkConfig(**CONFIG),
+            on_fail=lambda run_id, error: failures.append((run_id, error)),
+        )
+        # 살아있는 에이전트는 실패를 확인하고 멈춤
+        assert await asyncio.wait_for(alive.run_once(), timeout=5) == run_id
+
+        status = coordinator.get_status(run_id)
+        assert status.status == "failed"
+        assert dead_id in status.error
+        assert failures == [(run_id, status.error)]
+        assert coordinator.get_assignment(dead_id) is None
+
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://coordinator"
+        ) as client:
+            response = await client.get(f"/api/v1/distributed/runs/{run_id}/result")
+        assert response.status_code == 409
+        assert "Level 0 did not complete" in response.json()["detail"]
+
+        await alive.aclose()
+        await dead.aclose()
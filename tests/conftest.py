@@ -241,6 +241,10 @@ class MockServerAdapter:
         """Simulate warmup."""
         pass
 
+    async def aclose(self) -> None:
+        """Simulate releasing pooled connections."""
+        pass
+
 
 @pytest.fixture
 def mock_adapter() -> MockServerAdapter:
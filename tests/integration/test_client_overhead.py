@@ -0,0 +1,97 @@
+"""Integration tests: measurement error against the local mock server."""
+
+import httpx
+import pytest
+
+from shared.adapters.openai_compat import OpenAICompatibleAdapter
+from shared.core.load_generator import LoadGenerator
+from shared.core.models import BenchmarkConfig
+from shared.testing import MockOpenAIServer, MockServerThread
+
+
+class TestMockOpenAIServer:
+    """Tests for the mock server itself."""
+
+    @pytest.mark.asyncio
+    async def test_streaming_schedule(self):
+        """Test that a single request sees the injected TTFT and ITL."""
+        async with MockOpenAIServer(ttft_ms=40, itl_ms=10, output_tokens=8) as server:
+            adapter = OpenAICompatibleAdapter(server.url, "mock-model")
+            try:
+                result = await adapter.send_request(0, "hello world", 8, stream=True)
+            finally:
+                await adapter.aclose()
+
+        assert result.success
+        assert result.output_tokens == 8
+        assert result.input_tokens == 2
+        assert 40 <= result.ttft_ms < 60
+        assert 110 <= result.e2e_latency_ms < 140
+        assert len(result.itl_ms) == 7
+        assert server.requests == 1
+        assert server.chunks == 8
+
+    @pytest.mark.asyncio
+    async def test_batched_chunks(self):
+        """Test that tokens_per_chunk batches tokens into fewer deltas."""
+        async with MockOpenAIServer(output_tokens=8, tokens_per_chunk=3) as server:
+            adapter = OpenAICompatibleAdapter(server.url, "mock-model")
+            try:
+                result = await adapter.send_request(0, "hello", 8, stream=True)
+            finally:
+                await adapter.aclose()
+
+        assert result.success
+        assert result.output_tokens == 8
+        assert server.chunks == 3
+
+    @pytest.mark.asyncio
+    async def test_non_streaming_and_health(self):
+        async with MockOpenAIServer(ttft_ms=20, itl_ms=5) as server:
+            adapter = OpenAICompatibleAdapter(server.url, "mock-model")
+            try:
+                assert await adapter.health_check()
+                result = await adapter.send_request(0, "hello", 5, stream=False)
+            finally:
+                await adapter.aclose()
+
+            async with httpx.AsyncClient(base_url=server.url) as client:
+                response = await client.get("/v1/unknown")
+
+        assert result.success
+        assert result.output_tokens == 5
+        assert result.e2e_latency_ms >= 40
+        assert response.status_code == 404
+
+
+class TestMeasurementError:
+    """Tests that the load generator measures injected latencies accurately."""
+
+    @pytest.mark.asyncio
+    async def test_load_generator_error(self):
+        ttft_ms, itl_ms, tokens = 50.0, 10.0, 10
+        with MockServerThread(ttft_ms=ttft_ms, itl_ms=itl_ms, output_tokens=tokens) as server:
+            adapter = OpenAICompatibleAdapter(server.url, "mock-model")
+            config = BenchmarkConfig(
+                server_url=server.url,
+                model="mock-model",
+                input_len=16,
+                output_len=tokens,
+                num_prompts=40,
+                concurrency=[4],
+                warmup=0,
+            )
+            try:
+                result = await LoadGenerator(adapter).run(config)
+            finally:
+                await adapter.aclose()
+
+        level = result.results[0]
+        injected_e2e = ttft_ms + itl_ms * (tokens - 1)
+
+        assert level.failed_requests == 0
+        assert level.total_output_tokens == 40 * tokens
+        # 클라이언트 오버헤드로 인한 측정 오차는 수 ms 이내여야 함
+        assert 0 <= level.ttft.p50 - ttft_ms < 20
+        assert abs(level.itl.p50 - itl_ms) < 3
+        assert 0 <= level.e2e_latency.p50 - injected_e2e < 25
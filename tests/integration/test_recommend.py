@@ -267,7 +267,8 @@ class TestInfraRecommender:
             # Saturation should be detected at concurrency 100 (error rate > 5%)
             # But the previous point (50) is returned as saturation
             assert saturation_concurrency == 50
-            assert saturation_goodput == pytest.approx(95.8, rel=0.01)
+            # 46 of 50 requests met the SLO (the 2 failed ones count as misses)
+            assert saturation_goodput == pytest.approx(92.0)
 
         def test_no_results(self, recommender: InfraRecommender):
             """Test with no results."""
@@ -0,0 +1,57 @@
+"""Integration tests: adapter transports against the local mock server."""
+
+import asyncio
+
+import pytest
+
+from shared.adapters.openai_compat import OpenAICompatibleAdapter
+from shared.core.models import TransportConfig
+from shared.testing import MockOpenAIServer
+
+
+async def send_all(url: str, transport: TransportConfig, n: int = 12) -> tuple[list, str]:
+    """Send ``n`` concurrent streaming requests; returns results and HTTP version."""
+    adapter = OpenAICompatibleAdapter(url, "mock-model", max_connections=n, transport=transport)
+    try:
+        results = await asyncio.gather(
+            *(adapter.send_request(i, "hello world", 6, stream=True) for i in range(n))
+        )
+        response = await adapter._get_client().get("/health")
+    finally:
+        await adapter.aclose()
+    return results, response.http_version
+
+
+class TestTransports:
+    """Tests for HTTP/1.1, HTTP/2 and Unix-socket transports."""
+
+    @pytest.mark.asyncio
+    async def test_http1_socket_options(self):
+        transport = TransportConfig(tcp_nodelay=False, tcp_keepalive_seconds=30)
+        async with MockOpenAIServer(ttft_ms=10, itl_ms=2) as server:
+            results, version = await send_all(server.url, transport)
+
+        assert version == "HTTP/1.1"
+        assert all(r.success and r.output_tokens == 6 for r in results)
+
+    @pytest.mark.asyncio
+    async def test_http2_multiplexing(self):
+        """Test that h2c prior knowledge spreads streams over several connections."""
+        pytest.importorskip("h2")
+        transport = TransportConfig(http_version="2", http2_max_streams=4)
+        async with MockOpenAIServer(ttft_ms=10, itl_ms=2) as server:
+            results, version = await send_all(server.url, transport)
+
+        assert version == "HTTP/2"
+        assert all(r.success and r.output_tokens == 6 for r in results)
+        assert server.requests == 12
+
+    @pytest.mark.asyncio
+    async def test_unix_socket(self, tmp_path):
+        path = str(tmp_path / "mock.sock")
+        async with MockOpenAIServer(ttft_ms=10, itl_ms=2, uds=path) as server:
+            results, version = await send_all(server.url, TransportConfig(uds=path))
+
+        assert version == "HTTP/1.1"
+        assert all(r.success for r in results)
+        assert 10 <= min(r.ttft_ms for r in results) < 50
@@ -0,0 +1,235 @@
+"""Integration tests: Triton gRPC streaming adapter against a local stub server."""
+
+import asyncio
+import struct
+from contextlib import asynccontextmanager
+
+import pytest
+
+grpc = pytest.importorskip("grpc")
+pytest.importorskip("tritonclient.grpc")
+
+from tritonclient.grpc import service_pb2, service_pb2_grpc  # noqa: E402
+
+from shared.adapters import AdapterFactory  # noqa: E402
+from shared.adapters.triton_grpc import TritonGrpcAdapter, grpc_target  # noqa: E402
+from shared.core.models import TransportConfig  # noqa: E402
+from shared.core.tokenizer import TokenCounter  # noqa: E402
+
+
+def bytes_tensor(text: str) -> bytes:
+    data = text.encode()
+    return struct.pack("<I", len(data)) + data
+
+
+class StubTriton(service_pb2_grpc.GRPCInferenceServiceServicer):
+    """Decoupled model emitting ``max_tokens`` token responses ``itl_ms`` apart.
+
+    Each response carries up to ``tokens_per_response`` tokens (as a
+    speculative decoding backend would) as delta ``text_output`` and, with
+    ``output_ids``, as token ids; the model ``broken`` reports an in-stream
+    error.
+    """
+
+    def __init__(
+        self,
+        ttft_ms: float = 20.0,
+        itl_ms: float = 5.0,
+        tokens_per_response: int = 1,
+        output_ids: bool = False,
+    ):
+        self.ttft_ms = ttft_ms
+        self.itl_ms = itl_ms
+        self.tokens_per_response = tokens_per_response
+        self.output_ids = output_ids
+        self.requests: list[dict] = []
+        self.peers: set[str] = set()
+
+    def response(self, request, tokens: int, final: bool):
+        response = service_pb2.ModelInferResponse(model_name=request.model_name, id=request.id)
+        response.parameters["triton_final_response"].bool_param = final
+        if tokens:
+            response.outputs.add(name="text_output", datatype="BYTES", shape=[1, 1])
+            response.raw_output_contents.append(bytes_tensor(" tok" * tokens))
+            if self.output_ids:
+                response.outputs.add(name="output_ids", datatype="INT32", shape=[1, 1, tokens])
+                response.raw_output_contents.append(struct.pack(f"<{tokens}i", *range(tokens)))
+        return service_pb2.ModelStreamInferResponse(infer_response=response)
+
+    async def ModelStreamInfer(self, request_iterator, context):
+        self.peers.add(context.peer())
+        async for request in request_iterator:
+            if request.model_name == "missing":
+                await context.abort(grpc.StatusCode.NOT_FOUND, "unknown model")
+            if request.model_name == "broken":
+                yield service_pb2.ModelStreamInferResponse(error_message="engine failure")
+                continue
+
+            raw = dict(zip((i.name for i in request.inputs), request.raw_input_contents))
+            max_tokens = struct.unpack("<i", raw["max_tokens"])[0]
+            stream = struct.unpack("<?", raw["stream"])[0]
+            self.requests.append(
+                {
+                    "text_input": raw["text_input"][4:].decode(),
+                    "max_tokens": max_tokens,
+                    "stream": stream,
+                    "empty_final": request.parameters[
+                        "triton_enable_empty_final_response"
+                    ].bool_param,
+                }
+            )
+
+            await asyncio.sleep(self.ttft_ms / 1000)
+            if not stream:
+                yield self.response(request, max_tokens, final=True)
+                continue
+            sent = 0
+            while sent < max_tokens:
+                if sent:
+                    await asyncio.sleep(self.itl_ms / 1000)
+                tokens = min(self.tokens_per_response, max_tokens - sent)
+                sent += tokens
+                yield self.response(request, tokens, final=False)
+            yield self.response(request, 0, final=True)
+
+    async def ServerReady(self, request, context):
+        return service_pb2.ServerReadyResponse(ready=True)
+
+    async def ModelReady(self, request, context):
+        return service_pb2.ModelReadyResponse(ready=request.name == "ensemble")
+
+
+@asynccontextmanager
+async def serve(servicer: StubTriton):
+    """Run ``servicer`` on a free local port; yields the server URL."""
+    server = grpc.aio.server()
+    service_pb2_grpc.add_GRPCInferenceServiceServicer_to_server(servicer, server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+    try:
+        yield f"grpc://127.0.0.1:{port}"
+    finally:
+        await server.stop(None)
+
+
+@pytest.fixture(autouse=True)
+def local_token_count(monkeypatch):
+    """Count whitespace-separated words instead of downloading encodings."""
+
+    def count(cls, text, model=""):
+        return len(text.split())
+
+    monkeypatch.setattr(TokenCounter, "count", classmethod(count))
+
+
+class TestTritonGrpcAdapter:
+    """Tests for TritonGrpcAdapter."""
+
+    def test_factory_and_target(self):
+        adapter = AdapterFactory.create("triton-grpc", "grpcs://triton:8001", "ensemble")
+
+        assert isinstance(adapter, TritonGrpcAdapter)
+        assert (adapter.target, adapter.secure) == ("triton:8001", True)
+        assert grpc_target("localhost:8001", TransportConfig()) == ("localhost:8001", False)
+        assert grpc_target("grpc://x:1", TransportConfig(uds="/tmp/t.sock"))[0] == "unix:/tmp/t.sock"
+
+    @staticmethod
+    async def send(servicer: StubTriton, model: str = "ensemble", **request) -> object:
+        async with serve(servicer) as url:
+            adapter = TritonGrpcAdapter(url, model)
+            try:
+                return await adapter.send_request(**request)
+            finally:
+                await adapter.aclose()
+
+    @pytest.mark.asyncio
+    async def test_streaming(self):
+        servicer = StubTriton(ttft_ms=20, itl_ms=5)
+        result = await self.send(
+            servicer, request_id=7, prompt="hello triton world", max_tokens=8, stream=True
+        )
+
+        assert result.success, result.error_type
+        assert servicer.requests == [
+            {"text_input": "hello triton world", "max_tokens": 8, "stream": True, "empty_final": True}
+        ]
+        assert result.input_tokens == 3
+        assert result.output_tokens == 8
+        assert 20 <= result.ttft_ms < 100
+        assert len(result.itl_ms) == 7
+        assert min(result.itl_ms) >= 4
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("output_ids", [True, False])
+    async def test_multi_token_responses_weight_itl(self, output_ids):
+        """Test that responses carrying several tokens count every token.
+
+        Without ``output_ids`` (the default TensorRT-LLM ensemble) the delta
+        ``text_output`` is tokenized.
+        """
+        servicer = StubTriton(itl_ms=10, tokens_per_response=3, output_ids=output_ids)
+        result = await self.send(servicer, request_id=0, prompt="hi", max_tokens=7, stream=True)
+
+        assert result.output_tokens == 7
+        # 응답 3개(3, 3, 1 토큰): 두 번째 응답 간격은 샘플 3개, 세 번째는 1개
+        assert len(result.itl_ms) == 4
+        assert result.itl_ms[0] == pytest.approx(result.itl_ms[2])
+        assert result.itl_ms[3] > 2 * result.itl_ms[0]
+        assert result.tpot_ms == pytest.approx(
+            (result.e2e_latency_ms - result.ttft_ms) / 6, rel=0.2
+        )
+
+    @pytest.mark.asyncio
+    async def test_non_streaming(self):
+        servicer = StubTriton(ttft_ms=20)
+        result = await self.send(servicer, request_id=0, prompt="hi", max_tokens=5, stream=False)
+
+        assert servicer.requests[0]["stream"] is False
+        assert result.output_tokens == 5
+        assert result.ttft_ms == result.e2e_latency_ms >= 20
+        assert result.itl_ms is None
+
+    @pytest.mark.asyncio
+    async def test_errors(self):
+        request = dict(request_id=0, prompt="hi", max_tokens=5, stream=True)
+        broken = await self.send(StubTriton(), "broken", **request)
+        missing = await self.send(StubTriton(), "missing", **request)
+
+        assert not broken.success and broken.error_type == "TritonStreamError"
+        assert not missing.success and missing.error_type == "GRPC_NOT_FOUND"
+
+    @pytest.mark.asyncio
+    async def test_health_check(self):
+        down = TritonGrpcAdapter("grpc://127.0.0.1:1", "ensemble", timeout=1.0)
+        async with serve(StubTriton()) as url:
+            ready = TritonGrpcAdapter(url, "ensemble")
+            unknown = TritonGrpcAdapter(url, "other")
+            try:
+                assert await ready.health_check()
+                assert not await unknown.health_check()
+                assert not await down.health_check()
+            finally:
+                for adapter in (ready, unknown, down):
+                    await adapter.aclose()
+
+    @pytest.mark.asyncio
+    async def test_streams_spread_over_channels(self):
+        """Test that streams use ceil(max_connections / http2_max_streams) connections."""
+        servicer = StubTriton(ttft_ms=30, itl_ms=1)
+        async with serve(servicer) as url:
+            adapter = TritonGrpcAdapter(
+                url,
+                "ensemble",
+                max_connections=8,
+                transport=TransportConfig(http2_max_streams=4),
+            )
+            try:
+                results = await asyncio.gather(
+                    *(adapter.send_request(i, "hi", 4, stream=True) for i in range(8))
+                )
+                assert adapter.active == [0, 0]
+            finally:
+                await adapter.aclose()
+
+        assert all(r.success for r in results)
+        assert len(servicer.peers) == 2
@@ -0,0 +1,247 @@
+"""Unit tests for server adapters."""
+
+import json
+from typing import Optional
+
+import httpx
+import pytest
+
+from shared.adapters.base import DEFAULT_MAX_CONNECTIONS, AdapterFactory
+from shared.adapters.openai_compat import (
+    OpenAICompatibleAdapter,
+    tokens_per_chunk,
+    weighted_itl,
+)
+from shared.core.tokenizer import TokenCounter
+
+
+class TestPooledClient:
+    """Tests for the shared connection-pooled HTTP client."""
+
+    def test_client_is_reused(self):
+        """Test that every request shares one long-lived client."""
+        adapter = OpenAICompatibleAdapter("http://localhost:8000", "test-model")
+        assert adapter._get_client() is adapter._get_client()
+
+    def test_pool_size_follows_max_connections(self):
+        """Test that the pool is sized from max_connections."""
+        adapter = AdapterFactory.create(
+            name="openai",
+            server_url="http://localhost:8000",
+            model="test-model",
+            max_connections=256,
+        )
+        assert adapter.max_connections == 256
+
+        default_adapter = OpenAICompatibleAdapter("http://localhost:8000", "test-model")
+        assert default_adapter.max_connections == DEFAULT_MAX_CONNECTIONS
+
+    @pytest.mark.asyncio
+    async def test_aclose_releases_and_recreates_client(self):
+        """Test that aclose closes the client and a new one is created lazily."""
+        adapter = OpenAICompatibleAdapter("http://localhost:8000", "test-model")
+        client = adapter._get_client()
+
+        await adapter.aclose()
+        assert client.is_closed
+
+        # Closing twice is a no-op
+        await adapter.aclose()
+
+        new_client = adapter._get_client()
+        assert new_client is not client
+        assert not new_client.is_closed
+        await adapter.aclose()
+
+
+def sse_body(*events: dict) -> bytes:
+    """Encode chat-completion chunks as an SSE body ending with [DONE]."""
+    body = b"".join(b"data: " + json.dumps(e).encode() + b"\n\n" for e in events)
+    return body + b"data: [DONE]\n\n"
+
+
+def content_chunk(text: str, usage: Optional[dict] = None) -> dict:
+    """Build a content-bearing chunk."""
+    return {
+        "choices": [{"index": 0, "delta": {"content": text}, "finish_reason": None}],
+        "usage": usage,
+    }
+
+
+class TestStreamingUsage:
+    """Tests for server-reported usage in streaming mode."""
+
+    @pytest.fixture(autouse=True)
+    def local_token_count(self, monkeypatch):
+        """Count words and record local tokenizer calls instead of downloading encodings."""
+        self.local_counts = 0
+
+        def count(cls, text, model=""):
+            self.local_counts += 1
+            return len(text.split())
+
+        monkeypatch.setattr(TokenCounter, "count", classmethod(count))
+
+    def make_adapter(
+        self,
+        body: bytes,
+        requests: list,
+        reject_status: Optional[int] = None,
+        reject_all: bool = False,
+        error: str = "unknown field",
+    ) -> OpenAICompatibleAdapter:
+        """Adapter whose server answers with ``body``.
+
+        With ``reject_status`` the server answers requests carrying
+        ``stream_options`` (every request with ``reject_all``) with that
+        status and ``error`` instead.
+        """
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            payload = json.loads(request.content)
+            requests.append(payload)
+            if reject_status and (reject_all or "stream_options" in payload):
+                return httpx.Response(reject_status, json={"error": error})
+            return httpx.Response(200, content=body)
+
+        adapter = OpenAICompatibleAdapter("http://llm", "test-model")
+        adapter._client = httpx.AsyncClient(
+            base_url="http://llm", transport=httpx.MockTransport(handler)
+        )
+        return adapter
+
+    @pytest.mark.asyncio
+    async def test_usage_chunk_overrides_chunk_count(self):
+        """Test that batched deltas are counted from the final usage."""
+        body = sse_body(
+            content_chunk("a b"),
+            content_chunk("c d"),
+            content_chunk("e f"),
+            {"choices": [], "usage": {"prompt_tokens": 12, "completion_tokens": 6}},
+        )
+        requests: list = []
+        adapter = self.make_adapter(body, requests)
+
+        result = await adapter.send_request(0, "hello", 8, stream=True)
+
+        assert requests[0]["stream_options"] == {"include_usage": True}
+        assert adapter.usage_accepted
+        assert result.input_tokens == 12
+        assert result.output_tokens == 6
+        # Two gaps, each spread over the 2 tokens of the following chunk
+        assert len(result.itl_ms) == 4
+        assert self.local_counts == 0
+        await adapter.aclose()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_without_usage(self):
+        """Test that servers without usage fall back to local token counts."""
+        body = sse_body(content_chunk("a b"), content_chunk(" c"), content_chunk(" d e"))
+        adapter = self.make_adapter(body, [])
+
+        result = await adapter.send_request(0, "hello world", 8, stream=True)
+
+        assert result.output_tokens == 5
+        assert result.input_tokens == 2
+        # 5토큰을 청크 3개에 균등 분배(2, 2, 1): ITL 샘플은 2 + 1개
+        assert len(result.itl_ms) == 3
+        assert self.local_counts == 2
+        await adapter.aclose()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status", [400, 422])
+    async def test_retries_without_stream_options(self, status):
+        """Test that a server rejecting stream_options is retried without it."""
+        body = sse_body(content_chunk("a b"), content_chunk(" c d"))
+        requests: list = []
+        adapter = self.make_adapter(body, requests, reject_status=status)
+
+        first = await adapter.send_request(0, "hello", 8, stream=True)
+        second = await adapter.send_request(1, "hello", 8, stream=True)
+
+        assert first.success and second.success
+        assert first.output_tokens == second.output_tokens == 4
+        # 거부 후에는 stream_options 없이만 전송
+        assert ["stream_options" in r for r in requests] == [True, False, False]
+        assert adapter.include_usage is False
+        await adapter.aclose()
+
+    @pytest.mark.asyncio
+    async def test_disables_stream_options_named_in_error(self):
+        """Test that an error naming stream_options turns it off even if the retry fails."""
+        requests: list = []
+        adapter = self.make_adapter(
+            b"", requests, 400, reject_all=True, error="Unrecognized field: stream_options"
+        )
+
+        result = await adapter.send_request(0, "hello", 8, stream=True)
+
+        assert result.error_type == "HTTP_400"
+        assert ["stream_options" in r for r in requests] == [True, False]
+        assert adapter.include_usage is False
+        await adapter.aclose()
+
+    @pytest.mark.asyncio
+    async def test_keeps_stream_options_when_retry_fails(self):
+        """Test that a 400 unrelated to stream_options leaves it on."""
+        requests: list = []
+        adapter = self.make_adapter(
+            b"", requests, 400, reject_all=True, error="maximum context length exceeded"
+        )
+
+        result = await adapter.send_request(0, "hello", 8, stream=True)
+
+        assert result.error_type == "HTTP_400"
+        # 필드 지원 여부를 모르는 동안은 한 번 재시도
+        assert ["stream_options" in r for r in requests] == [True, False]
+        assert adapter.include_usage is True
+        await adapter.aclose()
+
+    @pytest.mark.asyncio
+    async def test_no_retry_once_stream_options_accepted(self):
+        """Test that a 400 is not retried once stream_options has been accepted."""
+        requests: list = []
+        adapter = self.make_adapter(
+            b"", requests, 400, reject_all=True, error="maximum context length exceeded"
+        )
+        adapter.usage_accepted = True
+
+        result = await adapter.send_request(0, "hello", 8, stream=True)
+
+        assert result.error_type == "HTTP_400"
+        assert len(requests) == 1
+        assert adapter.include_usage is True
+        await adapter.aclose()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status", [401, 404, 429, 500])
+    async def test_keeps_stream_options_on_other_errors(self, status):
+        """Test that rate limiting and server errors are not retried."""
+        requests: list = []
+        adapter = self.make_adapter(b"", requests, reject_status=status)
+
+        result = await adapter.send_request(0, "hello", 8, stream=True)
+
+        assert result.error_type == f"HTTP_{status}"
+        assert len(requests) == 1
+        assert adapter.include_usage is True
+        await adapter.aclose()
+
+
+class TestTokenWeighting:
+    """Tests for per-chunk token counts and weighted ITL."""
+
+    def test_exact_counts_from_cumulative_usage(self):
+        """Test that continuous usage gives exact per-chunk counts."""
+        assert tokens_per_chunk([1, 3, 4, 7], 7) == [1, 2, 1, 3]
+
+    def test_even_split_without_per_chunk_usage(self):
+        """Test that the final usage is spread evenly across chunks."""
+        assert tokens_per_chunk([None, None, None], 7) == [3, 2, 2]
+        assert tokens_per_chunk([None, None], 1) == [1, 1]
+        assert tokens_per_chunk([], 5) == []
+
+    def test_weighted_itl(self):
+        """Test that a gap is divided among the tokens of its chunk."""
+        itl = weighted_itl([0, 10_000_000, 40_000_000], [1, 1, 3])
+        assert itl == pytest.approx([10.0, 10.0, 10.0, 10.0])
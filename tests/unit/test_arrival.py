@@ -0,0 +1,61 @@
+"""Unit tests for open-loop arrival schedulers."""
+
+import numpy as np
+import pytest
+
+from shared.core.arrival import ArrivalScheduler
+
+
+class TestArrivalScheduler:
+    """Tests for ArrivalScheduler class."""
+
+    def test_constant_intervals(self):
+        """Test constant arrivals are evenly spaced at 1/rate."""
+        scheduler = ArrivalScheduler(request_rate=4.0, distribution="constant")
+        offsets = scheduler.offsets(5)
+        assert offsets.tolist() == pytest.approx([0.0, 0.25, 0.5, 0.75, 1.0])
+
+    def test_poisson_mean_rate(self):
+        """Test Poisson arrivals average to the target rate."""
+        scheduler = ArrivalScheduler(request_rate=20.0, distribution="poisson", seed=42)
+        intervals = scheduler.intervals(20000)
+        assert np.mean(intervals) == pytest.approx(1 / 20.0, rel=0.05)
+        # Exponential distribution: coefficient of variation is 1
+        assert np.std(intervals) / np.mean(intervals) == pytest.approx(1.0, rel=0.05)
+
+    def test_gamma_burstiness(self):
+        """Test gamma burstiness keeps the mean and changes the variance."""
+        bursty = ArrivalScheduler(request_rate=10.0, distribution="gamma", burstiness=0.25, seed=1)
+        smooth = ArrivalScheduler(request_rate=10.0, distribution="gamma", burstiness=4.0, seed=1)
+
+        bursty_intervals = bursty.intervals(20000)
+        smooth_intervals = smooth.intervals(20000)
+
+        assert np.mean(bursty_intervals) == pytest.approx(0.1, rel=0.05)
+        assert np.mean(smooth_intervals) == pytest.approx(0.1, rel=0.05)
+        # CV of a gamma distribution is 1/sqrt(shape)
+        assert np.std(bursty_intervals) / np.mean(bursty_intervals) == pytest.approx(2.0, rel=0.1)
+        assert np.std(smooth_intervals) / np.mean(smooth_intervals) == pytest.approx(0.5, rel=0.1)
+
+    def test_seed_is_reproducible(self):
+        """Test that the same seed produces the same schedule."""
+        a = ArrivalScheduler(request_rate=5.0, seed=7).offsets(50)
+        b = ArrivalScheduler(request_rate=5.0, seed=7).offsets(50)
+        assert np.array_equal(a, b)
+
+    def test_iter_offsets_is_monotonic(self):
+        """Test unbounded offsets start at zero and never decrease."""
+        scheduler = ArrivalScheduler(request_rate=100.0, seed=3)
+        iterator = scheduler.iter_offsets()
+        offsets = [next(iterator) for _ in range(3000)]
+        assert offsets[0] == 0.0
+        assert all(b >= a for a, b in zip(offsets, offsets[1:]))
+
+    def test_invalid_arguments(self):
+        """Test that invalid rates and distributions are rejected."""
+        with pytest.raises(ValueError):
+            ArrivalScheduler(request_rate=0)
+        with pytest.raises(ValueError):
+            ArrivalScheduler(request_rate=1.0, burstiness=0)
+        with pytest.raises(ValueError):
+            ArrivalScheduler(request_rate=1.0, distribution="uniform")
@@ -0,0 +1,84 @@
+"""Unit tests for constant-time live progress metrics."""
+
+import numpy as np
+import pytest
+
+from shared.core.live_metrics import P2Quantile, RunningMetrics
+from shared.core.models import RequestResult
+
+
+def make_result(request_id: int, ttft: float = 100.0, success: bool = True) -> RequestResult:
+    """Create a request result with fixed token counts."""
+    return RequestResult(
+        request_id=request_id,
+        ttft_ms=ttft,
+        e2e_latency_ms=ttft * 4,
+        input_tokens=64,
+        output_tokens=50,
+        success=success,
+        error_type=None if success else "timeout",
+    )
+
+
+class TestP2Quantile:
+    """Tests for P2Quantile class."""
+
+    def test_exact_for_few_samples(self):
+        """Test that the estimate is exact while five or fewer samples are held."""
+        median = P2Quantile(0.5)
+        for v in (5.0, 1.0, 3.0):
+            median.add(v)
+        assert median.value() == 3.0
+
+    def test_median_close_to_numpy(self):
+        """Test the streaming median converges to the true median."""
+        rng = np.random.default_rng(0)
+        values = rng.lognormal(mean=4.0, sigma=0.5, size=20_000)
+
+        median = P2Quantile(0.5)
+        for v in values:
+            median.add(float(v))
+
+        assert median.value() == pytest.approx(np.median(values), rel=0.02)
+
+    def test_invalid_quantile(self):
+        """Test that quantiles outside (0, 1) are rejected."""
+        with pytest.raises(ValueError):
+            P2Quantile(1.0)
+
+
+class TestRunningMetrics:
+    """Tests for RunningMetrics class."""
+
+    def test_snapshot_counts_and_averages(self):
+        """Test counters and averages in the snapshot payload."""
+        live = RunningMetrics()
+        live.add(make_result(0, ttft=100.0), now=0.5)
+        live.add(make_result(1, ttft=300.0), now=1.0)
+        live.add(make_result(2, success=False), now=1.5)
+
+        snapshot = live.snapshot(concurrency=4, elapsed=2.0, now=2.0)
+
+        assert snapshot["completed"] == 3
+        assert snapshot["success_count"] == 2
+        assert snapshot["error_count"] == 1
+        assert snapshot["ttft_avg"] == 200.0
+        assert snapshot["e2e_avg"] == 800.0
+        assert snapshot["throughput_current"] == 50.0
+
+    def test_throughput_window_slides(self):
+        """Test that completions older than the window stop counting."""
+        live = RunningMetrics(window_seconds=5.0)
+        for i in range(10):
+            live.add(make_result(i), now=float(i))
+
+        # At t=9 the window holds completions at 4..9
+        assert live.current_throughput(elapsed=9.0, now=9.0) == pytest.approx(6 * 50 / 5.0)
+        # At t=20 everything has left the 5s window
+        assert live.current_throughput(elapsed=20.0, now=20.0) == 0.0
+
+    def test_no_success_returns_none(self):
+        """Test that a snapshot is not produced before any success."""
+        live = RunningMetrics()
+        live.add(make_result(0, success=False))
+        assert live.snapshot(concurrency=1, elapsed=1.0) is None
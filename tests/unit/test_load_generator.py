@@ -0,0 +1,84 @@
+"""Unit tests for LoadGenerator using the mock server adapter."""
+
+import pytest
+
+from shared.core.load_generator import LoadGenerator
+from shared.core.models import BenchmarkConfig
+
+
+def make_config(**overrides) -> BenchmarkConfig:
+    """Create a small benchmark config for fast tests."""
+    values = {
+        "server_url": "http://localhost:8000",
+        "model": "test-model",
+        "input_len": 32,
+        "output_len": 16,
+        "num_prompts": 20,
+        "concurrency": [4],
+        "warmup": 0,
+    }
+    values.update(overrides)
+    return BenchmarkConfig(**values)
+
+
+class TestRequestRateMode:
+    """Tests for open-loop request-rate mode."""
+
+    @pytest.mark.asyncio
+    async def test_sends_all_requests_and_reports_lag(self, mock_adapter):
+        """Test that rate mode sends num_prompts requests and reports send lag."""
+        generator = LoadGenerator(mock_adapter)
+        config = make_config(request_rate=500.0, arrival_distribution="constant")
+
+        result = await generator.run(config)
+        level = result.results[0]
+
+        assert mock_adapter.request_count == 20
+        assert level.total_requests == 20
+        assert level.request_rate_target == 500.0
+        assert level.send_lag is not None
+        assert level.send_lag.min >= 0.0
+
+    @pytest.mark.asyncio
+    async def test_constant_rate_spacing(self, mock_adapter):
+        """Test that the run lasts roughly as long as the schedule."""
+        generator = LoadGenerator(mock_adapter)
+        config = make_config(num_prompts=11, request_rate=100.0, arrival_distribution="constant")
+
+        result = await generator.run(config)
+
+        # 11 requests at 100 req/s span 100ms of schedule
+        assert result.results[0].duration_seconds >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_closed_loop_has_no_send_lag(self, mock_adapter):
+        """Test that closed-loop mode does not report send lag."""
+        generator = LoadGenerator(mock_adapter)
+
+        result = await generator.run(make_config())
+
+        assert result.results[0].send_lag is None
+        assert result.results[0].request_rate_target is None
+
+
+class TestLiveProgress:
+    """Tests for live progress callbacks in request-count mode."""
+
+    @pytest.mark.asyncio
+    async def test_metrics_emitted_every_interval(self, mock_adapter):
+        """Test that partial metrics arrive with request logs at the interval."""
+        generator = LoadGenerator(mock_adapter)
+        payloads = []
+
+        def on_progress(current, total, extra):
+            if isinstance(extra, dict):
+                payloads.append(extra)
+
+        await generator.run(make_config(num_prompts=40), progress_callback=on_progress)
+
+        assert len(payloads) == 40
+        assert all("request_log" in p for p in payloads)
+        with_metrics = [p["metrics"] for p in payloads if "metrics" in p]
+        assert len(with_metrics) == 4
+        assert with_metrics[-1]["completed"] == 40
+        assert with_metrics[-1]["ttft_p50"] > 0
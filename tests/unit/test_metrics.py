@@ -2,7 +2,7 @@
 
 import pytest
 
-from shared.core.metrics import GoodputCalculator, MetricsCalculator
+from shared.core.metrics import GoodputCalculator, MetricsAggregator, MetricsCalculator
 from shared.core.models import GoodputThresholds, RequestResult
 
 
@@ -378,3 +378,70 @@ class TestGoodputCalculator:
         # Values exactly at threshold should meet SLO (<=)
         assert goodput.satisfied_requests == 1
         assert goodput.goodput_percent == 100.0
+
+
+class TestLengthBuckets:
+    """Tests for latency broken down by request length."""
+
+    @staticmethod
+    def make_results() -> list[RequestResult]:
+        """Short prompts are fast, long prompts are slow."""
+        results = []
+        for i in range(60):
+            long_prompt = i % 3 == 0
+            results.append(
+                RequestResult(
+                    request_id=i,
+                    ttft_ms=400.0 if long_prompt else 50.0,
+                    tpot_ms=10.0,
+                    e2e_latency_ms=1000.0 + i,
+                    input_tokens=3000 if long_prompt else 100,
+                    output_tokens=20 + i,
+                    success=i != 59,
+                )
+            )
+        return results
+
+    def test_exact_buckets(self):
+        """Test that buckets split requests by input and output length bins."""
+        aggregator = MetricsAggregator(mode="exact", length_buckets=True)
+        for result in self.make_results():
+            aggregator.add(result)
+
+        buckets = aggregator.finalize(1.0, 4).length_buckets
+        inputs = [b for b in buckets if b.axis == "input"]
+
+        assert [(b.min_tokens, b.max_tokens, b.count) for b in inputs] == [
+            (64, 128, 39),
+            (2048, 4096, 20),
+        ]
+        assert inputs[0].ttft.p99 == pytest.approx(50.0)
+        assert inputs[1].ttft.p50 == pytest.approx(400.0)
+        outputs = [b for b in buckets if b.axis == "output"]
+        assert sum(b.count for b in outputs) == 59
+        assert outputs[-1].max_tokens == 128
+
+    def test_sketch_buckets_match_exact(self):
+        """Test that sketch mode and merged shards report the same bins."""
+        exact = MetricsAggregator(mode="exact", length_buckets=True)
+        shards = [MetricsAggregator(mode="sketch", length_buckets=True) for _ in range(2)]
+        for result in self.make_results():
+            exact.add(result)
+            shards[result.request_id % 2].add(result)
+
+        merged = MetricsAggregator.from_dict(shards[0].to_dict())
+        merged.merge(MetricsAggregator.from_dict(shards[1].to_dict()))
+
+        expected = exact.finalize(1.0, 4).length_buckets
+        actual = merged.finalize(1.0, 4).length_buckets
+        assert [(b.axis, b.min_tokens, b.count) for b in actual] == [
+            (b.axis, b.min_tokens, b.count) for b in expected
+        ]
+        for a, e in zip(actual, expected):
+            assert a.ttft.p50 == pytest.approx(e.ttft.p50, rel=0.02)
+
+    def test_disabled_by_default(self):
+        """Test that fixed-length runs do not report buckets."""
+        aggregator = MetricsAggregator(mode="exact")
+        aggregator.add(self.make_results()[0])
+        assert aggregator.finalize(1.0, 1).length_buckets is None
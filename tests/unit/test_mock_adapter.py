@@ -0,0 +1,147 @@
+"""Unit tests for the simulated continuous-batching adapter."""
+
+import asyncio
+
+import pytest
+
+from shared.adapters import AdapterFactory
+from shared.adapters.mock import BatchingModel, MockAdapter
+from shared.core.load_generator import LoadGenerator
+from shared.core.models import BenchmarkConfig
+
+# 빠른 테스트용: 스텝 1ms + 시퀀스당 0.5ms + 프롬프트 토큰당 0.01ms
+FAST = "mock://local?decode_base_ms=1&decode_ms_per_seq=0.5&prefill_ms_per_token=0.01"
+
+
+def prompt(tokens: int) -> str:
+    return "abcd" * tokens
+
+
+class TestBatchingModel:
+    """Tests for BatchingModel."""
+
+    def test_from_url(self):
+        model = BatchingModel.from_url("mock://local?max_batch_size=32&decode_base_ms=2.5")
+
+        assert model.max_batch_size == 32
+        assert model.decode_base_ms == 2.5
+        assert model.kv_capacity_tokens == BatchingModel().kv_capacity_tokens
+
+    def test_unknown_parameter(self):
+        with pytest.raises(ValueError, match="Unknown mock server parameter"):
+            BatchingModel.from_url("mock://local?batch=32")
+
+    def test_step_ms(self):
+        model = BatchingModel(decode_base_ms=5, decode_ms_per_seq=0.5, prefill_ms_per_token=0.1)
+
+        assert model.step_ms(batch_size=4, prefill_tokens=100) == 17.0
+
+    def test_factory(self):
+        adapter = AdapterFactory.create("mock", server_url=FAST, model="mock-model")
+
+        assert isinstance(adapter, MockAdapter)
+        assert adapter.batching.decode_ms_per_seq == 0.5
+
+
+class TestMockAdapter:
+    """Tests for simulated request timings."""
+
+    @pytest.mark.asyncio
+    async def test_single_request(self):
+        adapter = MockAdapter(FAST, "mock-model")
+        try:
+            result = await adapter.send_request(0, prompt(100), 5, stream=True)
+        finally:
+            await adapter.aclose()
+
+        assert result.success
+        assert result.input_tokens == 100
+        assert result.output_tokens == 5
+        # 프리필 스텝: 1 + 0.5 + 100 * 0.01, 디코드 스텝: 1 + 0.5
+        assert result.ttft_ms == pytest.approx(2.5)
+        assert result.itl_ms == pytest.approx([1.5] * 4)
+        assert result.e2e_latency_ms == pytest.approx(8.5)
+
+    @pytest.mark.asyncio
+    async def test_itl_grows_with_batch(self):
+        adapter = MockAdapter(FAST, "mock-model")
+        try:
+            results = await asyncio.gather(
+                *(adapter.send_request(i, prompt(10), 10, stream=True) for i in range(8))
+            )
+        finally:
+            await adapter.aclose()
+
+        # 8개가 한 배치로 디코드: 1 + 0.5 * 8
+        assert all(r.itl_ms == pytest.approx([5.0] * 9) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_kv_capacity_queues_requests(self):
+        """Test that requests beyond the KV capacity wait for a free slot."""
+        adapter = MockAdapter(FAST + "&kv_capacity_tokens=40", "mock-model")
+        try:
+            results = await asyncio.gather(
+                *(adapter.send_request(i, prompt(10), 10, stream=True) for i in range(4))
+            )
+        finally:
+            await adapter.aclose()
+
+        first, second = results[:2], results[2:]
+        assert max(r.e2e_latency_ms for r in first) <= min(r.ttft_ms for r in second)
+
+    @pytest.mark.asyncio
+    async def test_too_long_for_kv_cache(self):
+        adapter = MockAdapter(FAST + "&kv_capacity_tokens=40", "mock-model")
+        result = await adapter.send_request(0, prompt(100), 10, stream=True)
+
+        assert not result.success
+        assert result.error_type == "HTTP_400"
+
+    @pytest.mark.asyncio
+    async def test_non_streaming(self):
+        adapter = MockAdapter(FAST, "mock-model")
+        try:
+            result = await adapter.send_request(0, prompt(100), 5, stream=False)
+        finally:
+            await adapter.aclose()
+
+        assert result.ttft_ms == result.e2e_latency_ms == pytest.approx(8.5)
+        assert result.itl_ms is None
+
+
+class TestMockPipeline:
+    """Tests for the full load generator pipeline against the simulation."""
+
+    @staticmethod
+    async def run() -> list:
+        config = BenchmarkConfig(
+            server_url=FAST + "&max_batch_size=4",
+            model="mock-model",
+            adapter="mock",
+            input_len=64,
+            output_len=16,
+            num_prompts=32,
+            concurrency=[1, 8],
+            warmup=0,
+        )
+        adapter = MockAdapter(config.server_url, config.model)
+        try:
+            result = await LoadGenerator(adapter).run(config)
+        finally:
+            await adapter.aclose()
+        return result.results
+
+    @pytest.mark.asyncio
+    async def test_deterministic_latency_curve(self):
+        first = await self.run()
+        second = await self.run()
+
+        for a, b in zip(first, second):
+            assert a.ttft.p50 == pytest.approx(b.ttft.p50)
+            assert a.e2e_latency.p99 == pytest.approx(b.e2e_latency.p99)
+
+        single, loaded = first
+        # 배치 한도(4)를 넘는 동시성에서는 대기열 때문에 TTFT가 크게 증가
+        assert loaded.ttft.p50 > 4 * single.ttft.p50
+        assert loaded.itl.p50 > single.itl.p50
+        assert loaded.failed_requests == 0
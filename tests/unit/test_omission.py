@@ -0,0 +1,167 @@
+"""Unit tests for coordinated-omission correction."""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from shared.core.load_generator import LoadGenerator
+from shared.core.metrics import MetricsAggregator
+from shared.core.models import BenchmarkConfig, RequestResult
+from shared.core.omission import PaceEstimator, corrected_values
+from shared.core.result_buffer import ResultBuffer
+
+
+def make_result(
+    request_id: int,
+    e2e_ms: float,
+    interval_ms: float | None = None,
+    send_lag_ms: float | None = None,
+) -> RequestResult:
+    return RequestResult(
+        request_id=request_id,
+        ttft_ms=e2e_ms / 2,
+        e2e_latency_ms=e2e_ms,
+        input_tokens=8,
+        output_tokens=10,
+        success=True,
+        send_lag_ms=send_lag_ms,
+        expected_interval_ms=interval_ms,
+    )
+
+
+class TestCorrectedValues:
+    """Tests for the intended-start correction."""
+
+    def test_synthesizes_omitted_requests(self):
+        """Test HdrHistogram's recordValueWithExpectedInterval expansion."""
+        values = corrected_values(
+            np.array([100.0, 20.0]), np.array([np.nan, np.nan]), np.array([30.0, 30.0])
+        )
+
+        assert sorted(values.tolist()) == [20.0, 40.0, 70.0, 100.0]
+
+    def test_ttft_follows_e2e_stall(self):
+        """Test that a stall during decode shows up in the corrected TTFT tail."""
+        ttft = np.array([100.0])
+        e2e = np.array([10_000.0])
+
+        values = corrected_values(ttft, np.array([np.nan]), np.array([1000.0]), e2e)
+
+        # 10초 동안 누락된 9개 요청: 워커 대기 (10000 - k*1000) + TTFT 100
+        assert sorted(values.tolist()) == [100.0] + [1100.0 + 1000.0 * k for k in range(9)]
+        assert np.percentile(values, 99) > 9000
+
+    def test_adds_send_lag(self):
+        values = corrected_values(np.array([10.0]), np.array([5.0]), np.array([np.nan]))
+
+        assert values.tolist() == [15.0]
+
+    def test_unknown_interval_is_not_expanded(self):
+        values = corrected_values(np.array([1000.0]), np.array([np.nan]), np.array([np.nan]))
+
+        assert values.tolist() == [1000.0]
+
+
+class TestPaceEstimator:
+    """Tests for PaceEstimator."""
+
+    def test_needs_min_samples(self):
+        pace = PaceEstimator(min_samples=4)
+        for _ in range(3):
+            pace.add(10.0)
+
+        assert pace.interval_ms is None
+
+        pace.add(10.0)
+        assert pace.interval_ms == 10.0
+
+    def test_median_ignores_stall(self):
+        pace = PaceEstimator(min_samples=4)
+        for e2e in (10.0, 11.0, 12.0, 5000.0):
+            pace.add(e2e)
+
+        assert pace.interval_ms == 11.5
+
+
+class TestAggregatorCorrection:
+    """Tests for corrected statistics in MetricsAggregator."""
+
+    results = [make_result(i, 10.0, interval_ms=10.0) for i in range(99)] + [
+        make_result(99, 1000.0, interval_ms=10.0)
+    ]
+
+    def test_exact_and_sketch_agree(self):
+        levels = {}
+        for mode in ("exact", "sketch"):
+            aggregator = MetricsAggregator(mode=mode)
+            for result in self.results:
+                aggregator.add(result)
+            levels[mode] = aggregator.finalize(duration_seconds=1.0, concurrency=1)
+
+        exact, sketch = levels["exact"], levels["sketch"]
+        # 1000ms 요청 동안 누락된 98개 요청이 추가됨
+        assert exact.e2e_latency.p99 < 20.0
+        assert exact.e2e_corrected.p99 > 900.0
+        assert exact.e2e_corrected.mean == pytest.approx(sketch.e2e_corrected.mean)
+        assert sketch.e2e_corrected.p50 == pytest.approx(exact.e2e_corrected.p50, rel=0.02)
+        # 누락된 요청의 TTFT: 워커 대기 (1000 - 10) + 자신의 TTFT 500
+        assert sketch.ttft_corrected.max == exact.ttft_corrected.max == 1490.0
+        assert exact.ttft_corrected.mean == pytest.approx(sketch.ttft_corrected.mean)
+
+    def test_survives_serialization(self):
+        """Test that the expected interval column is shipped between workers."""
+        buffer = ResultBuffer.from_results(self.results)
+        restored = ResultBuffer.from_dict(buffer.to_dict())
+
+        assert restored.expected_interval_ms.tolist() == [10.0] * 100
+        assert restored.to_results()[0].expected_interval_ms == 10.0
+
+
+class StallingAdapter:
+    """Adapter that stalls for a long time once."""
+
+    def __init__(self, stall_after: int = 40, stall_seconds: float = 0.3):
+        self.stall_after = stall_after
+        self.stall_seconds = stall_seconds
+        self.count = 0
+
+    async def send_request(self, request_id, prompt, max_tokens, stream) -> RequestResult:
+        self.count += 1
+        delay = self.stall_seconds if self.count == self.stall_after else 0.005
+        await asyncio.sleep(delay)
+        return make_result(request_id, delay * 1000)
+
+    async def health_check(self) -> bool:
+        return True
+
+    async def warmup(self, num_requests, input_len, output_len) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        pass
+
+
+class TestClosedLoopCorrection:
+    """Tests for correction in closed-loop load generation."""
+
+    @pytest.mark.asyncio
+    async def test_stall_raises_corrected_tail(self):
+        """Test that requests omitted during a stall show up in the corrected tail."""
+        config = BenchmarkConfig(
+            server_url="http://localhost:8000",
+            model="test-model",
+            input_len=8,
+            output_len=10,
+            num_prompts=200,
+            concurrency=[1],
+            warmup=0,
+            metrics_mode="exact",
+        )
+
+        result = await LoadGenerator(StallingAdapter()).run(config)
+        level = result.results[0]
+
+        assert level.e2e_latency.p95 < 50
+        assert level.e2e_corrected.p95 > 100
+        assert level.e2e_corrected.max == pytest.approx(level.e2e_latency.max)
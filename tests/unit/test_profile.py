@@ -0,0 +1,226 @@
+"""Unit tests for staged load profiles."""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from shared.core.load_generator import LoadGenerator
+from shared.core.models import BenchmarkConfig, LoadPhase, LoadProfile, RequestResult
+from shared.core.profile import ProfileSchedule, is_steady, max_connections_for, phase_levels
+
+
+class InFlightAdapter:
+    """Adapter that records the highest number of concurrent requests."""
+
+    def __init__(self, delay: float = 0.005):
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.request_count = 0
+
+    async def send_request(self, request_id, prompt, max_tokens, stream) -> RequestResult:
+        self.in_flight += 1
+        self.request_count += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return RequestResult(
+            request_id=request_id,
+            ttft_ms=self.delay * 500,
+            e2e_latency_ms=self.delay * 1000,
+            input_tokens=8,
+            output_tokens=10,
+            success=True,
+        )
+
+    async def health_check(self) -> bool:
+        return True
+
+    async def warmup(self, num_requests, input_len, output_len) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        pass
+
+
+def profile(*phases: dict, dimension: str = "concurrency") -> LoadProfile:
+    return LoadProfile(dimension=dimension, phases=[LoadPhase(**phase) for phase in phases])
+
+
+def make_config(load_profile: LoadProfile, **overrides) -> BenchmarkConfig:
+    values = {
+        "server_url": "http://localhost:8000",
+        "model": "test-model",
+        "input_len": 8,
+        "output_len": 10,
+        "concurrency": [64],
+        "warmup": 0,
+        "load_profile": load_profile,
+    }
+    values.update(overrides)
+    return BenchmarkConfig(**values)
+
+
+class TestPhaseLevels:
+    """Tests for the level of each phase shape."""
+
+    t = np.array([0.0, 2.5, 5.0, 7.5, 10.0])
+
+    def level(self, start: float = 0.0, **phase) -> list[float]:
+        phase.setdefault("duration_seconds", 10.0)
+        return phase_levels(LoadPhase(**phase), start, self.t).tolist()
+
+    def test_constant(self):
+        assert self.level(start=5.0, shape="constant", target=8) == [8.0] * 5
+
+    def test_ramp(self):
+        assert self.level(start=0.0, shape="ramp", target=40) == [0.0, 10.0, 20.0, 30.0, 40.0]
+
+    def test_step(self):
+        assert self.level(start=0.0, shape="step", target=40, steps=2) == [
+            20.0, 20.0, 40.0, 40.0, 40.0
+        ]
+
+    def test_spike(self):
+        levels = self.level(start=10.0, shape="spike", target=100, spike_seconds=4.0)
+        assert levels == [10.0, 10.0, 100.0, 10.0, 10.0]
+
+    def test_sine(self):
+        levels = self.level(start=10.0, shape="sine", target=30, period_seconds=10.0)
+        assert levels == pytest.approx([10.0, 20.0, 30.0, 20.0, 10.0])
+
+    def test_only_ramps_are_transient(self):
+        assert not is_steady(LoadPhase(shape="ramp", target=1, duration_seconds=1))
+        assert is_steady(LoadPhase(shape="spike", target=1, duration_seconds=1))
+        assert is_steady(LoadPhase(shape="ramp", target=1, duration_seconds=1, steady=True))
+
+
+class TestProfileSchedule:
+    """Tests for ProfileSchedule."""
+
+    def test_phases_chain_levels(self):
+        """Test that unset start levels continue from the previous phase."""
+        schedule = ProfileSchedule(
+            profile(
+                {"shape": "ramp", "target": 10, "duration_seconds": 10},
+                {"shape": "constant", "target": 10, "duration_seconds": 5},
+                {"shape": "ramp", "target": 0, "duration_seconds": 5, "steady": True},
+            )
+        )
+
+        assert schedule.duration == 20
+        assert schedule.starts == [0, 10, 15]
+        assert schedule.start_levels == [0, 10, 10]
+        assert schedule.phase_index(12.0) == 1
+        assert schedule.phase_index(99.0) == 2
+        assert schedule.level(5.0) == 5.0
+        assert schedule.level(17.5) == 5.0
+        assert schedule.max_level() == 10
+
+    def test_requires_steady_phase(self):
+        with pytest.raises(ValueError):
+            ProfileSchedule(profile({"shape": "ramp", "target": 10, "duration_seconds": 1}))
+
+    def test_constant_rate_arrivals(self):
+        schedule = ProfileSchedule(
+            profile({"shape": "constant", "target": 50, "duration_seconds": 2})
+        )
+
+        offsets = list(schedule.arrival_offsets("constant"))
+
+        assert len(offsets) == 100
+        assert np.diff(offsets) == pytest.approx(0.02)
+
+    def test_ramped_rate_arrivals(self):
+        """Test that arrivals follow a linearly increasing rate."""
+        schedule = ProfileSchedule(
+            profile({"shape": "ramp", "target": 200, "duration_seconds": 2, "steady": True})
+        )
+
+        offsets = np.array(list(schedule.arrival_offsets("poisson", seed=0)))
+
+        # 기대 도착 수 = 0.5 * 200 * 2 = 200, 후반부가 전반부의 약 3배
+        assert 160 < len(offsets) < 240
+        first, second = (offsets < 1.0).sum(), (offsets >= 1.0).sum()
+        assert 2 < second / first < 4.5
+        assert offsets.max() < 2.0
+
+
+class TestMaxConnections:
+    """Tests for max_connections_for."""
+
+    def test_concurrency_profile_peak_above_levels(self):
+        """Test that the pool covers every worker of a profile peaking above -c."""
+        config = make_config(
+            profile(
+                {"shape": "ramp", "target": 64, "duration_seconds": 60},
+                {"shape": "spike", "target": 256, "duration_seconds": 30, "spike_seconds": 10},
+            ),
+            concurrency=[1],
+        )
+
+        assert max_connections_for(config) == 256
+
+    def test_request_rate_profile_capped_by_levels(self):
+        config = make_config(
+            profile(
+                {"shape": "constant", "target": 500, "duration_seconds": 10},
+                dimension="request_rate",
+            ),
+            concurrency=[32],
+        )
+
+        assert max_connections_for(config) == 32
+
+    def test_without_profile(self):
+        assert max_connections_for(make_config(None, concurrency=[4, 16])) == 16
+
+
+class TestProfileRunner:
+    """Tests for running profiles through LoadGenerator."""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_profile(self):
+        """Test that ramps are split out and concurrency follows the profile."""
+        adapter = InFlightAdapter()
+        config = make_config(
+            profile(
+                {"shape": "ramp", "target": 6, "duration_seconds": 0.3},
+                {"shape": "constant", "target": 6, "duration_seconds": 0.4, "name": "hold"},
+                {"shape": "spike", "start": 2, "target": 12, "duration_seconds": 0.4},
+            )
+        )
+
+        result = await LoadGenerator(adapter).run(config)
+
+        assert [r.phase.index for r in result.results] == [1, 2]
+        assert [r.phase.index for r in result.transient_results] == [0]
+        hold, spike = result.results
+        assert hold.phase.name == "hold" and hold.phase.steady
+        assert hold.concurrency == 6 and spike.concurrency == 12
+        assert hold.duration_seconds == 0.4
+        assert adapter.max_in_flight <= 12
+        total = sum(r.total_requests for r in result.results + result.transient_results)
+        assert total == adapter.request_count
+
+    @pytest.mark.asyncio
+    async def test_request_rate_profile(self):
+        """Test open-loop profiles report the phase's mean rate."""
+        adapter = InFlightAdapter(delay=0.001)
+        config = make_config(
+            profile(
+                {"shape": "constant", "target": 200, "duration_seconds": 0.5},
+                dimension="request_rate",
+            ),
+            arrival_distribution="constant",
+        )
+
+        result = await LoadGenerator(adapter).run(config)
+        level = result.results[0]
+
+        assert level.request_rate_target == pytest.approx(200)
+        assert level.concurrency == 64
+        assert level.total_requests == 100
+        assert level.send_lag is not None
+        assert result.transient_results == []
@@ -0,0 +1,116 @@
+"""Unit tests for the columnar result buffer."""
+
+import numpy as np
+import pytest
+
+from shared.core.metrics import GoodputCalculator, MetricsCalculator
+from shared.core.models import GoodputThresholds, RequestResult
+from shared.core.result_buffer import ResultBuffer
+
+
+def make_result(request_id: int, itl: list[float] | None = None, **overrides) -> RequestResult:
+    """Create a request result with sensible defaults."""
+    values = {
+        "request_id": request_id,
+        "ttft_ms": 100.0 + request_id,
+        "tpot_ms": 10.0,
+        "e2e_latency_ms": 1000.0 + request_id,
+        "input_tokens": 64,
+        "output_tokens": 32,
+        "itl_ms": itl,
+    }
+    values.update(overrides)
+    return RequestResult(**values)
+
+
+class TestResultBuffer:
+    """Tests for ResultBuffer class."""
+
+    def test_append_grows_past_capacity(self):
+        """Test that the buffer grows and keeps earlier rows intact."""
+        buffer = ResultBuffer(capacity=2)
+        for i in range(10):
+            buffer.append(make_result(i, itl=[1.0] * i))
+
+        assert len(buffer) == 10
+        assert buffer.request_id.tolist() == list(range(10))
+        assert buffer.ttft_ms[7] == 107.0
+        assert buffer.itl_size == sum(range(10))
+        assert buffer.itl_offsets[-1] == buffer.itl_size
+
+    def test_optional_fields_are_nan(self):
+        """Test that missing TPOT and send lag are stored as NaN."""
+        buffer = ResultBuffer()
+        buffer.append(make_result(0, tpot_ms=None))
+        buffer.append(make_result(1, send_lag_ms=2.5))
+
+        assert np.isnan(buffer.tpot_ms[0])
+        assert np.isnan(buffer.send_lag_ms[0])
+        assert buffer.send_lag_ms[1] == 2.5
+
+    def test_itl_for_mask(self):
+        """Test selecting ITL samples of a subset of rows."""
+        buffer = ResultBuffer()
+        buffer.append(make_result(0, itl=[1.0, 2.0]))
+        buffer.append(make_result(1, itl=[3.0], success=False, error_type="timeout"))
+        buffer.append(make_result(2, itl=[4.0, 5.0, 6.0]))
+
+        assert buffer.itl_for(buffer.success).tolist() == [1.0, 2.0, 4.0, 5.0, 6.0]
+
+    def test_extend_remaps_error_codes(self):
+        """Test that merging buffers keeps ITL offsets and error types consistent."""
+        a = ResultBuffer()
+        a.append(make_result(0, itl=[1.0], success=False, error_type="timeout"))
+        b = ResultBuffer()
+        b.append(make_result(1, itl=[2.0, 3.0], success=False, error_type="http_500"))
+        b.append(make_result(2, success=False, error_type="timeout"))
+
+        a.extend(b)
+
+        assert len(a) == 3
+        assert a.itl_offsets.tolist() == [0, 1, 3, 3]
+        assert a.error_counts() == {"timeout": 2, "http_500": 1}
+
+    def test_round_trip(self):
+        """Test that rows convert back to equivalent RequestResult objects."""
+        results = [
+            make_result(0, itl=[1.5, 2.5]),
+            make_result(1, tpot_ms=None, success=False, error_type="timeout"),
+        ]
+        assert ResultBuffer.from_results(results).to_results() == results
+
+
+class TestColumnarMetrics:
+    """Tests for metrics computed from a ResultBuffer."""
+
+    def test_aggregate_buffer_matches_list_stats(self):
+        """Test vectorized aggregation against per-result values."""
+        results = [make_result(i, itl=[5.0, 6.0]) for i in range(20)]
+        results.append(make_result(20, success=False, error_type="timeout"))
+
+        level = MetricsCalculator.aggregate_buffer(
+            ResultBuffer.from_results(results), duration_seconds=2.0, concurrency=4
+        )
+
+        successful = [r for r in results if r.success]
+        assert level.ttft == MetricsCalculator.calculate_latency_stats(
+            [r.ttft_ms for r in successful]
+        )
+        assert level.failed_requests == 1
+        assert level.total_output_tokens == 32 * 20
+        assert level.itl.mean == pytest.approx(5.5)
+
+    def test_columnar_goodput_treats_missing_tpot_as_miss(self):
+        """Test that NaN TPOT never satisfies a TPOT threshold."""
+        thresholds = GoodputThresholds(ttft_ms=200.0, tpot_ms=20.0)
+        goodput = GoodputCalculator.calculate_columnar(
+            ttft_ms=np.array([100.0, 150.0, 250.0]),
+            tpot_ms=np.array([10.0, np.nan, 10.0]),
+            e2e_ms=np.array([1000.0, 1000.0, 1000.0]),
+            thresholds=thresholds,
+        )
+
+        assert goodput.satisfied_requests == 1
+        assert goodput.ttft_satisfied == 2
+        assert goodput.tpot_satisfied == 2
+        assert goodput.e2e_satisfied is None
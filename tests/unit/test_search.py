@@ -0,0 +1,204 @@
+"""Unit tests for the adaptive concurrency/request-rate search."""
+
+import asyncio
+
+import pytest
+
+from shared.core.load_generator import LoadGenerator
+from shared.core.models import BenchmarkConfig, GoodputThresholds, RequestResult, WorkloadSpec
+from shared.core.recommend import InfraRecommender
+from shared.core.search import ConcurrencySearch
+
+
+class CapacityAdapter:
+    """Adapter whose TTFT blows up once in-flight requests exceed a capacity."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.in_flight = 0
+        self.request_count = 0
+        self.closed = False
+
+    async def send_request(self, request_id, prompt, max_tokens, stream) -> RequestResult:
+        self.in_flight += 1
+        self.request_count += 1
+        ttft = 10.0 if self.in_flight <= self.capacity else 1000.0
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+        return RequestResult(
+            request_id=request_id,
+            ttft_ms=ttft,
+            tpot_ms=5.0,
+            e2e_latency_ms=ttft + 50.0,
+            input_tokens=8,
+            output_tokens=10,
+            success=True,
+        )
+
+    async def health_check(self) -> bool:
+        return True
+
+    async def warmup(self, num_requests, input_len, output_len) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+def make_config(**overrides) -> BenchmarkConfig:
+    """Create a small search config with a TTFT SLO."""
+    values = {
+        "server_url": "http://localhost:8000",
+        "model": "test-model",
+        "input_len": 8,
+        "output_len": 10,
+        "num_prompts": 40,
+        "concurrency": [1],
+        "warmup": 0,
+        "goodput_thresholds": GoodputThresholds(ttft_ms=100.0),
+    }
+    values.update(overrides)
+    return BenchmarkConfig(**values)
+
+
+class TestConcurrencySearch:
+    """Tests for ConcurrencySearch."""
+
+    @pytest.mark.asyncio
+    async def test_finds_knee(self):
+        """Test that ramp + bisection lands exactly on the capacity."""
+        adapter = CapacityAdapter(capacity=37)
+        search = ConcurrencySearch(LoadGenerator(adapter))
+
+        result = await search.search(make_config(), goodput_target_percent=100, precision=0.0)
+
+        assert result.optimum.value == 37
+        assert result.knee == 38
+        assert adapter.closed
+
+        values = [p.value for p in result.points]
+        assert values == sorted(values)
+        # 램프 1..64 (7개) + 이분 탐색 (5개)만 측정
+        assert len(values) == 12
+        assert all(p.passed == (p.value <= 37) for p in result.points)
+        assert result.total_requests == adapter.request_count
+
+    @pytest.mark.asyncio
+    async def test_precision_stops_early(self):
+        """Test that a coarse precision measures fewer levels."""
+        search = ConcurrencySearch(LoadGenerator(CapacityAdapter(capacity=37)))
+
+        result = await search.search(make_config(), goodput_target_percent=100, precision=0.25)
+
+        assert 32 <= result.optimum.value <= 37
+        assert result.knee - result.optimum.value <= 8
+        assert len(result.points) < 12
+
+    @pytest.mark.asyncio
+    async def test_stops_at_max_value(self):
+        """Test that the ramp stops at the upper bound when every level passes."""
+        search = ConcurrencySearch(LoadGenerator(CapacityAdapter(capacity=1000)))
+
+        result = await search.search(make_config(), max_value=20)
+
+        assert [p.value for p in result.points] == [1, 2, 4, 8, 16, 20]
+        assert result.optimum.value == 20
+        assert result.knee is None
+
+    @pytest.mark.asyncio
+    async def test_no_passing_level(self):
+        """Test that a failing first level yields no optimum."""
+        search = ConcurrencySearch(LoadGenerator(CapacityAdapter(capacity=0)))
+
+        result = await search.search(make_config())
+
+        assert len(result.points) == 1
+        assert result.optimum is None
+        assert result.knee == 1
+
+    @pytest.mark.asyncio
+    async def test_request_rate_dimension(self):
+        """Test searching the open-loop request rate."""
+        search = ConcurrencySearch(LoadGenerator(CapacityAdapter(capacity=1000)))
+        config = make_config(num_prompts=10, concurrency=[8], arrival_distribution="constant")
+
+        result = await search.search(
+            config, dimension="request_rate", start=100.0, max_value=400.0
+        )
+
+        assert [p.value for p in result.points] == [100.0, 200.0, 400.0]
+        assert all(p.result.request_rate_target == p.value for p in result.points)
+        assert result.optimum.value == 400.0
+
+    @pytest.mark.asyncio
+    async def test_requires_goodput_thresholds(self):
+        """Test that the search needs SLO thresholds to judge levels."""
+        search = ConcurrencySearch(LoadGenerator(CapacityAdapter(capacity=1)))
+
+        with pytest.raises(ValueError):
+            await search.search(make_config(goodput_thresholds=None))
+
+
+class FlakyAdapter(CapacityAdapter):
+    """Fast adapter failing every other request."""
+
+    async def send_request(self, request_id, prompt, max_tokens, stream) -> RequestResult:
+        result = await super().send_request(request_id, prompt, max_tokens, stream)
+        if request_id % 2:
+            return result.model_copy(update={"success": False, "error_type": "HTTP_500"})
+        return result
+
+
+class TestAdaptiveRecommend:
+    """Tests for InfraRecommender adaptive mode."""
+
+    @pytest.mark.asyncio
+    async def test_profile_from_search(self):
+        """Test that the recommendation uses the searched knee."""
+        recommender = InfraRecommender(LoadGenerator(CapacityAdapter(capacity=12)))
+        workload = WorkloadSpec(
+            peak_concurrency=100,
+            avg_input_tokens=8,
+            avg_output_tokens=10,
+            ttft_target_ms=100.0,
+            tpot_target_ms=50.0,
+        )
+
+        recommendation, benchmark_result = await recommender.recommend(
+            config=make_config(),
+            workload=workload,
+            num_requests_per_step=20,
+            adaptive=True,
+            max_concurrency=64,
+        )
+
+        concurrencies = [r.concurrency for r in benchmark_result.results]
+        assert concurrencies == sorted(concurrencies)
+        assert benchmark_result.config.concurrency == concurrencies
+        assert recommendation.current_infra.max_concurrency_at_slo >= 8
+
+    @pytest.mark.asyncio
+    async def test_failed_requests_count_as_misses(self):
+        """Test that the profile judges goodput like the search does."""
+        recommender = InfraRecommender(LoadGenerator(FlakyAdapter(capacity=100)))
+        workload = WorkloadSpec(
+            peak_concurrency=10,
+            avg_input_tokens=8,
+            avg_output_tokens=10,
+            ttft_target_ms=100.0,
+            tpot_target_ms=50.0,
+            goodput_target_percent=90.0,
+        )
+
+        recommendation, benchmark_result = await recommender.recommend(
+            config=make_config(),
+            workload=workload,
+            concurrency_steps=[1],
+            num_requests_per_step=20,
+        )
+
+        (result,) = benchmark_result.results
+        # 성공한 요청만 보면 모두 SLO를 만족하지만 절반이 실패
+        assert result.goodput.goodput_percent == 100.0
+        assert recommendation.current_infra.goodput_at_max_concurrency == pytest.approx(50.0)
+        assert recommendation.current_infra.saturation_goodput == pytest.approx(50.0)
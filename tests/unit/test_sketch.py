@@ -0,0 +1,184 @@
+"""Unit tests for latency sketches and the streaming metrics aggregator."""
+
+import numpy as np
+import pytest
+
+from shared.core.metrics import MetricsAggregator, MetricsCalculator
+from shared.core.models import GoodputThresholds, RequestResult
+from shared.core.sketch import LatencySketch
+
+
+def make_result(request_id: int, ttft: float, e2e: float, success: bool = True) -> RequestResult:
+    """Create a request result with a few ITL samples."""
+    return RequestResult(
+        request_id=request_id,
+        success=success,
+        ttft_ms=ttft,
+        tpot_ms=e2e / 20 if success else None,
+        e2e_latency_ms=e2e,
+        itl_ms=[ttft / 10, ttft / 8, ttft / 12] if success else None,
+        input_tokens=64,
+        output_tokens=20 if success else 0,
+        error_type=None if success else "timeout",
+    )
+
+
+class TestLatencySketch:
+    """Tests for LatencySketch class."""
+
+    def test_percentiles_within_relative_accuracy(self):
+        """Test sketch percentiles stay within 1% of exact percentiles."""
+        rng = np.random.default_rng(0)
+        values = rng.lognormal(mean=4.0, sigma=1.0, size=50_000)
+
+        sketch = LatencySketch.from_values(values)
+
+        for p in (50, 90, 95, 99, 99.9):
+            exact = np.percentile(values, p)
+            assert sketch.percentile(p) == pytest.approx(exact, rel=0.011)
+
+    def test_moments_are_exact(self):
+        """Test count, min, max, mean and std match NumPy."""
+        values = np.array([1.5, 20.0, 3.25, 400.0, 0.0])
+        sketch = LatencySketch()
+        for v in values:
+            sketch.add(float(v))
+
+        assert sketch.count == 5
+        assert sketch.min == 0.0
+        assert sketch.max == 400.0
+        assert sketch.mean == pytest.approx(np.mean(values))
+        assert sketch.std == pytest.approx(np.std(values))
+
+    def test_merge_matches_single_sketch(self):
+        """Test merging partial sketches equals sketching all values at once."""
+        rng = np.random.default_rng(1)
+        values = rng.exponential(scale=100.0, size=10_000)
+
+        merged = LatencySketch()
+        for chunk in np.array_split(values, 4):
+            merged.merge(LatencySketch.from_values(chunk))
+        whole = LatencySketch.from_values(values)
+
+        assert merged.count == whole.count
+        assert merged.mean == pytest.approx(whole.mean)
+        assert merged.std == pytest.approx(whole.std)
+        assert merged.quantiles([0.5, 0.99]) == pytest.approx(whole.quantiles([0.5, 0.99]))
+
+    def test_memory_is_bounded_by_range(self):
+        """Test bucket count depends on value range, not sample count."""
+        rng = np.random.default_rng(2)
+        sketch = LatencySketch.from_values(rng.uniform(1.0, 10_000.0, size=200_000))
+        assert sketch.bucket_count() < 500
+
+    def test_merge_rejects_different_accuracy(self):
+        """Test that sketches with different accuracy cannot be merged."""
+        with pytest.raises(ValueError):
+            LatencySketch(0.01).merge(LatencySketch.from_values(np.array([1.0]), 0.02))
+
+
+class TestMetricsAggregator:
+    """Tests for MetricsAggregator class."""
+
+    def test_exact_mode_matches_aggregate_results(self):
+        """Test exact aggregation reproduces the list-based statistics."""
+        results = [make_result(i, 50.0 + i, 500.0 + 3 * i) for i in range(30)]
+        results.append(make_result(30, 0, 0, success=False))
+
+        aggregator = MetricsAggregator(mode="exact")
+        for r in results:
+            aggregator.add(r)
+        level = aggregator.finalize(duration_seconds=2.0, concurrency=4)
+
+        ttft_values = [r.ttft_ms for r in results if r.success]
+        expected = MetricsCalculator.calculate_latency_stats(ttft_values)
+        assert level.ttft == expected
+        assert level.total_requests == 31
+        assert level.failed_requests == 1
+        assert level.total_output_tokens == 600
+        assert level.itl.mean == pytest.approx(
+            np.mean([v for r in results if r.success for v in r.itl_ms])
+        )
+        assert level.metrics_mode == "exact"
+
+    def test_sketch_mode_close_to_exact(self):
+        """Test sketch aggregation is within the sketch accuracy of exact."""
+        rng = np.random.default_rng(3)
+        ttfts = rng.gamma(2.0, 40.0, size=5_000)
+        results = [make_result(i, float(t), float(t) * 10) for i, t in enumerate(ttfts)]
+
+        exact = MetricsAggregator(mode="exact")
+        sketch = MetricsAggregator(mode="sketch")
+        for r in results:
+            exact.add(r)
+            sketch.add(r)
+
+        exact_level = exact.finalize(1.0, 8)
+        sketch_level = sketch.finalize(1.0, 8)
+
+        assert sketch_level.metrics_mode == "sketch"
+        assert sketch_level.ttft.mean == pytest.approx(exact_level.ttft.mean)
+        assert sketch_level.ttft.p99 == pytest.approx(exact_level.ttft.p99, rel=0.011)
+        assert sketch_level.itl.p50 == pytest.approx(exact_level.itl.p50, rel=0.011)
+
+    def test_auto_mode_switches_to_sketch(self):
+        """Test auto mode moves to sketches once the sample budget is exceeded."""
+        aggregator = MetricsAggregator(mode="auto", exact_limit=100)
+        for i in range(10):
+            aggregator.add(make_result(i, 10.0 + i, 100.0))
+        assert aggregator.is_exact
+
+        for i in range(10, 40):
+            aggregator.add(make_result(i, 10.0 + i, 100.0))
+        assert not aggregator.is_exact
+        assert aggregator.finalize(1.0, 1).ttft.max == 49.0
+
+    def test_merge_combines_counts_and_goodput(self):
+        """Test merging aggregators from separate workers."""
+        thresholds = GoodputThresholds(ttft_ms=60.0)
+        a = MetricsAggregator(mode="exact", goodput_thresholds=thresholds)
+        b = MetricsAggregator(mode="sketch", goodput_thresholds=thresholds)
+        for i in range(20):
+            a.add(make_result(i, 50.0 + i, 500.0))
+            b.add(make_result(100 + i, 50.0 + i, 500.0))
+
+        a.merge(b)
+        level = a.finalize(1.0, 2)
+
+        assert level.total_requests == 40
+        assert level.metrics_mode == "sketch"
+        # ttft 50..60 satisfies the threshold: 11 per worker
+        assert level.goodput.satisfied_requests == 22
+        assert level.goodput.total_requests == 40
+
+    def test_invalid_mode(self):
+        """Test that unknown modes are rejected."""
+        with pytest.raises(ValueError):
+            MetricsAggregator(mode="approximate")
+
+
+class TestSerialization:
+    """Tests for shipping sketches and aggregators between hosts."""
+
+    def test_sketch_round_trip(self):
+        """Test that a serialized sketch answers the same quantiles."""
+        rng = np.random.default_rng(4)
+        sketch = LatencySketch.from_values(rng.exponential(50.0, size=1000))
+
+        restored = LatencySketch.from_dict(sketch.to_dict())
+
+        assert restored.count == sketch.count
+        assert restored.std == pytest.approx(sketch.std)
+        assert restored.quantiles([0.5, 0.99]) == sketch.quantiles([0.5, 0.99])
+
+    @pytest.mark.parametrize("mode", ["exact", "sketch"])
+    def test_aggregator_round_trip(self, mode):
+        """Test that a serialized aggregator finalizes to the same result."""
+        thresholds = GoodputThresholds(ttft_ms=60.0)
+        aggregator = MetricsAggregator(mode=mode, goodput_thresholds=thresholds)
+        for i in range(20):
+            aggregator.add(make_result(i, 50.0 + i, 500.0, success=i % 7 != 0))
+
+        restored = MetricsAggregator.from_dict(aggregator.to_dict(), thresholds)
+
+        assert restored.finalize(1.0, 2) == aggregator.finalize(1.0, 2)
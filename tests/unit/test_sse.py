@@ -0,0 +1,147 @@
+"""Unit tests for the byte-level SSE parser."""
+
+import json
+
+import httpx
+import pytest
+
+from shared.adapters.openai_compat import OpenAICompatibleAdapter
+from shared.adapters.sse import DONE, SSEParser, scan_chunk
+from shared.core.tokenizer import TokenCounter
+
+
+def chunk(content=None, finish_reason=None, **extra) -> bytes:
+    """Build a chat-completion chunk payload."""
+    delta = {} if content is None else {"content": content}
+    data = {
+        "id": "chatcmpl-1",
+        "object": "chat.completion.chunk",
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+        **extra,
+    }
+    return json.dumps(data).encode()
+
+
+class TestSSEParser:
+    """Tests for splitting raw bytes into data payloads."""
+
+    def test_split_across_reads(self):
+        """Test that lines split across network reads are reassembled."""
+        stream = b"data: " + chunk("Hi") + b"\n\ndata: [DONE]\n\n"
+        parser = SSEParser()
+
+        payloads = []
+        for i in range(0, len(stream), 7):
+            payloads.extend(parser.feed(stream[i : i + 7]))
+
+        assert payloads == [chunk("Hi"), DONE]
+
+    def test_ignores_non_data_lines_and_crlf(self):
+        """Test that comments, event fields and CRLF endings are handled."""
+        parser = SSEParser()
+        payloads = parser.feed(b": keep-alive\r\nevent: message\r\ndata:{}\r\n\r\n")
+        assert payloads == [b"{}"]
+
+    def test_flush_returns_unterminated_line(self):
+        """Test that a final line without newline is not lost."""
+        parser = SSEParser()
+        assert parser.feed(b"data: [DONE]") == []
+        assert parser.flush() == [DONE]
+        assert parser.flush() == []
+
+
+class TestScanChunk:
+    """Tests for classifying chunk payloads."""
+
+    @pytest.mark.parametrize(
+        "payload, expected",
+        [
+            (chunk("Hello"), True),
+            (chunk(" "), True),
+            (chunk(""), False),
+            (chunk(None), False),
+            (b'{"choices":[{"delta":{"content":null}}]}', False),
+            (b'{"choices":[{"delta":{"role":"assistant","content":""}}]}', False),
+            (b'{"choices":[{"delta":{"reasoning_content":"hmm"}}]}', False),
+            # Quoted key inside content text is escaped and must not match
+            (chunk('say \\"content\\":\\"x'), True),
+            (chunk('"content":""'), True),
+        ],
+    )
+    def test_content_detection_matches_json(self, payload, expected):
+        """Test that the byte scan agrees with a full JSON decode."""
+        has_content, data = scan_chunk(payload)
+        assert has_content is expected
+        assert data is None
+
+    def test_finish_reason_is_decoded(self):
+        """Test that chunks with a finish reason are fully decoded."""
+        has_content, data = scan_chunk(chunk("!", finish_reason="stop"))
+        assert has_content is True
+        assert data["choices"][0]["finish_reason"] == "stop"
+
+    def test_usage_is_decoded(self):
+        """Test that usage chunks are fully decoded."""
+        payload = json.dumps(
+            {"choices": [], "usage": {"prompt_tokens": 3, "completion_tokens": 5}}
+        ).encode()
+        has_content, data = scan_chunk(payload)
+        assert has_content is False
+        assert data["usage"]["completion_tokens"] == 5
+
+    def test_error_is_decoded(self):
+        """Test that mid-stream errors are fully decoded."""
+        has_content, data = scan_chunk(b'{"error": {"message": "overloaded"}}')
+        assert has_content is False
+        assert data["error"]["message"] == "overloaded"
+
+    def test_malformed_json(self):
+        """Test that malformed chunks needing a decode are skipped."""
+        assert scan_chunk(b'{"finish_reason": "stop"') == (False, None)
+
+
+class TestStreamingAdapter:
+    """Tests for the adapter's streaming path over the byte parser."""
+
+    @pytest.fixture(autouse=True)
+    def offline_token_count(self, monkeypatch):
+        """Count one token per character without downloading tokenizer files."""
+        monkeypatch.setattr(
+            TokenCounter, "count", classmethod(lambda cls, text, model="": len(text))
+        )
+
+    @staticmethod
+    def make_adapter(body: bytes) -> OpenAICompatibleAdapter:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=body)
+
+        adapter = OpenAICompatibleAdapter("http://llm", "test-model")
+        adapter._client = httpx.AsyncClient(
+            base_url="http://llm", transport=httpx.MockTransport(handler)
+        )
+        return adapter
+
+    @pytest.mark.asyncio
+    async def test_counts_content_chunks(self):
+        """Test that only content-bearing chunks count as tokens."""
+        events = [chunk(None), chunk("a"), chunk("b"), chunk(""), chunk("c", "stop"), DONE]
+        body = b"".join(b"data: " + e + b"\n\n" for e in events)
+        adapter = self.make_adapter(body)
+
+        result = await adapter.send_request(0, "hello", 8, stream=True)
+
+        assert result.success
+        assert result.output_tokens == 3
+        await adapter.aclose()
+
+    @pytest.mark.asyncio
+    async def test_stream_error_fails_request(self):
+        """Test that an error event marks the request as failed."""
+        body = b'data: ' + chunk("a") + b'\n\ndata: {"error": {"message": "boom"}}\n\n'
+        adapter = self.make_adapter(body)
+
+        result = await adapter.send_request(0, "hello", 8, stream=True)
+
+        assert not result.success
+        assert result.error_type == "StreamError"
+        await adapter.aclose()
@@ -0,0 +1,355 @@
+"""Unit tests for confidence intervals and convergence-based early stopping."""
+
+import asyncio
+import random
+
+import numpy as np
+import pytest
+
+from shared.core.load_generator import LoadGenerator
+from shared.core.metrics import MetricsAggregator, MetricsCalculator
+from shared.core.models import BenchmarkConfig, ConfidenceInterval, RequestResult
+from shared.core.sketch import LatencySketch
+from shared.core.stats import (
+    ConvergenceMonitor,
+    compare_intervals,
+    mean_ci,
+    quantile_ci,
+    quantile_cis,
+    quantile_rank_bounds,
+    throughput_ci,
+    z_score,
+)
+
+
+def make_result(request_id: int, ttft: float, output_tokens: int = 10) -> RequestResult:
+    return RequestResult(
+        request_id=request_id,
+        ttft_ms=ttft,
+        tpot_ms=5.0,
+        e2e_latency_ms=ttft + 50.0,
+        input_tokens=8,
+        output_tokens=output_tokens,
+        success=True,
+    )
+
+
+class SleepyAdapter:
+    """Adapter with a small real delay and uniform TTFT in [100, 250] ms."""
+
+    def __init__(self, seed: int = 0):
+        self.rng = random.Random(seed)
+        self.request_count = 0
+
+    async def send_request(self, request_id, prompt, max_tokens, stream) -> RequestResult:
+        self.request_count += 1
+        await asyncio.sleep(0.001)
+        return make_result(request_id, self.rng.uniform(100, 250))
+
+    async def health_check(self) -> bool:
+        return True
+
+    async def warmup(self, num_requests, input_len, output_len) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        pass
+
+
+class TestQuantileCI:
+    """Tests for order-statistic quantile intervals."""
+
+    def test_rank_bounds(self):
+        """Test that the ranks bracket n*q and need enough samples."""
+        lower, upper = quantile_rank_bounds(1000, 0.5, 0.95)
+        assert lower < 500 < upper
+        assert upper - lower == pytest.approx(2 * 1.96 * np.sqrt(250), abs=3)
+
+        assert quantile_rank_bounds(3, 0.5, 0.95) is None
+        # p99 needs roughly 400 samples at 95%
+        assert quantile_rank_bounds(300, 0.99, 0.95) is None
+        assert quantile_rank_bounds(1000, 0.99, 0.95) is not None
+
+    def test_interval_brackets_estimate(self):
+        """Test that the interval contains the estimate and shrinks with n."""
+        rng = np.random.default_rng(1)
+        widths = []
+        for n in (200, 5000):
+            aggregator = MetricsAggregator(mode="exact")
+            for i, ttft in enumerate(rng.uniform(100, 200, n)):
+                aggregator.add(make_result(i, float(ttft)))
+
+            ci = quantile_ci(aggregator, "ttft", 0.5, 0.95)
+            assert ci.lower <= ci.estimate <= ci.upper
+            assert 140 < ci.lower and ci.upper < 160
+            widths.append(ci.relative_width)
+
+        assert widths[1] < widths[0] / 3
+
+    def test_sketch_mode(self):
+        """Test that sketch-mode aggregators give comparable intervals."""
+        rng = np.random.default_rng(2)
+        values = rng.uniform(100, 200, 2000)
+        exact = MetricsAggregator(mode="exact")
+        sketch = MetricsAggregator(mode="sketch")
+        for i, ttft in enumerate(values):
+            exact.add(make_result(i, float(ttft)))
+            sketch.add(make_result(i, float(ttft)))
+
+        exact_ci = quantile_ci(exact, "ttft", 0.99, 0.95)
+        sketch_ci = quantile_ci(sketch, "ttft", 0.99, 0.95)
+        assert sketch_ci.lower == pytest.approx(exact_ci.lower, rel=0.02)
+        assert sketch_ci.upper == pytest.approx(exact_ci.upper, rel=0.02)
+
+    @pytest.mark.parametrize("mode", ["exact", "sketch"])
+    def test_several_quantiles_match_single(self, mode):
+        """Test that quantile_cis matches one quantile_ci per quantile."""
+        aggregator = MetricsAggregator(mode=mode)
+        for i, ttft in enumerate(np.random.default_rng(5).uniform(100, 200, 1000)):
+            aggregator.add(make_result(i, float(ttft)))
+
+        p50, p99 = quantile_cis(aggregator, "ttft", [0.5, 0.99], 0.95)
+
+        assert p50 == quantile_ci(aggregator, "ttft", 0.5, 0.95)
+        assert p99 == quantile_ci(aggregator, "ttft", 0.99, 0.95)
+        assert aggregator.quantiles("ttft", [0.5, 0.99]) == pytest.approx(
+            [aggregator.percentile("ttft", 50), aggregator.percentile("ttft", 99)]
+        )
+
+    def test_too_few_samples(self):
+        """Test that too few samples yield an open interval."""
+        aggregator = MetricsAggregator(mode="exact")
+        aggregator.add(make_result(0, 100.0))
+
+        ci = quantile_ci(aggregator, "ttft", 0.99, 0.95)
+
+        assert ci.estimate == 100.0
+        assert ci.lower is None and ci.relative_width is None
+
+
+class TestLatencyCI:
+    """Tests for confidence intervals attached to LatencyStats."""
+
+    def test_exact_stats_carry_ci(self):
+        """Test that estimates match the point statistics and are bracketed."""
+        values = np.random.default_rng(3).lognormal(5, 0.5, 2000)
+
+        stats = MetricsCalculator.calculate_latency_stats(values)
+
+        assert stats.ci.confidence == 0.95
+        assert stats.ci.p50.estimate == stats.p50 == pytest.approx(np.percentile(values, 50))
+        for ci in (stats.ci.mean, stats.ci.p50, stats.ci.p95, stats.ci.p99):
+            assert ci.lower <= ci.estimate <= ci.upper
+
+    def test_coverage(self):
+        """Test that ~95% of intervals contain the true median and mean."""
+        rng = np.random.default_rng(4)
+        true_median = np.exp(5.0)
+        true_mean = np.exp(5.0 + 0.5**2 / 2)
+        trials = 400
+        median_hits = mean_hits = 0
+        for _ in range(trials):
+            ci = MetricsCalculator.calculate_latency_stats(rng.lognormal(5, 0.5, 300)).ci
+            median_hits += ci.p50.lower <= true_median <= ci.p50.upper
+            mean_hits += ci.mean.lower <= true_mean <= ci.mean.upper
+
+        assert 0.90 <= median_hits / trials <= 0.99
+        assert 0.90 <= mean_hits / trials <= 0.99
+
+    def test_sketch_stats_carry_ci(self):
+        """Test that sketch statistics carry comparable intervals."""
+        values = np.random.default_rng(5).uniform(100, 200, 5000)
+
+        exact = MetricsCalculator.calculate_latency_stats(values)
+        sketch = MetricsCalculator.calculate_sketch_stats(LatencySketch.from_values(values))
+
+        assert sketch.ci.p99.lower == pytest.approx(exact.ci.p99.lower, rel=0.02)
+        assert sketch.ci.mean.upper == pytest.approx(exact.ci.mean.upper)
+
+    def test_few_samples(self):
+        """Test that tail percentiles stay open with few samples."""
+        stats = MetricsCalculator.calculate_latency_stats([100.0, 120.0, 140.0])
+
+        assert stats.ci.p99.lower is None
+        assert stats.ci.mean.lower is not None
+
+
+class TestThroughputCI:
+    """Tests for the throughput interval."""
+
+    def test_constant_tokens(self):
+        """Test that N equal-size requests give a ±z/sqrt(N) interval."""
+        ci = throughput_ci(total_tokens=100 * 400, tokens_sq=400 * 100**2, duration_seconds=10)
+
+        assert ci.estimate == 4000
+        assert ci.upper - ci.estimate == pytest.approx(4000 * z_score(0.95) / 20)
+
+    def test_no_tokens(self):
+        assert throughput_ci(0, 0, 10) is None
+
+    def test_in_level_result(self):
+        """Test that level results record the throughput interval in both modes."""
+        for mode in ("exact", "sketch"):
+            aggregator = MetricsAggregator(mode=mode)
+            for i in range(100):
+                aggregator.add(make_result(i, 100.0, output_tokens=10 + i % 5))
+
+            level = aggregator.finalize(duration_seconds=2.0, concurrency=4)
+
+            assert level.throughput_ci.estimate == level.throughput_tokens_per_sec
+            assert level.throughput_ci.lower < level.throughput_ci.upper
+
+    def test_serialization_keeps_moments(self):
+        aggregator = MetricsAggregator(mode="sketch")
+        aggregator.add(make_result(0, 100.0, output_tokens=7))
+
+        restored = MetricsAggregator.from_dict(aggregator.to_dict())
+
+        assert restored.output_tokens_sq == 49
+
+
+class TestCompareIntervals:
+    """Tests for the two-run significance test."""
+
+    def interval(self, estimate: float, half: float) -> ConfidenceInterval:
+        return ConfidenceInterval(estimate=estimate, lower=estimate - half, upper=estimate + half)
+
+    def test_overlapping_not_significant(self):
+        test = compare_intervals("throughput", self.interval(1000, 50), self.interval(1030, 50))
+
+        assert test.diff_percent == pytest.approx(3.0)
+        assert not test.significant
+        assert test.p_value > 0.05
+
+    def test_tight_intervals_significant(self):
+        test = compare_intervals("throughput", self.interval(1000, 5), self.interval(1030, 5))
+
+        assert test.significant
+        assert test.p_value < 0.001
+
+    def test_open_interval(self):
+        test = compare_intervals(
+            "ttft_p99", ConfidenceInterval(estimate=100.0), self.interval(200, 5)
+        )
+
+        assert test.p_value is None
+        assert not test.significant
+
+
+class TestMeanCI:
+    """Tests for batch-mean intervals."""
+
+    def test_needs_minimum_batches(self):
+        assert mean_ci([1.0, 2.0, 3.0], 0.95).relative_width is None
+
+    def test_constant_values(self):
+        ci = mean_ci([5.0] * 10, 0.95)
+        assert ci.estimate == 5.0
+        assert ci.relative_width == 0.0
+
+    def test_width(self):
+        values = [9.0, 11.0] * 50
+        ci = mean_ci(values, 0.95)
+        half = z_score(0.95) * np.std(values, ddof=1) / np.sqrt(100)
+        assert ci.upper - ci.estimate == pytest.approx(half)
+
+
+class TestConvergenceMonitor:
+    """Tests for ConvergenceMonitor."""
+
+    def test_batches_close_every_batch_size(self):
+        monitor = ConvergenceMonitor(target_width=0.1, batch_size=4)
+        monitor.start(0.0)
+
+        closed = [monitor.add(make_result(i, 100.0), now=(i + 1) * 0.1) for i in range(8)]
+
+        assert closed == [False, False, False, True] * 2
+        # 4 completions x 10 tokens per 0.4 s
+        assert monitor._batch_rates == pytest.approx([100.0, 100.0])
+
+    def test_min_requests(self):
+        monitor = ConvergenceMonitor(target_width=1.0, min_requests=50, batch_size=1)
+        aggregator = MetricsAggregator(mode="exact")
+        monitor.start(0.0)
+        for i in range(10):
+            result = make_result(i, 100.0)
+            aggregator.add(result)
+            monitor.add(result, now=i + 1.0)
+
+        assert not monitor.converged(aggregator)
+
+    def test_check_reads_samples_once(self, monkeypatch):
+        """Test that a convergence check costs one quantile lookup."""
+        monitor = ConvergenceMonitor(target_width=0.1, min_requests=10)
+        aggregator = MetricsAggregator(mode="exact")
+        for i in range(1000):
+            aggregator.add(make_result(i, 100.0 + i % 7))
+        lookups = []
+        quantiles = aggregator.quantiles
+
+        def counting(metric, qs):
+            lookups.append(len(qs))
+            return quantiles(metric, qs)
+
+        monkeypatch.setattr(aggregator, "quantiles", counting)
+        monkeypatch.setattr(aggregator, "percentile", None)
+
+        monitor.converged(aggregator)
+
+        # p50, p99와 각각의 순위 경계 두 개
+        assert lookups == [6]
+
+    def test_disabled_by_default(self):
+        config = BenchmarkConfig(server_url="http://localhost:8000", model="m")
+        assert ConvergenceMonitor.for_config(config) is None
+
+
+class TestEarlyStop:
+    """Tests for convergence stopping in the load generator."""
+
+    def make_config(self, **overrides) -> BenchmarkConfig:
+        values = {
+            "server_url": "http://localhost:8000",
+            "model": "test-model",
+            "input_len": 8,
+            "output_len": 10,
+            "num_prompts": 3000,
+            "concurrency": [8],
+            "warmup": 0,
+        }
+        values.update(overrides)
+        return BenchmarkConfig(**values)
+
+    @pytest.mark.asyncio
+    async def test_stops_when_converged(self):
+        """Test that a stable level stops well before num_prompts."""
+        adapter = SleepyAdapter()
+        config = self.make_config(convergence_width=0.3, convergence_min_requests=100)
+
+        result = await LoadGenerator(adapter).run(config)
+        level = result.results[0]
+
+        assert level.convergence is not None
+        assert level.convergence.converged
+        assert level.total_requests < 3000
+        assert adapter.request_count == level.total_requests
+        assert level.convergence.requests == level.total_requests
+        for ci in (level.convergence.ttft_p50, level.convergence.ttft_p99):
+            assert ci.relative_width <= 0.3
+
+    @pytest.mark.asyncio
+    async def test_runs_to_max_without_convergence(self):
+        """Test that an unreachable width sends every request and says so."""
+        adapter = SleepyAdapter()
+        config = self.make_config(num_prompts=200, convergence_width=0.001)
+
+        result = await LoadGenerator(adapter).run(config)
+        level = result.results[0]
+
+        assert level.total_requests == 200
+        assert not level.convergence.converged
+
+    @pytest.mark.asyncio
+    async def test_no_convergence_field_when_disabled(self):
+        result = await LoadGenerator(SleepyAdapter()).run(self.make_config(num_prompts=20))
+        assert result.results[0].convergence is None
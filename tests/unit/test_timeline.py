@@ -0,0 +1,218 @@
+"""Unit tests for the per-interval metric timeline."""
+
+import asyncio
+
+import pytest
+
+from shared.core.load_generator import LoadGenerator
+from shared.core.metrics import MetricsAggregator
+from shared.core.models import BenchmarkConfig, RequestResult
+from shared.core.timeline import TimelineRecorder
+
+
+def make_result(
+    request_id: int,
+    e2e_ms: float = 100.0,
+    ttft_ms: float = 20.0,
+    output_tokens: int = 10,
+    success: bool = True,
+) -> RequestResult:
+    return RequestResult(
+        request_id=request_id,
+        ttft_ms=ttft_ms,
+        e2e_latency_ms=e2e_ms,
+        input_tokens=8,
+        output_tokens=output_tokens,
+        success=success,
+        error=None if success else "boom",
+    )
+
+
+def make_recorder(**kwargs) -> TimelineRecorder:
+    recorder = TimelineRecorder(**kwargs)
+    recorder.start(0.0)
+    return recorder
+
+
+class TestTimelineRecorder:
+    """Tests for TimelineRecorder bucketing."""
+
+    def test_counts_per_bucket(self):
+        """Test requests, errors, throughput and quantiles land in their bucket."""
+        recorder = make_recorder(interval_seconds=1.0)
+        recorder.add(make_result(0, ttft_ms=10.0), now=0.2)
+        recorder.add(make_result(1, ttft_ms=30.0), now=0.8)
+        recorder.add(make_result(2, success=False), now=2.5)
+
+        timeline = recorder.finalize()
+
+        assert timeline.requests == [2, 0, 1]
+        assert timeline.errors == [0, 0, 1]
+        assert timeline.throughput_tokens_per_sec == [20.0, 0.0, 0.0]
+        assert timeline.ttft_p50[0] == pytest.approx(10.0, rel=0.02)
+        assert timeline.ttft_p99[0] >= timeline.ttft_p50[0]
+        assert timeline.e2e_p50[0] == pytest.approx(100.0, rel=0.02)
+        assert timeline.ttft_p50[1] is None and timeline.e2e_p99[2] is None
+
+    def test_in_flight_is_time_averaged(self):
+        """Test that a request counts for the fraction of each bucket it spans."""
+        recorder = make_recorder(interval_seconds=1.0)
+        # 0.5초 ~ 3.0초 동안 진행
+        recorder.add(make_result(0, e2e_ms=2500.0), now=3.0)
+        recorder.add(make_result(1, e2e_ms=500.0), now=1.5)
+
+        timeline = recorder.finalize(duration_seconds=4.0)
+
+        assert timeline.in_flight == pytest.approx([0.5, 1.5, 1.0, 0.0])
+
+    def test_partial_last_bucket(self):
+        """Test that the last bucket is normalized by its actual width."""
+        recorder = make_recorder(interval_seconds=1.0)
+        recorder.add(make_result(0, e2e_ms=500.0, output_tokens=50), now=1.5)
+
+        timeline = recorder.finalize(duration_seconds=1.5)
+
+        assert timeline.throughput_tokens_per_sec == [0.0, 100.0]
+        assert timeline.in_flight == pytest.approx([0.0, 1.0])
+
+    def test_idle_tail_is_kept(self):
+        recorder = make_recorder(interval_seconds=1.0)
+        recorder.add(make_result(0), now=0.5)
+
+        assert len(recorder.finalize(duration_seconds=3.0).requests) == 3
+
+    def test_coarsens_when_full(self):
+        """Test that overflowing merges bucket pairs and doubles the interval."""
+        recorder = make_recorder(interval_seconds=1.0, max_buckets=4)
+        for second in range(4):
+            recorder.add(make_result(second, e2e_ms=1000.0), now=second + 1.0 - 1e-9)
+        recorder.add(make_result(4), now=5.5)
+
+        timeline = recorder.finalize()
+
+        assert timeline.interval_seconds == 2.0
+        assert timeline.requests == [2, 2, 1]
+        assert timeline.in_flight[:2] == pytest.approx([1.0, 1.0])
+        assert timeline.ttft_p50[0] == pytest.approx(20.0, rel=0.02)
+
+    def test_fixed_size(self):
+        """Test that a long run never grows past max_buckets."""
+        recorder = make_recorder(interval_seconds=1.0, max_buckets=8)
+        for i in range(1000):
+            recorder.add(make_result(i), now=i * 0.5)
+
+        timeline = recorder.finalize()
+
+        assert len(timeline.requests) <= 8
+        assert sum(timeline.requests) == 1000
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            TimelineRecorder(interval_seconds=0)
+        with pytest.raises(ValueError):
+            TimelineRecorder(max_buckets=5)
+
+
+class TestTimelineMerge:
+    """Tests for merging and serializing timelines."""
+
+    def test_merge_sums_buckets(self):
+        left = make_recorder(interval_seconds=1.0)
+        right = make_recorder(interval_seconds=1.0)
+        left.add(make_result(0, e2e_ms=500.0), now=0.5)
+        right.add(make_result(1, e2e_ms=500.0), now=0.7)
+        right.add(make_result(2, e2e_ms=2000.0), now=2.5)
+
+        left.merge(right)
+        timeline = left.finalize()
+
+        assert timeline.requests == [2, 0, 1]
+        assert timeline.in_flight == pytest.approx([1.5, 1.0, 0.5])
+        # 병합 대상은 변경되지 않음
+        assert right.finalize().requests == [1, 0, 1]
+
+    def test_merge_coarsens_finer_timeline(self):
+        coarse = make_recorder(interval_seconds=1.0, max_buckets=2)
+        coarse.add(make_result(0), now=3.0)
+        fine = make_recorder(interval_seconds=1.0, max_buckets=2)
+        fine.add(make_result(1), now=0.5)
+
+        fine.merge(coarse)
+
+        assert fine.interval_seconds == 2.0
+        assert fine.finalize().requests == [1, 1]
+
+    def test_merge_rejects_unrelated_intervals(self):
+        with pytest.raises(ValueError):
+            TimelineRecorder(interval_seconds=1.0).merge(TimelineRecorder(interval_seconds=1.5))
+
+    def test_round_trip(self):
+        recorder = make_recorder(interval_seconds=0.5)
+        recorder.add(make_result(0, e2e_ms=1200.0), now=1.3)
+        recorder.add(make_result(1, success=False), now=0.2)
+
+        restored = TimelineRecorder.from_dict(recorder.to_dict())
+
+        assert restored.finalize() == recorder.finalize()
+
+
+class SteadyAdapter:
+    """Adapter with a small real delay."""
+
+    async def send_request(self, request_id, prompt, max_tokens, stream) -> RequestResult:
+        await asyncio.sleep(0.002)
+        return make_result(request_id, e2e_ms=2.0)
+
+    async def health_check(self) -> bool:
+        return True
+
+    async def warmup(self, num_requests, input_len, output_len) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        pass
+
+
+class TestAggregatorTimeline:
+    """Tests for the timeline recorded by MetricsAggregator."""
+
+    def test_disabled_by_default(self):
+        aggregator = MetricsAggregator(mode="exact")
+        aggregator.add(make_result(0))
+
+        assert aggregator.timeline is None
+        assert aggregator.finalize(duration_seconds=1.0, concurrency=1).timeline is None
+
+    def test_survives_serialization_and_merge(self):
+        """Test that worker aggregators ship and merge their timelines."""
+        for mode in ("exact", "sketch"):
+            merged = MetricsAggregator(mode=mode, timeline_interval=1.0)
+            for worker in range(3):
+                aggregator = MetricsAggregator(mode=mode, timeline_interval=1.0)
+                aggregator.add(make_result(worker))
+                merged.merge(MetricsAggregator.from_dict(aggregator.to_dict()))
+
+            level = merged.finalize(duration_seconds=1.0, concurrency=3)
+
+            assert sum(level.timeline.requests) == 3
+
+    @pytest.mark.asyncio
+    async def test_level_result_has_timeline(self):
+        """Test that a benchmark level records a timeline covering every request."""
+        config = BenchmarkConfig(
+            server_url="http://localhost:8000",
+            model="test-model",
+            input_len=8,
+            output_len=10,
+            num_prompts=50,
+            concurrency=[4],
+            warmup=0,
+            timeline_interval=0.01,
+        )
+
+        result = await LoadGenerator(SteadyAdapter()).run(config)
+        level = result.results[0]
+
+        assert level.timeline.interval_seconds == 0.01
+        assert sum(level.timeline.requests) == level.total_requests == 50
+        assert max(level.timeline.in_flight) <= 4 + 1e-6
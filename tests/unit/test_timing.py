@@ -0,0 +1,132 @@
+"""Unit tests for client-side timing and event-loop lag tracking."""
+
+import asyncio
+import time
+
+import pytest
+
+from shared.core.load_generator import LoadGenerator
+from shared.core.metrics import MetricsAggregator
+from shared.core.models import BenchmarkConfig, RequestResult
+from shared.core.timing import LoopLagMonitor, elapsed_ms, now_ns
+
+
+def make_result(request_id: int) -> RequestResult:
+    return RequestResult(
+        request_id=request_id,
+        ttft_ms=5.0,
+        e2e_latency_ms=10.0,
+        input_tokens=8,
+        output_tokens=10,
+        success=True,
+    )
+
+
+class TestLoopLagMonitor:
+    """Tests for LoopLagMonitor."""
+
+    def test_elapsed_ms(self):
+        assert elapsed_ms(1_000_000, 3_500_000) == 2.5
+
+    def test_threshold(self):
+        samples = []
+        monitor = LoopLagMonitor(threshold_ms=10.0, sink=samples.append)
+
+        monitor.record(5_000_000, at_ns=100)
+        assert not monitor.saturated_since(0)
+
+        monitor.record(20_000_000, at_ns=200)
+        assert monitor.saturated_since(150)
+        assert not monitor.saturated_since(201)
+        assert samples == [5.0, 20.0]
+        assert monitor.max_lag_ms == 20.0
+
+    @pytest.mark.asyncio
+    async def test_detects_blocked_loop(self):
+        """Test that a blocking call shows up as loop lag."""
+        monitor = LoopLagMonitor(threshold_ms=10.0, interval_seconds=0.005)
+        monitor.start()
+        await asyncio.sleep(0.02)
+        started = now_ns()
+
+        time.sleep(0.05)  # 이벤트 루프 차단
+        await asyncio.sleep(0.02)
+        await monitor.stop()
+
+        assert monitor.max_lag_ms > 30
+        assert monitor.saturated_since(started)
+
+
+class BlockingAdapter:
+    """Adapter that blocks the event loop on every ``block_every``-th request."""
+
+    def __init__(self, block_every: int = 0):
+        self.block_every = block_every
+        self.count = 0
+
+    async def send_request(self, request_id, prompt, max_tokens, stream) -> RequestResult:
+        self.count += 1
+        await asyncio.sleep(0.002)
+        if self.block_every and self.count % self.block_every == 0:
+            time.sleep(0.03)
+        await asyncio.sleep(0.002)
+        return make_result(request_id)
+
+    async def health_check(self) -> bool:
+        return True
+
+    async def warmup(self, num_requests, input_len, output_len) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        pass
+
+
+def make_config() -> BenchmarkConfig:
+    return BenchmarkConfig(
+        server_url="http://localhost:8000",
+        model="test-model",
+        input_len=8,
+        output_len=10,
+        num_prompts=40,
+        concurrency=[4],
+        warmup=0,
+    )
+
+
+class TestClientSaturation:
+    """Tests for client_saturated in level results."""
+
+    @pytest.mark.asyncio
+    async def test_blocked_client_is_flagged(self):
+        result = await LoadGenerator(BlockingAdapter(block_every=10)).run(make_config())
+        level = result.results[0]
+
+        assert level.client_saturated
+        assert 0 < level.saturated_requests <= level.total_requests
+        assert level.loop_lag.max > 10
+
+    @pytest.mark.asyncio
+    async def test_idle_client_is_not_flagged(self):
+        result = await LoadGenerator(BlockingAdapter()).run(make_config())
+        level = result.results[0]
+
+        assert not level.client_saturated
+        assert level.saturated_requests == 0
+
+    def test_merge_and_serialization(self):
+        """Test that worker aggregators carry saturation counts and lag samples."""
+        merged = MetricsAggregator(mode="sketch")
+        for _ in range(2):
+            aggregator = MetricsAggregator(mode="exact")
+            result = make_result(0)
+            result.client_saturated = True
+            aggregator.add(result)
+            aggregator.add_loop_lag(25.0)
+            merged.merge(MetricsAggregator.from_dict(aggregator.to_dict()))
+
+        level = merged.finalize(duration_seconds=1.0, concurrency=2)
+
+        assert level.saturated_requests == 2
+        assert level.client_saturated
+        assert level.loop_lag.max == 25.0
@@ -239,3 +239,78 @@ def fibonacci(n):
             count = TokenCounter.count(text)
             tokens = TokenCounter.encode(text)
             assert count == len(tokens)
+
+    class TestCountCache:
+        """Tests for the memoized prompt token counts."""
+
+        class WordEncoder:
+            """Whitespace encoder counting how often it encodes."""
+
+            name = "words"
+
+            def __init__(self):
+                self.calls = 0
+
+            def encode(self, text):
+                self.calls += 1
+                return text.split()
+
+            def encode_batch(self, texts):
+                return [self.encode(text) for text in texts]
+
+        @pytest.fixture
+        def encoder(self, monkeypatch):
+            encoder = self.WordEncoder()
+            monkeypatch.setattr(
+                TokenCounter, "get_encoder", classmethod(lambda cls, model: encoder)
+            )
+            monkeypatch.setattr(TokenCounter, "cache_size", 2)
+            TokenCounter.cache_clear()
+            yield encoder
+            TokenCounter.cache_clear()
+
+        def test_repeated_prompt_is_encoded_once(self, encoder):
+            """Test that identical prompts hit the cache."""
+            prompt = "one two three"
+            assert [TokenCounter.count(prompt) for _ in range(5)] == [3] * 5
+            assert encoder.calls == 1
+
+            info = TokenCounter.cache_info()
+            assert info["hits"] == 4
+            assert info["misses"] == 1
+            assert info["size"] == 1
+
+        def test_least_recently_used_is_evicted(self, encoder):
+            """Test that the cache stays bounded."""
+            TokenCounter.count("a")
+            TokenCounter.count("b b")
+            TokenCounter.count("a")  # refresh "a"
+            TokenCounter.count("c c c")  # evicts "b b"
+
+            assert TokenCounter.cache_info()["size"] == 2
+            calls = encoder.calls
+            TokenCounter.count("a")
+            assert encoder.calls == calls
+            TokenCounter.count("b b")
+            assert encoder.calls == calls + 1
+
+        def test_count_many_prewarms_cache(self, encoder):
+            """Test that pre-tokenized prompts never encode again."""
+            prompts = ["x", "x y"]
+            assert TokenCounter.count_many(prompts) == [1, 2]
+
+            calls = encoder.calls
+            assert [TokenCounter.count(p) for p in prompts] == [1, 2]
+            assert encoder.calls == calls
+
+        def test_count_many_keeps_cache_bounded(self, encoder):
+            """Test that a dataset larger than the cache does not raise its limit."""
+            prompts = ["x", "x y", "x y z", "x y z w"]
+            assert TokenCounter.count_many(prompts) == [1, 2, 3, 4]
+
+            info = TokenCounter.cache_info()
+            assert info["maxsize"] == 2
+            assert info["size"] == 2
+            calls = encoder.calls
+            assert TokenCounter.count("x y z w") == 4
+            assert encoder.calls == calls
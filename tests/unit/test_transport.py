@@ -0,0 +1,103 @@
+"""Unit tests for adapter HTTP transports."""
+
+import socket
+
+import httpx
+import pytest
+
+from shared.adapters import AdapterFactory
+from shared.adapters.transport import HTTP2LaneTransport, build_transport, socket_options
+from shared.core.models import BenchmarkConfig, TransportConfig
+from shared.core.workers import adapter_builder_from_config
+
+
+class TestSocketOptions:
+    """Tests for socket_options."""
+
+    def test_default_sets_nodelay(self):
+        assert socket_options(TransportConfig()) == [
+            (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        ]
+
+    def test_nagle_and_keepalive(self):
+        options = socket_options(TransportConfig(tcp_nodelay=False, tcp_keepalive_seconds=15))
+
+        assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 0) in options
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+
+    def test_unix_socket_has_no_tcp_options(self):
+        assert socket_options(TransportConfig(uds="/tmp/server.sock")) == []
+
+
+class TestBuildTransport:
+    """Tests for build_transport."""
+
+    def test_http1(self):
+        transport = build_transport(TransportConfig(), 64, "http://localhost:8000")
+
+        assert isinstance(transport, httpx.AsyncHTTPTransport)
+
+    def test_http2_lanes(self):
+        """Test that HTTP/2 opens one connection per http2_max_streams requests."""
+        config = TransportConfig(http_version="2", http2_max_streams=8)
+        transport = build_transport(config, 20, "http://localhost:8000")
+
+        assert isinstance(transport, HTTP2LaneTransport)
+        assert len(transport.active) == 3
+
+    def test_adapter_uses_transport(self):
+        adapter = AdapterFactory.create(
+            name="openai",
+            server_url="http://localhost:8000",
+            model="test-model",
+            max_connections=200,
+            transport=TransportConfig(http_version="2"),
+        )
+
+        assert isinstance(adapter._get_client()._transport, HTTP2LaneTransport)
+
+    def test_worker_builder_keeps_transport(self):
+        config = BenchmarkConfig(
+            server_url="http://localhost:8000",
+            model="test-model",
+            transport=TransportConfig(uds="/tmp/server.sock"),
+        )
+        adapter = adapter_builder_from_config(config)(16)
+
+        assert adapter.transport.uds == "/tmp/server.sock"
+
+
+class TestHTTP2LaneTransport:
+    """Tests for stream routing across lanes."""
+
+    @pytest.mark.asyncio
+    async def test_least_loaded_lane_and_release(self):
+        seen = []
+
+        def lane(index):
+            async def body():
+                yield b"ok"
+
+            def handler(request):
+                seen.append(index)
+                # 스트리밍 본문: 닫힐 때까지 스트림이 열린 것으로 집계됨
+                return httpx.Response(200, content=body())
+
+            return httpx.MockTransport(handler)
+
+        transport = HTTP2LaneTransport([lane(0), lane(1)])
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            first = await client.send(client.build_request("GET", "/"), stream=True)
+            second = await client.send(client.build_request("GET", "/"), stream=True)
+            assert seen == [0, 1]
+            assert transport.active == [1, 1]
+
+            await first.aclose()
+            assert transport.active == [0, 1]
+
+            await client.get("/")
+            assert seen[-1] == 0
+            assert transport.active == [0, 1]
+
+            await second.aclose()
+            assert transport.active == [0, 0]
@@ -0,0 +1,215 @@
+"""Unit tests for warmup."""
+
+import asyncio
+
+import pytest
+
+from shared.adapters.base import BaseAdapter
+from shared.core.load_generator import LoadGenerator
+from shared.core.models import BenchmarkConfig, LoadPhase, LoadProfile, RequestResult
+from shared.core.warmup import (
+    WARMUP_REQUEST_ID_OFFSET,
+    SteadyStateDetector,
+    SteadyStateWarmup,
+    WarmupError,
+    first_concurrency,
+)
+
+
+class SettlingAdapter:
+    """Adapter whose TTFT starts high and settles after a number of requests."""
+
+    def __init__(self, cold_requests: int = 30, fail: bool = False):
+        self.cold_requests = cold_requests
+        self.fail = fail
+        self.request_ids: list[int] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def send_request(self, request_id, prompt, max_tokens, stream) -> RequestResult:
+        self.request_ids.append(request_id)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+        if self.fail:
+            return RequestResult(
+                request_id=request_id,
+                ttft_ms=0,
+                e2e_latency_ms=0,
+                input_tokens=0,
+                output_tokens=0,
+                success=False,
+                error_type="HTTP 503",
+            )
+        # 5%씩 감소하다가 cold_requests 이후 50ms로 고정
+        ttft = 50.0 * 1.05 ** max(self.cold_requests - len(self.request_ids), 0)
+        return RequestResult(
+            request_id=request_id,
+            ttft_ms=ttft,
+            e2e_latency_ms=ttft + 10,
+            input_tokens=8,
+            output_tokens=10,
+            success=True,
+        )
+
+    async def health_check(self) -> bool:
+        return True
+
+    async def warmup(self, num_requests, input_len, output_len) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        pass
+
+
+def make_config(**overrides) -> BenchmarkConfig:
+    values = {
+        "server_url": "http://localhost:8000",
+        "model": "test-model",
+        "input_len": 8,
+        "output_len": 10,
+        "num_prompts": 20,
+        "concurrency": [4, 8],
+        "warmup": 0,
+        "warmup_mode": "steady",
+        "warmup_ramp_seconds": 0.01,
+        "warmup_window": 5,
+        "warmup_max_seconds": 5.0,
+    }
+    values.update(overrides)
+    return BenchmarkConfig(**values)
+
+
+class TestSteadyStateDetector:
+    """Tests for SteadyStateDetector."""
+
+    def test_stable_after_flat_windows(self):
+        detector = SteadyStateDetector(window=2, tolerance=0.05)
+
+        results = [detector.add(ttft) for ttft in [100, 100, 100, 102, 101, 101]]
+
+        assert results == [False] * 5 + [True]
+        assert detector.means == [100, 101, 101]
+
+    def test_drifting_ttft_is_not_stable(self):
+        detector = SteadyStateDetector(window=2, tolerance=0.05)
+        for ttft in [300, 300, 200, 200, 100, 100]:
+            detector.add(ttft)
+
+        assert not detector.stable
+
+    def test_uses_most_recent_windows(self):
+        detector = SteadyStateDetector(window=1, tolerance=0.05)
+        for ttft in [300, 200, 100, 100, 100]:
+            detector.add(ttft)
+
+        assert detector.stable
+
+
+class TestSteadyStateWarmup:
+    """Tests for SteadyStateWarmup."""
+
+    @pytest.mark.asyncio
+    async def test_runs_until_stable(self):
+        """Test that warmup outlasts the cold phase and reports what it sent."""
+        adapter = SettlingAdapter(cold_requests=30)
+        config = make_config()
+
+        result = await SteadyStateWarmup.for_config(config, adapter).run(config, 4)
+
+        assert result.mode == "steady"
+        assert result.stable is True
+        assert result.ttft_mean_ms == pytest.approx(50.0)
+        assert result.total_requests == len(adapter.request_ids) > 30
+        assert result.failed_requests == 0
+        assert adapter.max_in_flight == 4
+        assert min(adapter.request_ids) >= WARMUP_REQUEST_ID_OFFSET
+
+    @pytest.mark.asyncio
+    async def test_time_limit(self):
+        adapter = SettlingAdapter(cold_requests=5000)
+        config = make_config(warmup_max_seconds=0.05)
+
+        result = await SteadyStateWarmup.for_config(config, adapter).run(config, 2)
+
+        assert result.stable is False
+        assert result.duration_seconds >= 0.05
+
+    @pytest.mark.asyncio
+    async def test_all_failed_raises(self):
+        """Test that a broken server stops the warmup after one window of failures."""
+        adapter = SettlingAdapter(fail=True)
+        config = make_config()
+
+        with pytest.raises(WarmupError) as excinfo:
+            await SteadyStateWarmup.for_config(config, adapter).run(config, 2)
+
+        report = excinfo.value.result
+        assert report.failed_requests == report.total_requests >= config.warmup_window
+        assert report.errors == ["HTTP 503"]
+
+    @pytest.mark.asyncio
+    async def test_load_generator_reports_warmup(self):
+        """Test that warmup requests are reported but not measured."""
+        adapter = SettlingAdapter(cold_requests=10)
+        config = make_config()
+
+        result = await LoadGenerator(adapter).run(config)
+
+        assert result.warmup.concurrency == 4
+        measured = sum(level.total_requests for level in result.results)
+        assert measured == 40
+        assert result.warmup.total_requests + measured == len(adapter.request_ids)
+
+    def test_first_concurrency_of_profile(self):
+        profile = LoadProfile(
+            phases=[LoadPhase(shape="ramp", target=64, duration_seconds=60)]
+            + [LoadPhase(shape="constant", target=64, duration_seconds=60)]
+        )
+
+        assert first_concurrency(make_config()) == 4
+        assert first_concurrency(make_config(load_profile=profile)) == 64
+
+
+class FlakyAdapter(BaseAdapter):
+    """BaseAdapter whose requests fail, then raise, then succeed."""
+
+    def __init__(self):
+        super().__init__("http://localhost:8000", "test-model")
+        self.calls = 0
+
+    async def send_request(self, request_id, prompt, max_tokens, stream=True):
+        self.calls += 1
+        if self.calls == 1:
+            raise ConnectionError("refused")
+        return RequestResult(
+            request_id=request_id,
+            ttft_ms=1.0,
+            e2e_latency_ms=2.0,
+            input_tokens=1,
+            output_tokens=1,
+            success=self.calls > 2,
+            error_type=None if self.calls > 2 else "HTTP 500",
+        )
+
+    async def health_check(self) -> bool:
+        return True
+
+    @property
+    def adapter_name(self) -> str:
+        return "flaky"
+
+
+class TestRequestsWarmup:
+    """Tests for the serial BaseAdapter warmup."""
+
+    @pytest.mark.asyncio
+    async def test_counts_failures(self):
+        result = await FlakyAdapter().warmup(num_requests=4)
+
+        assert result.mode == "requests"
+        assert result.total_requests == 4
+        assert result.failed_requests == 2
+        assert result.errors == ["ConnectionError: refused", "HTTP 500"]
+        assert result.stable is None
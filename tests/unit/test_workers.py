@@ -0,0 +1,128 @@
+"""Unit tests for multi-process load generation."""
+
+import pytest
+
+from shared.core.load_generator import LoadGenerator
+from shared.core.models import BenchmarkConfig, RequestResult
+from shared.core.workers import MultiProcessRunner, plan_shards, split_evenly
+
+
+class FixedLatencyAdapter:
+    """Picklable-by-reference adapter used inside worker processes."""
+
+    def __init__(self, max_connections: int):
+        self.max_connections = max_connections
+
+    async def send_request(
+        self, request_id: int, prompt: str, max_tokens: int, stream: bool = True
+    ) -> RequestResult:
+        return RequestResult(
+            request_id=request_id,
+            ttft_ms=100.0,
+            tpot_ms=10.0,
+            e2e_latency_ms=100.0 + 10.0 * (max_tokens - 1),
+            input_tokens=32,
+            output_tokens=max_tokens,
+            itl_ms=[10.0] * (max_tokens - 1),
+        )
+
+    async def health_check(self) -> bool:
+        return True
+
+    async def warmup(self, num_requests: int, input_len: int, output_len: int) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        pass
+
+
+def build_fixed_adapter(max_connections: int) -> FixedLatencyAdapter:
+    """Module-level adapter builder (must be importable from worker processes)."""
+    return FixedLatencyAdapter(max_connections)
+
+
+def make_config(**overrides) -> BenchmarkConfig:
+    """Create a small multi-worker benchmark config."""
+    values = {
+        "server_url": "http://localhost:8000",
+        "model": "test-model",
+        "input_len": 32,
+        "output_len": 8,
+        "num_prompts": 30,
+        "concurrency": [4],
+        "warmup": 0,
+        "workers": 2,
+    }
+    values.update(overrides)
+    return BenchmarkConfig(**values)
+
+
+class TestShardPlanning:
+    """Tests for shard planning helpers."""
+
+    def test_split_evenly(self):
+        """Test that remainders go to the first parts."""
+        assert split_evenly(10, 4) == [3, 3, 2, 2]
+        assert sum(split_evenly(7, 3)) == 7
+
+    def test_shards_cover_level(self):
+        """Test that shards partition concurrency and requests."""
+        shards = plan_shards(make_config(num_prompts=31), concurrency=5, workers=2)
+
+        assert [s.concurrency for s in shards] == [3, 2]
+        assert [s.num_requests for s in shards] == [16, 15]
+        assert [(s.index, s.stride) for s in shards] == [(0, 2), (1, 2)]
+
+    def test_workers_capped_by_concurrency(self):
+        """Test that no worker gets zero concurrency."""
+        shards = plan_shards(make_config(workers=8), concurrency=3, workers=8)
+        assert len(shards) == 3
+
+    def test_request_rate_is_divided(self):
+        """Test per-worker rates, seeds and constant-arrival phase shifts."""
+        config = make_config(request_rate=40.0, arrival_distribution="constant", seed=5)
+        shards = plan_shards(config, concurrency=8, workers=4)
+
+        assert all(s.request_rate == 10.0 for s in shards)
+        assert [s.seed for s in shards] == [5, 6, 7, 8]
+        assert [s.start_delay for s in shards] == pytest.approx([0.0, 0.025, 0.05, 0.075])
+
+
+class TestMultiProcessRunner:
+    """End-to-end tests running real worker processes."""
+
+    @pytest.mark.asyncio
+    async def test_merges_worker_results(self):
+        """Test that per-worker aggregates merge into one level result."""
+        runner = MultiProcessRunner(2, build_fixed_adapter)
+
+        aggregator, duration = await runner.run_level(make_config(), concurrency=4)
+        level = aggregator.finalize(duration, 4)
+
+        assert level.total_requests == 30
+        assert level.successful_requests == 30
+        assert level.total_output_tokens == 30 * 8
+        assert level.itl.mean == pytest.approx(10.0)
+        assert duration > 0
+
+    @pytest.mark.asyncio
+    async def test_forwards_progress(self):
+        """Test that completions in the workers reach the parent's progress callback."""
+        runner = MultiProcessRunner(2, build_fixed_adapter)
+        calls = []
+
+        await runner.run_level(
+            make_config(), concurrency=4, progress_callback=lambda *args: calls.append(args)
+        )
+
+        assert calls[-1] == (30, 30, "30 requests")
+        assert [c[0] for c in calls] == sorted(c[0] for c in calls)
+
+    @pytest.mark.asyncio
+    async def test_load_generator_uses_workers(self):
+        """Test that LoadGenerator.run shards levels when workers > 1."""
+        generator = LoadGenerator(build_fixed_adapter(1), adapter_builder=build_fixed_adapter)
+
+        result = await generator.run(make_config(concurrency=[2, 4], num_prompts=12))
+
+        assert [r.total_requests for r in result.results] == [12, 12]
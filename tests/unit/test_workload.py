@@ -0,0 +1,313 @@
+"""Unit tests for dataset-driven prompt workloads."""
+
+import json
+import pickle
+
+import numpy as np
+import pytest
+
+from shared.core.models import BenchmarkConfig, LengthDistribution
+from shared.core.tokenizer import TokenCounter
+from shared.core.workload import (
+    UNKNOWN_OUTPUT,
+    DatasetPrompts,
+    LengthSampler,
+    PrefixSharingPrompts,
+    PromptDataset,
+    SyntheticPrompts,
+    prompt_source_for,
+)
+
+
+@pytest.fixture(autouse=True)
+def word_tokenizer(monkeypatch):
+    """Count tokens as whitespace-separated words (no encoding downloads)."""
+    monkeypatch.setattr(
+        TokenCounter,
+        "count_many",
+        classmethod(lambda cls, texts, model="": [len(t.split()) for t in texts]),
+    )
+
+
+@pytest.fixture
+def jsonl_dataset(tmp_path):
+    path = tmp_path / "prompts.jsonl"
+    records = [
+        {"prompt": "one two three", "completion": "a b"},
+        {"prompt": "안녕하세요 세계", "output_len": 7},
+        {"messages": [{"role": "user", "content": "x y"}, {"role": "assistant", "content": "z"}]},
+        {"prompt": "just a prompt"},
+        {"title": "no prompt here"},
+    ]
+    path.write_text("\n".join(json.dumps(r, ensure_ascii=False) for r in records) + "\n")
+    return path
+
+
+@pytest.fixture
+def sharegpt_dataset(tmp_path):
+    path = tmp_path / "sharegpt.json"
+    records = [
+        {"id": "1", "conversations": [{"from": "human", "value": "hi there"}, {"from": "gpt", "value": "hello to you"}]},
+        {"id": "2", "conversations": [{"from": "gpt", "value": "orphan"}]},
+    ]
+    path.write_text(json.dumps(records))
+    return path
+
+
+class TestPromptDataset:
+    """Tests for parsing and caching datasets."""
+
+    def test_parse_jsonl(self, jsonl_dataset):
+        """Test that JSONL records of several shapes are parsed."""
+        dataset = PromptDataset.build(jsonl_dataset, "test-model")
+
+        assert len(dataset) == 4
+        assert dataset.prompt(1) == "안녕하세요 세계"
+        assert dataset.input_tokens.tolist() == [3, 2, 2, 3]
+        assert dataset.output_tokens.tolist() == [2, 7, 1, UNKNOWN_OUTPUT]
+
+    def test_parse_sharegpt(self, sharegpt_dataset):
+        """Test that ShareGPT conversations without a human turn are skipped."""
+        dataset = PromptDataset.build(sharegpt_dataset, "test-model")
+
+        assert len(dataset) == 1
+        assert dataset.prompt(0) == "hi there"
+        assert dataset.output_tokens.tolist() == [3]
+
+    def test_empty_dataset_is_rejected(self, tmp_path):
+        """Test that a dataset without prompts raises ValueError."""
+        path = tmp_path / "empty.jsonl"
+        path.write_text('{"title": "x"}\n')
+        with pytest.raises(ValueError, match="no prompts"):
+            PromptDataset.build(path, "test-model")
+
+    def test_cache_is_memory_mapped_and_reused(self, jsonl_dataset, tmp_path, monkeypatch):
+        """Test that a second load maps the cache without re-parsing."""
+        cache_dir = tmp_path / "cache"
+        first = PromptDataset.load(jsonl_dataset, "test-model", cache_dir=cache_dir)
+        assert len(list(cache_dir.iterdir())) == 2
+
+        monkeypatch.setattr(PromptDataset, "build", None)  # must not be called
+        second = PromptDataset.load(jsonl_dataset, "test-model", cache_dir=cache_dir)
+
+        assert isinstance(second.input_tokens, np.memmap) or isinstance(
+            second.input_tokens.base, np.memmap
+        )
+        assert [second.prompt(i) for i in range(len(second))] == [
+            first.prompt(i) for i in range(len(first))
+        ]
+
+    def test_cache_invalidated_when_model_changes(self, jsonl_dataset, tmp_path):
+        """Test that the cache key includes the tokenizer model."""
+        cache_dir = tmp_path / "cache"
+        PromptDataset.load(jsonl_dataset, "model-a", cache_dir=cache_dir)
+        PromptDataset.load(jsonl_dataset, "model-b", cache_dir=cache_dir)
+        assert len(list(cache_dir.iterdir())) == 4
+
+    def test_pickle_ships_only_cache_paths(self, jsonl_dataset, tmp_path):
+        """Test that worker processes remap the cache instead of copying prompts."""
+        dataset = PromptDataset.load(jsonl_dataset, "test-model", cache_dir=tmp_path)
+        payload = pickle.dumps(dataset)
+
+        assert b"one two three" not in payload
+        restored = pickle.loads(payload)
+        assert restored.prompt(0) == "one two three"
+
+
+class TestPromptSources:
+    """Tests for per-request prompt selection."""
+
+    def test_synthetic_prompt_is_shared(self):
+        """Test that synthetic prompts reuse one string object."""
+        source = SyntheticPrompts(input_len=64, output_len=32)
+        (a, max_a), (b, max_b) = source.get(0), source.get(1)
+        assert a is b
+        assert max_a == max_b == 32
+
+    def test_dataset_prompts_are_seeded_and_cycle(self, jsonl_dataset):
+        """Test that request ids map deterministically onto records."""
+        dataset = PromptDataset.build(jsonl_dataset, "test-model")
+        source = DatasetPrompts(dataset, default_output_len=16, seed=3)
+        again = DatasetPrompts(dataset, default_output_len=16, seed=3)
+
+        picks = [source.get(i) for i in range(8)]
+        assert picks == [again.get(i) for i in range(8)]
+        assert {p for p, _ in picks[:4]} == {dataset.prompt(i) for i in range(4)}
+        assert picks[:4] == picks[4:]
+        # Unknown reference output falls back to the configured output_len
+        assert dict(picks)["just a prompt"] == 16
+
+    def test_prompt_source_for_config(self, jsonl_dataset, tmp_path, monkeypatch):
+        """Test that the config selects a dataset or synthetic prompts."""
+        monkeypatch.setattr("shared.core.workload.DEFAULT_CACHE_DIR", tmp_path)
+        base = {"server_url": "http://localhost:8000", "model": "m"}
+
+        assert isinstance(prompt_source_for(BenchmarkConfig(**base)), SyntheticPrompts)
+        source = prompt_source_for(BenchmarkConfig(**base, dataset=str(jsonl_dataset)))
+        assert isinstance(source, DatasetPrompts)
+
+
+class TestPrefixSharingPrompts:
+    """Tests for synthetic prompts with a controlled shared prefix."""
+
+    @pytest.fixture(autouse=True)
+    def word_encoding(self, monkeypatch):
+        """Encode each space-prefixed word as one token id."""
+        vocab: dict[str, int] = {}
+        words: dict[int, str] = {}
+
+        def encode(cls, text, model=""):
+            ids = []
+            for word in text.split(" ")[1:]:
+                ids.append(vocab.setdefault(word, len(vocab)))
+                words[vocab[word]] = word
+            return ids
+
+        def decode(cls, tokens, model=""):
+            return "".join(" " + words[t] for t in tokens)
+
+        monkeypatch.setattr(TokenCounter, "encode", classmethod(encode))
+        monkeypatch.setattr(TokenCounter, "decode", classmethod(decode))
+
+    def test_exact_length_and_unique_suffixes(self):
+        """Test that prompts have exactly input_len tokens and differ per request."""
+        source = PrefixSharingPrompts("m", input_len=50, output_len=8, prefix_len=0, seed=1)
+        prompts = [source.get(i)[0] for i in range(20)]
+
+        assert all(len(TokenCounter.encode(p)) == 50 for p in prompts)
+        assert len(set(prompts)) == 20
+        assert source.get(3) == (prompts[3], 8)
+
+    def test_share_ratio_controls_prefix_hits(self):
+        """Test that roughly share_ratio of requests start with the prefix."""
+        source = PrefixSharingPrompts(
+            "m", input_len=40, output_len=8, prefix_len=30, share_ratio=0.25, seed=2
+        )
+        prompts = [source.get(i)[0] for i in range(400)]
+        shared = [p.startswith(source.prefix) for p in prompts]
+
+        assert len(TokenCounter.encode(source.prefix)) == 30
+        assert sum(shared) / len(shared) == pytest.approx(0.25, abs=0.07)
+        assert shared == [source.shares_prefix(i) for i in range(400)]
+        assert all(len(TokenCounter.encode(p)) == 40 for p in prompts)
+
+    def test_full_sharing(self):
+        """Test that share_ratio=1 gives every request the same prefix."""
+        source = PrefixSharingPrompts("m", input_len=20, output_len=8, prefix_len=20, seed=3)
+        assert {source.get(i)[0] for i in range(5)} == {source.prefix}
+
+    def test_invalid_prefix_len(self):
+        """Test that a prefix longer than the prompt is rejected."""
+        with pytest.raises(ValueError):
+            PrefixSharingPrompts("m", input_len=10, output_len=8, prefix_len=11)
+
+    def test_config_enables_generator(self):
+        """Test that prefix_len in the config selects the generator."""
+        config = BenchmarkConfig(
+            server_url="http://localhost:8000", model="m", prefix_len=0, input_len=16
+        )
+        assert isinstance(prompt_source_for(config), PrefixSharingPrompts)
+
+
+class TestLengthSampler:
+    """Tests for per-request length distributions."""
+
+    def test_uniform_bounds_and_determinism(self):
+        """Test that uniform lengths stay in range and depend only on the id."""
+        sampler = LengthSampler(LengthDistribution(kind="uniform", min=10, max=20), seed=1)
+        lengths = [sampler.sample(i) for i in range(500)]
+
+        assert min(lengths) == 10
+        assert max(lengths) == 20
+        assert lengths == [sampler.sample(i) for i in range(500)]
+
+    @pytest.mark.parametrize("kind", ["normal", "lognormal"])
+    def test_mean_and_std(self, kind):
+        """Test that sampled lengths follow the requested moments."""
+        dist = LengthDistribution(kind=kind, mean=500.0, std=100.0)
+        sampler = LengthSampler(dist, seed=2)
+        lengths = np.array([sampler.sample(i) for i in range(4000)])
+
+        assert lengths.mean() == pytest.approx(500.0, rel=0.03)
+        assert lengths.std() == pytest.approx(100.0, rel=0.08)
+
+    def test_clipping(self):
+        """Test that min/max clip the distribution tails."""
+        dist = LengthDistribution(kind="normal", mean=100.0, std=80.0, min=50, max=120)
+        sampler = LengthSampler(dist, seed=3)
+        lengths = [sampler.sample(i) for i in range(500)]
+        assert min(lengths) == 50
+        assert max(lengths) == 120
+
+    def test_empirical(self, tmp_path):
+        """Test resampling observed lengths from a file."""
+        path = tmp_path / "lengths.txt"
+        path.write_text("12\n40, 40\n7\n")
+        sampler = LengthSampler(LengthDistribution(kind="empirical", path=str(path)))
+        assert {sampler.sample(i) for i in range(200)} == {7, 12, 40}
+
+    def test_missing_parameters(self):
+        """Test that incomplete specs are rejected."""
+        with pytest.raises(ValueError):
+            LengthSampler(LengthDistribution(kind="uniform", min=10))
+        with pytest.raises(ValueError):
+            LengthSampler(LengthDistribution(kind="lognormal", mean=10.0))
+
+    def test_independent_streams(self):
+        """Test that input and output samplers with one seed differ."""
+        dist = LengthDistribution(kind="uniform", min=1, max=10_000)
+        a, b = LengthSampler(dist, seed=4, stream=1), LengthSampler(dist, seed=4, stream=2)
+        assert [a.sample(i) for i in range(10)] != [b.sample(i) for i in range(10)]
+
+
+class TestVaryingLengths:
+    """Tests for prompt sources with length distributions."""
+
+    @pytest.fixture(autouse=True)
+    def word_encoding(self, monkeypatch):
+        """Encode each space-prefixed word as one token id."""
+        vocab: dict[str, int] = {}
+        words: dict[int, str] = {}
+
+        def encode(cls, text, model=""):
+            ids = []
+            for word in text.split(" ")[1:]:
+                ids.append(vocab.setdefault(word, len(vocab)))
+                words[vocab[word]] = word
+            return ids
+
+        monkeypatch.setattr(TokenCounter, "encode", classmethod(encode))
+        monkeypatch.setattr(
+            TokenCounter,
+            "decode",
+            classmethod(lambda cls, tokens, model="": "".join(" " + words[t] for t in tokens)),
+        )
+
+    def test_config_samples_input_and_output_lengths(self):
+        """Test that each request gets its sampled prompt length and max_tokens."""
+        config = BenchmarkConfig(
+            server_url="http://localhost:8000",
+            model="m",
+            seed=5,
+            prefix_len=16,
+            input_len_dist=LengthDistribution(kind="uniform", min=8, max=64),
+            output_len_dist=LengthDistribution(kind="uniform", min=4, max=32),
+        )
+        source = prompt_source_for(config)
+        input_lengths = LengthSampler(config.input_len_dist, 5, stream=1)
+        output_lengths = LengthSampler(config.output_len_dist, 5, stream=2)
+
+        for i in range(50):
+            prompt, max_tokens = source.get(i)
+            assert len(TokenCounter.encode(prompt)) == input_lengths.sample(i)
+            assert max_tokens == output_lengths.sample(i)
+            # Prompts shorter than the prefix carry a truncated prefix
+            shared = min(16, input_lengths.sample(i))
+            assert prompt.split(" ")[1 : shared + 1] == source.prefix.split(" ")[1 : shared + 1]
+
+    def test_output_distribution_with_fixed_prompt(self):
+        """Test that output lengths vary even with the fixed synthetic prompt."""
+        source = SyntheticPrompts(
+            32, 16, LengthSampler(LengthDistribution(kind="uniform", min=1, max=1000), seed=6)
+        )
+        assert len({source.get(i)[1] for i in range(20)}) > 1